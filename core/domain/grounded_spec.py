@@ -515,3 +515,40 @@ class GroundedSpec:
         summary += f"  Out of Scope: {', '.join(self.out_of_scope) or 'None'}\n"
         summary += f"  Negative Scenarios: {', '.join(self.negative_scenarios) or 'None'}\n"
         return summary
+
+    def to_dict(self) -> Dict:
+        """Convert to a JSON-serializable dictionary (sets become lists)."""
+        return {
+            'story_id': self.story_id,
+            'feature_name': self.feature_name,
+            'entry_points': [vars(ep).copy() for ep in self.entry_points],
+            'surfaces': list(self.surfaces),
+            'controls': [vars(c).copy() for c in self.controls],
+            'platform_requirements': [vars(pr).copy() for pr in self.platform_requirements],
+            'out_of_scope': list(self.out_of_scope),
+            'constraints': list(self.constraints),
+            'object_types': list(self.object_types),
+            'actions': list(self.actions),
+            'negative_scenarios': list(self.negative_scenarios),
+            'ac_bullets': dict(self.ac_bullets),
+            'qa_prep_bullets': dict(self.qa_prep_bullets),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'GroundedSpec':
+        """Create from dictionary produced by to_dict."""
+        return cls(
+            story_id=data['story_id'],
+            feature_name=data['feature_name'],
+            entry_points=[EntryPoint(**ep) for ep in data['entry_points']],
+            surfaces=set(data['surfaces']),
+            controls=[Control(**c) for c in data['controls']],
+            platform_requirements=[PlatformRequirement(**pr) for pr in data['platform_requirements']],
+            out_of_scope=set(data['out_of_scope']),
+            constraints=list(data['constraints']),
+            object_types=set(data['object_types']),
+            actions=list(data['actions']),
+            negative_scenarios=set(data['negative_scenarios']),
+            ac_bullets=dict(data['ac_bullets']),
+            qa_prep_bullets=dict(data['qa_prep_bullets']),
+        )
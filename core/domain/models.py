@@ -33,7 +33,7 @@ class UserStory:
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TestStep:
     """Single test step with action and expected result."""
     index: int
@@ -48,7 +48,7 @@ class TestStep:
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TestCase:
     """Test case with steps and metadata."""
     test_id: str
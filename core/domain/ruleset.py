@@ -83,6 +83,30 @@ class Ruleset:
         """Extract signals from bullets after initialization."""
         self._extract_signals()
     
+    @classmethod
+    def from_evidence(
+        cls,
+        story_id: int,
+        ac_texts: List[str],
+        qa_prep_texts: Optional[List[str]] = None
+    ) -> 'Ruleset':
+        """Build a ruleset from AC and QA Prep bullet texts in one pass.
+
+        Bullets are numbered AC1.., QA-1.. and signals are consolidated once
+        at the end (add_ac_bullet re-consolidates after every bullet).
+        """
+        ruleset = cls(story_id=story_id)
+        for idx, text in enumerate(ac_texts):
+            bullet = EvidenceBullet(id=f"AC{idx + 1}", text=text, source="AC")
+            ruleset.ac_bullets.append(bullet)
+            ruleset._extract_signals_from_bullet(bullet)
+        for idx, text in enumerate(qa_prep_texts or []):
+            bullet = EvidenceBullet(id=f"QA-{idx + 1}", text=text, source="QA_PREP")
+            ruleset.qa_prep_bullets.append(bullet)
+            ruleset._extract_signals_from_bullet(bullet)
+        ruleset._extract_signals()
+        return ruleset
+
     def add_ac_bullet(self, bullet_id: str, text: str):
         """Add an AC bullet and extract signals."""
         bullet = EvidenceBullet(id=bullet_id, text=text, source="AC")
@@ -240,3 +264,39 @@ class Ruleset:
     def get_all_qa_prep_ids(self) -> List[str]:
         """Get all QA Prep bullet IDs."""
         return [bullet.id for bullet in self.qa_prep_bullets]
+
+    def to_dict(self) -> Dict:
+        """Convert to a JSON-serializable dictionary (sets become lists)."""
+        data = {}
+        for name, value in vars(self).items():
+            if name in ('ac_bullets', 'qa_prep_bullets'):
+                value = [
+                    {'id': b.id, 'text': b.text, 'source': b.source, 'signals': list(b.signals)}
+                    for b in value
+                ]
+            elif name == 'signals':
+                value = {
+                    key: {'signal_type': s.signal_type, 'value': s.value, 'evidence_refs': list(s.evidence_refs)}
+                    for key, s in value.items()
+                }
+            elif isinstance(value, set):
+                value = list(value)
+            data[name] = value
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Ruleset':
+        """Create from dictionary produced by to_dict (no re-extraction)."""
+        ruleset = cls(story_id=data['story_id'])
+        for name, value in data.items():
+            if name in ('ac_bullets', 'qa_prep_bullets'):
+                value = [
+                    EvidenceBullet(id=b['id'], text=b['text'], source=b['source'], signals=set(b['signals']))
+                    for b in value
+                ]
+            elif name == 'signals':
+                value = {key: Signal(**s) for key, s in value.items()}
+            elif isinstance(getattr(ruleset, name), set):
+                value = set(value)
+            setattr(ruleset, name, value)
+        return ruleset
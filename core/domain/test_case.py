@@ -21,7 +21,7 @@ class TestCategory(str, Enum):
     VALIDATION = "Validation"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TestStep:
     """Represents a single test step."""
     action: str
@@ -29,7 +29,7 @@ class TestStep:
     step_number: Optional[int] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TestCase:
     """Domain entity representing a test case."""
     id: str
@@ -25,6 +25,25 @@ class IStoryRepository(ABC):
         """
         pass
 
+    def get_stories(self, story_ids: List[int]) -> Dict[int, UserStory]:
+        """Retrieve several user stories.
+
+        Platforms with a bulk endpoint override this; the default fetches
+        the stories one at a time.
+
+        Args:
+            story_ids: Story IDs
+
+        Returns:
+            Story ID -> UserStory for every story found
+        """
+        stories = {}
+        for story_id in story_ids:
+            story = self.get_story(story_id)
+            if story:
+                stories[story_id] = story
+        return stories
+
     @abstractmethod
     def get_qa_prep(self, story_id: int) -> Optional[str]:
         """Retrieve QA Prep content for a story.
@@ -103,6 +122,30 @@ class ITestSuiteRepository(ABC):
         """
         pass
 
+    def add_test_cases_to_suite(
+        self,
+        plan_id: int,
+        suite_id: int,
+        test_case_ids: List[int]
+    ) -> List[int]:
+        """Add several test cases to a test suite.
+
+        Platforms with a bulk endpoint override this; the default adds the
+        test cases one at a time.
+
+        Args:
+            plan_id: Test plan ID
+            suite_id: Test suite ID
+            test_case_ids: Test case work item IDs
+
+        Returns:
+            IDs of the test cases that were added
+        """
+        return [
+            test_case_id for test_case_id in test_case_ids
+            if self.add_test_case_to_suite(plan_id, suite_id, test_case_id)
+        ]
+
 
 class ITestCaseRepository(ABC):
     """Interface for test case data access."""
@@ -128,6 +171,38 @@ class ITestCaseRepository(ABC):
         """
         pass
 
+    def create_test_cases(
+        self,
+        test_cases: List[Dict[str, Any]],
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """Create several test cases.
+
+        Platforms with a bulk endpoint override this; the default creates
+        the test cases one at a time.
+
+        Args:
+            test_cases: Dicts with 'title', 'steps' and 'objective'
+            **kwargs: Additional fields applied to every test case
+
+        Returns:
+            One {'id': work item ID or None, 'error': message or None} per
+            test case, in order
+        """
+        results = []
+        for tc in test_cases:
+            work_item_id = self.create_test_case(
+                title=tc.get('title', ''),
+                steps=tc.get('steps', []),
+                objective=tc.get('objective', ''),
+                **kwargs
+            )
+            results.append({
+                'id': work_item_id,
+                'error': None if work_item_id else 'Failed to create'
+            })
+        return results
+
     @abstractmethod
     def update_test_case(
         self,
@@ -145,6 +220,23 @@ class ITestCaseRepository(ABC):
         """
         pass
 
+    def update_test_cases(self, updates: Dict[int, Dict[str, Any]]) -> Dict[int, bool]:
+        """Update several test cases.
+
+        Platforms that can update concurrently or in bulk override this;
+        the default updates the test cases one at a time.
+
+        Args:
+            updates: Test case ID -> fields to update
+
+        Returns:
+            Test case ID -> True if updated
+        """
+        return {
+            test_case_id: self.update_test_case(test_case_id, fields)
+            for test_case_id, fields in updates.items()
+        }
+
     @abstractmethod
     def get_test_case(self, test_case_id: int) -> Optional[Dict[str, Any]]:
         """Get a test case by ID.
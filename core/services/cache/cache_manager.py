@@ -23,7 +23,8 @@ class CacheManager:
         memory_max_size: int = 500,
         file_max_size: int = 10000,
         memory_ttl: Optional[timedelta] = None,
-        file_ttl: Optional[timedelta] = None
+        file_ttl: Optional[timedelta] = None,
+        namespace: Optional[str] = None
     ):
         """Initialize cache manager.
 
@@ -35,11 +36,15 @@ class CacheManager:
             file_max_size: Max entries in file cache
             memory_ttl: Memory cache TTL (default 1 hour)
             file_ttl: File cache TTL (default 7 days)
+            namespace: Key prefix, so managers sharing a cache directory
+                never see each other's entries (clear() and keys() only
+                touch this namespace)
         """
         self._memory_cache: Optional[MemoryCache] = None
         self._file_cache: Optional[FileCache] = None
         self._enable_memory = enable_memory
         self._enable_file = enable_file
+        self._namespace = namespace
 
         if enable_memory:
             self._memory_cache = MemoryCache(
@@ -54,6 +59,22 @@ class CacheManager:
                 default_ttl=file_ttl or timedelta(days=7)
             )
 
+    @property
+    def namespace(self) -> Optional[str]:
+        """Key prefix of this manager (None = shared key space)."""
+        return self._namespace
+
+    def _key(self, key: str) -> str:
+        return f"{self._namespace}:{key}" if self._namespace else key
+
+    def _own_keys(self, cache) -> List[str]:
+        """Stored keys of one tier that belong to this namespace (prefixed)."""
+        keys = cache.keys()
+        if not self._namespace:
+            return keys
+        prefix = f"{self._namespace}:"
+        return [key for key in keys if key.startswith(prefix)]
+
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache (checks memory first, then file).
 
@@ -63,6 +84,7 @@ class CacheManager:
         Returns:
             Cached value or None
         """
+        key = self._key(key)
         # Try memory cache first
         if self._memory_cache:
             value = self._memory_cache.get(key)
@@ -95,6 +117,7 @@ class CacheManager:
             ttl: Time-to-live
             memory_only: Only store in memory cache
         """
+        key = self._key(key)
         if self._memory_cache:
             self._memory_cache.set(key, value, ttl)
 
@@ -110,6 +133,7 @@ class CacheManager:
         Returns:
             True if deleted from any cache
         """
+        key = self._key(key)
         deleted = False
 
         if self._memory_cache:
@@ -121,12 +145,15 @@ class CacheManager:
         return deleted
 
     def clear(self) -> None:
-        """Clear all caches."""
-        if self._memory_cache:
-            self._memory_cache.clear()
-
-        if self._file_cache:
-            self._file_cache.clear()
+        """Clear all caches (only this namespace's entries, if it has one)."""
+        for cache in (self._memory_cache, self._file_cache):
+            if not cache:
+                continue
+            if self._namespace:
+                for key in self._own_keys(cache):
+                    cache.delete(key)
+            else:
+                cache.clear()
 
     def contains(self, key: str) -> bool:
         """Check if key exists in any cache.
@@ -137,6 +164,7 @@ class CacheManager:
         Returns:
             True if key exists
         """
+        key = self._key(key)
         if self._memory_cache and self._memory_cache.contains(key):
             return True
 
@@ -255,18 +283,19 @@ class CacheManager:
         return result
 
     def keys(self) -> Dict[str, List[str]]:
-        """Get all valid keys from all caches.
+        """Get all valid keys from all caches (this namespace's, unprefixed).
 
         Returns:
             Dictionary with keys per cache type
         """
         result = {}
+        strip = len(self._namespace) + 1 if self._namespace else 0
 
         if self._memory_cache:
-            result["memory"] = self._memory_cache.keys()
+            result["memory"] = [key[strip:] for key in self._own_keys(self._memory_cache)]
 
         if self._file_cache:
-            result["file"] = self._file_cache.keys()
+            result["file"] = [key[strip:] for key in self._own_keys(self._file_cache)]
 
         return result
 
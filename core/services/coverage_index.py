@@ -0,0 +1,146 @@
+"""
+Coverage Index - fast AC-to-test matching.
+
+Indexes test case text once (word -> tests posting lists) so that mapping
+every AC to the tests that mention its keywords costs one posting-list
+lookup per keyword instead of a regex scan of every test. The keyword mode
+reproduces the original whole-word substring matching exactly.
+
+Optional scoring modes return calibrated similarity scores in [0, 1] for
+all ACs at once:
+- "tfidf": cosine similarity of TF-IDF vectors, computed as one sparse
+  matrix product (scipy when installed, NumPy otherwise)
+- "embedding": cosine similarity of provider embeddings
+"""
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+import numpy as np
+
+try:
+    from scipy import sparse
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+from core.services.embeddings.embedding_interface import embedding_matrix
+
+# Whole-word tokens; a keyword matches \bkeyword\b in a text exactly when it
+# is one of these tokens
+_WORD = re.compile(r'\w+')
+
+SCORING_MODES = ("keyword", "tfidf", "embedding")
+
+
+def searchable_text(test_case: Dict) -> str:
+    """Searchable text of a test case (title, objective, step actions/expected)."""
+    title = test_case.get('title', '').lower()
+    objective = test_case.get('objective', '').lower()
+    step_actions = ' '.join(s.get('action', '').lower() for s in test_case.get('steps', []))
+    step_expected = ' '.join(s.get('expected', '').lower() for s in test_case.get('steps', []))
+    return f"{title} {objective} {step_actions} {step_expected}"
+
+
+class CoverageIndex:
+    """Inverted index over test case texts.
+
+    Usage:
+        index = CoverageIndex([searchable_text(tc) for tc in test_cases])
+        hits = index.keyword_hits({'rotate', 'object'})   # {test_idx: n}
+        scores = index.tfidf_scores([{'rotate', 'object'}])  # (1, n_tests)
+    """
+
+    def __init__(self, documents: Sequence[str]):
+        """Build the index.
+
+        Args:
+            documents: One lowercased text per test case
+        """
+        self.size = len(documents)
+        self._documents = list(documents)
+        self._term_counts: List[Counter] = [Counter(_WORD.findall(doc)) for doc in documents]
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        for doc_idx, counts in enumerate(self._term_counts):
+            for term in counts:
+                self._postings[term].append(doc_idx)
+        self._doc_matrix = None
+        self._vocabulary: Dict[str, int] = {}
+        self._idf: Optional[np.ndarray] = None
+
+    def keyword_hits(self, keywords: Iterable[str]) -> Dict[int, int]:
+        """Number of distinct keywords each test contains (tests with none omitted)."""
+        hits: Dict[int, int] = defaultdict(int)
+        for keyword in set(keywords):
+            for doc_idx in self._postings.get(keyword, ()):
+                hits[doc_idx] += 1
+        return hits
+
+    def keyword_scores(self, queries: Sequence[Set[str]]) -> np.ndarray:
+        """Share of each query's keywords found in each test (queries x tests)."""
+        scores = np.zeros((len(queries), self.size), dtype=np.float32)
+        for row, keywords in enumerate(queries):
+            if keywords:
+                for doc_idx, n in self.keyword_hits(keywords).items():
+                    scores[row, doc_idx] = n / len(keywords)
+        return scores
+
+    def _build_tfidf(self) -> None:
+        """TF-IDF document matrix (L2-normalized rows), built on first use."""
+        self._vocabulary = {term: i for i, term in enumerate(self._postings)}
+        n_docs = max(self.size, 1)
+        # Smoothed IDF (as in scikit-learn): terms in every test still count
+        self._idf = np.array([
+            math.log((1 + n_docs) / (1 + len(self._postings[term]))) + 1.0
+            for term in self._vocabulary
+        ], dtype=np.float32)
+
+        rows, cols, values = [], [], []
+        for doc_idx, counts in enumerate(self._term_counts):
+            weights = {self._vocabulary[t]: (1.0 + math.log(c)) * self._idf[self._vocabulary[t]]
+                       for t, c in counts.items()}
+            norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+            for col, weight in weights.items():
+                rows.append(doc_idx)
+                cols.append(col)
+                values.append(weight / norm)
+        self._doc_matrix = self._matrix(rows, cols, values, self.size)
+
+    def _matrix(self, rows: List[int], cols: List[int], values: List[float], n_rows: int):
+        shape = (n_rows, len(self._vocabulary))
+        if SCIPY_AVAILABLE:
+            return sparse.csr_matrix((values, (rows, cols)), shape=shape, dtype=np.float32)
+        dense = np.zeros(shape, dtype=np.float32)
+        dense[rows, cols] = values
+        return dense
+
+    def tfidf_scores(self, queries: Sequence[Iterable[str]]) -> np.ndarray:
+        """Cosine similarity of each query's TF-IDF vector to each test (queries x tests)."""
+        if self._doc_matrix is None:
+            self._build_tfidf()
+
+        rows, cols, values = [], [], []
+        for row, terms in enumerate(queries):
+            columns = {self._vocabulary[t] for t in terms if t in self._vocabulary}
+            norm = math.sqrt(sum(float(self._idf[c]) ** 2 for c in columns)) or 1.0
+            for col in columns:
+                rows.append(row)
+                cols.append(col)
+                values.append(float(self._idf[col]) / norm)
+        query_matrix = self._matrix(rows, cols, values, len(queries))
+
+        scores = query_matrix @ self._doc_matrix.T
+        if SCIPY_AVAILABLE:
+            scores = scores.toarray()
+        return np.asarray(scores, dtype=np.float32)
+
+    def embedding_scores(self, queries: Sequence[str], embedding_provider) -> np.ndarray:
+        """Cosine similarity of query and test embeddings (queries x tests)."""
+        if not queries or not self.size:
+            return np.zeros((len(queries), self.size), dtype=np.float32)
+        matrix = embedding_matrix(embedding_provider, list(queries) + self._documents)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix = matrix / norms
+        return np.clip(matrix[:len(queries)] @ matrix[len(queries):].T, 0.0, 1.0)
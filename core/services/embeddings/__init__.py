@@ -35,12 +35,14 @@ from .embedding_interface import (
     EmbeddingResult,
     SimilarityMatch,
     cosine_similarity,
+    embedding_matrix,
 )
 from .embedding_cache import EmbeddingCache
 from .pattern_index import EmbeddingPatternIndex, PatternEntry
 from .semantic_matcher import SemanticMatcher
 from .providers import (
     OpenAIEmbeddingProvider,
+    HashingEmbeddingProvider,
     create_embedding_provider,
 )
 
@@ -50,6 +52,7 @@ __all__ = [
     "EmbeddingResult",
     "SimilarityMatch",
     "cosine_similarity",
+    "embedding_matrix",
     # Cache
     "EmbeddingCache",
     # Pattern Index
@@ -59,5 +62,6 @@ __all__ = [
     "SemanticMatcher",
     # Providers
     "OpenAIEmbeddingProvider",
+    "HashingEmbeddingProvider",
     "create_embedding_provider",
 ]
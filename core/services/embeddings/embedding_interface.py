@@ -6,7 +6,7 @@ to enable semantic similarity matching in AC parsing.
 """
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence
 import numpy as np
 
 
@@ -134,3 +134,28 @@ def cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
         return 0.0
 
     return float(np.dot(vec1, vec2) / (norm1 * norm2))
+
+
+def embedding_matrix(provider: IEmbeddingProvider, texts: Sequence[str]) -> np.ndarray:
+    """Embed texts in one batch as matrix rows (row i belongs to texts[i]).
+
+    embed_batch skips empty texts and may drop failed ones, so results are
+    mapped back by text; texts without an embedding get a zero row.
+
+    Args:
+        provider: Embedding provider
+        texts: Texts to embed
+
+    Returns:
+        float32 matrix of shape (len(texts), dimensions)
+    """
+    vectors = {
+        result.text: np.asarray(result.vector, dtype=np.float32)
+        for result in provider.embed_batch(list(texts))
+    }
+    dimensions = len(next(iter(vectors.values()))) if vectors else 0
+    matrix = np.zeros((len(texts), dimensions), dtype=np.float32)
+    for row, text in enumerate(texts):
+        if text in vectors:
+            matrix[row] = vectors[text]
+    return matrix
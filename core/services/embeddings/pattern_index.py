@@ -2,17 +2,48 @@
 Embedding pattern index for pre-computed pattern embeddings.
 
 Loads patterns from JSON and pre-computes embeddings for fast similarity search.
+The built index is snapshotted to disk keyed by a fingerprint of the pattern
+file and model name, so unchanged patterns load with a single memory-mapped read.
 """
+import hashlib
 import json
+import os
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
 from .embedding_interface import IEmbeddingProvider
 from .embedding_cache import EmbeddingCache
 
+_NON_WORD_RE = re.compile(r"[^a-z0-9]+")
+_ARTICLES = {"a", "an", "the"}
+_STEM_SUFFIXES = ("ing", "ed", "es", "s")
+
+
+def normalize_pattern_text(text: str) -> str:
+    """Normalize text for exact lookup (case, punctuation, whitespace)."""
+    return " ".join(_NON_WORD_RE.sub(" ", text.lower()).split())
+
+
+def _light_stem(word: str) -> str:
+    """Strip a common inflection suffix from longer words."""
+    if len(word) > 4:
+        for suffix in _STEM_SUFFIXES:
+            if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+                return word[:-len(suffix)]
+    return word
+
+
+def stem_pattern_text(text: str) -> str:
+    """Normalize text for near-exact lookup (also drops articles, stems words)."""
+    return " ".join(
+        _light_stem(word) for word in normalize_pattern_text(text).split()
+        if word not in _ARTICLES
+    )
+
 
 @dataclass
 class PatternEntry:
@@ -50,7 +81,9 @@ class EmbeddingPatternIndex:
         self,
         provider: IEmbeddingProvider,
         cache: Optional[EmbeddingCache] = None,
-        patterns_file: str = "patterns/ac_patterns.json"
+        patterns_file: str = "patterns/ac_patterns.json",
+        snapshot_dir: Optional[str] = ".cache/pattern_index",
+        stem_lookup: bool = True
     ):
         """Initialize pattern index.
 
@@ -58,12 +91,20 @@ class EmbeddingPatternIndex:
             provider: Embedding provider for computing vectors
             cache: Optional cache for persistence
             patterns_file: Path to patterns JSON file
+            snapshot_dir: Directory for the built-index snapshot (None disables it)
+            stem_lookup: Also build the stemmed near-exact text index
         """
         self._provider = provider
         self._cache = cache or EmbeddingCache()
         self._patterns_file = patterns_file
+        self._snapshot_dir = snapshot_dir
+        self.load_source: Optional[str] = None  # "snapshot", "incremental" or "full"
         self._patterns: Dict[str, PatternEntry] = {}
         self._category_index: Dict[str, List[str]] = {}
+        # Normalized canonical/synonym text -> pattern_id (built at load time)
+        self._exact_index: Dict[str, str] = {}
+        self._stem_index: Dict[str, str] = {}
+        self._stem_lookup = stem_lookup
         self._loaded = False
 
     @property
@@ -76,9 +117,19 @@ class EmbeddingPatternIndex:
         """Number of loaded patterns."""
         return len(self._patterns)
 
+    def ensure_loaded(self) -> None:
+        """Load patterns on first use (no-op once loaded)."""
+        if not self._loaded:
+            self.load_patterns()
+
     def load_patterns(self) -> None:
         """Load patterns from JSON and compute embeddings.
 
+        Uses the on-disk snapshot when the patterns file and model are
+        unchanged (one memory-mapped read, no JSON parsing of the pattern
+        file, no cache lookups). When the file changed, only texts missing
+        from the previous snapshot are embedded.
+
         Raises:
             FileNotFoundError: If patterns file doesn't exist
         """
@@ -86,31 +137,69 @@ class EmbeddingPatternIndex:
         if not patterns_path.exists():
             raise FileNotFoundError(f"Patterns file not found: {self._patterns_file}")
 
-        with open(patterns_path) as f:
-            data = json.load(f)
-
-        # Collect all texts to embed (canonical + synonyms)
-        all_texts = []
-        text_mapping = {}  # text -> (pattern_id, is_canonical)
-
-        for pattern in data["patterns"]:
-            pattern_id = pattern["id"]
-            canonical = pattern["canonical"]
-
-            # Add canonical
-            all_texts.append(canonical)
-            text_mapping[canonical] = (pattern_id, True)
-
-            # Add synonyms
-            for synonym in pattern.get("synonyms", []):
-                all_texts.append(synonym)
-                text_mapping[synonym] = (pattern_id, False)
-
-        # Batch embed all texts
-        embeddings = self._embed_all(all_texts)
-
-        # Build pattern entries
-        for pattern in data["patterns"]:
+        raw = patterns_path.read_bytes()
+        model = self._provider.model_name
+        fingerprint = hashlib.sha256(model.encode() + b"\0" + raw).hexdigest()
+        snapshot = self._load_snapshot()
+
+        if snapshot and snapshot[0].get("fingerprint") == fingerprint:
+            meta, matrix = snapshot
+            patterns = meta["patterns"]
+            embeddings = {text: matrix[row] for row, text in enumerate(meta["texts"])}
+            self.load_source = "snapshot"
+        else:
+            patterns = json.loads(raw)["patterns"]
+            embeddings = self._embed_incremental(patterns, snapshot)
+            if self._snapshot_dir and all(t in embeddings for t in self._pattern_texts(patterns)):
+                self._save_snapshot(fingerprint, patterns, embeddings)
+
+        self._build_entries(patterns, embeddings)
+        self._loaded = True
+        print(f"Loaded {len(self._patterns)} patterns with embeddings ({self.load_source})")
+
+    @staticmethod
+    def _pattern_texts(patterns: List[Dict]) -> List[str]:
+        """All unique canonical + synonym texts, in pattern order."""
+        texts = []
+        seen = set()
+        for pattern in patterns:
+            for text in [pattern["canonical"]] + pattern.get("synonyms", []):
+                if text not in seen:
+                    seen.add(text)
+                    texts.append(text)
+        return texts
+
+    def _embed_incremental(
+        self,
+        patterns: List[Dict],
+        snapshot: Optional[Tuple[Dict, np.ndarray]]
+    ) -> Dict[str, np.ndarray]:
+        """Reuse vectors from the previous snapshot, embed only new texts."""
+        texts = self._pattern_texts(patterns)
+        embeddings: Dict[str, np.ndarray] = {}
+        if snapshot:
+            meta, matrix = snapshot
+            previous = {text: row for row, text in enumerate(meta["texts"])}
+            for text in texts:
+                if text in previous:
+                    embeddings[text] = np.array(matrix[previous[text]])
+            self.load_source = "incremental"
+        else:
+            self.load_source = "full"
+
+        missing = [t for t in texts if t not in embeddings]
+        if missing:
+            embeddings.update(self._embed_all(missing))
+        return embeddings
+
+    def _build_entries(self, patterns: List[Dict], embeddings: Dict[str, np.ndarray]) -> None:
+        """Build PatternEntry objects, the category index and the text indexes."""
+        self._patterns = {}
+        self._category_index = {}
+        self._exact_index = {}
+        self._stem_index = {}
+
+        for pattern in patterns:
             pattern_id = pattern["id"]
             canonical = pattern["canonical"]
 
@@ -147,8 +236,62 @@ class EmbeddingPatternIndex:
                 self._category_index[category] = []
             self._category_index[category].append(pattern_id)
 
-        self._loaded = True
-        print(f"Loaded {len(self._patterns)} patterns with embeddings")
+            # Update text indexes (first pattern wins, as in a linear scan)
+            for text in [canonical] + entry.synonyms:
+                self._exact_index.setdefault(normalize_pattern_text(text), pattern_id)
+                if self._stem_lookup:
+                    self._stem_index.setdefault(stem_pattern_text(text), pattern_id)
+
+    def _snapshot_paths(self) -> Tuple[Path, Path]:
+        """Matrix and metadata paths for the current model."""
+        slug = re.sub(r"[^A-Za-z0-9_.-]", "_", self._provider.model_name)
+        base = Path(self._snapshot_dir)
+        return base / f"{slug}.npy", base / f"{slug}.json"
+
+    def _load_snapshot(self) -> Optional[Tuple[Dict, np.ndarray]]:
+        """Load snapshot metadata and memory-map its matrix."""
+        if not self._snapshot_dir:
+            return None
+        matrix_path, meta_path = self._snapshot_paths()
+        if not matrix_path.exists() or not meta_path.exists():
+            return None
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            matrix = np.load(matrix_path, mmap_mode="r")
+        except (json.JSONDecodeError, OSError, ValueError):
+            return None
+        if meta.get("model") != self._provider.model_name or len(meta.get("texts", [])) != len(matrix):
+            return None
+        return meta, matrix
+
+    def _save_snapshot(
+        self,
+        fingerprint: str,
+        patterns: List[Dict],
+        embeddings: Dict[str, np.ndarray]
+    ) -> None:
+        """Persist the built index (matrix + metadata) for the next startup."""
+        texts = self._pattern_texts(patterns)
+        matrix_path, meta_path = self._snapshot_paths()
+        try:
+            matrix_path.parent.mkdir(parents=True, exist_ok=True)
+            matrix = np.array([embeddings[t] for t in texts], dtype=np.float32)
+            tmp_matrix = matrix_path.with_suffix(".npy.tmp")
+            with open(tmp_matrix, "wb") as f:
+                np.save(f, matrix)
+            tmp_meta = meta_path.with_suffix(".json.tmp")
+            with open(tmp_meta, "w") as f:
+                json.dump({
+                    "model": self._provider.model_name,
+                    "fingerprint": fingerprint,
+                    "texts": texts,
+                    "patterns": patterns,
+                }, f)
+            os.replace(tmp_matrix, matrix_path)
+            os.replace(tmp_meta, meta_path)
+        except (OSError, ValueError) as e:
+            print(f"Pattern index snapshot write error: {e}")
 
     def _embed_all(self, texts: List[str]) -> Dict[str, np.ndarray]:
         """Embed all texts, using cache where possible.
@@ -189,11 +332,13 @@ class EmbeddingPatternIndex:
         Returns:
             List of PatternEntry objects
         """
+        self.ensure_loaded()
         pattern_ids = self._category_index.get(category, [])
         return [self._patterns[pid] for pid in pattern_ids if pid in self._patterns]
 
     def get_all_patterns(self) -> List[PatternEntry]:
         """Get all loaded patterns."""
+        self.ensure_loaded()
         return list(self._patterns.values())
 
     def get_pattern_by_id(self, pattern_id: str) -> Optional[PatternEntry]:
@@ -205,6 +350,7 @@ class EmbeddingPatternIndex:
         Returns:
             PatternEntry or None if not found
         """
+        self.ensure_loaded()
         return self._patterns.get(pattern_id)
 
     def get_category_embeddings(self, category: str) -> np.ndarray:
@@ -226,6 +372,7 @@ class EmbeddingPatternIndex:
 
     def get_categories(self) -> List[str]:
         """Get list of all categories."""
+        self.ensure_loaded()
         return list(self._category_index.keys())
 
     def search_by_text(self, text: str) -> Optional[PatternEntry]:
@@ -237,11 +384,30 @@ class EmbeddingPatternIndex:
         Returns:
             PatternEntry if exact match found, None otherwise
         """
-        text_lower = text.lower().strip()
-        for pattern in self._patterns.values():
-            if pattern.canonical.lower() == text_lower:
-                return pattern
-            for synonym in pattern.synonyms:
-                if synonym.lower() == text_lower:
-                    return pattern
+        match = self.lookup_text(text, allow_stem=False)
+        return match[0] if match else None
+
+    def lookup_text(
+        self,
+        text: str,
+        allow_stem: bool = True
+    ) -> Optional[Tuple[PatternEntry, str]]:
+        """Hash lookup of text against canonical and synonym texts.
+
+        Args:
+            text: Text to look up
+            allow_stem: Fall back to the stemmed near-exact index
+
+        Returns:
+            (PatternEntry, match_type) where match_type is "exact" or
+            "stem", or None if there is no hit
+        """
+        self.ensure_loaded()
+        pattern_id = self._exact_index.get(normalize_pattern_text(text))
+        if pattern_id:
+            return self._patterns[pattern_id], "exact"
+        if allow_stem and self._stem_lookup:
+            pattern_id = self._stem_index.get(stem_pattern_text(text))
+            if pattern_id:
+                return self._patterns[pattern_id], "stem"
         return None
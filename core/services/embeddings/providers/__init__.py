@@ -3,11 +3,14 @@ Embedding providers package.
 
 Available providers:
 - OpenAIEmbeddingProvider: Uses OpenAI text-embedding-3-small/large
+- HashingEmbeddingProvider: Local feature-hashing embeddings (no API)
 """
 from .openai_embeddings import OpenAIEmbeddingProvider
+from .hashing_embeddings import HashingEmbeddingProvider
 from .provider_factory import create_embedding_provider
 
 __all__ = [
     "OpenAIEmbeddingProvider",
+    "HashingEmbeddingProvider",
     "create_embedding_provider",
 ]
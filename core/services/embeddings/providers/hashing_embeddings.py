@@ -0,0 +1,105 @@
+"""
+Hashing Embedding Provider.
+
+Local, dependency-free embeddings built with the hashing trick over word
+unigrams, word bigrams and character trigrams. Quality is well below a
+neural model, but vectors are deterministic, need no network or model
+download and are fast enough for small corpora, CI and the MCP server.
+"""
+import hashlib
+import re
+from typing import List, Optional
+
+import numpy as np
+
+from ..embedding_interface import IEmbeddingProvider, EmbeddingResult
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+class HashingEmbeddingProvider(IEmbeddingProvider):
+    """Embedding provider using feature hashing (no external service)."""
+
+    def __init__(self, dimensions: int = 512):
+        """Initialize hashing embedding provider.
+
+        Args:
+            dimensions: Embedding vector dimensions
+        """
+        self._dimensions = dimensions
+
+    @property
+    def provider_name(self) -> str:
+        """Provider identifier."""
+        return "hashing"
+
+    @property
+    def model_name(self) -> str:
+        """Model being used."""
+        return f"hashing-{self._dimensions}"
+
+    @property
+    def dimensions(self) -> int:
+        """Embedding vector dimensions."""
+        return self._dimensions
+
+    def _features(self, text: str) -> List[str]:
+        """Extract hashed features: words, word bigrams and char trigrams."""
+        words = _TOKEN_RE.findall(text.lower())
+        features = [f"w:{w}" for w in words]
+        features.extend(f"b:{a}_{b}" for a, b in zip(words, words[1:]))
+        for word in words:
+            padded = f"#{word}#"
+            features.extend(f"c:{padded[i:i + 3]}" for i in range(len(padded) - 2))
+        return features
+
+    def _vectorize(self, text: str) -> np.ndarray:
+        """Build an L2-normalized signed hashing vector for text."""
+        vector = np.zeros(self._dimensions, dtype=np.float32)
+        for feature in self._features(text):
+            digest = hashlib.blake2b(feature.encode(), digest_size=8).digest()
+            value = int.from_bytes(digest, "little")
+            sign = 1.0 if value & 1 else -1.0
+            vector[(value >> 1) % self._dimensions] += sign
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector
+
+    def embed(self, text: str) -> Optional[EmbeddingResult]:
+        """Generate embedding for single text.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            EmbeddingResult with vector or None for empty text
+        """
+        if not text or not text.strip():
+            return None
+        return EmbeddingResult(
+            text=text,
+            vector=self._vectorize(text),
+            model=self.model_name,
+            dimensions=self._dimensions,
+        )
+
+    def embed_batch(self, texts: List[str]) -> List[EmbeddingResult]:
+        """Generate embeddings for multiple texts.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            List of EmbeddingResults (empty texts are skipped)
+        """
+        results = []
+        for text in texts:
+            result = self.embed(text)
+            if result is not None:
+                results.append(result)
+        return results
+
+    def is_available(self) -> bool:
+        """Hashing embeddings are always available."""
+        return True
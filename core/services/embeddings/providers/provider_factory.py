@@ -8,6 +8,7 @@ from typing import Optional
 
 from ..embedding_interface import IEmbeddingProvider
 from .openai_embeddings import OpenAIEmbeddingProvider
+from .hashing_embeddings import HashingEmbeddingProvider
 
 
 def create_embedding_provider(
@@ -18,7 +19,7 @@ def create_embedding_provider(
     """Create embedding provider based on configuration.
 
     Args:
-        provider_type: Provider type ("openai" or None for auto-detect)
+        provider_type: Provider type ("openai", "hashing" or None for auto-detect)
         model: Model name (defaults based on provider)
         api_key: API key (for OpenAI)
 
@@ -51,6 +52,9 @@ def create_embedding_provider(
             model=model
         )
 
+    if provider == "hashing":
+        return HashingEmbeddingProvider()
+
     # Unknown provider
     print(f"Unknown embedding provider: {provider_type}")
     return None
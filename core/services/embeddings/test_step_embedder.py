@@ -1,5 +1,7 @@
 
-from infrastructure.vector_db.chroma_repository import ChromaRepository
+from typing import Optional
+
+from infrastructure.vector_db.store_registry import get_vector_store
 
 # Template/boilerplate steps that should NOT be stored or returned as references
 _SKIP_PATTERNS = [
@@ -74,11 +76,25 @@ def _deduplicate_steps(steps: list[str]) -> list[str]:
 
 
 class TestStepEmbedder:
-    store = ChromaRepository("test_steps")
-
-    def __init__(self, collection_name: str = "test_steps"):
-        #Composition: Has-a relationship with chroma repository
-        self.store = ChromaRepository(collection_name)
+    def __init__(
+        self,
+        collection_name: str = "test_steps",
+        path: Optional[str] = None,
+        backend: Optional[str] = None
+    ):
+        # Composition: the store comes from the process-wide registry and is
+        # only resolved on first use, so constructing an embedder is free.
+        self.collection_name = collection_name
+        self.path = path
+        self.backend = backend
+        self._store = None
+
+    @property
+    def store(self):
+        """Lazy lookup of the shared vector store for this collection."""
+        if self._store is None:
+            self._store = get_vector_store(self.collection_name, path=self.path, backend=self.backend)
+        return self._store
 
     def store_steps(self, test_cases: list[dict]) -> int:
         """Store feature-specific steps (skips boilerplate template steps)."""
@@ -100,7 +116,7 @@ class TestStepEmbedder:
 
 
     def find_similar(self, step_text: str, n_results: int = 3):
-        """Find similar steps to the given step text using the ChromaRepository's search functionality."""
+        """Find similar steps to the given step text using the vector store's search functionality."""
         return self.store.query(step_text, n_results)
 
     def get_reference_steps(self, feature_name: str, n_results: int = 10) -> list[str]:
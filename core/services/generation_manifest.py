@@ -0,0 +1,349 @@
+"""
+Generation Manifest - incremental regeneration of a story's tests.
+
+A manifest saved next to the generated outputs records, per acceptance
+criterion, a hash of its text and the IDs of the tests derived from it,
+plus the final test cases themselves. On rerun the ACs are diffed against
+the manifest: tests for unchanged ACs are kept verbatim, and only new or
+edited ACs go back through generation, LLM correction and the judges.
+New tests are merged with stable IDs (an edited AC reuses its previous
+IDs, new ACs get IDs after the highest existing one).
+
+Any change to the story context (title, description, QA Prep, project or
+mode), the project settings, models or heuristic rule tables invalidates
+the manifest and triggers a full regeneration.
+"""
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Set
+
+from core.services.heuristic_rules import rules_fingerprint
+from core.services.near_duplicates import NearDuplicateDetector
+from core.services.test_generator import GenericTestGenerator, significant_ac_words
+
+MANIFEST_VERSION = 1
+
+# Minimum share of an AC's significant words a corrected test must contain
+# to be attributed to that AC (tests below it are story-level)
+ATTRIBUTION_THRESHOLD = 0.5
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+def ac_hash(ac_text: str) -> str:
+    """Hash of an AC bullet (whitespace and case insensitive)."""
+    return _digest(' '.join(ac_text.lower().split()))
+
+
+def context_hash(*parts: Optional[str]) -> str:
+    """Hash of the story context every test depends on."""
+    return _digest(json.dumps([p or '' for p in parts], ensure_ascii=False))
+
+
+def generation_fingerprint(config) -> str:
+    """Hash of the project settings, models and rules generated tests depend on."""
+    judges = [
+        config.self_judge_enabled, config.judge_enabled, config.judge_provider,
+        config.judge_model, config.judge_max_rounds, config.judge_auto_fix
+    ]
+    return _digest(json.dumps([config.to_yaml(), judges, rules_fingerprint()], ensure_ascii=False))
+
+
+def _words(text: str) -> Set[str]:
+    return significant_ac_words(re.sub(r'[^a-z0-9\s]', ' ', text.lower()))
+
+
+def _test_text(test_case: Dict) -> str:
+    steps = ' '.join(
+        f"{s.get('action', '')} {s.get('expected', '')}" for s in test_case.get('steps', [])
+    )
+    return f"{test_case.get('title', '')} {test_case.get('objective', '')} {steps}"
+
+
+def _test_num(test_id: str) -> Optional[int]:
+    suffix = test_id.rsplit('-', 1)[-1]
+    return int(suffix) if suffix.isdigit() else None
+
+
+def _title_key(test_case: Dict) -> str:
+    title = test_case.get('title', '')
+    test_id = test_case.get('id', '')
+    if test_id and title.startswith(test_id):
+        title = title[len(test_id):].lstrip(': ')
+    return ' '.join(title.lower().split())
+
+
+def attribution_by_title(
+    test_cases: Sequence[Dict],
+    known: Dict[str, Optional[int]]
+) -> Dict[str, Optional[int]]:
+    """Key known attribution by test title (without its ID prefix).
+
+    Correction renumbers tests by position, so generator IDs do not survive
+    it; titles do unless the LLM rewrites them. Titles shared by tests of
+    different ACs are left out.
+
+    Args:
+        test_cases: Tests the attribution was recorded for
+        known: Test ID -> 0-based AC index
+
+    Returns:
+        Title key -> 0-based AC index
+    """
+    by_title: Dict[str, Optional[int]] = {}
+    ambiguous: Set[str] = set()
+    for tc in test_cases:
+        if tc.get('id') not in known:
+            continue
+        key, idx = _title_key(tc), known[tc.get('id')]
+        if by_title.get(key, idx) != idx:
+            ambiguous.add(key)
+        by_title[key] = idx
+    return {key: idx for key, idx in by_title.items() if key not in ambiguous}
+
+
+def attribution_by_id(
+    test_cases: Sequence[Dict],
+    by_title: Dict[str, Optional[int]]
+) -> Dict[str, Optional[int]]:
+    """Test ID -> 0-based AC index for the tests whose title is in by_title."""
+    return {
+        tc.get('id', ''): by_title[_title_key(tc)]
+        for tc in test_cases if _title_key(tc) in by_title
+    }
+
+
+def attribute_tests(
+    test_cases: Sequence[Dict],
+    criteria: Sequence[str],
+    known: Optional[Dict[str, Optional[int]]] = None
+) -> Dict[str, Optional[int]]:
+    """Attribute each test to the AC it was derived from.
+
+    Args:
+        test_cases: Final test cases
+        criteria: Cleaned AC bullets
+        known: Test ID -> 0-based AC index (None: story-level) already
+            known, e.g. recorded by the generator or a previous manifest
+
+    Returns:
+        Test ID -> 0-based AC index, or None for story-level tests
+    """
+    known = known or {}
+    ac_words = [_words(ac) for ac in criteria]
+    attribution: Dict[str, Optional[int]] = {}
+    for tc in test_cases:
+        tc_id = tc.get('id', '')
+        if tc_id in known:
+            attribution[tc_id] = known[tc_id]
+            continue
+        words = _words(_test_text(tc))
+        best, best_score = None, ATTRIBUTION_THRESHOLD
+        for idx, ac in enumerate(ac_words):
+            if ac:
+                score = len(ac & words) / len(ac)
+                if score > best_score or (score == best_score and best is None):
+                    best, best_score = idx, score
+        attribution[tc_id] = best
+    return attribution
+
+
+@dataclass
+class ManifestEntry:
+    """One AC as recorded in the manifest."""
+    ac_hash: str
+    text: str
+    test_ids: List[str] = field(default_factory=list)
+
+
+@dataclass
+class RegenerationPlan:
+    """What to rebuild for a rerun, from diffing ACs against a manifest."""
+    full: bool
+    changed: List[int] = field(default_factory=list)  # 0-based AC indices to regenerate
+    kept_tests: List[Dict] = field(default_factory=list)
+    reusable_ids: Dict[int, List[str]] = field(default_factory=dict)
+    removed: int = 0
+    # Test ID -> 0-based AC index (None: story-level) of kept and merged tests
+    attribution: Dict[str, Optional[int]] = field(default_factory=dict)
+
+    @property
+    def unchanged(self) -> bool:
+        """True when the previous tests can be reused as-is."""
+        return not self.full and not self.changed and not self.removed
+
+
+@dataclass
+class GenerationManifest:
+    """Per-story record of AC hashes and the tests derived from each."""
+    story_id: int
+    context_hash: str
+    acs: List[ManifestEntry] = field(default_factory=list)
+    story_test_ids: List[str] = field(default_factory=list)
+    test_cases: List[Dict] = field(default_factory=list)
+
+    @staticmethod
+    def path_for(output_dir: str, story_id: int) -> str:
+        """Manifest location for a story's outputs."""
+        return os.path.join(output_dir, f"{story_id}_MANIFEST.json")
+
+    @classmethod
+    def build(
+        cls,
+        story_id: int,
+        context: str,
+        criteria: Sequence[str],
+        test_cases: List[Dict],
+        known: Optional[Dict[str, Optional[int]]] = None
+    ) -> 'GenerationManifest':
+        """Record the final tests of a run against the ACs they cover."""
+        manifest = cls(
+            story_id=story_id,
+            context_hash=context,
+            acs=[ManifestEntry(ac_hash(ac), ac) for ac in criteria],
+            test_cases=test_cases
+        )
+        for tc_id, idx in attribute_tests(test_cases, criteria, known).items():
+            if idx is None:
+                manifest.story_test_ids.append(tc_id)
+            else:
+                manifest.acs[idx].test_ids.append(tc_id)
+        return manifest
+
+    def plan(self, criteria: Sequence[str], context: str) -> RegenerationPlan:
+        """Diff ACs against this manifest.
+
+        An AC whose hash is in the manifest keeps its tests. Otherwise it is
+        regenerated; if the AC at the same position is gone it counts as an
+        edit of it and reuses its test IDs.
+        """
+        if context != self.context_hash:
+            return RegenerationPlan(full=True)
+
+        current = [ac_hash(ac) for ac in criteria]
+        by_hash = {entry.ac_hash: entry for entry in self.acs}
+        plan = RegenerationPlan(full=False)
+        plan.attribution = {test_id: None for test_id in self.story_test_ids}
+
+        for idx, digest in enumerate(current):
+            if digest in by_hash:
+                plan.attribution.update((test_id, idx) for test_id in by_hash[digest].test_ids)
+                continue
+            plan.changed.append(idx)
+            if idx < len(self.acs) and self.acs[idx].ac_hash not in current:
+                plan.reusable_ids[idx] = list(self.acs[idx].test_ids)
+
+        plan.removed = sum(1 for entry in self.acs if entry.ac_hash not in current)
+        plan.kept_tests = [tc for tc in self.test_cases if tc.get('id') in plan.attribution]
+        return plan
+
+    def to_dict(self) -> Dict:
+        return {
+            'version': MANIFEST_VERSION,
+            'story_id': self.story_id,
+            'context_hash': self.context_hash,
+            'acs': [vars(entry) for entry in self.acs],
+            'story_test_ids': self.story_test_ids,
+            'test_cases': self.test_cases,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'GenerationManifest':
+        return cls(
+            story_id=data['story_id'],
+            context_hash=data['context_hash'],
+            acs=[ManifestEntry(**entry) for entry in data.get('acs', [])],
+            story_test_ids=data.get('story_test_ids', []),
+            test_cases=data.get('test_cases', [])
+        )
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> Optional['GenerationManifest']:
+        """Load a manifest (None if missing, unreadable or outdated)."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get('version') != MANIFEST_VERSION:
+            return None
+        return cls.from_dict(data)
+
+
+def merge_tests(
+    plan: RegenerationPlan,
+    new_tests: List[Dict],
+    story_id: int,
+    criteria: Sequence[str],
+    increment: int = 5,
+    known: Optional[Dict[str, Optional[int]]] = None
+) -> List[Dict]:
+    """Merge regenerated tests into the kept ones with stable IDs.
+
+    New tests that near-duplicate a kept test (e.g. accessibility tests the
+    corrector re-adds) are dropped. The rest take a reusable ID of the AC
+    they cover, or the next free ID after every existing one.
+
+    Args:
+        plan: Plan the new tests were generated for
+        new_tests: Tests for the changed ACs
+        story_id: Story ID (for new test IDs)
+        criteria: Cleaned AC bullets
+        increment: Test ID numbering step
+        known: Test ID -> 0-based AC index recorded by the generator
+
+    Returns:
+        Kept and new tests in ID order (plan.attribution is updated with
+        the new tests' final IDs)
+    """
+    kept_texts = [_strip_id(tc) for tc in plan.kept_tests]
+    detector = NearDuplicateDetector(threshold=0.9)
+    duplicates = {
+        j - len(kept_texts)
+        for i, j, _ in detector.similar_pairs(kept_texts + [_strip_id(tc) for tc in new_tests])
+        if i < len(kept_texts) <= j
+    }
+    new_tests = [tc for n, tc in enumerate(new_tests) if n not in duplicates]
+
+    reusable = {idx: list(ids) for idx, ids in plan.reusable_ids.items()}
+    taken = {tc.get('id') for tc in plan.kept_tests}
+    numbers = [_test_num(i) for i in taken | {i for ids in reusable.values() for i in ids}]
+    next_num = max([n for n in numbers if n is not None] + [0])
+
+    attribution = attribute_tests(new_tests, criteria, known)
+    merged = list(plan.kept_tests)
+    for tc in new_tests:
+        ac_index = attribution.get(tc.get('id'))
+        pool = reusable.get(ac_index, [])
+        while pool and pool[0] in taken:
+            pool.pop(0)
+        if pool:
+            test_id = pool.pop(0)
+        else:
+            next_num += increment - next_num % increment if increment > 0 else 1
+            test_id = f"{story_id}-{next_num:03d}"
+        taken.add(test_id)
+        plan.attribution[test_id] = ac_index
+        merged.append(GenericTestGenerator._assign_test_id(tc, test_id))
+    # Same order as a full run: the first (non-numeric) ID, then by number
+    merged.sort(key=lambda tc: (_test_num(tc.get('id', '')) is not None, _test_num(tc.get('id', '')) or 0))
+    return merged
+
+
+def _strip_id(test_case: Dict) -> str:
+    """Test text without its ID prefix (for duplicate checks)."""
+    title = test_case.get('title', '')
+    test_id = test_case.get('id', '')
+    if test_id and title.startswith(test_id):
+        title = title[len(test_id):].lstrip(': ')
+    return _test_text(dict(test_case, title=title))
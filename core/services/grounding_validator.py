@@ -5,9 +5,9 @@ This module prevents the generator from inventing context by validating
 that all test elements (entry points, scenarios, assertions) are supported
 by evidence from AC or QA Prep.
 """
-from typing import List, Dict, Tuple, Set
+from typing import List, Dict, Optional, Tuple, Set
 from core.domain.grounded_spec import GroundedSpec
-from core.config import environment as config
+from core.services.test_rules import TestRules
 
 
 class GroundingValidator:
@@ -21,8 +21,17 @@ class GroundingValidator:
     4. Steps don't include forbidden words
     """
 
-    def __init__(self, grounded_spec: GroundedSpec):
+    def __init__(self, grounded_spec: GroundedSpec, forbidden_words: Optional[List[str]] = None):
+        """
+        Args:
+            grounded_spec: Evidence extracted from the story, AC and QA Prep
+            forbidden_words: Words steps and objectives must not contain
+                (defaults to TestRules.DEFAULT_FORBIDDEN_WORDS)
+        """
         self.grounded_spec = grounded_spec
+        self.forbidden_words = list(
+            TestRules.DEFAULT_FORBIDDEN_WORDS if forbidden_words is None else forbidden_words
+        )
 
     def validate_test_cases(self, test_cases: List[Dict]) -> Tuple[bool, List[str]]:
         """
@@ -150,7 +159,7 @@ class GroundingValidator:
 
         # Check forbidden words
         objective_lower = objective.lower()
-        for forbidden in config.FORBIDDEN_WORDS:
+        for forbidden in self.forbidden_words:
             if forbidden.lower() in objective_lower:
                 errors.append(
                     f"{tc_id}: Objective contains forbidden word: '{forbidden}'"
@@ -193,7 +202,7 @@ class GroundingValidator:
         """Check for forbidden words in step."""
         errors = []
 
-        for forbidden in config.FORBIDDEN_WORDS:
+        for forbidden in self.forbidden_words:
             if forbidden.lower() in action.lower():
                 errors.append(
                     f"{tc_id}: Step {step_idx} action contains forbidden word: '{forbidden}'"
@@ -0,0 +1,325 @@
+"""
+Heuristic Rule Tables for GenericTestGenerator
+
+Declarative, precompiled replacements for the inline regex/keyword
+heuristics used while deriving tests from acceptance criteria.
+
+Each RuleTable is an ordered list of rules where the first matching rule
+wins. Patterns are compiled once at import. Rules that are plain keywords
+(or keyword alternations) are decided by substring checks, and regex rules
+are only run when the literal words they require occur in the text, so a
+table is decided in one cheap pass per AC instead of a loop of re.search
+calls. RuleEngine evaluates tables and extractors and records a RuleTrace
+of which rule fired and how long rule evaluation took.
+"""
+import hashlib
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Pattern, Sequence, Tuple
+
+# Characters that make a pattern fragment more than a literal
+_REGEX_META = set('\\.^$*+?{}[]()|')
+
+
+@dataclass(frozen=True)
+class HeuristicRule:
+    """A single heuristic: regex pattern plus the result it selects."""
+    name: str
+    pattern: str
+    result: str = ""
+
+
+# (table name, fired rule name or None, evaluated text)
+RuleFiring = Tuple[str, Optional[str], str]
+
+
+@dataclass
+class RuleTrace:
+    """Which rules fired and how long rule evaluation took."""
+    firings: List[RuleFiring] = field(default_factory=list)
+    evaluations: int = 0
+    elapsed_seconds: float = 0.0
+
+    def record(self, table: str, rule: Optional[str], text: str, elapsed: float) -> None:
+        self.firings.append((table, rule, text))
+        self.evaluations += 1
+        self.elapsed_seconds += elapsed
+
+    @property
+    def fired_count(self) -> int:
+        """Number of evaluations where a rule matched."""
+        return sum(1 for _, rule, _ in self.firings if rule is not None)
+
+    def counts(self) -> Dict[str, int]:
+        """Fire counts keyed by 'table.rule' (misses are not counted)."""
+        counts: Dict[str, int] = {}
+        for table, rule, _ in self.firings:
+            if rule is not None:
+                key = f"{table}.{rule}"
+                counts[key] = counts.get(key, 0) + 1
+        return counts
+
+    def summary(self) -> str:
+        """One-line human readable summary."""
+        return (
+            f"{self.evaluations} rule evaluations, {self.fired_count} fired "
+            f"in {self.elapsed_seconds * 1000:.2f} ms"
+        )
+
+
+def _is_literal(fragment: str) -> bool:
+    return bool(fragment) and not any(ch in _REGEX_META for ch in fragment)
+
+
+class RuleTable:
+    """Ordered first-match rule table.
+
+    Equivalent to:
+        for rule in rules:
+            if re.search(rule.pattern, text, flags):
+                return rule
+
+    Keyword prefilters are only used for case-sensitive tables; with
+    IGNORECASE every rule runs its compiled regex.
+    """
+
+    def __init__(self, name: str, rules: Sequence[HeuristicRule], flags: int = 0):
+        """Compile the table.
+
+        Args:
+            name: Table name (used in traces)
+            rules: Rules in priority order
+            flags: re flags applied to every rule
+        """
+        self.name = name
+        self.rules: Tuple[HeuristicRule, ...] = tuple(rules)
+        # Per rule: (any-of keywords, required keywords, compiled regex or None)
+        self._checks: List[Tuple[Tuple[str, ...], Tuple[str, ...], Optional[Pattern]]] = []
+        ignore_case = bool(flags & re.IGNORECASE)
+        for rule in self.rules:
+            terms = rule.pattern.split('|')
+            parts = rule.pattern.split('.*')
+            if ignore_case:
+                self._checks.append(((), (), re.compile(rule.pattern, flags)))
+            elif all(_is_literal(t) for t in terms):
+                # "a|b|c": plain substring alternation, no regex needed
+                self._checks.append((tuple(terms), (), None))
+            elif all(_is_literal(p) for p in parts):
+                # "a.*b": both words must be present before ordering is checked
+                self._checks.append(((), tuple(parts), re.compile(rule.pattern, flags)))
+            else:
+                self._checks.append(((), (), re.compile(rule.pattern, flags)))
+
+    def first(self, text: str) -> Optional[HeuristicRule]:
+        """Return the first rule (in table order) whose pattern occurs in text."""
+        for rule, (any_of, required, pattern) in zip(self.rules, self._checks):
+            if pattern is None:
+                for term in any_of:
+                    if term in text:
+                        return rule
+                continue
+            for word in required:
+                if word not in text:
+                    break
+            else:
+                if pattern.search(text):
+                    return rule
+        return None
+
+
+def _rules(*entries: Tuple[str, str, str]) -> List[HeuristicRule]:
+    return [HeuristicRule(name, pattern, result) for name, pattern, result in entries]
+
+
+def _keywords(*entries: Tuple[str, str]) -> List[HeuristicRule]:
+    """Rules that test for a literal substring (result templates use {feature})."""
+    return [HeuristicRule(keyword, re.escape(keyword), result) for keyword, result in entries]
+
+
+# =============================================================================
+# STORY-LEVEL DETECTION (generate_test_cases, run on lowered description + ACs)
+# =============================================================================
+
+PROPERTIES_PANEL_ENTRY = RuleTable('properties_panel_entry', _rules(
+    ('controlled_via_panel',
+     r'(?:controlled?|access(?:ed|ible)?|available|configur(?:ed?|able)|manag(?:ed?|able)|set|adjust(?:ed|able)?)\s+(?:via|through|from|in|using)\s+(?:the\s+)?properties\s*panel',
+     'Properties Panel'),
+    ('panel_controls',
+     r'properties\s*panel\s+(?:controls?|provides?|allows?|contains?|displays?|shows?)',
+     'Properties Panel'),
+), re.IGNORECASE)
+
+NO_SELECTION_EDGE_CASE = RuleTable('no_selection_edge_case', _rules(
+    ('enabled_only_when_selected', r'enabled\s+only\s+when.*(?:object|item|element).*selected', 'no_selection'),
+    ('disabled_when_none_selected', r'disabled\s+when\s+no.*selected', 'no_selection'),
+    ('requires_selection', r'requires?\s+(?:a|an|at least one)\s+(?:object|selection)', 'no_selection'),
+    ('only_available_when_selected', r'only\s+(?:available|enabled|active)\s+(?:when|if).*selected', 'no_selection'),
+    ('at_least_one_selected', r'at\s+least\s+one\s+object\s+(?:is\s+)?selected', 'no_selection'),
+), re.IGNORECASE)
+
+UNDO_REDO_EDGE_CASE = RuleTable('undo_redo_edge_case', _rules(
+    ('undo_redo', r'\bundo\b.*\bredo\b|\bredo\b.*\bundo\b|\bundo/redo\b', 'transformation'),
+), re.IGNORECASE)
+
+# =============================================================================
+# SCENARIO TITLES (_extract_scenario_from_ac, run on lowered AC text)
+# Order matters: more specific patterns first
+# =============================================================================
+
+SCENARIO_TITLES = RuleTable('scenario_title', _rules(
+    ('horizontally_flip', 'horizontally flip', 'Horizontal flip (mirror) transformation'),
+    ('vertically_flip', 'vertically flip', 'Vertical flip (mirror) transformation'),
+    ('horizontal', 'horizontal', 'Horizontal mirror transformation'),
+    ('vertical', 'vertical', 'Vertical mirror transformation'),
+    ('mirror_horizontal', 'mirror.*horizontal', 'Horizontal mirror transformation'),
+    ('mirror_vertical', 'mirror.*vertical', 'Vertical mirror transformation'),
+    ('rotate_object', 'rotate.*object', 'Rotate selected objects'),
+    ('multi_select', 'multi.*select', 'Multi-selection transformation'),
+    ('undo_redo', 'undo.*redo', 'Undo and redo support'),
+    ('undo', 'undo', 'Undo action support'),
+    ('redo', 'redo', 'Redo action support'),
+    ('enabled_when_select', 'enabled.*when.*select', 'Commands enabled on selection'),
+    ('enabled', 'enabled', 'Command enabled state'),
+    ('disabled', 'disabled', 'Command disabled state'),
+    ('properties_panel_available', 'properties panel.*available', 'Properties Panel commands'),
+    ('properties_panel_sync', 'properties panel.*synchron', 'Menu and Properties Panel sync'),
+    ('properties_panel', 'properties panel', 'Properties Panel availability'),
+    ('synchron', 'synchron', 'Menu and Properties Panel sync'),
+    ('preserve_position', 'preserve.*position', 'Position preservation on transform'),
+    ('preserve', 'preserve', 'Property preservation on transform'),
+    ('update_canvas', 'update.*canvas', 'Immediate canvas update'),
+    ('canvas_immediate', 'canvas.*immediate', 'Immediate canvas update'),
+    ('canvas', 'canvas', 'Canvas update behavior'),
+    ('color_border_stroke', 'color.*border.*stroke', 'Visual property preservation'),
+    ('not_modify_color', 'not.*modify.*color', 'Visual property preservation'),
+    ('color', 'color', 'Color preservation on transform'),
+    ('border', 'border', 'Border preservation on transform'),
+    ('available_tools', 'available.*tools', 'Tools menu commands available'),
+    ('available_menu', 'available.*menu', 'Menu commands available'),
+    ('available', 'available', 'Command availability'),
+    ('transform_together', 'transform.*together', 'Group transformation behavior'),
+    ('transform', 'transform', 'Transformation behavior'),
+    ('rotate', 'rotate', 'Rotate transformation'),
+    ('mirror', 'mirror', 'Mirror transformation'),
+    ('flip', 'flip', 'Flip transformation'),
+    ('select', 'select', 'Selection behavior'),
+))
+
+# =============================================================================
+# STEP DERIVATION BRANCH (_derive_specific_steps_from_ac, run on lowered AC)
+# =============================================================================
+
+STEP_BRANCHES = RuleTable('step_branch', _rules(
+    ('dialog_open', 'open', 'dialog_open'),
+    ('default_value', 'default', 'default_value'),
+    ('field_availability', 'field|available|include', 'field_availability'),
+    ('setting_dependency', r'follow[\s\S]*setting|setting[\s\S]*follow', 'setting_dependency'),
+    ('recent_items', 'recent', 'recent_items'),
+    ('create_action', 'create|initialize', 'create_action'),
+    ('close_cancel', 'close|cancel|exit', 'close_cancel'),
+    ('accessibility', 'accessibility|wcag|508', 'accessibility'),
+))
+
+# =============================================================================
+# EXPECTED RESULTS (_extract_verification, run on lowered AC text)
+# Results are templates formatted with feature=<feature name>
+# =============================================================================
+
+HELP_OUTCOMES = RuleTable('help_outcome', _keywords(
+    ('open', '{feature} viewer opens'),
+    ('display', '{feature} content is displayed'),
+    ('appear', '{feature} is visible in the menu'),
+    ('viewer', 'In-app viewer displays content correctly'),
+    ('offline', 'Content is accessible without internet connection'),
+    ('browser', 'No external browser is launched'),
+    ('remain', 'QuickDraw application remains open behind the viewer'),
+    ('close', '{feature} viewer closes'),
+))
+
+ACTION_OUTCOMES = RuleTable('action_outcome', _keywords(
+    ('display', '{feature} is displayed'),
+    ('show', '{feature} is visible'),
+    ('hide', '{feature} is hidden'),
+    ('enable', '{feature} is enabled'),
+    ('disable', '{feature} is disabled'),
+    ('rotate', 'Selected object is rotated'),
+    ('mirror', 'Selected object is mirrored'),
+    ('flip', 'Selected object is flipped'),
+    ('transform', 'Object transformation is applied'),
+    ('open', '{feature} dialog opens'),
+    ('close', '{feature} closes'),
+    ('save', 'Changes are saved'),
+    ('update', '{feature} is updated'),
+    ('select', 'Object is selected'),
+    ('apply', '{feature} is applied to the selection'),
+) + _rules(
+    # Visibility / state-change indicators checked after the action words
+    ('visibility', 'displayed|shown|visible|appears', '{feature} is displayed'),
+    ('state_disabled', 'disabled|inactive', '{feature} is disabled'),
+    ('state_enabled', 'enabled|active', '{feature} is enabled'),
+))
+
+# =============================================================================
+# EXTRACTORS (single patterns whose groups are used)
+# =============================================================================
+
+EXTRACTORS: Dict[str, Pattern] = {
+    'menu_name': re.compile(r'(file|edit|view|tools?|insert|help)\s*(?:→|->|menu)?'),
+    'selected_command': re.compile(r'(?:select|click|choose)\s+["\']?(\w+)["\']?'),
+    'default_value': re.compile(r'default(?:\s+preset)?\s*=\s*["\']?([^"\'\.]+)', re.IGNORECASE),
+    'field_list': re.compile(r'fields?\s*(?:available|include)?:?\s*([^\.]+)', re.IGNORECASE),
+    'setting_name': re.compile(r'follow(?:s)?\s+(?:the\s+)?(?:current\s+)?(\w+(?:\s+\w+)?)\s+setting'),
+    'scenario_verb': re.compile(
+        r'\b(rotate|mirror|flip|transform|update|preserve|synchronize|enable|disable|select|display|show|hide|apply)\w*\b'
+    ),
+}
+
+# Plain text transforms (not traced)
+FIELD_SEPARATOR = re.compile(r'[,;]')
+PARENTHETICAL = re.compile(r'\([^)]+\)')
+LEADING_FILLER_WORD = re.compile(r'^(the|a|an|and|or|but|if|when|then)\s+', re.IGNORECASE)
+
+
+def rules_fingerprint() -> str:
+    """Hash of every rule table and extractor (changes when the heuristics do)."""
+    tables = sorted(
+        (value.name, [(rule.name, rule.pattern, rule.result) for rule in value.rules])
+        for value in globals().values() if isinstance(value, RuleTable)
+    )
+    extractors = sorted((name, pattern.pattern, pattern.flags) for name, pattern in EXTRACTORS.items())
+    return hashlib.sha256(repr((tables, extractors)).encode('utf-8')).hexdigest()[:16]
+
+
+class RuleEngine:
+    """Evaluates rule tables and extractors, recording a RuleTrace.
+
+    Usage:
+        engine = RuleEngine()
+        rule = engine.first(SCENARIO_TITLES, "user can rotate the object")
+        print(rule.result)              # "Rotate selected objects"
+        print(engine.trace.summary())   # "1 rule evaluations, 1 fired in 0.01 ms"
+    """
+
+    def __init__(self, extractors: Optional[Dict[str, Pattern]] = None):
+        self._extractors = extractors if extractors is not None else EXTRACTORS
+        self.trace = RuleTrace()
+
+    def reset_trace(self) -> RuleTrace:
+        """Start a new trace, returning the previous one."""
+        previous, self.trace = self.trace, RuleTrace()
+        return previous
+
+    def first(self, table: RuleTable, text: str) -> Optional[HeuristicRule]:
+        """Return the first matching rule of table for text."""
+        start = time.perf_counter()
+        rule = table.first(text)
+        self.trace.record(table.name, rule.name if rule else None, text, time.perf_counter() - start)
+        return rule
+
+    def search(self, extractor: str, text: str) -> Optional[re.Match]:
+        """Run a named extractor pattern (re.search semantics)."""
+        start = time.perf_counter()
+        match = self._extractors[extractor].search(text)
+        self.trace.record(extractor, extractor if match else None, text, time.perf_counter() - start)
+        return match
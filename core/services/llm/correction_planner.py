@@ -0,0 +1,192 @@
+"""
+Adaptive Correction Planner - decides what the LLM corrector needs to see.
+
+Scores every rule-engine test with the quality analyzer, TestCaseValidator
+and GroundingValidator, and checks which ACs no test covers. Only tests
+below the quality threshold or with validation errors are sent to the
+LLM; passing tests are kept as-is. When every test passes, every AC is
+covered and the suite meets the corrector's minimum test count the LLM
+call is skipped entirely. The tokens (and the estimated
+time and cost) not sent to the LLM are reported.
+"""
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from core.services.metrics.cost_calculator import CostCalculator
+from core.services.quality import get_quality_analyzer
+from core.services.test_validator import TestCaseValidator
+from core.services.grounding_validator import GroundingValidator
+from core.services.story_context_cache import build_grounded_spec
+
+# Rough token estimate for JSON test cases (same heuristic as the providers)
+CHARS_PER_TOKEN = 4
+
+# Nominal LLM output speed used to estimate time saved by skipped tests
+OUTPUT_TOKENS_PER_SECOND = 50.0
+
+
+def estimate_tokens(test_cases: List[Dict]) -> int:
+    """Approximate token count of test cases serialized for a prompt."""
+    if not test_cases:
+        return 0
+    return len(json.dumps({"test_cases": test_cases}, indent=2)) // CHARS_PER_TOKEN
+
+
+@dataclass
+class TestAssessment:
+    """Quality gate results for one test case."""
+    test_id: str
+    quality_score: float
+    errors: List[str] = field(default_factory=list)
+    passed: bool = False
+
+
+@dataclass
+class CorrectionPlan:
+    """Which tests (and ACs) need LLM correction."""
+    passing: List[Dict] = field(default_factory=list)
+    failing: List[Dict] = field(default_factory=list)
+    uncovered_acs: List[int] = field(default_factory=list)  # 1-based
+    minimum_tests: int = 0
+    assessments: List[TestAssessment] = field(default_factory=list)
+    tokens_saved: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def skip_llm(self) -> bool:
+        """True when no test fails the gates, every AC is covered and there are enough tests."""
+        return (
+            not self.failing and not self.uncovered_acs
+            and len(self.passing) >= self.minimum_tests
+        )
+
+    @property
+    def seconds_saved(self) -> float:
+        """Estimated LLM time saved (skipped tests are not regenerated)."""
+        return self.tokens_saved / OUTPUT_TOKENS_PER_SECOND
+
+    def cost_saved(self, model: str) -> float:
+        """Estimated USD saved (skipped tests are neither sent nor returned)."""
+        return CostCalculator.calculate_cost(model, self.tokens_saved, self.tokens_saved)
+
+    def summary(self) -> str:
+        """One-line report for the console."""
+        return (
+            f"{len(self.failing)} of {len(self.failing) + len(self.passing)} test(s) below quality gates, "
+            f"{len(self.uncovered_acs)} uncovered AC(s), minimum {self.minimum_tests} test(s); "
+            f"~{self.tokens_saved} tokens and ~{self.seconds_saved:.0f}s saved "
+            f"(planned in {self.elapsed_seconds * 1000:.1f} ms)"
+        )
+
+
+class _RulesValidationConfig:
+    """IValidationConfig view of a project config."""
+
+    def __init__(self, project_config):
+        self.forbidden_words = list(project_config.rules.forbidden_words)
+        self.prereq_pattern = "Pre-req"
+        self.close_pattern = "Close"
+
+
+class CorrectionPlanner:
+    """Splits a suite into tests that pass the quality gates and tests the LLM should fix.
+
+    Usage:
+        planner = CorrectionPlanner(project_config, corrector)
+        plan = planner.plan(test_cases, acceptance_criteria, story_data, qa_prep)
+        if not plan.skip_llm:
+            corrector.correct_test_cases(plan.failing, ..., passing_tests=plan.passing)
+    """
+
+    def __init__(
+        self,
+        project_config,
+        corrector=None,
+        quality_threshold: Optional[float] = None
+    ):
+        """Initialize planner.
+
+        Args:
+            project_config: ProjectConfig (validation rules, threshold)
+            corrector: LLMCorrector used for AC coverage mapping and the
+                minimum test count (None skips both checks)
+            quality_threshold: Minimum quality score (defaults to the
+                project's correction_quality_threshold)
+        """
+        self._corrector = corrector
+        self.quality_threshold = (
+            quality_threshold if quality_threshold is not None
+            else project_config.correction_quality_threshold
+        )
+        self._analyzer = get_quality_analyzer()
+        self._forbidden_words = list(project_config.rules.forbidden_words)
+        self._validator = TestCaseValidator(_RulesValidationConfig(project_config))
+
+    def plan(
+        self,
+        test_cases: List[Dict],
+        acceptance_criteria: List[str],
+        story_data: Optional[Dict] = None,
+        qa_prep: Optional[str] = None
+    ) -> CorrectionPlan:
+        """Assess every test and find uncovered ACs.
+
+        Args:
+            test_cases: Rule-engine test cases
+            acceptance_criteria: AC bullets
+            story_data: Story (story_id, title, description) for grounding
+            qa_prep: QA Prep content for grounding
+
+        Returns:
+            CorrectionPlan
+        """
+        start = time.perf_counter()
+        grounding = self._grounding_validator(story_data, acceptance_criteria, qa_prep, self._forbidden_words)
+
+        plan = CorrectionPlan()
+        for idx, tc in enumerate(test_cases):
+            assessment = TestAssessment(
+                test_id=tc.get('id', f'TC-{idx}'),
+                quality_score=self._analyzer.analyze_test_case(tc).overall_score
+            )
+            assessment.errors.extend(self._validator.validate_single(tc, idx).errors)
+            if grounding is not None:
+                assessment.errors.extend(grounding.validate_test_cases([tc])[1])
+            assessment.passed = (
+                assessment.quality_score >= self.quality_threshold and not assessment.errors
+            )
+            plan.assessments.append(assessment)
+            (plan.passing if assessment.passed else plan.failing).append(tc)
+
+        if self._corrector is not None:
+            coverage = self._corrector.map_acs_to_tests(test_cases, acceptance_criteria)
+            plan.uncovered_acs = [ac_idx for ac_idx, ids in coverage.items() if not ids]
+            plan.minimum_tests = self._corrector.minimum_test_count(
+                acceptance_criteria, (story_data or {}).get('title')
+            )
+
+        plan.tokens_saved = estimate_tokens(plan.passing)
+        plan.elapsed_seconds = time.perf_counter() - start
+        return plan
+
+    @staticmethod
+    def _grounding_validator(
+        story_data: Optional[Dict],
+        acceptance_criteria: List[str],
+        qa_prep: Optional[str],
+        forbidden_words: List[str]
+    ) -> Optional[GroundingValidator]:
+        if not story_data:
+            return None
+        spec = build_grounded_spec(
+            {
+                'story_id': story_data.get('story_id'),
+                'title': story_data.get('title', ''),
+                'description_text': story_data.get('description', ''),
+            },
+            acceptance_criteria,
+            qa_prep
+        )
+        return GroundingValidator(spec, forbidden_words)
@@ -33,7 +33,9 @@ import os
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
 
 from dotenv import load_dotenv
 load_dotenv()
@@ -44,6 +46,8 @@ sys.path.insert(0, str(Path(__file__).parent))
 from infrastructure.repository_factory import get_story_repository, get_test_repositories
 from infrastructure.export import CSVGenerator, ObjectiveGenerator
 from core.services import GenericTestGenerator
+from core.services.near_duplicates import NearDuplicateDetector
+from core.services.coverage_index import CoverageIndex, SCORING_MODES, searchable_text
 from projects import get_project_manager
 from core.config import environment as config
 
@@ -97,6 +101,13 @@ META_AC_PATTERNS = [
     r'follow.*specifications',
 ]
 
+# Minimum cosine similarity for a test to cover an AC in the similarity
+# scoring modes (keyword mode uses the share of AC keywords instead)
+COVERAGE_SCORE_THRESHOLDS = {
+    'tfidf': 0.2,
+    'embedding': 0.5,
+}
+
 
 def find_existing_test_files(story_id: int, output_dir: str = "output") -> Dict[str, str]:
     """
@@ -188,31 +199,24 @@ def upload_tests_to_platform(
 
         print(f"  Found test suite: {suite['name']} (ID: {suite['id']})")
 
-        # Upload each test case
-        created_count = 0
+        # Create all test cases in bulk, then add them to the suite in one call
         plan_id = suite.get('plan_id', 0)
         suite_id = suite['id']
 
-        for tc in test_cases:
-            title = tc.get('title', '')
-            steps = tc.get('steps', [])
-            objective = tc.get('objective', '')
-
-            # Create test case using repository (platform-agnostic)
-            tc_id = case_repo.create_test_case(
-                title=title,
-                steps=steps,
-                objective=objective,
-                section_id=suite_id
-            )
+        created = case_repo.create_test_cases(test_cases, section_id=suite_id)
+        work_item_ids = [item['id'] for item in created if item['id']]
+        in_suite = set(suite_repo.add_test_cases_to_suite(plan_id, suite_id, work_item_ids))
 
-            if tc_id:
-                # Add to test suite
-                suite_repo.add_test_case_to_suite(plan_id, suite_id, tc_id)
+        created_count = 0
+        for tc, item in zip(test_cases, created):
+            title = tc.get('title', '')
+            if item['id']:
+                if item['id'] not in in_suite:
+                    print(f"  Warning: {title[:60]}... (ID: {item['id']}) not added to suite")
                 created_count += 1
-                print(f"  Created: {title[:60]}... (ID: {tc_id})")
+                print(f"  Created: {title[:60]}... (ID: {item['id']})")
             else:
-                print(f"  Failed: {title[:60]}...")
+                print(f"  Failed: {title[:60]}... ({item.get('error') or 'Failed to create'})")
 
         print(f"\nUpload complete: {created_count}/{len(test_cases)} test cases created")
 
@@ -244,7 +248,8 @@ class LLMCorrector:
         model: str = "gpt-4o-mini",
         app_config=None,
         project_config=None,  # Full project config for dynamic prompts
-        provider_type: Optional[str] = None  # Override provider type
+        provider_type: Optional[str] = None,  # Override provider type
+        coverage_scoring: Optional[str] = None  # AC coverage mode: keyword, tfidf, embedding
     ):
         # Determine provider from project_config, explicit param, or env
         self._provider_type = (
@@ -259,6 +264,21 @@ class LLMCorrector:
         self._app_config = app_config
         self._project_config = project_config
 
+        # AC-to-test coverage scoring (see coverage_index)
+        self._coverage_scoring = (coverage_scoring or os.getenv("AC_COVERAGE_SCORING", "keyword")).lower()
+        if self._coverage_scoring not in SCORING_MODES:
+            raise ValueError(f"Unknown AC coverage scoring mode: {self._coverage_scoring}")
+        self._coverage_embedder = None
+        if self._coverage_scoring == "embedding":
+            from core.services.embeddings.providers.provider_factory import create_embedding_provider
+            embedder = create_embedding_provider()
+            if embedder is not None and embedder.is_available():
+                self._coverage_embedder = embedder
+            else:
+                # Embedding thresholds don't apply to keyword-overlap scores
+                print("  Warning: no embedding provider available, AC coverage falls back to keyword scoring")
+                self._coverage_scoring = "keyword"
+
         # Default step templates (can be overridden by app_config or project_config)
         self._app_name = "Application"
         self._prereq = "Pre-req: The application is installed"
@@ -312,6 +332,27 @@ class LLMCorrector:
             return provider.client if provider else None
         return self.provider
 
+    def post_process(
+        self,
+        test_cases: List[Dict],
+        story_id: str,
+        feature_name: str,
+        acceptance_criteria: List[str]
+    ) -> List[Dict]:
+        """
+        Apply the deterministic clean-up without calling the LLM.
+
+        Normalizes titles and step numbering, adds missing accessibility
+        tests and removes duplicates, as correct_test_cases does after the
+        LLM call. Used when the correction planner skips the LLM because
+        every test passes the gates.
+        """
+        self._current_feature_name = feature_name
+        self._current_acceptance_criteria = acceptance_criteria
+        test_cases = self._post_process_corrections(test_cases, story_id)
+        test_cases = self._ensure_accessibility_tests(test_cases, story_id, feature_name)
+        return self._remove_duplicate_tests(test_cases, story_id)
+
     def correct_test_cases(
         self,
         test_cases: List[Dict],
@@ -320,7 +361,8 @@ class LLMCorrector:
         acceptance_criteria: List[str],
         qa_prep: str,
         reference_steps: Optional[List[Dict]] = None,
-        story_description: str = ""
+        story_description: str = "",
+        passing_tests: Optional[List[Dict]] = None
     ) -> List[Dict]:
         """
         Send test cases to LLM for correction and enhancement.
@@ -330,15 +372,22 @@ class LLMCorrector:
 
         Supports multiple LLM providers (OpenAI, Gemini, Anthropic, Ollama)
         via the factory pattern.
+
+        passing_tests (from CorrectionPlanner) are not sent to the LLM; they
+        are merged back in original order before post-processing, dedup and
+        AC coverage checks. With no test_cases to correct, only the
+        gap-filling path calls the LLM.
         """
+        passing_tests = passing_tests or []
         if not self.provider:
             print(f"  Warning: LLM provider ({self._provider_type}) not available, skipping correction")
             # Still apply post-processing even without LLM
+            test_cases = self._merge_passing_tests(passing_tests, test_cases)
             test_cases = self._post_process_corrections(test_cases, story_id)
             test_cases = self._ensure_accessibility_tests(test_cases, story_id, feature_name)
             return test_cases
 
-        # Store for use in _get_minimum_test_count and _ensure_accessibility_tests
+        # Store for use in minimum_test_count and _ensure_accessibility_tests
         self._current_feature_name = feature_name
         self._current_acceptance_criteria = acceptance_criteria
 
@@ -389,9 +438,10 @@ class LLMCorrector:
             print(f"  Using fallback prompts for {self._app_name}")
 
         try:
-            result = self._call_llm(system_prompt, user_prompt)
+            result = self._call_llm(system_prompt, user_prompt) if test_cases else {}
 
             corrected = result.get("test_cases", test_cases)
+            corrected = self._merge_passing_tests(passing_tests, corrected)
 
             # Post-process to ensure correct structure
             corrected = self._post_process_corrections(corrected, story_id)
@@ -411,7 +461,7 @@ class LLMCorrector:
             corrected = self._remove_duplicate_tests(corrected, story_id)
 
             # Enforce minimum test count — retry if under minimum
-            min_tests = self._get_minimum_test_count(acceptance_criteria)
+            min_tests = self.minimum_test_count(acceptance_criteria)
             if len(corrected) < min_tests:
                 print(f"  Warning: {len(corrected)} tests < minimum {min_tests}, retrying for more coverage...")
                 corrected = self._retry_for_minimum_count(
@@ -428,6 +478,7 @@ class LLMCorrector:
         except Exception as e:
             print(f"  Warning: LLM correction failed: {e}")
             # Still apply post-processing and accessibility checks even without LLM
+            test_cases = self._merge_passing_tests(passing_tests, test_cases)
             test_cases = self._post_process_corrections(test_cases, story_id)
             test_cases = self._ensure_accessibility_tests(test_cases, story_id, feature_name)
             # Still check AC coverage (will attempt LLM gap-fill if provider available)
@@ -486,7 +537,7 @@ class LLMCorrector:
 
         raise RuntimeError(f"Provider {self._provider_type} does not support JSON generation")
 
-    def _get_minimum_test_count(self, acceptance_criteria: List[str]) -> int:
+    def minimum_test_count(self, acceptance_criteria: List[str], feature_name: Optional[str] = None) -> int:
         """Calculate the minimum required test count based on story complexity."""
         try:
             from .prompt_builder import (
@@ -516,7 +567,7 @@ class LLMCorrector:
                 platform_count = len(all_platforms) if all_platforms else 1
 
             # Detect feature types
-            feature_name = getattr(self, '_current_feature_name', 'Feature')
+            feature_name = feature_name or getattr(self, '_current_feature_name', 'Feature')
             feature_types = detect_feature_types(feature_name, in_scope)
 
             # Extract complexity indicators
@@ -710,6 +761,24 @@ Return enhanced JSON: {{"test_cases": [...]}}'''
 
         return system_prompt, user_prompt
 
+    def _merge_passing_tests(self, passing_tests: List[Dict], corrected: List[Dict]) -> List[Dict]:
+        """Merge tests kept out of the LLM call back in, ordered by original ID."""
+        if not passing_tests:
+            return corrected
+
+        first_test_id = "AC1"
+        if self._project_config:
+            first_test_id = getattr(self._project_config.rules, 'first_test_id', 'AC1')
+
+        def order(tc: Dict) -> tuple:
+            suffix = tc.get('id', '').rsplit('-', 1)[-1]
+            if suffix == first_test_id:
+                return (0, 0)
+            return (1, int(suffix)) if suffix.isdigit() else (2, 0)
+
+        # Stable sort: on equal IDs the kept test comes first
+        return sorted(list(passing_tests) + list(corrected), key=order)
+
     def _renumber_test_ids(self, test_cases: List[Dict], story_id: str) -> List[Dict]:
         """
         Renumber test case IDs to ensure proper sequence.
@@ -859,43 +928,32 @@ Return enhanced JSON: {{"test_cases": [...]}}'''
     def _remove_duplicate_tests(self, test_cases: List[Dict], story_id: str) -> List[Dict]:
         """Remove test cases whose objectives overlap heavily with an earlier test.
 
-        Uses word-overlap on the objective field. AC1 and accessibility tests are
+        Uses word-overlap on the objective field (near-duplicate detector, so
+        large batches avoid all-pairs comparison). AC1 and accessibility tests are
         always kept. When a duplicate is detected, the earlier (lower-index) test
         wins and the later one is dropped.
         """
         if len(test_cases) <= 1:
             return test_cases
 
-        def _objective_words(tc: Dict) -> set:
-            obj = tc.get('objective', tc.get('title', '')).lower()
+        def _objective_words(text: str) -> set:
             # Strip common filler words for better comparison
             stop = {'a', 'an', 'the', 'is', 'are', 'of', 'to', 'and', 'or', 'in',
                     'on', 'that', 'for', 'by', 'it', 'its', 'with', 'can', 'be', 'not'}
-            return set(obj.split()) - stop
+            return set(text.lower().split()) - stop
 
-        keep: list[Dict] = []
-        removed = 0
-        for tc in test_cases:
-            tc_id = tc.get('id', '')
-            # Always keep AC1 and accessibility tests
-            if tc_id.endswith('-AC1') or 'accessibility' in tc.get('title', '').lower():
-                keep.append(tc)
-                continue
-
-            tc_words = _objective_words(tc)
-            is_dup = False
-            for existing in keep:
-                existing_words = _objective_words(existing)
-                if not tc_words or not existing_words:
-                    continue
-                overlap = len(tc_words & existing_words) / len(tc_words | existing_words)
-                if overlap > 0.75:
-                    is_dup = True
-                    break
-            if is_dup:
-                removed += 1
-            else:
-                keep.append(tc)
+        # Always keep AC1 and accessibility tests
+        always_keep = {
+            idx for idx, tc in enumerate(test_cases)
+            if tc.get('id', '').endswith('-AC1') or 'accessibility' in tc.get('title', '').lower()
+        }
+        detector = NearDuplicateDetector(threshold=0.75, tokenizer=_objective_words, inclusive=False)
+        dropped = detector.duplicates_of_earlier(
+            [tc.get('objective', tc.get('title', '')) for tc in test_cases],
+            always_keep=always_keep
+        )
+        keep: list[Dict] = [tc for idx, tc in enumerate(test_cases) if idx not in dropped]
+        removed = len(dropped)
 
         if removed:
             print(f"  Removed {removed} duplicate test(s)")
@@ -1007,7 +1065,7 @@ Return enhanced JSON: {{"test_cases": [...]}}'''
         ac_lower = ac_text.lower()
         return any(_re.search(p, ac_lower) for p in META_AC_PATTERNS)
 
-    def _map_acs_to_tests(
+    def map_acs_to_tests(
         self,
         test_cases: List[Dict],
         acceptance_criteria: List[str]
@@ -1016,30 +1074,9 @@ Return enhanced JSON: {{"test_cases": [...]}}'''
         Map each in-scope AC to test case IDs that cover it.
         Returns {ac_index (1-based): [test_ids]}. Empty list = uncovered.
         """
-        import re as _re
-
-        try:
-            from .prompt_builder import clean_acceptance_criteria, split_scope
-            cleaned = clean_acceptance_criteria(acceptance_criteria)
-            in_scope, _ = split_scope(cleaned)
-        except ImportError:
-            in_scope = acceptance_criteria
-
-        # Pre-build searchable text blob for each test case (once, reused per AC)
-        tc_blobs = []
-        for tc in test_cases:
-            title = tc.get('title', '').lower()
-            objective = tc.get('objective', '').lower()
-            step_actions = ' '.join(
-                s.get('action', '').lower() for s in tc.get('steps', [])
-            )
-            step_expected = ' '.join(
-                s.get('expected', '').lower() for s in tc.get('steps', [])
-            )
-            tc_blobs.append(f"{title} {objective} {step_actions} {step_expected}")
+        in_scope, scores = self._score_ac_coverage(test_cases, acceptance_criteria)
 
         coverage_map = {}
-
         for ac_idx, ac in enumerate(in_scope, 1):
             keywords = self._extract_ac_keywords(ac)
             if not keywords:
@@ -1047,21 +1084,48 @@ Return enhanced JSON: {{"test_cases": [...]}}'''
                 coverage_map[ac_idx] = ['(no keywords)']
                 continue
 
-            matching_tests = []
-            min_hits = max(2, int(len(keywords) * 0.4))
-
-            for tc_i, blob in enumerate(tc_blobs):
-                hits = sum(
-                    1 for kw in keywords
-                    if _re.search(rf'\b{_re.escape(kw)}\b', blob)
-                )
-                if hits >= min_hits:
-                    matching_tests.append(test_cases[tc_i].get('id', f'TC-{tc_i}'))
+            if self._coverage_scoring == "keyword":
+                # At least 40% of the keywords (and no fewer than 2) must appear
+                threshold = max(2, int(len(keywords) * 0.4)) / len(keywords)
+            else:
+                threshold = COVERAGE_SCORE_THRESHOLDS[self._coverage_scoring]
 
-            coverage_map[ac_idx] = matching_tests
+            coverage_map[ac_idx] = [
+                test_cases[tc_i].get('id', f'TC-{tc_i}')
+                for tc_i in np.flatnonzero(scores[ac_idx - 1] >= threshold - 1e-6)
+            ]
 
         return coverage_map
 
+    def _score_ac_coverage(
+        self,
+        test_cases: List[Dict],
+        acceptance_criteria: List[str]
+    ) -> Tuple[List[str], np.ndarray]:
+        """
+        Score how well each in-scope AC is covered by each test case.
+
+        Returns (in-scope ACs, scores in [0, 1] of shape ACs x tests). In
+        keyword mode the score is the share of the AC's keywords the test
+        mentions; tfidf/embedding modes return cosine similarities.
+        """
+        try:
+            from .prompt_builder import clean_acceptance_criteria, split_scope
+            cleaned = clean_acceptance_criteria(acceptance_criteria)
+            in_scope, _ = split_scope(cleaned)
+        except ImportError:
+            in_scope = acceptance_criteria
+
+        # Index test case text once per round, reused for every AC
+        index = CoverageIndex([searchable_text(tc) for tc in test_cases])
+        keyword_sets = [self._extract_ac_keywords(ac) for ac in in_scope]
+
+        if self._coverage_scoring == "tfidf":
+            return in_scope, index.tfidf_scores(keyword_sets)
+        if self._coverage_scoring == "embedding":
+            return in_scope, index.embedding_scores(in_scope, self._coverage_embedder)
+        return in_scope, index.keyword_scores(keyword_sets)
+
     def _get_max_test_num(self, test_cases: List[Dict]) -> int:
         """Get the highest numeric test ID from existing test cases."""
         max_id = 0
@@ -1291,7 +1355,7 @@ Return JSON: {{"test_cases": [...]}}"""
             return test_cases
 
         # Map ACs to existing tests
-        coverage_map = self._map_acs_to_tests(test_cases, acceptance_criteria)
+        coverage_map = self.map_acs_to_tests(test_cases, acceptance_criteria)
 
         # Identify uncovered ACs (skip meta-ACs that are vague catch-all statements)
         uncovered = []
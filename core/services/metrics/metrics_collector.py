@@ -6,7 +6,6 @@ Collects, aggregates, and exports metrics for LLM usage and performance.
 import json
 import logging
 from collections import defaultdict
-from datetime import datetime
 from typing import Dict, List, Optional
 
 from core.interfaces.metrics import (
@@ -35,7 +34,10 @@ class MetricsCollector(IMetricsCollector):
         """
         self._generations: List[GenerationMetrics] = []
         self._cache_metrics: Dict[str, CacheMetrics] = {}
-        self._parsing_times: List[Dict] = []
+        # Parser -> running totals (count, duration, successes, confidence)
+        self._parsing_stats: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: {"count": 0, "duration_ms": 0.0, "successes": 0, "confidence": 0.0}
+        )
 
         # Track cache hits/misses by provider
         self._cache_hits = defaultdict(int)
@@ -78,25 +80,28 @@ class MetricsCollector(IMetricsCollector):
         parser: str,
         duration_ms: float,
         success: bool,
-        confidence: float = 1.0
+        confidence: float = 1.0,
+        log: bool = True
     ) -> None:
         """Record a parsing operation.
 
+        Only per-parser totals are kept, so memory does not grow with the
+        number of parses.
+
         Args:
             parser: Parser type used
             duration_ms: Duration in milliseconds
             success: Whether parsing succeeded
             confidence: Confidence score (0-1)
+            log: Also emit a structured log line
         """
-        self._parsing_times.append({
-            "parser": parser,
-            "duration_ms": duration_ms,
-            "success": success,
-            "confidence": confidence,
-            "timestamp": datetime.now().isoformat()
-        })
+        stats = self._parsing_stats[parser]
+        stats["count"] += 1
+        stats["duration_ms"] += duration_ms
+        stats["successes"] += 1 if success else 0
+        stats["confidence"] += confidence
 
-        if self._logger:
+        if self._logger and log:
             self._logger.log_parsing(
                 parser=parser,
                 duration_ms=duration_ms,
@@ -259,7 +264,7 @@ class MetricsCollector(IMetricsCollector):
         """Reset all collected metrics."""
         self._generations.clear()
         self._cache_metrics.clear()
-        self._parsing_times.clear()
+        self._parsing_stats.clear()
         self._cache_hits.clear()
         self._cache_misses.clear()
 
@@ -334,7 +339,7 @@ class MetricsCollector(IMetricsCollector):
                 for k, v in self._cache_metrics.items()
             },
             "parsing_metrics": {
-                "total_operations": len(self._parsing_times),
+                "total_operations": sum(int(s["count"]) for s in self._parsing_stats.values()),
                 "by_parser": self._aggregate_parsing_metrics()
             },
             "generations": [
@@ -372,35 +377,16 @@ class MetricsCollector(IMetricsCollector):
 
     def _aggregate_parsing_metrics(self) -> Dict[str, Dict]:
         """Aggregate parsing metrics by parser type."""
-        result: Dict[str, Dict] = defaultdict(
-            lambda: {
-                "count": 0,
-                "avg_duration_ms": 0.0,
-                "success_rate": 0.0,
-                "avg_confidence": 0.0
+        result: Dict[str, Dict] = {}
+        for parser, stats in self._parsing_stats.items():
+            count = int(stats["count"])
+            result[parser] = {
+                "count": count,
+                "avg_duration_ms": round(stats["duration_ms"] / count, 2),
+                "success_rate": round(stats["successes"] / count, 3),
+                "avg_confidence": round(stats["confidence"] / count, 3)
             }
-        )
-
-        for p in self._parsing_times:
-            parser = p["parser"]
-            result[parser]["count"] += 1
-            result[parser]["avg_duration_ms"] += p["duration_ms"]
-            result[parser]["success_rate"] += 1 if p["success"] else 0
-            result[parser]["avg_confidence"] += p["confidence"]
-
-        for parser, data in result.items():
-            if data["count"] > 0:
-                data["avg_duration_ms"] = round(
-                    data["avg_duration_ms"] / data["count"], 2
-                )
-                data["success_rate"] = round(
-                    data["success_rate"] / data["count"], 3
-                )
-                data["avg_confidence"] = round(
-                    data["avg_confidence"] / data["count"], 3
-                )
-
-        return dict(result)
+        return result
 
 
 # Global metrics collector instance
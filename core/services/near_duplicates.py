@@ -0,0 +1,214 @@
+"""
+Near-Duplicate Detection Service
+
+Finds pairs of near-duplicate texts (ACs, test objectives) without
+comparing every pair. Texts are reduced to token sets, summarized as
+MinHash signatures and bucketed with LSH banding; only texts sharing a
+bucket are compared, and every candidate is verified with exact Jaccard
+similarity. There are no false positives; the default banding misses a
+pair at the 0.7 threshold with probability below 0.1%.
+
+Small inputs (below exact_limit texts) are compared pairwise, which is
+cheaper than signing them and gives exact results. An optional embedding
+mode scores pairs by cosine similarity of provider embeddings instead.
+"""
+import hashlib
+from collections import defaultdict
+from typing import Callable, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from core.services.embeddings.embedding_interface import embedding_matrix
+
+# Mersenne prime for universal hashing; token hashes and coefficients stay
+# below it so a * x + b fits in int64
+_MERSENNE_PRIME = (1 << 31) - 1
+
+Tokenizer = Callable[[str], Set[str]]
+
+# (earlier index, later index, similarity)
+SimilarPair = Tuple[int, int, float]
+
+
+def default_tokenizer(text: str) -> Set[str]:
+    """Lowercased whitespace tokens."""
+    return set(text.lower().split())
+
+
+def jaccard(tokens1: Set[str], tokens2: Set[str]) -> float:
+    """Jaccard similarity of two token sets (0.0 if either is empty)."""
+    if not tokens1 or not tokens2:
+        return 0.0
+    return len(tokens1 & tokens2) / len(tokens1 | tokens2)
+
+
+def _token_hash(token: str) -> int:
+    """Process-independent token hash below the Mersenne prime."""
+    digest = hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little') % _MERSENNE_PRIME
+
+
+class MinHasher:
+    """MinHash signatures over token sets using universal hash functions."""
+
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        """Initialize hash functions.
+
+        Args:
+            num_perm: Number of hash functions (signature length)
+            seed: Seed for the hash coefficients (signatures are only
+                comparable between hashers with the same seed)
+        """
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self._a = rng.randint(1, _MERSENNE_PRIME, size=num_perm, dtype=np.int64)
+        self._b = rng.randint(0, _MERSENNE_PRIME, size=num_perm, dtype=np.int64)
+
+    def signature(self, tokens: Iterable[str]) -> np.ndarray:
+        """MinHash signature of a token set (all-max for an empty set)."""
+        hashes = np.fromiter((_token_hash(t) for t in set(tokens)), dtype=np.int64)
+        if hashes.size == 0:
+            return np.full(self.num_perm, _MERSENNE_PRIME, dtype=np.int64)
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % _MERSENNE_PRIME
+        return permuted.min(axis=1)
+
+
+class NearDuplicateDetector:
+    """Finds near-duplicate pairs among texts.
+
+    Usage:
+        detector = NearDuplicateDetector(threshold=0.7)
+        pairs = detector.similar_pairs(["open the file menu", "open the file menu now"])
+        # [(0, 1, 0.8)]
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.7,
+        tokenizer: Optional[Tokenizer] = None,
+        inclusive: bool = True,
+        num_perm: int = 128,
+        bands: int = 32,
+        exact_limit: int = 64,
+        embedding_provider: Optional[object] = None
+    ):
+        """Initialize detector.
+
+        Args:
+            threshold: Minimum similarity for a pair to be reported
+            tokenizer: Text -> token set (defaults to lowercased words)
+            inclusive: Report similarity == threshold (False: strictly greater)
+            num_perm: MinHash signature length
+            bands: LSH bands (num_perm must divide evenly); more bands catch
+                lower similarities at the cost of more candidates
+            exact_limit: Below this many texts, compare all pairs directly
+            embedding_provider: IEmbeddingProvider to score pairs by cosine
+                similarity of embeddings instead of token Jaccard
+        """
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+        self.threshold = threshold
+        self.inclusive = inclusive
+        self.exact_limit = exact_limit
+        self._tokenizer = tokenizer or default_tokenizer
+        self._bands = bands
+        self._rows = num_perm // bands
+        self._hasher = MinHasher(num_perm)
+        self._embedding_provider = embedding_provider
+
+    def _passes(self, similarity: float) -> bool:
+        if self.inclusive:
+            return similarity >= self.threshold
+        return similarity > self.threshold
+
+    def similar_pairs(self, texts: Sequence[str]) -> List[SimilarPair]:
+        """Find all near-duplicate pairs.
+
+        Args:
+            texts: Texts to compare
+
+        Returns:
+            (i, j, similarity) with i < j, sorted by (i, j)
+        """
+        if self._embedding_provider is not None:
+            return self._embedding_pairs(texts)
+
+        token_sets = [self._tokenizer(text) for text in texts]
+        if len(token_sets) < self.exact_limit:
+            candidates: Iterable[Tuple[int, int]] = (
+                (i, j) for i in range(len(token_sets)) for j in range(i + 1, len(token_sets))
+            )
+        else:
+            candidates = sorted(self._lsh_candidates(token_sets))
+
+        pairs = []
+        for i, j in candidates:
+            similarity = jaccard(token_sets[i], token_sets[j])
+            if similarity > 0.0 and self._passes(similarity):
+                pairs.append((i, j, similarity))
+        return pairs
+
+    def _lsh_candidates(self, token_sets: List[Set[str]]) -> Set[Tuple[int, int]]:
+        """Pairs sharing at least one LSH band bucket."""
+        buckets = defaultdict(list)
+        for index, tokens in enumerate(token_sets):
+            if not tokens:
+                continue
+            signature = self._hasher.signature(tokens)
+            for band in range(self._bands):
+                key = signature[band * self._rows:(band + 1) * self._rows].tobytes()
+                buckets[(band, key)].append(index)
+
+        candidates = set()
+        for members in buckets.values():
+            for position, i in enumerate(members):
+                for j in members[position + 1:]:
+                    candidates.add((i, j))
+        return candidates
+
+    def _embedding_pairs(self, texts: Sequence[str]) -> List[SimilarPair]:
+        """Pairs whose embeddings have cosine similarity over the threshold."""
+        if len(texts) < 2:
+            return []
+        matrix = embedding_matrix(self._embedding_provider, texts)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix = matrix / norms
+        scores = matrix @ matrix.T
+
+        upper = np.triu(np.ones(scores.shape, dtype=bool), k=1)
+        if self.inclusive:
+            hits = (scores >= self.threshold) & upper
+        else:
+            hits = (scores > self.threshold) & upper
+        return [(int(i), int(j), float(scores[i, j])) for i, j in zip(*np.nonzero(hits))]
+
+    def duplicates_of_earlier(
+        self,
+        texts: Sequence[str],
+        always_keep: Optional[Set[int]] = None
+    ) -> Set[int]:
+        """Indices to drop when keeping the first of each near-duplicate group.
+
+        Walks texts in order; a text is dropped if it is similar to an
+        earlier text that was kept. Indices in always_keep are never dropped.
+
+        Args:
+            texts: Texts in priority order
+            always_keep: Indices that must be kept
+
+        Returns:
+            Set of indices to drop
+        """
+        always_keep = always_keep or set()
+        earlier = defaultdict(list)
+        for i, j, _ in self.similar_pairs(texts):
+            earlier[j].append(i)
+
+        dropped: Set[int] = set()
+        for index in range(len(texts)):
+            if index in always_keep:
+                continue
+            if any(i not in dropped for i in earlier.get(index, ())):
+                dropped.add(index)
+        return dropped
@@ -4,10 +4,13 @@ NLP services for semantic parsing of acceptance criteria.
 Provides spaCy-based and hybrid parsing capabilities.
 """
 from .spacy_parser import SpacySemanticParser, SPACY_AVAILABLE
+from .spacy_models import get_spacy_model, clear_spacy_models
 from .hybrid_parser import HybridACParser
 
 __all__ = [
     'SpacySemanticParser',
     'HybridACParser',
-    'SPACY_AVAILABLE'
+    'SPACY_AVAILABLE',
+    'get_spacy_model',
+    'clear_spacy_models'
 ]
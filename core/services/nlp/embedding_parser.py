@@ -34,6 +34,9 @@ class EmbeddingSemanticParser(ISemanticParser):
         print(f"Confidence: {result.confidence}")  # 0.92
     """
 
+    # Scores assigned to hash-index hits (exact text vs stemmed near-exact)
+    EXACT_MATCH_SCORES = {"exact": 1.0, "stem": 0.95}
+
     def __init__(
         self,
         provider: Optional[IEmbeddingProvider] = None,
@@ -79,15 +82,16 @@ class EmbeddingSemanticParser(ISemanticParser):
         if pattern_index:
             self._index = pattern_index
         else:
-            self._index = EmbeddingPatternIndex(
-                self._provider,
-                self._cache,
-                patterns_file
-            )
-            try:
-                self._index.load_patterns()
-            except FileNotFoundError as e:
-                print(f"Warning: Could not load patterns: {e}")
+            # Patterns load lazily on the first match (from the on-disk
+            # snapshot when the pattern file is unchanged)
+            if os.path.exists(patterns_file):
+                self._index = EmbeddingPatternIndex(
+                    self._provider,
+                    self._cache,
+                    patterns_file
+                )
+            else:
+                print(f"Warning: Could not load patterns: Patterns file not found: {patterns_file}")
                 self._index = None
 
         # Initialize matcher
@@ -134,6 +138,11 @@ class EmbeddingSemanticParser(ISemanticParser):
         if not self.is_available:
             return self._empty_result()
 
+        # Exact / near-exact pattern hit: skip embedding entirely
+        exact_result = self._parse_exact(text)
+        if exact_result is not None:
+            return exact_result
+
         # Find matching action pattern
         action_match = self._matcher.match_action(text)
 
@@ -143,6 +152,49 @@ class EmbeddingSemanticParser(ISemanticParser):
         # Find matching boundary pattern
         boundary_match = self._matcher.match_boundary(text)
 
+        return self._build_components(action_match, outcome_match, boundary_match, "embedding")
+
+    def _parse_exact(self, text: str) -> Optional[SemanticComponents]:
+        """Resolve text via the pattern index hash lookup (no embedding call).
+
+        Args:
+            text: Raw AC text
+
+        Returns:
+            SemanticComponents with method "embedding_exact"/"embedding_stem",
+            or None if the text is not a known pattern phrase
+        """
+        hit = self._index.lookup_text(text) if self._index else None
+        if hit is None:
+            return None
+
+        entry, match_type = hit
+        match = SimilarityMatch(
+            pattern_id=entry.pattern_id,
+            pattern_text=entry.canonical,
+            category=entry.category,
+            similarity_score=self.EXACT_MATCH_SCORES[match_type],
+            metadata={
+                "subcategory": entry.subcategory,
+                "regex_fallback": entry.regex_fallback,
+                "match_type": match_type
+            }
+        )
+        return self._build_components(
+            match if entry.category == "action" else None,
+            match if entry.category == "outcome" else None,
+            match if entry.category == "boundary" else None,
+            f"embedding_{match_type}"
+        )
+
+    def _build_components(
+        self,
+        action_match: Optional[SimilarityMatch],
+        outcome_match: Optional[SimilarityMatch],
+        boundary_match: Optional[SimilarityMatch],
+        method: str
+    ) -> SemanticComponents:
+        """Assemble SemanticComponents from per-category matches."""
         # Calculate overall confidence
         confidence = self._calculate_confidence(action_match, outcome_match)
 
@@ -168,7 +220,7 @@ class EmbeddingSemanticParser(ISemanticParser):
             modal=None,
             tense="present",
             confidence=confidence,
-            method="embedding"
+            method=method
         )
 
     def extract_action_target_outcome(
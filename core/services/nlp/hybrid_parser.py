@@ -8,10 +8,12 @@ Provides domain-agnostic parsing with graceful degradation:
 """
 import os
 import re
+import time
 from typing import List, Optional, Tuple
 
 from core.interfaces.semantic_parser import ISemanticParser, SemanticComponents
 from core.services.ac_parser import ACParser, ACSemantics
+from core.services.metrics import get_metrics_collector
 from .spacy_parser import SpacySemanticParser, SPACY_AVAILABLE
 
 
@@ -84,7 +86,7 @@ class HybridACParser(ISemanticParser):
 
     @property
     def last_method(self) -> str:
-        """Get the method used for the last parse."""
+        """Get the method used for the last parse ("embedding", "spacy" or "regex")."""
         return self._last_method
 
     @property
@@ -103,9 +105,23 @@ class HybridACParser(ISemanticParser):
         Returns:
             SemanticComponents with extracted semantics
         """
-        # Clean the text
-        clean_text = self._clean_text(text)
+        start = time.perf_counter()
+        result = self._parse_layers(self._clean_text(text))
+
+        # Counted under result.method, so exact pattern hits
+        # ("embedding_exact"/"embedding_stem") are told apart from
+        # embedding similarity matches; no log line per parse
+        get_metrics_collector().record_parsing(
+            parser=result.method,
+            duration_ms=(time.perf_counter() - start) * 1000,
+            success=result.confidence > 0,
+            confidence=result.confidence,
+            log=False
+        )
+        return result
 
+    def _parse_layers(self, clean_text: str) -> SemanticComponents:
+        """Run the embedding → spaCy → regex fallback chain on clean text."""
         # Layer 1: Try embedding first if available
         if self._embedding_parser and self._embedding_parser.is_available:
             embedding_result = self._embedding_parser.parse(clean_text)
@@ -123,10 +139,8 @@ class HybridACParser(ISemanticParser):
                 return spacy_result
 
         # Layer 3: Fall back to regex parser
-        regex_result = self._parse_with_regex(clean_text)
         self._last_method = "regex"
-
-        return regex_result
+        return self._parse_with_regex(clean_text)
 
     def extract_action_target_outcome(
         self,
@@ -0,0 +1,106 @@
+"""
+Process-wide spaCy model registry.
+
+Each (model, excluded components) pipeline is loaded once per process and
+shared by every parser instance. Parsing only needs the tagger, dependency
+parser and lemmatizer, so the default parse profile excludes ``ner``.
+Repeated AC strings reuse a memoized Doc instead of re-running the pipeline.
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple
+
+# Try to import spaCy (catch all errors including runtime/compatibility issues)
+try:
+    import spacy
+    SPACY_AVAILABLE = True
+except Exception:
+    SPACY_AVAILABLE = False
+    spacy = None
+
+# Components not needed for dependency/POS/lemma analysis
+PARSE_EXCLUDE: Tuple[str, ...] = ("ner",)
+
+# Max memoized Docs per pipeline
+DOC_MEMO_SIZE = 1024
+
+_ModelKey = Tuple[str, FrozenSet[str]]
+
+_models: Dict[_ModelKey, Any] = {}
+_doc_memos: Dict[_ModelKey, "OrderedDict[str, Any]"] = {}
+_lock = threading.Lock()
+
+
+def _model_key(name: str, exclude: Iterable[str]) -> _ModelKey:
+    return name, frozenset(exclude)
+
+
+def get_spacy_model(name: str = "en_core_web_sm", exclude: Iterable[str] = ()) -> Optional[Any]:
+    """Get the shared spaCy pipeline, loading it on first use.
+
+    A failed load is remembered so the install hint prints only once.
+
+    Args:
+        name: spaCy model name
+        exclude: Pipeline components to leave out (not loaded at all)
+
+    Returns:
+        spaCy Language pipeline or None if spaCy/the model is unavailable
+    """
+    if not SPACY_AVAILABLE:
+        return None
+
+    key = _model_key(name, exclude)
+    with _lock:
+        if key in _models:
+            return _models[key]
+        try:
+            nlp = spacy.load(name, exclude=sorted(key[1]))
+        except OSError:
+            print(f"spaCy model '{name}' not found.")
+            print(f"Install with: python -m spacy download {name}")
+            nlp = None
+        _models[key] = nlp
+        _doc_memos[key] = OrderedDict()
+        return nlp
+
+
+def analyze(text: str, name: str = "en_core_web_sm", exclude: Iterable[str] = PARSE_EXCLUDE) -> Optional[Any]:
+    """Run the shared pipeline on text, memoizing the resulting Doc (LRU).
+
+    Returned Docs are shared between callers and must be treated as read-only.
+
+    Args:
+        text: Text to analyze
+        name: spaCy model name
+        exclude: Pipeline components to leave out
+
+    Returns:
+        spaCy Doc or None if the model is unavailable
+    """
+    nlp = get_spacy_model(name, exclude)
+    if nlp is None:
+        return None
+
+    key = _model_key(name, exclude)
+    with _lock:
+        memo = _doc_memos[key]
+        doc = memo.get(text)
+        if doc is not None:
+            memo.move_to_end(text)
+            return doc
+
+    doc = nlp(text)
+
+    with _lock:
+        memo[text] = doc
+        if len(memo) > DOC_MEMO_SIZE:
+            memo.popitem(last=False)
+    return doc
+
+
+def clear_spacy_models() -> None:
+    """Drop all loaded pipelines and memoized Docs."""
+    with _lock:
+        _models.clear()
+        _doc_memos.clear()
@@ -6,6 +6,7 @@ Uses dependency parsing for domain-agnostic semantic extraction.
 from typing import List, Optional, Tuple
 
 from core.interfaces.semantic_parser import ISemanticParser, SemanticComponents
+from .spacy_models import PARSE_EXCLUDE, analyze, get_spacy_model
 
 # Try to import spaCy (catch all errors including runtime/compatibility issues)
 try:
@@ -53,18 +54,11 @@ class SpacySemanticParser(ISemanticParser):
             model: spaCy model name to load
         """
         self._model_name = model
-        self._nlp = None
 
     @property
     def nlp(self):
-        """Lazy load spaCy model."""
-        if self._nlp is None and SPACY_AVAILABLE:
-            try:
-                self._nlp = spacy.load(self._model_name)
-            except OSError:
-                print(f"spaCy model '{self._model_name}' not found.")
-                print(f"Install with: python -m spacy download {self._model_name}")
-        return self._nlp
+        """Shared spaCy pipeline for parsing (loaded once per process, no NER)."""
+        return get_spacy_model(self._model_name, exclude=PARSE_EXCLUDE)
 
     @property
     def is_available(self) -> bool:
@@ -96,7 +90,7 @@ class SpacySemanticParser(ISemanticParser):
                 method="spacy_unavailable"
             )
 
-        doc = self.nlp(text)
+        doc = analyze(text, self._model_name, exclude=PARSE_EXCLUDE)
 
         # Find the root verb (main action)
         root = self._find_root_verb(doc)
@@ -169,10 +163,10 @@ class SpacySemanticParser(ISemanticParser):
         Returns:
             List of entity strings
         """
-        if not self.is_available:
+        # Entities need the full pipeline (with NER), loaded only on demand
+        doc = analyze(text, self._model_name, exclude=())
+        if doc is None:
             return []
-
-        doc = self.nlp(text)
         return [ent.text for ent in doc.ents]
 
     def _find_root_verb(self, doc: "Doc") -> Optional["Token"]:
@@ -0,0 +1,209 @@
+"""
+Content-addressed memo for story context extraction.
+
+GroundedSpec, Ruleset, story type classification and description parsing
+are pure functions of the story content (title, description, ACs, QA
+Prep). Their results are cached under a hash of that content plus a
+fingerprint of the extractor's source file, in memory (and optionally on
+disk), so regenerating, judging or re-correcting an unchanged story skips
+extraction entirely and an edited extractor never serves stale results.
+
+The memo is in-memory by default: the file tier rewrites its index on
+every write, which costs more than the extraction it saves within one
+run. Set STORY_CONTEXT_CACHE=file to persist entries across runs, or
+=off to disable the memo.
+"""
+import hashlib
+import json
+import os
+import threading
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+
+import core.domain.grounded_spec as grounded_spec_module
+import core.domain.ruleset as ruleset_module
+from core.domain.grounded_spec import GroundedSpec
+from core.domain.ruleset import Ruleset
+from core.services.cache import CacheManager
+
+T = TypeVar('T')
+
+DEFAULT_STORY_CONTEXT_DIR = ".cache/story_context"
+
+# Entries are content-addressed, so they only expire to bound disk usage
+STORY_CONTEXT_TTL = timedelta(days=30)
+
+
+def _source_fingerprint(source_file: Optional[str]) -> str:
+    """Short hash of an extractor's source file ('' if unavailable)."""
+    if not source_file:
+        return ""
+    try:
+        with open(source_file, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()[:16]
+    except OSError:
+        return ""
+
+
+class StoryContextMemo:
+    """Memo keyed by story content (memory, plus an optional file tier).
+
+    Values are stored as JSON-compatible dicts and rebuilt on every hit,
+    so callers always get a fresh object they are free to mutate.
+
+    Usage:
+        memo = get_story_context_memo()
+        spec = memo.get_or_build(
+            "grounded_spec", [title, description, criteria],
+            build=lambda: GroundedSpec.from_story_data(...),
+            to_dict=GroundedSpec.to_dict, from_dict=GroundedSpec.from_dict,
+            source_file=grounded_spec_module.__file__
+        )
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_STORY_CONTEXT_DIR,
+        enable_file: bool = False,
+        enabled: bool = True
+    ):
+        """Initialize memo.
+
+        Args:
+            cache_dir: Directory for the on-disk tier
+            enable_file: Persist entries across runs
+            enabled: False to always rebuild (no caching)
+        """
+        self.enabled = enabled
+        self._cache = CacheManager(
+            enable_memory=True,
+            enable_file=enable_file,
+            cache_dir=cache_dir,
+            file_ttl=STORY_CONTEXT_TTL
+        ) if enabled else None
+        self._fingerprints: Dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, kind: str, parts: Sequence[Any], source_file: Optional[str] = None) -> str:
+        """Content-addressed cache key.
+
+        Args:
+            kind: Result type (e.g. "grounded_spec")
+            parts: JSON-serializable story content the result depends on
+            source_file: Extractor source file (edits invalidate entries)
+
+        Returns:
+            Cache key string
+        """
+        if source_file not in self._fingerprints:
+            self._fingerprints[source_file] = _source_fingerprint(source_file)
+        payload = json.dumps(list(parts), sort_keys=True, ensure_ascii=False, default=str)
+        digest = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+        return f"story_context:{kind}:{self._fingerprints[source_file]}:{digest}"
+
+    def get_or_build(
+        self,
+        kind: str,
+        parts: Sequence[Any],
+        build: Callable[[], T],
+        to_dict: Callable[[T], Any],
+        from_dict: Callable[[Any], T],
+        source_file: Optional[str] = None
+    ) -> T:
+        """Return the memoized result for parts, building it on a miss.
+
+        Args:
+            kind: Result type (part of the key)
+            parts: Story content the result depends on
+            build: Computes the result
+            to_dict: Result -> JSON-compatible value
+            from_dict: JSON-compatible value -> result
+            source_file: Extractor source file (part of the key)
+
+        Returns:
+            Result object (rebuilt from the cached value on a hit)
+        """
+        if not self.enabled:
+            return build()
+
+        key = self.key(kind, parts, source_file)
+        data = self._cache.get(key)
+        if data is not None:
+            self.hits += 1
+            return from_dict(data)
+
+        self.misses += 1
+        result = build()
+        self._cache.set(key, to_dict(result), ttl=STORY_CONTEXT_TTL)
+        return result
+
+    def clear(self) -> None:
+        """Drop all memoized entries (both tiers)."""
+        if self._cache:
+            self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_memo: Optional[StoryContextMemo] = None
+_memo_lock = threading.Lock()
+
+
+def get_story_context_memo() -> StoryContextMemo:
+    """Get the process-wide story context memo (configured from env)."""
+    global _memo
+    with _memo_lock:
+        if _memo is None:
+            mode = os.getenv("STORY_CONTEXT_CACHE", "memory").lower()
+            _memo = StoryContextMemo(
+                cache_dir=os.getenv("STORY_CONTEXT_CACHE_DIR", DEFAULT_STORY_CONTEXT_DIR),
+                enable_file=mode == "file",
+                enabled=mode != "off"
+            )
+        return _memo
+
+
+def reset_story_context_memo() -> None:
+    """Forget the process-wide memo (next call re-reads env settings)."""
+    global _memo
+    with _memo_lock:
+        _memo = None
+
+
+def build_grounded_spec(
+    story_data: Dict,
+    criteria: List[str],
+    qa_prep_content: Optional[str] = None
+) -> GroundedSpec:
+    """Memoized GroundedSpec.from_story_data."""
+    parts = [
+        story_data.get('story_id') or story_data.get('id'),
+        story_data.get('title', ''),
+        story_data.get('description_text', ''),
+        list(criteria),
+        qa_prep_content,
+    ]
+    return get_story_context_memo().get_or_build(
+        "grounded_spec", parts,
+        build=lambda: GroundedSpec.from_story_data(story_data, criteria, qa_prep_content),
+        to_dict=GroundedSpec.to_dict,
+        from_dict=GroundedSpec.from_dict,
+        source_file=grounded_spec_module.__file__
+    )
+
+
+def build_ruleset(
+    story_id: int,
+    ac_texts: List[str],
+    qa_prep_texts: Optional[List[str]] = None
+) -> Ruleset:
+    """Memoized Ruleset.from_evidence."""
+    parts = [story_id, list(ac_texts), list(qa_prep_texts or [])]
+    return get_story_context_memo().get_or_build(
+        "ruleset", parts,
+        build=lambda: Ruleset.from_evidence(story_id, ac_texts, qa_prep_texts),
+        to_dict=Ruleset.to_dict,
+        from_dict=Ruleset.from_dict,
+        source_file=ruleset_module.__file__
+    )
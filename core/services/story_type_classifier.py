@@ -7,6 +7,8 @@ and prevent cross-story leakage (e.g., tool-state text in fullscreen mode).
 from typing import List, Set
 from enum import Enum
 
+from core.services.story_context_cache import get_story_context_memo
+
 
 class StoryType(Enum):
     """Story types for classification."""
@@ -86,6 +88,18 @@ class StoryTypeClassifier:
         Returns:
             StoryType enum
         """
+        # Memoized by story content (see story_context_cache)
+        return get_story_context_memo().get_or_build(
+            "story_type", [story_title, list(ac_bullets), qa_prep, description],
+            build=lambda: cls._classify(story_title, ac_bullets, qa_prep, description),
+            to_dict=lambda story_type: story_type.value,
+            from_dict=StoryType,
+            source_file=__file__
+        )
+
+    @classmethod
+    def _classify(cls, story_title: str, ac_bullets: List[str], qa_prep: str = "", description: str = "") -> StoryType:
+        """Classify without the memo (see classify)."""
         # Combine all text for analysis (description included for context)
         all_text = story_title.lower()
         if description:
@@ -5,9 +5,11 @@ Integrates quality enhancement for high-quality, deterministic output.
 Uses StoryTypeClassifier to avoid irrelevant edge cases.
 Uses story description to generate context-rich, meaningful test scenarios.
 """
-from typing import List, Dict, Optional, Any, Tuple
+from typing import List, Dict, Optional, Any, Set, Tuple
 import re
-from dataclasses import dataclass, field
+from collections import defaultdict
+from itertools import combinations
+from dataclasses import asdict, dataclass, field
 
 import sys
 import os
@@ -16,6 +18,21 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from projects.project_config import ProjectConfig
 from projects.test_suite_creator import QAPrepGenerator
 from core.services.story_type_classifier import StoryType, StoryTypeClassifier
+from core.services.heuristic_rules import (
+    RuleEngine,
+    PROPERTIES_PANEL_ENTRY,
+    NO_SELECTION_EDGE_CASE,
+    UNDO_REDO_EDGE_CASE,
+    SCENARIO_TITLES,
+    STEP_BRANCHES,
+    HELP_OUTCOMES,
+    ACTION_OUTCOMES,
+    FIELD_SEPARATOR,
+    PARENTHETICAL,
+    LEADING_FILLER_WORD,
+)
+from core.services.near_duplicates import NearDuplicateDetector
+from core.services.story_context_cache import get_story_context_memo
 from core.services.embeddings.test_step_embedder import TestStepEmbedder
 # Note: clean_acceptance_criteria is imported lazily in generate_test_cases to avoid circular import
 
@@ -47,10 +64,22 @@ class DescriptionParser:
 
     @classmethod
     def parse(cls, description: str) -> DescriptionContext:
-        """Parse description and extract structured context."""
+        """Parse description and extract structured context (memoized by content)."""
         if not description:
             return DescriptionContext()
 
+        return get_story_context_memo().get_or_build(
+            "description_context", [description],
+            build=lambda: cls._parse(description),
+            to_dict=asdict,
+            from_dict=lambda data: DescriptionContext(**data),
+            source_file=__file__
+        )
+
+    @classmethod
+    def _parse(cls, description: str) -> DescriptionContext:
+        """Parse without the memo (see parse)."""
+
         ctx = DescriptionContext(raw_description=description)
         desc_lower = description.lower()
 
@@ -216,6 +245,23 @@ def cls_similar(text1: str, text2: str, threshold: float = 0.8) -> bool:
     similarity = len(intersection) / len(union)
     return similarity >= threshold
 
+# Words ignored when comparing ACs for redundancy
+AC_STOPWORDS = frozenset({
+    'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
+    'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
+    'shall', 'should', 'can', 'could', 'may', 'might', 'must',
+    'that', 'this', 'these', 'those', 'and', 'or', 'but', 'if',
+    'when', 'where', 'which', 'who', 'whom', 'why', 'how',
+    'to', 'of', 'in', 'for', 'on', 'with', 'at', 'by', 'from',
+    'up', 'about', 'into', 'over', 'after', 'user', 'users'
+})
+
+
+def significant_ac_words(text: str) -> set:
+    """Words of a normalized AC used for similarity (no stopwords, len > 2)."""
+    return set(w for w in text.split() if w not in AC_STOPWORDS and len(w) > 2)
+
+
 # Import quality enhancement services
 try:
     from core.services.quality import (
@@ -258,7 +304,9 @@ class GenericTestGenerator:
         self.app = config.application
         self.rules = config.rules
         self.test_id_counter = config.rules.test_id_increment
-        self.embedder = TestStepEmbedder()
+        self.embedder = TestStepEmbedder(
+            path=config.vector_db_path, backend=config.vector_db_backend
+        )
 
         # Quality enhancement
         self.enable_quality_enhancement = enable_quality_enhancement and QUALITY_SERVICES_AVAILABLE
@@ -274,6 +322,15 @@ class GenericTestGenerator:
         self.description_context: Optional[DescriptionContext] = None
         self.story_type: StoryType = StoryType.UNKNOWN
 
+        # Precompiled AC heuristics; trace is reset per story
+        self.heuristics = RuleEngine()
+
+        # 0-based AC index -> IDs of the tests derived from it (last story)
+        self.ac_test_ids: Dict[int, List[str]] = {}
+
+        # Near-duplicate AC detection (word Jaccard, MinHash/LSH on large stories)
+        self._ac_duplicates = NearDuplicateDetector(threshold=0.7, tokenizer=significant_ac_words)
+
         if self.enable_quality_enhancement:
             self._quality_analyzer = get_quality_analyzer()
             self._step_builder = get_semantic_step_builder()
@@ -282,7 +339,8 @@ class GenericTestGenerator:
         self,
         story_data: Dict,
         criteria: List[str],
-        qa_prep_content: Optional[str] = None
+        qa_prep_content: Optional[str] = None,
+        only_acs: Optional[Set[int]] = None
     ) -> List[Dict]:
         """
         Generate comprehensive test cases for a story.
@@ -294,6 +352,9 @@ class GenericTestGenerator:
             story_data: Story information (story_id, title, description).
             criteria: List of acceptance criteria bullets.
             qa_prep_content: Optional QA Prep task content.
+            only_acs: Incremental mode - 0-based indices (into the cleaned
+                criteria) of the ACs to derive tests for. Story-level tests
+                (edge case, platform, accessibility) are skipped.
 
         Returns:
             List of test case dictionaries.
@@ -301,6 +362,8 @@ class GenericTestGenerator:
         test_cases = []
         story_id = story_data['story_id']
         feature_name = self._extract_feature_name(story_data['title'])
+        self.heuristics.reset_trace()
+        self.ac_test_ids = {}
 
         # Clean acceptance criteria - remove headers like "Acceptance Criteria:", "When active:", etc.
         # Lazy import to avoid circular dependency
@@ -343,16 +406,10 @@ class GenericTestGenerator:
         properties_panel_detected = False
         if 'properties panel' in combined_text or 'properties' in combined_text and 'panel' in combined_text:
             # Check if description/ACs explicitly mention Properties panel as control point
-            properties_patterns = [
-                r'(?:controlled?|access(?:ed|ible)?|available|configur(?:ed?|able)|manag(?:ed?|able)|set|adjust(?:ed|able)?)\s+(?:via|through|from|in|using)\s+(?:the\s+)?properties\s*panel',
-                r'properties\s*panel\s+(?:controls?|provides?|allows?|contains?|displays?|shows?)',
-            ]
-            for pattern in properties_patterns:
-                if re.search(pattern, combined_text, re.IGNORECASE):
-                    qa_details['entry_points'] = ['Properties Panel']
-                    properties_panel_detected = True
-                    print(f"  Entry point set to Properties Panel (detected from description/AC)")
-                    break
+            if self.heuristics.first(PROPERTIES_PANEL_ENTRY, combined_text):
+                qa_details['entry_points'] = ['Properties Panel']
+                properties_panel_detected = True
+                print(f"  Entry point set to Properties Panel (detected from description/AC)")
             else:
                 # Fallback: If story type is PROPERTIES, use Properties Panel
                 if self.story_type == StoryType.PROPERTIES:
@@ -377,23 +434,15 @@ class GenericTestGenerator:
             qa_details['edge_cases'] = []
 
         # Detect no_selection edge case from ACs
-        no_selection_patterns = [
-            r'enabled\s+only\s+when.*(?:object|item|element).*selected',
-            r'disabled\s+when\s+no.*selected',
-            r'requires?\s+(?:a|an|at least one)\s+(?:object|selection)',
-            r'only\s+(?:available|enabled|active)\s+(?:when|if).*selected',
-            r'at\s+least\s+one\s+object\s+(?:is\s+)?selected',
-        ]
-        for pattern in no_selection_patterns:
-            if re.search(pattern, combined_text, re.IGNORECASE):
-                if 'no_selection' not in qa_details['negative_scenarios']:
-                    qa_details['negative_scenarios'].append('no_selection')
-                break
+        if self.heuristics.first(NO_SELECTION_EDGE_CASE, combined_text):
+            if 'no_selection' not in qa_details['negative_scenarios']:
+                qa_details['negative_scenarios'].append('no_selection')
 
         # Detect undo/redo edge case from ACs
-        if re.search(r'\bundo\b.*\bredo\b|\bredo\b.*\bundo\b|\bundo/redo\b', combined_text, re.IGNORECASE):
+        undo_redo_rule = self.heuristics.first(UNDO_REDO_EDGE_CASE, combined_text)
+        if undo_redo_rule:
             if 'undo_redo' not in qa_details.get('edge_cases', []):
-                qa_details.setdefault('undo_redo_actions', []).append('transformation')
+                qa_details.setdefault('undo_redo_actions', []).append(undo_redo_rule.result)
 
         # Store all criteria for AC1 acceptance test generation
         self._all_criteria = criteria
@@ -432,6 +481,9 @@ class GenericTestGenerator:
                 for warning in feasibility['warnings']:
                     print(f"  NOTE AC{idx + 1}: {warning}")
 
+            if only_acs is not None and idx not in only_acs:
+                continue
+
             # Generate test ID
             if idx == 0:
                 test_id = f"{story_id}-{self.rules.first_test_id}"
@@ -444,10 +496,16 @@ class GenericTestGenerator:
             )
             if test_case:
                 test_cases.append(test_case)
+                self.ac_test_ids.setdefault(idx, []).append(test_case['id'])
                 # Only increment counter after successful test creation (skip for AC1 which uses special ID)
                 if idx != 0:
                     self.test_id_counter += self.rules.test_id_increment
 
+        # Incremental mode: story-level tests are kept from the previous run
+        if only_acs is not None:
+            print(f"  Generated {len(test_cases)} test cases for {len(only_acs)} changed AC(s)")
+            return self._finish_generation(test_cases, feature_name)
+
         # Generate edge case tests
         edge_cases = self._extract_edge_cases(qa_details, feature_name)
         for edge_case in edge_cases:
@@ -471,6 +529,11 @@ class GenericTestGenerator:
         test_cases.extend(accessibility_tests)
 
         print(f"  Generated {len(test_cases)} test cases from {len(criteria)} AC bullets")
+        return self._finish_generation(test_cases, feature_name)
+
+    def _finish_generation(self, test_cases: List[Dict], feature_name: str) -> List[Dict]:
+        """Quality-enhance generated tests and store their steps."""
+        print(f"  Heuristic rules: {self.heuristics.trace.summary()}")
 
         # Apply quality enhancement if enabled
         if self.enable_quality_enhancement and self._quality_analyzer:
@@ -481,6 +544,21 @@ class GenericTestGenerator:
 
         return test_cases
 
+    def ac_test_ids_by_test(self) -> Dict[str, int]:
+        """Test ID -> 0-based AC index for the tests derived in the last story."""
+        return {test_id: idx for idx, ids in self.ac_test_ids.items() for test_id in ids}
+
+    @staticmethod
+    def _assign_test_id(test_case: Optional[Dict], test_id: str) -> Optional[Dict]:
+        """Replace a test's ID (and the title prefix that repeats it) with test_id."""
+        if test_case is None:
+            return None
+        placeholder = test_case['id']
+        test_case = dict(test_case, id=test_id)
+        if test_case['title'].startswith(placeholder):
+            test_case['title'] = test_id + test_case['title'][len(placeholder):]
+        return test_case
+
     def _enhance_test_quality(
         self,
         test_cases: List[Dict],
@@ -925,16 +1003,18 @@ class GenericTestGenerator:
         if entry_point == "Properties Panel" or story_type == StoryType.PROPERTIES:
             return self._derive_properties_panel_steps(ac_bullet, feature_name, entry_point)
 
-        # Pattern-based step generation for specific AC types
+        # Pattern-based step generation for specific AC types (see STEP_BRANCHES)
+        branch_rule = self.heuristics.first(STEP_BRANCHES, ac_lower)
+        branch = branch_rule.result if branch_rule else None
 
         # 1. Dialog/menu opening ACs
-        if 'opens' in ac_lower or 'open' in ac_lower:
-            menu_match = re.search(r'(file|edit|view|tools?|insert|help)\s*(?:→|->|menu)?', ac_lower)
+        if branch == 'dialog_open':
+            menu_match = self.heuristics.search('menu_name', ac_lower)
             if menu_match:
                 menu = menu_match.group(1).capitalize()
                 steps.append({"action": f"Open the {menu} Menu.", "expected": f"{menu} Menu opens displaying available commands."})
 
-            action_match = re.search(r'(?:select|click|choose)\s+["\']?(\w+)["\']?', ac_lower)
+            action_match = self.heuristics.search('selected_command', ac_lower)
             if action_match:
                 action = action_match.group(1).capitalize()
                 steps.append({"action": f"Select '{action}'.", "expected": f"The {feature_name} dialog opens."})
@@ -942,9 +1022,9 @@ class GenericTestGenerator:
                 steps.append({"action": f"Select the {feature_name} command.", "expected": f"The {feature_name} dialog opens."})
 
         # 2. Default value ACs
-        elif 'default' in ac_lower:
+        elif branch == 'default_value':
             steps.append({"action": f"Open the {entry_point}.", "expected": f"{entry_point} opens."})
-            default_match = re.search(r'default(?:\s+preset)?\s*=\s*["\']?([^"\'\.]+)', ac_bullet, re.IGNORECASE)
+            default_match = self.heuristics.search('default_value', ac_bullet)
             if default_match:
                 default_val = default_match.group(1).strip()
                 steps.append({"action": f"Verify the default preset value.", "expected": f"Preset shows '{default_val}'."})
@@ -952,24 +1032,24 @@ class GenericTestGenerator:
                 steps.append({"action": "Verify the default preset values are displayed.", "expected": "Default values are shown correctly."})
 
         # 3. Field/control availability ACs
-        elif 'field' in ac_lower or 'available' in ac_lower or 'include' in ac_lower:
+        elif branch == 'field_availability':
             steps.append({"action": f"Open the {entry_point}.", "expected": f"{entry_point} opens."})
             # Extract field names if listed
-            field_match = re.search(r'fields?\s*(?:available|include)?:?\s*([^\.]+)', ac_bullet, re.IGNORECASE)
+            field_match = self.heuristics.search('field_list', ac_bullet)
             if field_match:
                 fields_str = field_match.group(1)
-                fields = [f.strip() for f in re.split(r'[,;]', fields_str) if f.strip() and len(f.strip()) > 1]
+                fields = [f.strip() for f in FIELD_SEPARATOR.split(fields_str) if f.strip() and len(f.strip()) > 1]
                 for field in fields[:5]:  # Limit to 5 fields
-                    clean_field = re.sub(r'\([^)]+\)', '', field).strip()
+                    clean_field = PARENTHETICAL.sub('', field).strip()
                     if clean_field:
                         steps.append({"action": f"Verify {clean_field} is displayed.", "expected": f"{clean_field} field/control is visible."})
             else:
                 steps.append({"action": f"Verify all required controls are displayed.", "expected": "All controls are visible and functional."})
 
         # 4. Setting dependency ACs
-        elif 'follow' in ac_lower and 'setting' in ac_lower:
+        elif branch == 'setting_dependency':
             # Extract what setting
-            setting_match = re.search(r'follow(?:s)?\s+(?:the\s+)?(?:current\s+)?(\w+(?:\s+\w+)?)\s+setting', ac_lower)
+            setting_match = self.heuristics.search('setting_name', ac_lower)
             setting_name = setting_match.group(1) if setting_match else "Unit of Measure"
             steps.append({"action": f"Open Settings.", "expected": "Settings panel/dialog opens."})
             steps.append({"action": f"Note the current {setting_name} setting.", "expected": ""})
@@ -977,20 +1057,20 @@ class GenericTestGenerator:
             steps.append({"action": f"Verify the dropdown reflects the current {setting_name} setting.", "expected": f"Dropdown value matches the {setting_name} setting."})
 
         # 5. Recent items ACs
-        elif 'recent' in ac_lower:
+        elif branch == 'recent_items':
             steps.append({"action": f"Open the {entry_point}.", "expected": f"{entry_point} opens."})
             steps.append({"action": "Locate the Recent Items section.", "expected": "Recent Items section is displayed."})
             steps.append({"action": "Verify Recent Items shows previously used presets.", "expected": "Most recently used canvas presets are listed."})
 
         # 6. Create/action button ACs
-        elif 'create' in ac_lower or 'initialize' in ac_lower:
+        elif branch == 'create_action':
             steps.append({"action": f"Open the {entry_point}.", "expected": f"{entry_point} opens."})
             steps.append({"action": "Set desired size and unit values.", "expected": ""})
             steps.append({"action": "Click 'Create' button.", "expected": "A new blank canvas is created with the selected settings."})
             steps.append({"action": "Verify the canvas reflects the chosen dimensions.", "expected": "Canvas matches the specified size and units."})
 
         # 7. Close/cancel button ACs
-        elif 'close' in ac_lower or 'cancel' in ac_lower or 'exit' in ac_lower:
+        elif branch == 'close_cancel':
             steps.append({"action": "Open an existing document.", "expected": "Document is displayed."})
             steps.append({"action": f"Open the {entry_point}.", "expected": f"{entry_point} opens."})
             steps.append({"action": "Modify some values in the dialog.", "expected": ""})
@@ -998,7 +1078,7 @@ class GenericTestGenerator:
             steps.append({"action": "Verify the previous document is still displayed.", "expected": "User returns to the previously open document."})
 
         # 8. Accessibility/WCAG ACs (handled separately, skip here)
-        elif 'accessibility' in ac_lower or 'wcag' in ac_lower or '508' in ac_lower:
+        elif branch == 'accessibility':
             pass  # Will be generated by accessibility test generator
 
         # 9. Fallback: Extract specific action from AC text
@@ -1909,59 +1989,15 @@ class GenericTestGenerator:
             title = self._generate_help_scenario_title(text_lower, feature_name, desc_ctx)
             return self._validate_and_fix_title(title, feature_name)
 
-        # Extract key action and create balanced title - order matters (more specific first)
-        action_patterns = [
-            # Specific patterns first
-            ('horizontally flip', 'Horizontal flip (mirror) transformation'),
-            ('vertically flip', 'Vertical flip (mirror) transformation'),
-            ('horizontal', 'Horizontal mirror transformation'),
-            ('vertical', 'Vertical mirror transformation'),
-            ('mirror.*horizontal', 'Horizontal mirror transformation'),
-            ('mirror.*vertical', 'Vertical mirror transformation'),
-            ('rotate.*object', 'Rotate selected objects'),
-            ('multi.*select', 'Multi-selection transformation'),
-            ('undo.*redo', 'Undo and redo support'),
-            ('undo', 'Undo action support'),
-            ('redo', 'Redo action support'),
-            ('enabled.*when.*select', 'Commands enabled on selection'),
-            ('enabled', 'Command enabled state'),
-            ('disabled', 'Command disabled state'),
-            ('properties panel.*available', 'Properties Panel commands'),
-            ('properties panel.*synchron', 'Menu and Properties Panel sync'),
-            ('properties panel', 'Properties Panel availability'),
-            ('synchron', 'Menu and Properties Panel sync'),
-            ('preserve.*position', 'Position preservation on transform'),
-            ('preserve', 'Property preservation on transform'),
-            ('update.*canvas', 'Immediate canvas update'),
-            ('canvas.*immediate', 'Immediate canvas update'),
-            ('canvas', 'Canvas update behavior'),
-            ('color.*border.*stroke', 'Visual property preservation'),
-            ('not.*modify.*color', 'Visual property preservation'),
-            ('color', 'Color preservation on transform'),
-            ('border', 'Border preservation on transform'),
-            ('available.*tools', 'Tools menu commands available'),
-            ('available.*menu', 'Menu commands available'),
-            ('available', 'Command availability'),
-            ('transform.*together', 'Group transformation behavior'),
-            ('transform', 'Transformation behavior'),
-            ('rotate', 'Rotate transformation'),
-            ('mirror', 'Mirror transformation'),
-            ('flip', 'Flip transformation'),
-            ('select', 'Selection behavior'),
-        ]
-
-        # Try to match action patterns (uses regex)
-        for pattern, title in action_patterns:
-            if re.search(pattern, text_lower):
-                return self._validate_and_fix_title(title, feature_name)
+        # Extract key action and create balanced title (SCENARIO_TITLES, most specific first)
+        title_rule = self.heuristics.first(SCENARIO_TITLES, text_lower)
+        if title_rule:
+            return self._validate_and_fix_title(title_rule.result, feature_name)
 
         # If no pattern matched, create a summarized title
         # Extract the main verb and object
         # Look for verb phrases
-        verb_match = re.search(
-            r'\b(rotate|mirror|flip|transform|update|preserve|synchronize|enable|disable|select|display|show|hide|apply)\w*\b',
-            text_lower
-        )
+        verb_match = self.heuristics.search('scenario_verb', text_lower)
 
         if verb_match:
             verb = verb_match.group(1).capitalize()
@@ -1978,7 +2014,7 @@ class GenericTestGenerator:
 
         # Fallback: Clean and truncate
         # Remove leading articles and conjunctions
-        text = re.sub(r'^(the|a|an|and|or|but|if|when|then)\s+', '', text, flags=re.IGNORECASE)
+        text = LEADING_FILLER_WORD.sub('', text)
 
         if text:
             text = text[0].upper() + text[1:]
@@ -2071,54 +2107,17 @@ class GenericTestGenerator:
         # Context-specific outcomes based on story type
         if story_type == StoryType.HELP_DOCUMENTATION:
             # Help/Documentation specific outcomes
-            help_outcomes = {
-                'open': f"{feature_name} viewer opens",
-                'display': f"{feature_name} content is displayed",
-                'appear': f"{feature_name} is visible in the menu",
-                'viewer': "In-app viewer displays content correctly",
-                'offline': "Content is accessible without internet connection",
-                'browser': "No external browser is launched",
-                'remain': "QuickDraw application remains open behind the viewer",
-                'close': f"{feature_name} viewer closes",
-            }
-            for keyword, outcome in help_outcomes.items():
-                if keyword in text_lower:
-                    return outcome
+            outcome_rule = self.heuristics.first(HELP_OUTCOMES, text_lower)
+            if outcome_rule:
+                return outcome_rule.result.format(feature=feature_name)
             # Default for Help features
             return f"{feature_name} content is displayed correctly"
 
-        # Action-specific observable outcomes (for object manipulation features)
-        action_outcomes = {
-            'display': f"{feature_name} is displayed",
-            'show': f"{feature_name} is visible",
-            'hide': f"{feature_name} is hidden",
-            'enable': f"{feature_name} is enabled",
-            'disable': f"{feature_name} is disabled",
-            'rotate': f"Selected object is rotated",
-            'mirror': f"Selected object is mirrored",
-            'flip': f"Selected object is flipped",
-            'transform': f"Object transformation is applied",
-            'open': f"{feature_name} dialog opens",
-            'close': f"{feature_name} closes",
-            'save': f"Changes are saved",
-            'update': f"{feature_name} is updated",
-            'select': f"Object is selected",
-            'apply': f"{feature_name} is applied to the selection",
-        }
-
-        for action_word, outcome in action_outcomes.items():
-            if action_word in text_lower:
-                return outcome
-
-        # Check for visibility indicators
-        if any(word in text_lower for word in ['displayed', 'shown', 'visible', 'appears']):
-            return f"{feature_name} is displayed"
-
-        # Check for state change indicators
-        if any(word in text_lower for word in ['enabled', 'disabled', 'active', 'inactive']):
-            if 'disabled' in text_lower or 'inactive' in text_lower:
-                return f"{feature_name} is disabled"
-            return f"{feature_name} is enabled"
+        # Action-specific observable outcomes (for object manipulation features),
+        # then visibility and state change indicators
+        outcome_rule = self.heuristics.first(ACTION_OUTCOMES, text_lower)
+        if outcome_rule:
+            return outcome_rule.result.format(feature=feature_name)
 
         # Default: Context-specific outcome
         if story_type == StoryType.HELP_DOCUMENTATION:
@@ -2142,8 +2141,6 @@ class GenericTestGenerator:
         Returns list of tuples: (ac_index1, ac_index2, reason)
         where ac_index2 should be skipped in favor of ac_index1.
         """
-        redundant = []
-
         # Normalize ACs for comparison
         normalized = []
         for ac in criteria:
@@ -2153,32 +2150,27 @@ class GenericTestGenerator:
             norm = re.sub(r'\s+', ' ', norm)
             normalized.append(norm)
 
-        # Check for similar ACs
-        for i, ac1 in enumerate(normalized):
-            for j, ac2 in enumerate(normalized):
-                if i >= j:
-                    continue
+        # Word overlap: near-duplicate detector (same rule as _are_acs_similar)
+        similar = {(i, j) for i, j, _ in self._ac_duplicates.similar_pairs(normalized)}
 
-                # Check for high similarity using word overlap
-                if self._are_acs_similar(ac1, ac2):
-                    reason = "Similar content - consolidating tests"
-                    redundant.append((i, j, reason))
+        # Key phrase overlap: the 0.9 boost only reaches the threshold when
+        # both ACs have exactly the same key phrases, so bucket by phrase set
+        phrase_groups = defaultdict(list)
+        for idx, norm in enumerate(normalized):
+            phrases = self._extract_key_phrases(norm)
+            if phrases and significant_ac_words(norm):
+                phrase_groups[frozenset(phrases)].append(idx)
+        for members in phrase_groups.values():
+            similar.update(combinations(members, 2))
 
-        return redundant
+        reason = "Similar content - consolidating tests"
+        return [(i, j, reason) for i, j in sorted(similar)]
 
     def _are_acs_similar(self, text1: str, text2: str, threshold: float = 0.7) -> bool:
         """Check if two AC texts are similar using word overlap."""
         # Extract significant words (remove common words)
-        stopwords = {'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
-                     'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
-                     'shall', 'should', 'can', 'could', 'may', 'might', 'must',
-                     'that', 'this', 'these', 'those', 'and', 'or', 'but', 'if',
-                     'when', 'where', 'which', 'who', 'whom', 'why', 'how',
-                     'to', 'of', 'in', 'for', 'on', 'with', 'at', 'by', 'from',
-                     'up', 'about', 'into', 'over', 'after', 'user', 'users'}
-
-        words1 = set(w for w in text1.split() if w not in stopwords and len(w) > 2)
-        words2 = set(w for w in text2.split() if w not in stopwords and len(w) > 2)
+        words1 = significant_ac_words(text1)
+        words2 = significant_ac_words(text2)
 
         if not words1 or not words2:
             return False
@@ -7,6 +7,9 @@ Contains:
 - testrail: TestRail integration (test case target)
 - export: Output generators (CSV, objectives, summaries)
 - repository_factory: Platform-agnostic repository creation
+- upload_executor, http_throttle: Concurrent uploads with 429 throttling
+- http_cache: Conditional GET cache for platform reads
+- http_resilience: Retries, circuit breaker and request metrics
 """
 from .ado import (
     ADOHttpClient,
@@ -35,6 +38,10 @@ from .repository_factory import (
     get_story_repository,
     get_test_repositories
 )
+from .upload_executor import UploadExecutor
+from .http_throttle import HostThrottle, get_host_throttle
+from .http_cache import HttpResponseCache, get_http_cache
+from .http_resilience import CircuitBreaker, CircuitOpenError, get_http_metrics
 
 __all__ = [
     # ADO
@@ -59,4 +66,15 @@ __all__ = [
     'RepositoryFactory',
     'get_story_repository',
     'get_test_repositories',
+    # Uploads
+    'UploadExecutor',
+    'HostThrottle',
+    'get_host_throttle',
+    # HTTP cache
+    'HttpResponseCache',
+    'get_http_cache',
+    # HTTP resilience
+    'CircuitBreaker',
+    'CircuitOpenError',
+    'get_http_metrics',
 ]
@@ -12,6 +12,7 @@ from .ado_repository import (
 )
 
 from .ado_bug_repository import ADOBugRepository
+from .suite_index import SuiteIndex, get_suite_index
 
 __all__ = [
     'ADOHttpClient',
@@ -19,5 +20,7 @@ __all__ = [
     'ADOTestSuiteRepository',
     'ADOTestCaseRepository',
     'ADOBugRepository',
-    'HtmlParser'
+    'HtmlParser',
+    'SuiteIndex',
+    'get_suite_index'
 ]
@@ -3,7 +3,7 @@ Azure DevOps repository implementations.
 
 Implements repository interfaces for ADO data access.
 """
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 import re
 from bs4 import BeautifulSoup
 
@@ -15,7 +15,9 @@ from core.interfaces.repository import (
     ITestCaseRepository
 )
 from core.interfaces.config_provider import IADOConfig
+from infrastructure.upload_executor import UploadExecutor
 from .http_client import ADOHttpClient
+from .suite_index import get_suite_index
 
 
 class HtmlParser:
@@ -259,6 +261,20 @@ class ADOStoryRepository(IStoryRepository):
         )
         self._parser = HtmlParser()
 
+    # Fields read from QA Prep tasks
+    QA_PREP_FIELDS = ['System.Id', 'System.Title', 'System.Description']
+
+    # Story ID -> QA Prep task ID, shared by all instances (keyed by project URL)
+    _qa_prep_ids: Dict[Tuple[str, int], int] = {}
+
+    # Fields needed to build a UserStory (projection for bulk reads)
+    STORY_FIELDS = [
+        'System.Id',
+        'System.Title',
+        'System.Description',
+        'Microsoft.VSTS.Common.AcceptanceCriteria',
+    ]
+
     def get_story(self, story_id: int) -> Optional[UserStory]:
         """Retrieve a user story by ID."""
         try:
@@ -266,31 +282,68 @@ class ADOStoryRepository(IStoryRepository):
                 f"_apis/wit/workitems/{story_id}",
                 params={"$expand": "all"}
             )
+            return self._story_from_fields(story_id, data.get('fields', {}))
+        except Exception as e:
+            print(f"Error retrieving story {story_id}: {e}")
+            return None
 
-            fields = data.get('fields', {})
-            title = fields.get('System.Title', '')
-            description_html = fields.get('System.Description', '')
-            ac_html = fields.get('Microsoft.VSTS.Common.AcceptanceCriteria', '')
+    def get_stories(self, story_ids: List[int]) -> Dict[int, UserStory]:
+        """Retrieve user stories with workitemsbatch (up to 200 per request).
 
-            description = self._parser.normalize_to_text(description_html)
-            ac_text = self._parser.normalize_to_text(ac_html)
+        Only the fields a UserStory needs are requested. Stories whose AC
+        field is empty still fall back to their first comment, one request
+        each. Missing or invalid stories are left out.
+        """
+        ids = list(dict.fromkeys(int(story_id) for story_id in story_ids))
+        limit = self._client.BATCH_LIMIT
+        chunks = [ids[start:start + limit] for start in range(0, len(ids), limit)]
 
-            # Try comments if AC field is empty
-            if not ac_text:
-                ac_text = self._extract_ac_from_comments(story_id)
+        def fetch(chunk: List[int]) -> List[Dict[str, Any]]:
+            result = self._client.post(
+                "_apis/wit/workitemsbatch",
+                data={"ids": chunk, "fields": self.STORY_FIELDS, "errorPolicy": "omit"}
+            )
+            return [item for item in result.get('value', []) if item]
 
-            ac_bullets = self._parser.parse_acceptance_criteria(ac_text)
+        stories = {}
+        for chunk, (items, error) in zip(chunks, UploadExecutor().map(fetch, chunks)):
+            if error is not None:
+                print(f"Error retrieving stories {chunk[0]}..{chunk[-1]}: {error}")
+                continue
+            for item in items:
+                story_id = item.get('id')
+                try:
+                    stories[story_id] = self._story_from_fields(story_id, item.get('fields', {}))
+                except Exception as e:
+                    print(f"Error retrieving story {story_id}: {e}")
+        return stories
 
-            return UserStory(
-                story_id=story_id,
-                title=title,
-                description=description,
-                acceptance_criteria_text=ac_text,
-                acceptance_criteria=ac_bullets
-            )
-        except Exception as e:
-            print(f"Error retrieving story {story_id}: {e}")
-            return None
+    def _story_from_fields(self, story_id: int, fields: Dict[str, Any]) -> UserStory:
+        """Build a UserStory from work item fields.
+
+        Raises:
+            ValueError: If the story has no title or acceptance criteria
+        """
+        title = fields.get('System.Title', '')
+        description_html = fields.get('System.Description', '')
+        ac_html = fields.get('Microsoft.VSTS.Common.AcceptanceCriteria', '')
+
+        description = self._parser.normalize_to_text(description_html)
+        ac_text = self._parser.normalize_to_text(ac_html)
+
+        # Try comments if AC field is empty
+        if not ac_text:
+            ac_text = self._extract_ac_from_comments(story_id)
+
+        ac_bullets = self._parser.parse_acceptance_criteria(ac_text)
+
+        return UserStory(
+            story_id=story_id,
+            title=title,
+            description=description,
+            acceptance_criteria_text=ac_text,
+            acceptance_criteria=ac_bullets
+        )
 
     def get_qa_prep(self, story_id: int) -> Optional[str]:
         """
@@ -300,68 +353,34 @@ class ADOStoryRepository(IStoryRepository):
         1. Gets child work items linked to the story
         2. Finds the QA Prep task among them
         3. Returns the QA Planning Summary from the Description field
+
+        A known QA Prep task is read with one request; otherwise the story's
+        children are resolved with two (see _qa_prep_children).
         """
         qa_prep_pattern = self._config.qa_prep_pattern
         if not qa_prep_pattern:
             return None
 
-        qa_prep_title = qa_prep_pattern.format(story_id=story_id)
-
         try:
-            # First, try to get QA Prep as a child task linked to the story
-            # Get story with relations
-            story_data = self._client.get(
-                f"_apis/wit/workitems/{story_id}",
-                params={"$expand": "relations"}
-            )
+            known_id = self._qa_prep_ids.get(self._qa_prep_key(story_id))
+            if known_id:
+                items = self._get_work_items([known_id], self.QA_PREP_FIELDS)
+                description = items[0].get('fields', {}).get('System.Description', '') if items else ''
+                if description:
+                    return self._parser.normalize_to_text(description)
 
-            relations = story_data.get('relations', [])
-
-            # Look for child links (System.LinkTypes.Hierarchy-Forward)
-            child_ids = []
-            for relation in relations:
-                rel_type = relation.get('rel', '')
-                # Child links are "System.LinkTypes.Hierarchy-Forward" or contains "Child"
-                if 'Hierarchy-Forward' in rel_type or 'Child' in rel_type:
-                    url = relation.get('url', '')
-                    # Extract work item ID from URL
-                    if '/workItems/' in url:
-                        child_id = url.split('/workItems/')[-1]
-                        try:
-                            child_ids.append(int(child_id))
-                        except ValueError:
-                            pass
-
-            # Check each child for QA Prep
-            for child_id in child_ids:
-                try:
-                    child_data = self._client.get(f"_apis/wit/workitems/{child_id}")
-                    child_fields = child_data.get('fields', {})
-                    child_title = child_fields.get('System.Title', '')
-
-                    # Check if this is the QA Prep task
-                    if 'QA Prep' in child_title or child_title == qa_prep_title:
-                        description = child_fields.get('System.Description', '')
-                        if description:
-                            return self._parser.normalize_to_text(description)
-                except Exception:
-                    continue
+            # First, try to get QA Prep as a child task linked to the story
+            children = self._qa_prep_children(story_id)
+            for child in children:
+                description = child.get('fields', {}).get('System.Description', '')
+                if description:
+                    return self._parser.normalize_to_text(description)
 
             # Fallback: Search by title pattern if no child QA Prep found
-            query = (
-                f"Select [System.Id], [System.Title] "
-                f"From WorkItems "
-                f"Where [System.Title] Contains 'QA Prep' "
-                f"And [System.Title] Contains '{story_id}'"
-            )
-
-            result = self._client.execute_wiql(query)
-            work_items = result.get('workItems', [])
-
-            if work_items:
-                work_item_id = work_items[0]['id']
-                item_data = self._client.get(f"_apis/wit/workitems/{work_item_id}")
-                description = item_data.get('fields', {}).get('System.Description', '')
+            work_item_id = self._search_qa_prep_id(story_id)
+            if work_item_id:
+                items = self._get_work_items([work_item_id], self.QA_PREP_FIELDS)
+                description = items[0].get('fields', {}).get('System.Description', '') if items else ''
                 return self._parser.normalize_to_text(description)
 
             return None
@@ -410,7 +429,7 @@ class ADOStoryRepository(IStoryRepository):
             return False
 
     def _find_qa_prep_id(self, story_id: int) -> Optional[int]:
-        """Find QA Prep child task ID for a story.
+        """Find QA Prep child task ID for a story (memoized per project).
 
         Returns:
             Work item ID of the QA Prep task, or None if not found
@@ -419,58 +438,100 @@ class ADOStoryRepository(IStoryRepository):
         if not qa_prep_pattern:
             return None
 
-        qa_prep_title = qa_prep_pattern.format(story_id=story_id)
+        known_id = self._qa_prep_ids.get(self._qa_prep_key(story_id))
+        if known_id:
+            return known_id
 
         try:
-            # Get story with relations
-            story_data = self._client.get(
-                f"_apis/wit/workitems/{story_id}",
-                params={"$expand": "relations"}
-            )
-
-            relations = story_data.get('relations', [])
-
-            # Look for child links
-            child_ids = []
-            for relation in relations:
-                rel_type = relation.get('rel', '')
-                if 'Hierarchy-Forward' in rel_type or 'Child' in rel_type:
-                    url = relation.get('url', '')
-                    if '/workItems/' in url:
-                        child_id = url.split('/workItems/')[-1]
-                        try:
-                            child_ids.append(int(child_id))
-                        except ValueError:
-                            pass
-
-            # Check each child for QA Prep
-            for child_id in child_ids:
-                try:
-                    child_data = self._client.get(f"_apis/wit/workitems/{child_id}")
-                    child_title = child_data.get('fields', {}).get('System.Title', '')
-                    if 'QA Prep' in child_title or child_title == qa_prep_title:
-                        return child_id
-                except Exception:
-                    continue
+            children = self._qa_prep_children(story_id)
+            if children:
+                return children[0]['id']
 
             # Fallback: WIQL search
-            query = (
-                f"Select [System.Id], [System.Title] "
-                f"From WorkItems "
-                f"Where [System.Title] Contains 'QA Prep' "
-                f"And [System.Title] Contains '{story_id}'"
-            )
-
-            result = self._client.execute_wiql(query)
-            work_items = result.get('workItems', [])
-            if work_items:
-                return work_items[0]['id']
-
-            return None
+            return self._search_qa_prep_id(story_id)
         except Exception as e:
             print(f"  Error finding QA Prep task for story {story_id}: {e}")
             return None
 
+    def _qa_prep_key(self, story_id: int) -> Tuple[str, int]:
+        return (self._client.base_url, int(story_id))
+
+    def _qa_prep_children(self, story_id: int) -> List[Dict[str, Any]]:
+        """QA Prep child tasks of a story, in link order.
+
+        Costs two requests whatever the number of children: the story's
+        relations, then one workitemsbatch of every child's Title and
+        Description. The first match is memoized as the story's QA Prep.
+        """
+        qa_prep_title = self._config.qa_prep_pattern.format(story_id=story_id)
+
+        story_data = self._client.get(
+            f"_apis/wit/workitems/{story_id}",
+            params={"$expand": "relations"}
+        )
+
+        # Look for child links (System.LinkTypes.Hierarchy-Forward)
+        child_ids = []
+        for relation in story_data.get('relations', []) or []:
+            rel_type = relation.get('rel', '')
+            # Child links are "System.LinkTypes.Hierarchy-Forward" or contains "Child"
+            if 'Hierarchy-Forward' in rel_type or 'Child' in rel_type:
+                url = relation.get('url', '')
+                # Extract work item ID from URL
+                if '/workItems/' in url:
+                    child_id = url.split('/workItems/')[-1]
+                    try:
+                        child_ids.append(int(child_id))
+                    except ValueError:
+                        pass
+
+        if not child_ids:
+            return []
+
+        matches = []
+        for child in self._get_work_items(child_ids, self.QA_PREP_FIELDS):
+            child_title = child.get('fields', {}).get('System.Title', '')
+            # Check if this is the QA Prep task
+            if 'QA Prep' in child_title or child_title == qa_prep_title:
+                matches.append(child)
+
+        if matches:
+            self._qa_prep_ids[self._qa_prep_key(story_id)] = matches[0]['id']
+        return matches
+
+    def _search_qa_prep_id(self, story_id: int) -> Optional[int]:
+        """QA Prep task found by title search (memoized like a child match)."""
+        query = (
+            f"Select [System.Id], [System.Title] "
+            f"From WorkItems "
+            f"Where [System.Title] Contains 'QA Prep' "
+            f"And [System.Title] Contains '{story_id}'"
+        )
+
+        result = self._client.execute_wiql(query)
+        work_items = result.get('workItems', [])
+        if not work_items:
+            return None
+
+        work_item_id = work_items[0]['id']
+        self._qa_prep_ids[self._qa_prep_key(story_id)] = work_item_id
+        return work_item_id
+
+    def _get_work_items(self, ids: List[int], fields: List[str]) -> List[Dict[str, Any]]:
+        """Work items (selected fields only) in ID order, missing ones left out.
+
+        Uses one workitemsbatch request per ADOHttpClient.BATCH_LIMIT IDs.
+        """
+        items = []
+        limit = self._client.BATCH_LIMIT
+        for start in range(0, len(ids), limit):
+            result = self._client.post(
+                "_apis/wit/workitemsbatch",
+                data={"ids": ids[start:start + limit], "fields": fields, "errorPolicy": "omit"}
+            )
+            items.extend(item for item in result.get('value', []) if item)
+        return items
+
     @staticmethod
     def _bold_to_html(text: str) -> str:
         """Convert **bold** Markdown to <b>bold</b> HTML."""
@@ -584,39 +645,14 @@ class ADOTestSuiteRepository(ITestSuiteRepository):
         )
 
     def find_suite_by_story_id(self, story_id: int) -> Optional[Dict[str, Any]]:
-        """Find test suite matching story ID pattern."""
-        prefix = f"{story_id} :"
-
+        """Find test suite matching story ID pattern (via the run-wide suite index)."""
         try:
-            # Get all test plans
-            plans = self._client.get("_apis/testplan/plans")
-
-            for plan in plans.get('value', []):
-                plan_id = plan['id']
-                suites = self._get_all_suites(plan_id)
-
-                for suite in suites:
-                    if suite.get('name', '').startswith(prefix):
-                        return {
-                            'id': suite['id'],
-                            'name': suite['name'],
-                            'plan_id': plan_id
-                        }
+            return get_suite_index(self._client).find(story_id)
         except Exception as e:
             print(f"Error finding test suite for story {story_id}: {e}")
 
         return None
 
-    def _get_all_suites(self, plan_id: int) -> List[Dict]:
-        """Get all suites in a test plan recursively."""
-        suites = []
-        try:
-            result = self._client.get(f"_apis/testplan/Plans/{plan_id}/suites")
-            suites.extend(result.get('value', []))
-        except Exception:
-            pass
-        return suites
-
     def create_suite(
         self,
         plan_id: int,
@@ -638,11 +674,13 @@ class ADOTestSuiteRepository(ITestSuiteRepository):
                 }
             )
 
-            return {
+            suite = {
                 'id': result['id'],
                 'name': result['name'],
                 'plan_id': plan_id
             }
+            get_suite_index(self._client).add(story_id, suite)
+            return suite
         except Exception as e:
             print(f"Error creating test suite: {e}")
             return None
@@ -664,6 +702,43 @@ class ADOTestSuiteRepository(ITestSuiteRepository):
             print(f"Error adding test case to suite: {e}")
             return False
 
+    def add_test_cases_to_suite(
+        self,
+        plan_id: int,
+        suite_id: int,
+        test_case_ids: List[int]
+    ) -> List[int]:
+        """Add test cases to a test suite in one request.
+
+        Test cases the bulk response does not list as added (or all of
+        them, if the bulk request fails) are retried one at a time, so each
+        failure is reported for its own test case.
+        """
+        if not test_case_ids:
+            return []
+
+        added: List[int] = []
+        try:
+            result = self._client.post(
+                f"_apis/testplan/Plans/{plan_id}/Suites/{suite_id}/TestCase",
+                data=[{'workItem': {'id': test_case_id}} for test_case_id in test_case_ids]
+            )
+            if isinstance(result, dict) and 'value' in result:
+                listed = {item.get('workItem', {}).get('id') for item in result['value']}
+                added = [i for i in test_case_ids if i in listed]
+            else:
+                added = list(test_case_ids)
+        except Exception as e:
+            print(f"Error adding test cases to suite (bulk): {e}")
+
+        in_suite = set(added)
+        missing = [i for i in test_case_ids if i not in in_suite]
+        added.extend(
+            test_case_id for test_case_id in missing
+            if self.add_test_case_to_suite(plan_id, suite_id, test_case_id)
+        )
+        return added
+
     def get_test_cases_in_suite(
         self,
         plan_id: int,
@@ -717,34 +792,7 @@ class ADOTestCaseRepository(ITestCaseRepository):
         State transition to 'Ready' happens later via update-objectives workflow.
         """
         try:
-            steps_xml = self._build_steps_xml(steps)
-
-            patch_doc = [
-                {"op": "add", "path": "/fields/System.Title", "value": title},
-                {"op": "add", "path": "/fields/Microsoft.VSTS.TCM.Steps", "value": steps_xml}
-            ]
-
-            # Add optional fields
-            if kwargs.get('assigned_to') or self._config.assigned_to:
-                patch_doc.append({
-                    "op": "add",
-                    "path": "/fields/System.AssignedTo",
-                    "value": kwargs.get('assigned_to', self._config.assigned_to)
-                })
-
-            if kwargs.get('area_path') or self._config.area_path:
-                patch_doc.append({
-                    "op": "add",
-                    "path": "/fields/System.AreaPath",
-                    "value": kwargs.get('area_path', self._config.area_path)
-                })
-
-            if objective:
-                patch_doc.append({
-                    "op": "add",
-                    "path": "/fields/System.Description",
-                    "value": objective
-                })
+            patch_doc = self._build_patch_doc(title, steps, objective, **kwargs)
 
             result = self._client.patch(
                 "_apis/wit/workitems/$Test Case",
@@ -756,6 +804,98 @@ class ADOTestCaseRepository(ITestCaseRepository):
             print(f"Error creating test case: {e}")
             return None
 
+    def create_test_cases(
+        self,
+        test_cases: List[Dict[str, Any]],
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """Create test cases through the work item $batch endpoint.
+
+        Test cases are sent in chunks of up to ADOHttpClient.BATCH_LIMIT,
+        several chunks at a time (see UploadExecutor).
+        A failed operation only fails its own test case; a failed chunk
+        request fails every test case in that chunk.
+
+        Args:
+            test_cases: Dicts with 'title', 'steps' and 'objective'
+            **kwargs: Additional fields (assigned_to, area_path)
+
+        Returns:
+            One {'id': work item ID or None, 'error': message or None} per
+            test case, in order
+        """
+        uri = f"/{self._client.project}/_apis/wit/workitems/$Test Case?api-version={self._client.API_VERSION}"
+        operations = [
+            {
+                'method': 'PATCH',
+                'uri': uri,
+                'headers': {'Content-Type': 'application/json-patch+json'},
+                'body': self._build_patch_doc(
+                    tc.get('title', ''), tc.get('steps', []), tc.get('objective', ''), **kwargs
+                )
+            }
+            for tc in test_cases
+        ]
+
+        limit = self._client.BATCH_LIMIT
+        chunks = [operations[start:start + limit] for start in range(0, len(operations), limit)]
+
+        results = []
+        for chunk, (responses, error) in zip(chunks, UploadExecutor().map(self._client.batch, chunks)):
+            if error is not None:
+                print(f"Error creating test cases (batch of {len(chunk)}): {error}")
+                results.extend({'id': None, 'error': str(error)} for _ in chunk)
+                continue
+
+            for idx in range(len(chunk)):
+                if idx >= len(responses):
+                    results.append({'id': None, 'error': 'No response in batch'})
+                    continue
+                code, body = responses[idx]['code'], responses[idx]['body']
+                if 200 <= code < 300 and isinstance(body, dict) and body.get('id'):
+                    results.append({'id': body['id'], 'error': None})
+                else:
+                    message = body.get('message') if isinstance(body, dict) else None
+                    results.append({'id': None, 'error': message or f"HTTP {code}"})
+        return results
+
+    def _build_patch_doc(
+        self,
+        title: str,
+        steps: List[Dict[str, str]],
+        objective: str,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """JSON patch document that creates a test case."""
+        patch_doc = [
+            {"op": "add", "path": "/fields/System.Title", "value": title},
+            {"op": "add", "path": "/fields/Microsoft.VSTS.TCM.Steps", "value": self._build_steps_xml(steps)}
+        ]
+
+        # Add optional fields
+        if kwargs.get('assigned_to') or self._config.assigned_to:
+            patch_doc.append({
+                "op": "add",
+                "path": "/fields/System.AssignedTo",
+                "value": kwargs.get('assigned_to', self._config.assigned_to)
+            })
+
+        if kwargs.get('area_path') or self._config.area_path:
+            patch_doc.append({
+                "op": "add",
+                "path": "/fields/System.AreaPath",
+                "value": kwargs.get('area_path', self._config.area_path)
+            })
+
+        if objective:
+            patch_doc.append({
+                "op": "add",
+                "path": "/fields/System.Description",
+                "value": objective
+            })
+
+        return patch_doc
+
     def update_test_case(
         self,
         test_case_id: int,
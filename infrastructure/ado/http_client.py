@@ -4,22 +4,45 @@ ADO HTTP Client - Low-level HTTP interactions with Azure DevOps.
 This class handles only HTTP concerns, keeping infrastructure separate from domain logic.
 """
 import base64
-from typing import Dict, Optional, Any
+import json
+import os
+import re
+from typing import Dict, List, Optional, Any
 import requests
 from requests.auth import HTTPBasicAuth
 
+from infrastructure.http_cache import HttpResponseCache, RevisionProbe, get_http_cache
+from infrastructure.http_throttle import throttled_request
+
+# Single work item reads, which can be revalidated by reading only their rev
+_WORK_ITEM_ENDPOINT = re.compile(r'^_apis/wit/workitems/(\d+)$', re.IGNORECASE)
+
 
 class ADOHttpClient:
     """Low-level HTTP client for Azure DevOps API."""
 
     API_VERSION = "7.1"
 
+    # Azure DevOps Services (override for Azure DevOps Server or a local fake)
+    DEFAULT_SERVER_URL = "https://dev.azure.com"
+
+    # Maximum operations per work item $batch request
+    BATCH_LIMIT = 200
+
+    # Response header carrying the next page's token on list endpoints
+    CONTINUATION_HEADER = 'x-ms-continuationtoken'
+
+    # POST endpoints that only read, so they are safe to retry
+    READ_ONLY_POSTS = ('_apis/wit/workitemsbatch', '_apis/wit/wiql')
+
     def __init__(
         self,
         organization: str,
         project: str,
         pat: str,
-        timeout: int = 30
+        timeout: int = 30,
+        cache: Optional[HttpResponseCache] = None,
+        server_url: Optional[str] = None
     ):
         """Initialize ADO HTTP client.
 
@@ -28,6 +51,9 @@ class ADOHttpClient:
             project: ADO project name
             pat: Personal Access Token
             timeout: Request timeout in seconds
+            cache: Response cache for get() (default: process-wide cache)
+            server_url: Server URL (default: ADO_SERVER_URL env var, or
+                https://dev.azure.com)
         """
         if not pat:
             raise ValueError("Personal Access Token (PAT) is required")
@@ -40,14 +66,26 @@ class ADOHttpClient:
         self._project = project
         self._pat = pat
         self._timeout = timeout
-        self._base_url = f"https://dev.azure.com/{organization}/{project}"
+        self._server_url = (server_url or os.getenv("ADO_SERVER_URL") or self.DEFAULT_SERVER_URL).rstrip('/')
+        self._base_url = f"{self._server_url}/{organization}/{project}"
         self._headers = self._create_headers()
+        self._cache = cache if cache is not None else get_http_cache()
 
     @property
     def base_url(self) -> str:
         """Base URL for API calls."""
         return self._base_url
 
+    @property
+    def organization_url(self) -> str:
+        """Organization-level URL (for APIs not scoped to a project)."""
+        return f"{self._server_url}/{self._organization}"
+
+    @property
+    def project(self) -> str:
+        """Project name."""
+        return self._project
+
     @property
     def headers(self) -> Dict[str, str]:
         """Headers for API calls."""
@@ -64,6 +102,9 @@ class ADOHttpClient:
     def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """Make GET request to ADO API.
 
+        Responses are cached; a stored response is revalidated (work item
+        rev probe or If-None-Match) before it is reused.
+
         Args:
             endpoint: API endpoint (relative to base URL)
             params: Optional query parameters
@@ -74,19 +115,74 @@ class ADOHttpClient:
         Raises:
             requests.HTTPError: If request fails
         """
+        params = dict(params or {})
+        params.setdefault('api-version', self.API_VERSION)
+        return self._cache.get(
+            f"{self._base_url}/{endpoint}",
+            params,
+            fetch=lambda headers: self._get_response(endpoint, dict(params), headers),
+            probe=self._revision_probe(endpoint)
+        )
+
+    def _revision_probe(self, endpoint: str) -> Optional[RevisionProbe]:
+        """Probe comparing a cached work item's rev with the server's."""
+        if not _WORK_ITEM_ENDPOINT.match(endpoint):
+            return None
+
+        def probe(cached: Dict[str, Any]) -> bool:
+            if 'rev' not in cached:
+                return False
+            current = self._get_response(endpoint, {'fields': 'System.Rev'}).json()
+            return current.get('rev') == cached['rev']
+
+        return probe
+
+    def get_all(self, endpoint: str, params: Optional[Dict] = None) -> List[Dict[str, Any]]:
+        """GET every page of a list endpoint.
+
+        Follows the x-ms-continuationtoken response header (passed back as
+        the continuationToken query parameter) until the last page.
+
+        Args:
+            endpoint: API endpoint returning {'value': [...]}
+            params: Optional query parameters
+
+        Returns:
+            Items of all pages
+
+        Raises:
+            requests.HTTPError: If a request fails
+        """
+        params = dict(params or {})
+        items: List[Dict[str, Any]] = []
+        while True:
+            response = self._get_response(endpoint, dict(params))
+            items.extend(response.json().get('value', []))
+            token = (response.headers or {}).get(self.CONTINUATION_HEADER)
+            if not token:
+                return items
+            params['continuationToken'] = token
+
+    def _get_response(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> requests.Response:
         url = f"{self._base_url}/{endpoint}"
         if 'api-version' not in (params or {}):
             params = params or {}
             params['api-version'] = self.API_VERSION
 
-        response = requests.get(
+        response = throttled_request(
+            requests.get,
             url,
-            headers=self._headers,
+            headers={**self._headers, **(headers or {})},
             params=params,
             timeout=self._timeout
         )
         response.raise_for_status()
-        return response.json()
+        return response
 
     def post(
         self,
@@ -109,8 +205,10 @@ class ADOHttpClient:
             params = params or {}
             params['api-version'] = self.API_VERSION
 
-        response = requests.post(
+        response = throttled_request(
+            requests.post,
             url,
+            idempotent=endpoint in self.READ_ONLY_POSTS,
             headers=self._headers,
             json=data,
             params=params,
@@ -145,7 +243,8 @@ class ADOHttpClient:
         headers = self._headers.copy()
         headers['Content-Type'] = content_type
 
-        response = requests.patch(
+        response = throttled_request(
+            requests.patch,
             url,
             headers=headers,
             json=data,
@@ -165,3 +264,46 @@ class ADOHttpClient:
             Query results
         """
         return self.post("_apis/wit/wiql", {"query": query})
+
+    def batch(self, operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send work item operations in one $batch request.
+
+        The batch is not transactional: each operation succeeds or fails on
+        its own and gets its own status code.
+
+        Args:
+            operations: Up to BATCH_LIMIT operations, each a dict with
+                'method', 'uri' (project-relative, e.g.
+                "/Project/_apis/wit/workitems/$Test Case?api-version=7.1"),
+                'headers' and 'body'
+
+        Returns:
+            One {'code': int, 'body': parsed JSON} per operation, in order
+
+        Raises:
+            ValueError: If more than BATCH_LIMIT operations are given
+            requests.HTTPError: If the batch request itself fails
+        """
+        if len(operations) > self.BATCH_LIMIT:
+            raise ValueError(f"At most {self.BATCH_LIMIT} operations per batch, got {len(operations)}")
+
+        response = throttled_request(
+            requests.post,
+            f"{self.organization_url}/_apis/wit/$batch",
+            headers=self._headers,
+            json=operations,
+            params={'api-version': self.API_VERSION},
+            timeout=self._timeout
+        )
+        response.raise_for_status()
+
+        results = []
+        for item in response.json().get('value', []):
+            body = item.get('body')
+            if isinstance(body, str):
+                try:
+                    body = json.loads(body)
+                except ValueError:
+                    pass
+            results.append({'code': item.get('code', 0), 'body': body})
+        return results
@@ -0,0 +1,140 @@
+"""
+ADO Suite Index - story ID -> test suite lookup.
+
+Finding a story's suite ("{story_id} : {title}") used to list every test
+plan and every plan's suites on each lookup. The index lists them once
+(all pages, plans in parallel) and answers lookups from memory. It is
+shared per organization/project for the whole run and rebuilt when older
+than its TTL. A lookup that misses rebuilds it early, at most once per
+refresh interval, so suites created elsewhere during a long run are still
+found.
+"""
+import os
+import re
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from infrastructure.upload_executor import UploadExecutor
+from .http_client import ADOHttpClient
+
+# Suite names start with "{story_id} :"
+_STORY_PREFIX = re.compile(r'^(\d+) :')
+
+DEFAULT_TTL_SECONDS = 900.0
+DEFAULT_MISS_REFRESH_SECONDS = 60.0
+
+
+class SuiteIndex:
+    """Story ID -> test suite index over all test plans.
+
+    Usage:
+        index = get_suite_index(client)
+        suite = index.find(story_id)  # {'id', 'name', 'plan_id'} or None
+    """
+
+    def __init__(
+        self,
+        client: ADOHttpClient,
+        ttl: Optional[float] = None,
+        miss_refresh: float = DEFAULT_MISS_REFRESH_SECONDS
+    ):
+        """Initialize index (built on first lookup).
+
+        Args:
+            client: ADO HTTP client
+            ttl: Seconds before the index is rebuilt (default:
+                SUITE_INDEX_TTL env var, or 900)
+            miss_refresh: Minimum seconds between rebuilds triggered by a
+                lookup that found nothing
+        """
+        self._client = client
+        self.ttl = ttl if ttl is not None else float(os.getenv("SUITE_INDEX_TTL", DEFAULT_TTL_SECONDS))
+        self.miss_refresh = miss_refresh
+        self._suites: Dict[int, Dict] = {}
+        self._built_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self.builds = 0
+
+    def find(self, story_id: int) -> Optional[Dict]:
+        """Suite for a story.
+
+        Args:
+            story_id: Story work item ID
+
+        Returns:
+            Dict with 'id', 'name', 'plan_id', or None if no suite matches
+        """
+        with self._lock:
+            if self._built_at is None or self._age() > self.ttl:
+                self._build()
+            elif story_id not in self._suites and self._age() > self.miss_refresh:
+                self._build()
+            suite = self._suites.get(story_id)
+            return dict(suite) if suite else None
+
+    def add(self, story_id: int, suite: Dict) -> None:
+        """Record a suite created during this run."""
+        with self._lock:
+            self._suites.setdefault(story_id, dict(suite))
+
+    def refresh(self) -> None:
+        """Rebuild the index now."""
+        with self._lock:
+            self._build()
+
+    def __len__(self) -> int:
+        return len(self._suites)
+
+    def invalidate(self) -> None:
+        """Force a rebuild on the next lookup."""
+        with self._lock:
+            self._built_at = None
+
+    def _age(self) -> float:
+        return time.monotonic() - self._built_at
+
+    def _build(self) -> None:
+        plans = self._client.get_all("_apis/testplan/plans")
+        suites: Dict[int, Dict] = {}
+        listed = UploadExecutor().map(self._plan_suites, [plan['id'] for plan in plans])
+        for plan_suites, error in listed:
+            if error is not None:
+                continue
+            for story_id, suite in plan_suites:
+                # First match in plan/suite order wins, as in a linear scan
+                suites.setdefault(story_id, suite)
+        self._suites = suites
+        self._built_at = time.monotonic()
+        self.builds += 1
+
+    def _plan_suites(self, plan_id: int) -> List[Tuple[int, Dict]]:
+        found = []
+        for suite in self._client.get_all(f"_apis/testplan/Plans/{plan_id}/suites"):
+            match = _STORY_PREFIX.match(suite.get('name', ''))
+            if match:
+                found.append((int(match.group(1)), {
+                    'id': suite['id'],
+                    'name': suite['name'],
+                    'plan_id': plan_id
+                }))
+        return found
+
+
+_indexes: Dict[str, SuiteIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_suite_index(client: ADOHttpClient) -> SuiteIndex:
+    """Run-wide suite index for the client's organization and project."""
+    with _indexes_lock:
+        key = client.base_url
+        if key not in _indexes:
+            _indexes[key] = SuiteIndex(client)
+        return _indexes[key]
+
+
+def reset_suite_indexes() -> None:
+    """Drop all suite indexes."""
+    with _indexes_lock:
+        _indexes.clear()
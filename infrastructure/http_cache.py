@@ -0,0 +1,221 @@
+"""
+HTTP Response Cache - conditional GETs for ADO and Jira reads.
+
+Story, suite and test case reads used to be refetched in full on every
+workflow run. GET responses are now stored (in the "http" namespace of a
+CacheManager) with their ETag. A stored response
+younger than its TTL is served without a request; an older one is
+revalidated first, either with a cheap revision probe supplied by the
+client (e.g. reading only a work item's rev) or with If-None-Match, and
+served locally when the server reports no change (304).
+
+The default TTL is 0 (always revalidate); per-endpoint overrides let
+slow-changing endpoints (field lists, test configurations) be served
+without asking. Entries are kept for the current process by default. Set
+HTTP_CACHE=file to persist them across runs (revalidations only refresh
+the in-memory copy, so the file index is rewritten only when a body
+changes), or =off to disable. HTTP_CACHE_TTL sets the default TTL in
+seconds and HTTP_CACHE_TTLS adds overrides as "regex=seconds;...".
+"""
+import copy
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Callable, Dict, Optional
+
+DEFAULT_HTTP_CACHE_DIR = ".cache/http"
+DEFAULT_NAMESPACE = "http"
+
+# Stored responses expire to bound disk usage; freshness is governed by TTLs
+HTTP_CACHE_RETENTION = timedelta(days=7)
+
+NOT_MODIFIED = 304
+
+# URL regex -> seconds a response is served without revalidation
+DEFAULT_ENDPOINT_TTLS: Dict[str, float] = {
+    r'/_apis/testplan/configurations$': 3600.0,
+    r'/rest/api/\d+/field$': 3600.0,
+}
+
+# Returns True when the cached body is still current
+RevisionProbe = Callable[[Any], bool]
+
+
+class HttpResponseCache:
+    """Conditional GET cache over a namespaced CacheManager.
+
+    Usage:
+        cache = get_http_cache()
+        body = cache.get(url, params, fetch=lambda headers: send(headers))
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_HTTP_CACHE_DIR,
+        namespace: str = DEFAULT_NAMESPACE,
+        ttl: float = 0.0,
+        endpoint_ttls: Optional[Dict[str, float]] = None,
+        enable_file: bool = False,
+        enabled: bool = True
+    ):
+        """Initialize cache.
+
+        Args:
+            cache_dir: Directory for the on-disk tier
+            namespace: CacheManager key namespace
+            ttl: Seconds a response is served without revalidation
+            endpoint_ttls: URL regex -> TTL overrides (longest match wins;
+                default: DEFAULT_ENDPOINT_TTLS)
+            enable_file: Persist responses across runs
+            enabled: False to always fetch (no caching)
+        """
+        # Imported here: core.services imports the repositories that use this
+        from core.services.cache import CacheManager
+
+        self.enabled = enabled
+        self.ttl = ttl
+        self.endpoint_ttls = dict(DEFAULT_ENDPOINT_TTLS if endpoint_ttls is None else endpoint_ttls)
+        self._cache = CacheManager(
+            enable_memory=True,
+            enable_file=enable_file,
+            cache_dir=cache_dir,
+            file_ttl=HTTP_CACHE_RETENTION,
+            namespace=namespace
+        ) if enabled else None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def ttl_for(self, url: str) -> float:
+        """TTL for a URL (the longest matching override, else the default)."""
+        matches = [p for p in self.endpoint_ttls if re.search(p, url)]
+        if not matches:
+            return self.ttl
+        return self.endpoint_ttls[max(matches, key=len)]
+
+    @staticmethod
+    def key(url: str, params: Optional[Dict] = None) -> str:
+        """Cache key for a GET (URL plus sorted query parameters)."""
+        payload = json.dumps([url, params or {}], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict],
+        fetch: Callable[[Dict[str, str]], Any],
+        probe: Optional[RevisionProbe] = None
+    ) -> Any:
+        """JSON body for a GET, from cache when the server says it is current.
+
+        Args:
+            url: Request URL (without query string)
+            params: Query parameters
+            fetch: Sends the GET with the given extra headers and returns
+                the response (raising on HTTP errors)
+            probe: Optional cheap check that a cached body is current,
+                tried before a conditional GET
+
+        Returns:
+            Parsed JSON body (a copy on cache hits, free to mutate)
+        """
+        if not self.enabled:
+            return fetch({}).json()
+
+        key = self.key(url, params)
+        entry = self._cache.get(key)
+
+        if entry is not None:
+            if time.time() - entry['stored_at'] < self.ttl_for(url):
+                self._count('hits')
+                return copy.deepcopy(entry['body'])
+            if probe is not None and self._probe(probe, entry['body']):
+                self._touch(key, entry)
+                return copy.deepcopy(entry['body'])
+
+        headers = {'If-None-Match': entry['etag']} if entry and entry.get('etag') else {}
+        response = fetch(headers)
+        if entry is not None and response.status_code == NOT_MODIFIED:
+            self._touch(key, entry)
+            return copy.deepcopy(entry['body'])
+
+        body = response.json()
+        self._count('misses')
+        self._cache.set(key, {
+            'body': copy.deepcopy(body),
+            'etag': (response.headers or {}).get('ETag'),
+            'stored_at': time.time(),
+        }, ttl=HTTP_CACHE_RETENTION)
+        return body
+
+    def invalidate(self, url: str, params: Optional[Dict] = None) -> None:
+        """Drop the stored response for a GET."""
+        if self._cache:
+            self._cache.delete(self.key(url, params))
+
+    def clear(self) -> None:
+        """Drop all stored responses (both tiers)."""
+        if self._cache:
+            self._cache.clear()
+        self.hits = self.revalidated = self.misses = 0
+
+    @staticmethod
+    def _probe(probe: RevisionProbe, body: Any) -> bool:
+        try:
+            return bool(probe(body))
+        except Exception:
+            # A failed probe only means we cannot skip the full request
+            return False
+
+    def _touch(self, key: str, entry: Dict[str, Any]) -> None:
+        # The stored body is unchanged, so the file tier is left alone
+        self._count('revalidated')
+        self._cache.set(key, dict(entry, stored_at=time.time()), ttl=HTTP_CACHE_RETENTION, memory_only=True)
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+
+def _parse_endpoint_ttls(value: str) -> Dict[str, float]:
+    ttls = {}
+    for item in value.split(';'):
+        pattern, sep, seconds = item.strip().rpartition('=')
+        if sep and pattern:
+            ttls[pattern] = float(seconds)
+    return ttls
+
+
+_cache: Optional[HttpResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> HttpResponseCache:
+    """Get the process-wide HTTP response cache (configured from env)."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            mode = os.getenv("HTTP_CACHE", "memory").lower()
+            endpoint_ttls = dict(DEFAULT_ENDPOINT_TTLS)
+            endpoint_ttls.update(_parse_endpoint_ttls(os.getenv("HTTP_CACHE_TTLS", "")))
+            _cache = HttpResponseCache(
+                cache_dir=os.getenv("HTTP_CACHE_DIR", DEFAULT_HTTP_CACHE_DIR),
+                namespace=os.getenv("HTTP_CACHE_NAMESPACE", DEFAULT_NAMESPACE),
+                ttl=float(os.getenv("HTTP_CACHE_TTL", "0")),
+                endpoint_ttls=endpoint_ttls,
+                enable_file=mode == "file",
+                enabled=mode != "off"
+            )
+        return _cache
+
+
+def reset_http_cache() -> None:
+    """Forget the process-wide cache (next call re-reads env settings)."""
+    global _cache
+    with _cache_lock:
+        _cache = None
@@ -0,0 +1,260 @@
+"""
+HTTP Resilience - retry backoff, circuit breaking and request metrics.
+
+Shared by every request sent through http_throttle.throttled_request (the
+ADO, Jira and TestRail clients):
+
+- Transient failures (connection errors, timeouts, 500/502/503/504) are
+  retried with jittered exponential backoff, but only for idempotent
+  requests; a POST that may have been applied is never sent twice.
+- A per-host circuit breaker opens after a run of consecutive failures, so
+  a degraded server is not hammered: requests fail fast with
+  CircuitOpenError until the reset timeout, then a single half-open probe
+  decides whether to close the circuit again.
+- Every attempt is recorded per endpoint (latency histogram, retries,
+  failures); see get_http_metrics().report().
+"""
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+
+# Server errors worth retrying (the request may succeed a moment later)
+TRANSIENT_STATUS = frozenset({500, 502, 503, 504})
+
+# Methods that can be repeated without changing the outcome
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+
+BACKOFF_BASE = 0.5
+MAX_BACKOFF = 30.0
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30.0
+
+# Latency histogram bucket upper bounds (milliseconds)
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Numeric path segments, except API versions (/rest/api/3)
+_NUMERIC_SEGMENT = re.compile(r'(?<!/api)/\d+(?=/|&|$)')
+_ISSUE_KEY = re.compile(r'/[A-Z][A-Z0-9_]+-\d+(?=/|&|$)')
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """Request refused because the host's circuit is open."""
+
+
+def backoff_seconds(attempt: int) -> float:
+    """Full-jitter exponential backoff: uniform in [0, min(30, 0.5 * 2**attempt)]."""
+    return random.uniform(0, min(MAX_BACKOFF, BACKOFF_BASE * 2 ** attempt))
+
+
+def method_of(send) -> str:
+    """HTTP method of a requests function (requests.get -> 'GET')."""
+    return getattr(send, '__name__', '').upper()
+
+
+def endpoint_key(method: str, url: str) -> str:
+    """Metrics label for a request: method, host and path with IDs removed.
+
+    "GET https://dev.azure.com/org/Proj/_apis/wit/workitems/42" becomes
+    "GET dev.azure.com/org/Proj/_apis/wit/workitems/{id}". TestRail paths
+    (index.php?/api/v2/get_case/7&limit=250) keep the API path but not the
+    trailing arguments.
+    """
+    parts = urlsplit(url)
+    path = parts.path + (f"?{parts.query.split('&', 1)[0]}" if parts.query.startswith('/') else '')
+    path = _ISSUE_KEY.sub('/{key}', _NUMERIC_SEGMENT.sub('/{id}', path))
+    return f"{method} {parts.netloc}{path}".strip()
+
+
+@dataclass
+class _Circuit:
+    failures: int = 0
+    opened_at: Optional[float] = None
+    probing: bool = False
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker (closed -> open -> half-open -> closed).
+
+    Usage:
+        probe = breaker.before_request(host)  # raises CircuitOpenError when open
+        ... send request ...
+        breaker.record(host, success=True, probe=probe)
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT
+    ):
+        """Initialize breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open a circuit
+            reset_timeout: Seconds an open circuit refuses requests before
+                letting one probe through
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def state(self, host: str) -> str:
+        """'closed', 'open' or 'half-open'."""
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None or circuit.opened_at is None:
+                return 'closed'
+            if circuit.probing or time.monotonic() - circuit.opened_at >= self.reset_timeout:
+                return 'half-open'
+            return 'open'
+
+    def before_request(self, host: str) -> bool:
+        """Allow a request to host, or raise CircuitOpenError.
+
+        Once the reset timeout has passed, exactly one request (the probe)
+        is let through; others keep failing fast until it finishes.
+
+        Returns:
+            True if this request is the half-open probe; pass it back to
+            record() as probe
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(host, _Circuit())
+            if circuit.opened_at is None:
+                return False
+            waited = time.monotonic() - circuit.opened_at
+            if circuit.probing or waited < self.reset_timeout:
+                retry_in = max(0.0, self.reset_timeout - waited)
+                raise CircuitOpenError(f"Circuit open for {host} (retry in {retry_in:.0f}s)")
+            circuit.probing = True
+            return True
+
+    def record(self, host: str, success: bool, probe: bool = False) -> None:
+        """Record the outcome of a request allowed by before_request.
+
+        Only the probe decides a half-open circuit; requests that started
+        before the circuit opened and finish later are ignored.
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(host, _Circuit())
+            if probe:
+                circuit.probing = False
+            elif circuit.opened_at is not None:
+                return
+            if success:
+                circuit.failures = 0
+                circuit.opened_at = None
+                return
+            circuit.failures += 1
+            if probe or circuit.failures >= self.failure_threshold:
+                circuit.opened_at = time.monotonic()
+
+
+@dataclass
+class _EndpointStats:
+    requests: int = 0
+    retries: int = 0
+    failures: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    buckets: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+
+
+class HttpMetrics:
+    """Per-endpoint request latency histograms and retry/failure counts."""
+
+    def __init__(self):
+        self._stats: Dict[str, _EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, endpoint: str, seconds: float, failed: bool) -> None:
+        """Record one attempt."""
+        ms = seconds * 1000
+        with self._lock:
+            stats = self._stats.setdefault(endpoint, _EndpointStats())
+            stats.requests += 1
+            stats.failures += int(failed)
+            stats.total_ms += ms
+            stats.max_ms = max(stats.max_ms, ms)
+            bucket = next((i for i, bound in enumerate(LATENCY_BUCKETS_MS) if ms <= bound), len(LATENCY_BUCKETS_MS))
+            stats.buckets[bucket] += 1
+
+    def retried(self, endpoint: str) -> None:
+        """Record that an attempt is being retried."""
+        with self._lock:
+            self._stats.setdefault(endpoint, _EndpointStats()).retries += 1
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Stats per endpoint.
+
+        Returns:
+            Endpoint -> {'requests', 'retries', 'failures', 'mean_ms',
+            'max_ms', 'histogram': {'<=50ms': n, ..., '>10000ms': n}}
+        """
+        labels = [f"<={bound:g}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]:g}ms"]
+        with self._lock:
+            return {
+                endpoint: {
+                    'requests': stats.requests,
+                    'retries': stats.retries,
+                    'failures': stats.failures,
+                    'mean_ms': round(stats.total_ms / stats.requests, 1) if stats.requests else 0.0,
+                    'max_ms': round(stats.max_ms, 1),
+                    'histogram': dict(zip(labels, stats.buckets)),
+                }
+                for endpoint, stats in self._stats.items()
+            }
+
+    def report(self) -> str:
+        """Human-readable table, slowest endpoints first."""
+        rows = sorted(self.snapshot().items(), key=lambda item: -item[1]['mean_ms'])
+        lines = [f"{'requests':>8} {'retries':>7} {'failed':>6} {'mean ms':>8} {'max ms':>8}  endpoint"]
+        for endpoint, s in rows:
+            lines.append(
+                f"{s['requests']:>8} {s['retries']:>7} {s['failures']:>6} "
+                f"{s['mean_ms']:>8.1f} {s['max_ms']:>8.1f}  {endpoint}"
+            )
+        return '\n'.join(lines)
+
+    def reset(self) -> None:
+        """Forget all recorded requests."""
+        with self._lock:
+            self._stats.clear()
+
+
+_breaker: Optional[CircuitBreaker] = None
+_metrics: Optional[HttpMetrics] = None
+_singletons_lock = threading.Lock()
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """Process-wide circuit breaker."""
+    global _breaker
+    with _singletons_lock:
+        if _breaker is None:
+            _breaker = CircuitBreaker()
+        return _breaker
+
+
+def get_http_metrics() -> HttpMetrics:
+    """Process-wide HTTP request metrics."""
+    global _metrics
+    with _singletons_lock:
+        if _metrics is None:
+            _metrics = HttpMetrics()
+        return _metrics
+
+
+def reset_http_resilience() -> None:
+    """Drop the process-wide circuit breaker and metrics."""
+    global _breaker, _metrics
+    with _singletons_lock:
+        _breaker = None
+        _metrics = None
@@ -0,0 +1,236 @@
+"""
+HTTP Throttle - adaptive per-host throttling for platform API calls.
+
+ADO and TestRail answer bursts with 429 (or 503) and usually a Retry-After
+header. Requests through throttled_request() share one HostThrottle per
+process: a throttled response pauses every request to that host for the
+Retry-After delay and halves the host's concurrency limit; the limit grows
+back by one after a run of successful requests.
+
+throttled_request() is also where the shared resilience layer applies
+(see http_resilience): transient-failure retries with jittered backoff,
+the per-host circuit breaker and per-endpoint request metrics.
+"""
+import os
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+from infrastructure.http_resilience import (
+    IDEMPOTENT_METHODS,
+    TRANSIENT_STATUS,
+    backoff_seconds,
+    endpoint_key,
+    get_circuit_breaker,
+    get_http_metrics,
+    method_of
+)
+
+# Responses that mean "slow down" (503 only when it carries Retry-After)
+THROTTLE_STATUS = 429
+UNAVAILABLE_STATUS = 503
+
+MAX_THROTTLE_RETRIES = 5
+
+# Upper bound for any single wait, whatever the server asks for
+MAX_RETRY_AFTER = 120.0
+
+
+@dataclass
+class _HostState:
+    limit: int
+    active: int = 0
+    paused_until: float = 0.0
+    successes: int = 0
+
+
+class HostThrottle:
+    """Per-host concurrency limit with pause-on-429 and additive recovery.
+
+    Usage:
+        throttle = HostThrottle(max_concurrency=8)
+        throttle.acquire(host)
+        ... send request ...
+        throttle.release(host, throttled=False)
+    """
+
+    def __init__(self, max_concurrency: int = 8, recovery_after: int = 10):
+        """Initialize throttle.
+
+        Args:
+            max_concurrency: Concurrent requests allowed per host
+            recovery_after: Successful requests before the limit grows by one
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.recovery_after = recovery_after
+        self._hosts: Dict[str, _HostState] = {}
+        self._cond = threading.Condition()
+
+    def _state(self, host: str) -> _HostState:
+        if host not in self._hosts:
+            self._hosts[host] = _HostState(limit=self.max_concurrency)
+        return self._hosts[host]
+
+    def limit(self, host: str) -> int:
+        """Current concurrency limit for a host."""
+        with self._cond:
+            return self._state(host).limit
+
+    def acquire(self, host: str) -> None:
+        """Block until a request to host may be sent."""
+        with self._cond:
+            state = self._state(host)
+            while True:
+                wait = state.paused_until - time.monotonic()
+                if wait <= 0 and state.active < state.limit:
+                    break
+                self._cond.wait(timeout=wait if wait > 0 else None)
+            state.active += 1
+
+    def release(self, host: str, throttled: bool, delay: float = 0.0) -> None:
+        """Record a finished request.
+
+        Args:
+            host: Host the request went to
+            throttled: True if the server asked to slow down
+            delay: Seconds to pause the host for (throttled requests)
+        """
+        with self._cond:
+            state = self._state(host)
+            state.active -= 1
+            if throttled:
+                state.limit = max(1, state.limit // 2)
+                state.successes = 0
+                state.paused_until = max(state.paused_until, time.monotonic() + delay)
+            else:
+                state.successes += 1
+                if state.successes >= self.recovery_after and state.limit < self.max_concurrency:
+                    state.limit += 1
+                    state.successes = 0
+            self._cond.notify_all()
+
+
+_throttle: Optional[HostThrottle] = None
+_throttle_lock = threading.Lock()
+
+
+def get_host_throttle() -> HostThrottle:
+    """Process-wide throttle (per-host limit from UPLOAD_CONCURRENCY, default 8)."""
+    global _throttle
+    with _throttle_lock:
+        if _throttle is None:
+            _throttle = HostThrottle(max_concurrency=int(os.getenv("UPLOAD_CONCURRENCY", "8")))
+        return _throttle
+
+
+def reset_host_throttle() -> None:
+    """Drop the process-wide throttle (e.g. after changing UPLOAD_CONCURRENCY)."""
+    global _throttle
+    with _throttle_lock:
+        _throttle = None
+
+
+def retry_after_seconds(response: Any, attempt: int = 0) -> Optional[float]:
+    """Delay a throttled response asks for, or None if it is not throttled.
+
+    Uses the Retry-After header (seconds or HTTP date); without one a 429
+    backs off exponentially by attempt (1, 2, 4, ... seconds).
+    """
+    status = getattr(response, 'status_code', None)
+    header = (getattr(response, 'headers', None) or {}).get('Retry-After')
+    if status != THROTTLE_STATUS and not (status == UNAVAILABLE_STATUS and header):
+        return None
+
+    delay = None
+    if header:
+        try:
+            delay = float(header)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(header).timestamp() - time.time()
+            except (TypeError, ValueError):
+                delay = None
+    if delay is None:
+        delay = float(2 ** attempt)
+    return min(max(delay, 0.0), MAX_RETRY_AFTER)
+
+
+def throttled_request(
+    send: Callable[..., Any],
+    url: str,
+    max_retries: int = MAX_THROTTLE_RETRIES,
+    idempotent: Optional[bool] = None,
+    **kwargs
+) -> Any:
+    """Send a request through the host throttle and circuit breaker.
+
+    Throttled responses (429, 503 with Retry-After) are retried after the
+    delay the server asks for. Transient failures (connection errors,
+    timeouts, 500/502/503/504) are retried with jittered exponential
+    backoff when the request is idempotent; connect timeouts are always
+    retried since nothing reached the server.
+
+    Args:
+        send: requests function to call (requests.get, requests.post, ...)
+        url: Request URL
+        max_retries: Retries after a throttled or transient failure
+        idempotent: Whether the request may be repeated (default: by
+            method; pass True for read-only POSTs such as searches)
+        **kwargs: Passed to send
+
+    Returns:
+        The response (the last failed one if retries run out)
+
+    Raises:
+        CircuitOpenError: If the host's circuit is open
+        requests.ConnectionError, requests.Timeout: If the last attempt
+            could not get a response
+    """
+    host = urlsplit(url).netloc
+    method = method_of(send)
+    endpoint = endpoint_key(method, url)
+    if idempotent is None:
+        idempotent = method in IDEMPOTENT_METHODS
+    throttle = get_host_throttle()
+    breaker = get_circuit_breaker()
+    metrics = get_http_metrics()
+    attempt = 0
+    while True:
+        probe = breaker.before_request(host)
+        throttle.acquire(host)
+        response, error, delay = None, None, None
+        start = time.monotonic()
+        try:
+            response = send(url, **kwargs)
+            delay = retry_after_seconds(response, attempt)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            error = e
+        except Exception:
+            # Never leave a half-open probe outstanding
+            breaker.record(host, success=False, probe=probe)
+            raise
+        finally:
+            throttle.release(host, throttled=delay is not None, delay=delay or 0.0)
+
+        transient = error is not None or getattr(response, 'status_code', None) in TRANSIENT_STATUS
+        metrics.observe(endpoint, time.monotonic() - start, failed=transient)
+        # A throttled server is up; only transient failures count against it
+        breaker.record(host, success=not transient or delay is not None, probe=probe)
+
+        retryable = delay is not None or (
+            transient and (idempotent or isinstance(error, requests.ConnectTimeout))
+        )
+        if not retryable or attempt >= max_retries:
+            if error is not None:
+                raise error
+            return response
+
+        metrics.retried(endpoint)
+        if delay is None:
+            time.sleep(backoff_seconds(attempt))
+        attempt += 1
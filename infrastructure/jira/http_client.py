@@ -4,22 +4,35 @@ Jira HTTP Client - Low-level HTTP interactions with Jira Cloud/Server.
 This class handles only HTTP concerns, keeping infrastructure separate from domain logic.
 """
 import base64
-from typing import Dict, Optional, Any, List
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, Optional, Any, List
 import requests
 
+from infrastructure.upload_executor import UploadExecutor
+from infrastructure.http_cache import HttpResponseCache, RevisionProbe, get_http_cache
+from infrastructure.http_throttle import throttled_request
+
+# Single issue reads, which can be revalidated by reading only 'updated'
+_ISSUE_ENDPOINT = re.compile(r'^issue/[^/]+$')
+
 
 class JiraHttpClient:
     """Low-level HTTP client for Jira API."""
 
     API_VERSION = "3"  # Jira Cloud REST API v3
 
+    # Largest search page Jira returns (larger maxResults are capped)
+    MAX_SEARCH_PAGE = 100
+
     def __init__(
         self,
         base_url: str,
         email: str,
         api_token: str,
         timeout: int = 30,
-        is_cloud: bool = True
+        is_cloud: bool = True,
+        cache: Optional[HttpResponseCache] = None
     ):
         """Initialize Jira HTTP client.
 
@@ -29,6 +42,7 @@ class JiraHttpClient:
             api_token: API token (Cloud) or password (Server)
             timeout: Request timeout in seconds
             is_cloud: True for Jira Cloud, False for Jira Server/Data Center
+            cache: Response cache for get() (default: process-wide cache)
         """
         if not api_token:
             raise ValueError("API token is required")
@@ -43,6 +57,7 @@ class JiraHttpClient:
         self._timeout = timeout
         self._is_cloud = is_cloud
         self._headers = self._create_headers()
+        self._cache = cache if cache is not None else get_http_cache()
 
     @property
     def base_url(self) -> str:
@@ -78,6 +93,9 @@ class JiraHttpClient:
     def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """Make GET request to Jira API.
 
+        Responses are cached; a stored response is revalidated (issue
+        'updated' probe or If-None-Match) before it is reused.
+
         Args:
             endpoint: API endpoint (relative to API base)
             params: Optional query parameters
@@ -88,16 +106,44 @@ class JiraHttpClient:
         Raises:
             requests.HTTPError: If request fails
         """
+        return self._cache.get(
+            f"{self._get_api_base()}/{endpoint}",
+            params,
+            fetch=lambda headers: self._get_response(endpoint, params, headers),
+            probe=self._revision_probe(endpoint)
+        )
+
+    def _revision_probe(self, endpoint: str) -> Optional[RevisionProbe]:
+        """Probe comparing a cached issue's 'updated' with the server's."""
+        if not _ISSUE_ENDPOINT.match(endpoint):
+            return None
+
+        def probe(cached: Dict[str, Any]) -> bool:
+            updated = (cached.get('fields') or {}).get('updated')
+            if not updated:
+                return False
+            current = self._get_response(endpoint, {'fields': 'updated'}).json()
+            return (current.get('fields') or {}).get('updated') == updated
+
+        return probe
+
+    def _get_response(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> requests.Response:
         url = f"{self._get_api_base()}/{endpoint}"
 
-        response = requests.get(
+        response = throttled_request(
+            requests.get,
             url,
-            headers=self._headers,
+            headers={**self._headers, **(headers or {})},
             params=params,
             timeout=self._timeout
         )
         response.raise_for_status()
-        return response.json()
+        return response
 
     def post(
         self,
@@ -117,8 +163,11 @@ class JiraHttpClient:
         """
         url = f"{self._get_api_base()}/{endpoint}"
 
-        response = requests.post(
+        response = throttled_request(
+            requests.post,
             url,
+            # Searches only read
+            idempotent=endpoint == 'search',
             headers=self._headers,
             json=data,
             params=params,
@@ -145,7 +194,8 @@ class JiraHttpClient:
         """
         url = f"{self._get_api_base()}/{endpoint}"
 
-        response = requests.put(
+        response = throttled_request(
+            requests.put,
             url,
             headers=self._headers,
             json=data,
@@ -160,7 +210,9 @@ class JiraHttpClient:
         jql: str,
         fields: Optional[List[str]] = None,
         start_at: int = 0,
-        max_results: int = 50
+        max_results: int = 50,
+        expand: Optional[List[str]] = None,
+        validate_query: Optional[str] = None
     ) -> Dict[str, Any]:
         """Search issues using JQL.
 
@@ -169,6 +221,9 @@ class JiraHttpClient:
             fields: List of fields to return (None for all)
             start_at: Starting index for pagination
             max_results: Maximum results per page
+            expand: List of expansions (e.g., ["renderedFields"])
+            validate_query: "strict", "warn" or "none" ("warn" turns
+                unknown issue keys into warnings instead of an error)
 
         Returns:
             Search results with issues
@@ -180,9 +235,86 @@ class JiraHttpClient:
         }
         if fields:
             data["fields"] = fields
+        if expand:
+            data["expand"] = expand
+        if validate_query:
+            data["validateQuery"] = validate_query
 
         return self.post("search", data)
 
+    def iter_issues(
+        self,
+        jql: str,
+        fields: Optional[List[str]] = None,
+        page_size: int = MAX_SEARCH_PAGE,
+        expand: Optional[List[str]] = None,
+        validate_query: Optional[str] = None,
+        parallel: bool = False,
+        max_workers: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over every issue matching a JQL query, page by page.
+
+        The next page is requested in the background while the current one
+        is consumed. With parallel=True the remaining pages are fetched
+        concurrently once the first page reports the total; issues are
+        still yielded in search order. A page without a 'total' is treated
+        as the last one.
+
+        Args:
+            jql: JQL query string
+            fields: Fields to return (project only what you need; None
+                returns all fields)
+            page_size: Issues per search request
+            expand: List of expansions (e.g., ["renderedFields"])
+            validate_query: "strict", "warn" or "none"
+            parallel: Fan out the remaining pages once the total is known
+            max_workers: Concurrent page requests in parallel mode
+                (default: UPLOAD_CONCURRENCY env var, or 8)
+
+        Yields:
+            Issue dicts
+
+        Raises:
+            requests.HTTPError: If a search request fails
+        """
+        def fetch(start_at: int) -> Dict[str, Any]:
+            return self.search_issues(
+                jql, fields=fields, start_at=start_at, max_results=page_size,
+                expand=expand, validate_query=validate_query
+            )
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            page = fetch(0)
+            start_at = 0
+            while True:
+                issues = page.get('issues', [])
+                start_at += len(issues)
+                total = page.get('total')
+                # Jira may cap the page below page_size
+                step = page.get('maxResults') or page_size
+
+                if parallel and total is not None and issues and start_at < total:
+                    yield from issues
+                    yield from self._iter_pages(fetch, range(start_at, total, step), max_workers)
+                    return
+
+                # Without a total there is no safe way to page further
+                if not issues or total is None or start_at >= total:
+                    yield from issues
+                    return
+
+                next_page = pool.submit(fetch, start_at)
+                yield from issues
+                page = next_page.result()
+
+    @staticmethod
+    def _iter_pages(fetch, offsets: range, max_workers: Optional[int]) -> Iterator[Dict[str, Any]]:
+        """Issues of pages at known offsets, fetched concurrently, in order."""
+        workers = min(max_workers or UploadExecutor().max_workers, len(offsets))
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            for page in pool.map(fetch, offsets):
+                yield from page.get('issues', [])
+
     def get_issue(
         self,
         issue_key: str,
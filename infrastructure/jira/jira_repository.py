@@ -216,6 +216,9 @@ class JiraStoryRepository(IStoryRepository):
         'customfield_10000',  # Common default
     ]
 
+    # Issues per JQL "key in (...)" search (Jira caps search pages at 100)
+    SEARCH_BATCH = 100
+
     def __init__(
         self,
         base_url: str,
@@ -294,47 +297,92 @@ class JiraStoryRepository(IStoryRepository):
                 issue_key,
                 expand=['renderedFields']
             )
+            return self._story_from_issue(issue_key, issue)
 
-            fields = issue.get('fields', {})
-            rendered_fields = issue.get('renderedFields', {})
+        except Exception as e:
+            print(f"Error retrieving story {story_id}: {e}")
+            return None
 
-            title = fields.get('summary', '')
-            description = fields.get('description', '')
-            description_html = rendered_fields.get('description', '')
+    def get_stories(self, story_ids: List[int]) -> Dict[int, UserStory]:
+        """Retrieve user stories with JQL "key in (...)" searches.
 
-            # Try to get description as text
-            description_text = self._parser.normalize_to_text(
-                description_html or description
+        Requests only summary, description and the AC field (rendered), up
+        to SEARCH_BATCH issues per search. Missing or invalid stories are
+        left out.
+        """
+        keys = {}
+        for story_id in story_ids:
+            issue_key = f"{self._project_key}-{story_id}" if isinstance(story_id, int) else str(story_id)
+            keys[issue_key] = story_id
+
+        self._discover_ac_field()
+        fields = ['summary', 'description'] + ([self._ac_field_id] if self._ac_field_id else [])
+        key_list = list(keys)
+
+        stories = {}
+        for start in range(0, len(key_list), self.SEARCH_BATCH):
+            chunk = key_list[start:start + self.SEARCH_BATCH]
+            issues = self._client.iter_issues(
+                f"key in ({', '.join(chunk)})",
+                fields=fields,
+                page_size=len(chunk),
+                expand=['renderedFields'],
+                # Unknown keys must not fail the whole search
+                validate_query='warn'
             )
+            try:
+                for issue in issues:
+                    issue_key = issue.get('key', '')
+                    try:
+                        stories[keys.get(issue_key, issue_key)] = self._story_from_issue(issue_key, issue)
+                    except Exception as e:
+                        print(f"Error retrieving story {issue_key}: {e}")
+            except Exception as e:
+                print(f"Error retrieving stories {chunk[0]}..{chunk[-1]}: {e}")
+        return stories
+
+    def _story_from_issue(self, issue_key: str, issue: Dict[str, Any]) -> UserStory:
+        """Build a UserStory from an issue (with renderedFields).
+
+        Raises:
+            ValueError: If the story has no title or acceptance criteria
+        """
+        fields = issue.get('fields', {})
+        rendered_fields = issue.get('renderedFields', {}) or {}
 
-            # Get acceptance criteria from custom field or description
-            ac_text = ''
-            if self._ac_field_id:
-                ac_content = fields.get(self._ac_field_id, '')
-                ac_rendered = rendered_fields.get(self._ac_field_id, '')
-                ac_text = self._parser.normalize_to_text(ac_rendered or ac_content)
-
-            # Fallback: extract AC from description if it contains AC section
-            if not ac_text:
-                ac_text = self._extract_ac_from_description(description_text)
-
-            # Parse AC bullets
-            ac_bullets = self._parser.parse_acceptance_criteria(ac_text)
-
-            # Extract numeric ID from issue key
-            numeric_id = int(issue_key.split('-')[-1]) if '-' in issue_key else story_id
-
-            return UserStory(
-                story_id=numeric_id,
-                title=title,
-                description=description_text,
-                acceptance_criteria_text=ac_text,
-                acceptance_criteria=ac_bullets
-            )
+        title = fields.get('summary', '')
+        description = fields.get('description', '')
+        description_html = rendered_fields.get('description', '')
 
-        except Exception as e:
-            print(f"Error retrieving story {story_id}: {e}")
-            return None
+        # Try to get description as text
+        description_text = self._parser.normalize_to_text(
+            description_html or description
+        )
+
+        # Get acceptance criteria from custom field or description
+        ac_text = ''
+        if self._ac_field_id:
+            ac_content = fields.get(self._ac_field_id, '')
+            ac_rendered = rendered_fields.get(self._ac_field_id, '')
+            ac_text = self._parser.normalize_to_text(ac_rendered or ac_content)
+
+        # Fallback: extract AC from description if it contains AC section
+        if not ac_text:
+            ac_text = self._extract_ac_from_description(description_text)
+
+        # Parse AC bullets
+        ac_bullets = self._parser.parse_acceptance_criteria(ac_text)
+
+        # Extract numeric ID from issue key
+        numeric_id = int(issue_key.split('-')[-1]) if '-' in issue_key else issue_key
+
+        return UserStory(
+            story_id=numeric_id,
+            title=title,
+            description=description_text,
+            acceptance_criteria_text=ac_text,
+            acceptance_criteria=ac_bullets
+        )
 
     def _extract_ac_from_description(self, description: str) -> str:
         """Extract AC section from description if present."""
@@ -4,13 +4,18 @@ TestRail HTTP Client - Low-level HTTP interactions with TestRail.
 This class handles only HTTP concerns for TestRail API.
 """
 import base64
-from typing import Dict, Optional, Any, List
+from typing import Dict, Iterator, Optional, Any, List
 import requests
 
+from infrastructure.http_throttle import throttled_request
+
 
 class TestRailHttpClient:
     """Low-level HTTP client for TestRail API."""
 
+    # Prefix of the _links.next URLs returned by paginated endpoints
+    API_PREFIX = "/api/v2/"
+
     def __init__(
         self,
         base_url: str,
@@ -79,7 +84,8 @@ class TestRailHttpClient:
         """
         url = self._get_api_url(endpoint)
 
-        response = requests.get(
+        response = throttled_request(
+            requests.get,
             url,
             headers=self._headers,
             params=params,
@@ -104,8 +110,11 @@ class TestRailHttpClient:
         """
         url = self._get_api_url(endpoint)
 
-        response = requests.post(
+        response = throttled_request(
+            requests.post,
             url,
+            # update_* calls set fields and can be repeated; add_* cannot
+            idempotent=endpoint.startswith('update_'),
             headers=self._headers,
             json=data,
             timeout=self._timeout
@@ -113,6 +122,45 @@ class TestRailHttpClient:
         response.raise_for_status()
         return response.json()
 
+    def iter_pages(
+        self,
+        endpoint: str,
+        key: str,
+        params: Optional[Dict] = None
+    ) -> Iterator[Dict]:
+        """Iterate over every item of a paginated list endpoint.
+
+        TestRail 6.7+ returns pages of up to 250 items as
+        {'offset', 'limit', 'size', '_links': {'next', 'prev'}, key: [...]};
+        the next page is requested from _links.next until it is null.
+        Older servers return the whole list at once.
+
+        Args:
+            endpoint: API endpoint (e.g., "get_cases/1")
+            key: Key of the items in a page (e.g., "cases")
+            params: Optional query parameters (first page only; _links.next
+                carries them on)
+
+        Yields:
+            Items of all pages, in order
+
+        Raises:
+            requests.HTTPError: If a request fails
+        """
+        while True:
+            result = self.get(endpoint, params=params)
+            if not isinstance(result, dict):
+                yield from result or []
+                return
+
+            yield from result.get(key, [])
+            next_link = (result.get('_links') or {}).get('next')
+            if not next_link:
+                return
+            # "/api/v2/get_cases/1&suite_id=2&limit=250&offset=250"
+            endpoint = next_link.split(self.API_PREFIX, 1)[-1]
+            params = None
+
     # Projects
 
     def get_projects(self) -> List[Dict]:
@@ -156,12 +204,15 @@ class TestRailHttpClient:
     # Sections
 
     def get_sections(self, project_id: int, suite_id: Optional[int] = None) -> List[Dict]:
-        """Get all sections in a project/suite."""
-        endpoint = f"get_sections/{project_id}"
+        """Get all sections in a project/suite (all pages)."""
+        return list(self.iter_sections(project_id, suite_id))
+
+    def iter_sections(self, project_id: int, suite_id: Optional[int] = None) -> Iterator[Dict]:
+        """Iterate over all sections in a project/suite, page by page."""
         params = {}
         if suite_id:
             params['suite_id'] = suite_id
-        return self.get(endpoint, params=params or None)
+        return self.iter_pages(f"get_sections/{project_id}", 'sections', params or None)
 
     def add_section(
         self,
@@ -201,7 +252,7 @@ class TestRailHttpClient:
         suite_id: Optional[int] = None,
         section_id: Optional[int] = None
     ) -> List[Dict]:
-        """Get test cases.
+        """Get test cases (all pages).
 
         Args:
             project_id: Project ID
@@ -211,18 +262,21 @@ class TestRailHttpClient:
         Returns:
             List of test cases
         """
-        endpoint = f"get_cases/{project_id}"
+        return list(self.iter_cases(project_id, suite_id, section_id))
+
+    def iter_cases(
+        self,
+        project_id: int,
+        suite_id: Optional[int] = None,
+        section_id: Optional[int] = None
+    ) -> Iterator[Dict]:
+        """Iterate over test cases, page by page (see get_cases)."""
         params = {}
         if suite_id:
             params['suite_id'] = suite_id
         if section_id:
             params['section_id'] = section_id
-
-        result = self.get(endpoint, params=params or None)
-        # Handle paginated response
-        if isinstance(result, dict):
-            return result.get('cases', [])
-        return result
+        return self.iter_pages(f"get_cases/{project_id}", 'cases', params or None)
 
     def get_case(self, case_id: int) -> Dict:
         """Get a specific test case."""
@@ -270,11 +324,12 @@ class TestRailHttpClient:
     # Test Runs
 
     def get_runs(self, project_id: int) -> List[Dict]:
-        """Get all test runs in a project."""
-        result = self.get(f"get_runs/{project_id}")
-        if isinstance(result, dict):
-            return result.get('runs', [])
-        return result
+        """Get all test runs in a project (all pages)."""
+        return list(self.iter_runs(project_id))
+
+    def iter_runs(self, project_id: int) -> Iterator[Dict]:
+        """Iterate over all test runs in a project, page by page."""
+        return self.iter_pages(f"get_runs/{project_id}", 'runs')
 
     def add_run(
         self,
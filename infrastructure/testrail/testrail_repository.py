@@ -6,6 +6,7 @@ Implements repository interfaces for TestRail data access.
 from typing import Optional, List, Dict, Any
 
 from core.interfaces.repository import ITestSuiteRepository, ITestCaseRepository
+from infrastructure.upload_executor import UploadExecutor
 from .http_client import TestRailHttpClient
 
 
@@ -52,7 +53,8 @@ class TestRailTestSuiteRepository(ITestSuiteRepository):
         section_prefix = f"{story_id} :"
 
         try:
-            sections = self._client.get_sections(
+            # Stops paging at the first match
+            sections = self._client.iter_sections(
                 self._project_id,
                 suite_id=self._suite_id
             )
@@ -145,8 +147,8 @@ class TestRailTestSuiteRepository(ITestSuiteRepository):
             return self._section_cache[section_name]
 
         try:
-            # Search for existing section
-            sections = self._client.get_sections(
+            # Search for existing section (stops paging at the first match)
+            sections = self._client.iter_sections(
                 self._project_id,
                 suite_id=self._suite_id
             )
@@ -276,6 +278,35 @@ class TestRailTestCaseRepository(ITestCaseRepository):
             print(f"Error creating test case: {e}")
             return None
 
+    def create_test_cases(
+        self,
+        test_cases: List[Dict[str, Any]],
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """Create test cases concurrently (TestRail has no bulk create endpoint).
+
+        Args:
+            test_cases: Dicts with 'title', 'steps' and 'objective'
+            **kwargs: Additional fields applied to every test case (see
+                create_test_case)
+
+        Returns:
+            One {'id': case ID or None, 'error': message or None} per test
+            case, in order
+        """
+        def create(tc: Dict[str, Any]) -> Optional[int]:
+            return self.create_test_case(
+                title=tc.get('title', ''),
+                steps=tc.get('steps', []),
+                objective=tc.get('objective', ''),
+                **kwargs
+            )
+
+        return [
+            {'id': case_id, 'error': None if case_id else (str(error) if error else 'Failed to create')}
+            for case_id, error in UploadExecutor().map(create, test_cases)
+        ]
+
     def _build_steps_separated(self, steps: List[Dict[str, str]]) -> List[Dict[str, str]]:
         """Build TestRail separated steps format.
 
@@ -308,6 +339,8 @@ class TestRailTestCaseRepository(ITestCaseRepository):
             True if successful
         """
         try:
+            fields = dict(fields)
+
             # Convert steps if present
             if 'steps' in fields:
                 fields['custom_steps_separated'] = self._build_steps_separated(fields.pop('steps'))
@@ -323,6 +356,19 @@ class TestRailTestCaseRepository(ITestCaseRepository):
             print(f"Error updating test case {test_case_id}: {e}")
             return False
 
+    def update_test_cases(self, updates: Dict[int, Dict[str, Any]]) -> Dict[int, bool]:
+        """Update test cases concurrently (see update_test_case).
+
+        Args:
+            updates: Test case ID -> fields to update
+
+        Returns:
+            Test case ID -> True if updated
+        """
+        items = list(updates.items())
+        outcomes = UploadExecutor().map(lambda item: self.update_test_case(*item), items)
+        return {case_id: bool(updated) for (case_id, _), (updated, _) in zip(items, outcomes)}
+
     def get_test_case(self, test_case_id: int) -> Optional[Dict[str, Any]]:
         """Get a test case by ID.
 
@@ -343,7 +389,7 @@ class TestRailTestCaseRepository(ITestCaseRepository):
         section_id: int,
         test_cases: List[Dict[str, Any]]
     ) -> List[int]:
-        """Create multiple test cases in a section.
+        """Create multiple test cases in a section (concurrently).
 
         Args:
             section_id: Section ID
@@ -352,16 +398,13 @@ class TestRailTestCaseRepository(ITestCaseRepository):
         Returns:
             List of created test case IDs
         """
-        created_ids = []
-        for tc in test_cases:
-            case_id = self.create_test_case(
+        def create(tc: Dict[str, Any]) -> Optional[int]:
+            return self.create_test_case(
                 title=tc.get('title', 'Untitled'),
                 steps=tc.get('steps', []),
                 objective=tc.get('objective', ''),
                 section_id=section_id,
                 **{k: v for k, v in tc.items() if k not in ['title', 'steps', 'objective']}
             )
-            if case_id:
-                created_ids.append(case_id)
 
-        return created_ids
+        return [case_id for case_id, _ in UploadExecutor().map(create, test_cases) if case_id]
@@ -0,0 +1,80 @@
+"""
+Upload Executor - bounded parallelism for platform uploads.
+
+Runs one upload call per item on a thread pool and hands results back in
+input order, so progress output and the test ID -> work item mapping are
+the same as a sequential run. Rate limiting is left to the HTTP clients
+(see http_throttle), which slow down on 429/Retry-After.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar('T')
+
+# (result, error) per item; error is the exception the call raised, if any
+Outcome = Tuple[Any, Optional[BaseException]]
+
+
+class UploadExecutor:
+    """Ordered thread-pool executor for upload calls.
+
+    Usage:
+        executor = UploadExecutor(max_workers=8)
+        outcomes = executor.map(create_one, test_cases, on_result=print_progress)
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """Initialize executor.
+
+        Args:
+            max_workers: Concurrent upload calls (default: UPLOAD_CONCURRENCY
+                env var, or 8; 1 runs sequentially)
+        """
+        if max_workers is None:
+            max_workers = int(os.getenv("UPLOAD_CONCURRENCY", "8"))
+        self.max_workers = max(1, max_workers)
+
+    def map(
+        self,
+        fn: Callable[[T], Any],
+        items: Sequence[T],
+        on_result: Optional[Callable[[int, T, Any, Optional[BaseException]], None]] = None
+    ) -> List[Outcome]:
+        """Call fn on every item.
+
+        Args:
+            fn: Upload call for one item
+            items: Items to upload
+            on_result: Called as on_result(index, item, result, error) in
+                input order, on the calling thread
+
+        Returns:
+            (result, error) per item, in input order
+        """
+        items = list(items)
+        outcomes: List[Outcome] = []
+
+        def report(idx: int, outcome: Outcome) -> None:
+            outcomes.append(outcome)
+            if on_result:
+                on_result(idx, items[idx], *outcome)
+
+        if self.max_workers == 1 or len(items) < 2:
+            for idx, item in enumerate(items):
+                report(idx, self._call(fn, item))
+            return outcomes
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as pool:
+            futures = [pool.submit(self._call, fn, item) for item in items]
+            # Waiting on futures in submission order keeps output ordered
+            for idx, future in enumerate(futures):
+                report(idx, future.result())
+        return outcomes
+
+    @staticmethod
+    def _call(fn: Callable[[T], Any], item: T) -> Outcome:
+        try:
+            return fn(item), None
+        except Exception as e:
+            return None, e
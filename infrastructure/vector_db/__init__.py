@@ -0,0 +1,23 @@
+"""
+Vector database implementations of IVectorStore.
+"""
+from .chroma_repository import ChromaRepository, DEFAULT_CHROMA_PATH
+from .numpy_store import NumpyVectorStore
+from .store_registry import (
+    VECTOR_STORE_BACKENDS,
+    get_vector_store,
+    reset_vector_stores,
+    resolve_vector_db_backend,
+    resolve_vector_db_path,
+)
+
+__all__ = [
+    'ChromaRepository',
+    'DEFAULT_CHROMA_PATH',
+    'NumpyVectorStore',
+    'VECTOR_STORE_BACKENDS',
+    'get_vector_store',
+    'reset_vector_stores',
+    'resolve_vector_db_backend',
+    'resolve_vector_db_path',
+]
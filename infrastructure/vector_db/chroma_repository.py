@@ -1,15 +1,52 @@
-import chromadb
+"""
+ChromaDB-backed vector store.
+
+The chromadb client (and its embedding model) is heavy to import and start,
+so it is created lazily on first use and shared per persistence path across
+every repository instance in the process.
+"""
+import threading
+from typing import Any, Dict, List, Optional
 
 from core.interfaces.vector_store import IVectorStore
 
+DEFAULT_CHROMA_PATH = "./db"
+
+# Process-wide PersistentClient instances keyed by persistence path
+_clients: Dict[str, Any] = {}
+_clients_lock = threading.Lock()
+
+
+def _get_client(path: str):
+    """Get or create the shared chromadb client for a persistence path."""
+    with _clients_lock:
+        client = _clients.get(path)
+        if client is None:
+            import chromadb
+            client = chromadb.PersistentClient(path=path)
+            _clients[path] = client
+        return client
+
 
 class ChromaRepository(IVectorStore):
-    def __init__ (self, collection_name: str):
-        self.client = chromadb.PersistentClient(path="./db")
+    def __init__(self, collection_name: str, path: str = DEFAULT_CHROMA_PATH):
         self.collection_name = collection_name
-        self.collection = self.client.get_or_create_collection(name=self.collection_name)
+        self.path = path or DEFAULT_CHROMA_PATH
+        self._collection = None
 
-    def add(self, ids, documents, metadata):
+    @property
+    def client(self):
+        """Lazy load the shared chromadb client for this path."""
+        return _get_client(self.path)
+
+    @property
+    def collection(self):
+        """Lazy load the collection on first access."""
+        if self._collection is None:
+            self._collection = self.client.get_or_create_collection(name=self.collection_name)
+        return self._collection
+
+    def add(self, ids: List[str], documents: List[str], metadata: Optional[Dict[str, str]] = None):
         self.collection.add(
             ids=ids,
             documents=documents,
@@ -22,12 +59,9 @@ class ChromaRepository(IVectorStore):
             n_results=n_results
         )
         return results
-    
-    
+
     def delete(self, ids):
         self.collection.delete(ids=ids)
-    
+
     def count(self):
         return self.collection.count()
-
-    
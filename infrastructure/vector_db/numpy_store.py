@@ -0,0 +1,185 @@
+"""
+NumPy-backed in-process vector store.
+
+Brute-force top-k search over a normalized float32 matrix. Intended for
+small corpora (a few thousand test steps), CI and the MCP server, where
+ChromaDB's startup and on-disk SQLite are not worth it.
+
+Persistence layout under ``path``:
+    <collection>.npy   - embedding matrix (memory-mapped on load)
+    <collection>.json  - ids, documents and metadatas, row-aligned with the matrix
+"""
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from core.interfaces.vector_store import IVectorStore
+from core.services.embeddings.embedding_interface import IEmbeddingProvider
+from core.services.embeddings.providers.hashing_embeddings import HashingEmbeddingProvider
+
+
+class NumpyVectorStore(IVectorStore):
+    """IVectorStore implementation using NumPy and .npy/.json files.
+
+    Query results use the same shape as ChromaDB (one inner list per query
+    text) and the same distance scale: squared L2 between unit vectors,
+    i.e. ``2 - 2 * cosine``, so distance thresholds tuned for Chroma keep
+    their meaning.
+    """
+
+    def __init__(
+        self,
+        collection_name: str,
+        path: Optional[str] = None,
+        embedding_provider: Optional[IEmbeddingProvider] = None
+    ):
+        """Initialize NumPy vector store.
+
+        Args:
+            collection_name: Collection name (used for file names)
+            path: Persistence directory (None = in-memory only)
+            embedding_provider: Provider used to embed documents and queries
+                (defaults to the local HashingEmbeddingProvider)
+        """
+        self.collection_name = collection_name
+        self.path = path
+        self._provider = embedding_provider or HashingEmbeddingProvider()
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._vectors: np.ndarray = np.zeros((0, self._provider.dimensions), dtype=np.float32)
+        self._ids: List[str] = []
+        self._documents: List[str] = []
+        self._metadatas: List[Optional[Dict[str, str]]] = []
+
+    def _matrix_path(self) -> Optional[Path]:
+        return Path(self.path) / f"{self.collection_name}.npy" if self.path else None
+
+    def _meta_path(self) -> Optional[Path]:
+        return Path(self.path) / f"{self.collection_name}.json" if self.path else None
+
+    def _ensure_loaded(self) -> None:
+        """Load persisted matrix (memory-mapped) and metadata on first use."""
+        if self._loaded:
+            return
+        self._loaded = True
+        matrix_path, meta_path = self._matrix_path(), self._meta_path()
+        if not matrix_path or not matrix_path.exists() or not meta_path.exists():
+            return
+        try:
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+            vectors = np.load(matrix_path, mmap_mode='r')
+        except (json.JSONDecodeError, OSError, ValueError):
+            return
+        if meta.get("model") != self._provider.model_name or len(meta.get("ids", [])) != vectors.shape[0]:
+            # Embedded with a different model or out of sync - start fresh
+            return
+        self._vectors = vectors
+        self._ids = meta["ids"]
+        self._documents = meta["documents"]
+        self._metadatas = meta["metadatas"]
+
+    def _save(self) -> None:
+        """Persist matrix and metadata (atomic replace)."""
+        matrix_path, meta_path = self._matrix_path(), self._meta_path()
+        if not matrix_path:
+            return
+        matrix_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_matrix = matrix_path.with_suffix(".npy.tmp")
+        tmp_meta = meta_path.with_suffix(".json.tmp")
+        with open(tmp_matrix, 'wb') as f:
+            np.save(f, np.ascontiguousarray(self._vectors, dtype=np.float32))
+        with open(tmp_meta, 'w') as f:
+            json.dump({
+                "model": self._provider.model_name,
+                "ids": self._ids,
+                "documents": self._documents,
+                "metadatas": self._metadatas,
+            }, f)
+        # Release the memory map before replacing the file it points to
+        self._vectors = np.array(self._vectors, dtype=np.float32)
+        os.replace(tmp_matrix, matrix_path)
+        os.replace(tmp_meta, meta_path)
+
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        """Embed texts into a normalized (n, dims) float32 matrix."""
+        matrix = np.zeros((len(texts), self._provider.dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            result = self._provider.embed(text)
+            if result is None:
+                continue
+            vector = np.asarray(result.vector, dtype=np.float32)
+            norm = np.linalg.norm(vector)
+            if norm > 0:
+                matrix[row] = vector / norm
+        return matrix
+
+    def add(self, ids: List[str], documents: List[str], metadata: Optional[Dict[str, str]] = None):
+        """Add documents; ids already present are skipped (like Chroma's add)."""
+        with self._lock:
+            self._ensure_loaded()
+            existing = set(self._ids)
+            new_ids, new_docs = [], []
+            for doc_id, doc in zip(ids, documents):
+                if doc_id in existing:
+                    continue
+                existing.add(doc_id)
+                new_ids.append(doc_id)
+                new_docs.append(doc)
+            if not new_ids:
+                return
+            self._vectors = np.vstack([self._vectors, self._embed(new_docs)])
+            self._ids.extend(new_ids)
+            self._documents.extend(new_docs)
+            self._metadatas.extend([metadata] * len(new_ids))
+            self._save()
+
+    def query(self, query_text, n_results=5) -> Dict[str, List[List[Any]]]:
+        """Return the n_results nearest documents in ChromaDB's result shape."""
+        with self._lock:
+            self._ensure_loaded()
+            empty = {"ids": [[]], "documents": [[]], "metadatas": [[]], "distances": [[]]}
+            total = len(self._ids)
+            if total == 0 or n_results <= 0:
+                return empty
+
+            query_vector = self._embed([query_text])[0]
+            scores = np.asarray(self._vectors @ query_vector)
+            k = min(n_results, total)
+            if k < total:
+                top = np.argpartition(-scores, k - 1)[:k]
+            else:
+                top = np.arange(total)
+            top = top[np.argsort(-scores[top], kind="stable")]
+
+            return {
+                "ids": [[self._ids[i] for i in top]],
+                "documents": [[self._documents[i] for i in top]],
+                "metadatas": [[self._metadatas[i] for i in top]],
+                "distances": [[float(2.0 - 2.0 * scores[i]) for i in top]],
+            }
+
+    def delete(self, ids):
+        """Delete documents by id."""
+        if isinstance(ids, str):
+            ids = [ids]
+        with self._lock:
+            self._ensure_loaded()
+            remove = set(ids)
+            keep = [i for i, doc_id in enumerate(self._ids) if doc_id not in remove]
+            if len(keep) == len(self._ids):
+                return
+            self._vectors = np.asarray(self._vectors)[keep]
+            self._ids = [self._ids[i] for i in keep]
+            self._documents = [self._documents[i] for i in keep]
+            self._metadatas = [self._metadatas[i] for i in keep]
+            self._save()
+
+    def count(self):
+        with self._lock:
+            self._ensure_loaded()
+            return len(self._ids)
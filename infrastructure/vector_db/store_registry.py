@@ -0,0 +1,81 @@
+"""
+Process-wide registry of vector stores.
+
+Services ask the registry for a store instead of constructing one, so a
+collection is opened once per process and reused by every generator,
+workflow and MCP tool call that needs it.
+
+Backends:
+    chroma - ChromaDB PersistentClient (default)
+    numpy  - in-process NumPy store with .npy/.json persistence
+"""
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+from core.interfaces.vector_store import IVectorStore
+from .chroma_repository import ChromaRepository, DEFAULT_CHROMA_PATH
+
+VECTOR_STORE_BACKENDS = ("chroma", "numpy")
+
+_stores: Dict[Tuple[str, str, str], IVectorStore] = {}
+_stores_lock = threading.Lock()
+
+
+def resolve_vector_db_path(path: Optional[str] = None) -> str:
+    """Resolve the persistence path (explicit > VECTOR_DB_PATH env > default)."""
+    return path or os.getenv("VECTOR_DB_PATH") or DEFAULT_CHROMA_PATH
+
+
+def resolve_vector_db_backend(backend: Optional[str] = None) -> str:
+    """Resolve the backend name (explicit > VECTOR_DB_BACKEND env > chroma)."""
+    name = (backend or os.getenv("VECTOR_DB_BACKEND") or "chroma").lower().strip()
+    if name not in VECTOR_STORE_BACKENDS:
+        raise ValueError(
+            f"Unknown vector store backend: {name}. "
+            f"Supported: {', '.join(VECTOR_STORE_BACKENDS)}"
+        )
+    return name
+
+
+def _create_store(backend: str, path: str, collection_name: str) -> IVectorStore:
+    if backend == "numpy":
+        from .numpy_store import NumpyVectorStore
+        return NumpyVectorStore(collection_name, path=path)
+    return ChromaRepository(collection_name, path=path)
+
+
+def get_vector_store(
+    collection_name: str = "test_steps",
+    path: Optional[str] = None,
+    backend: Optional[str] = None
+) -> IVectorStore:
+    """Get or create the shared vector store for a collection.
+
+    The returned store is lazy: nothing is opened or loaded until the
+    first add/query/count call.
+
+    Args:
+        collection_name: Collection name
+        path: Persistence directory (defaults to VECTOR_DB_PATH or ./db)
+        backend: "chroma" or "numpy" (defaults to VECTOR_DB_BACKEND or chroma)
+
+    Returns:
+        Shared IVectorStore instance
+
+    Raises:
+        ValueError: If backend is not supported
+    """
+    key = (resolve_vector_db_backend(backend), resolve_vector_db_path(path), collection_name)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _create_store(*key)
+            _stores[key] = store
+        return store
+
+
+def reset_vector_stores() -> None:
+    """Drop all registered stores (mainly for tests)."""
+    with _stores_lock:
+        _stores.clear()
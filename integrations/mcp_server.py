@@ -25,7 +25,6 @@ import asyncio
 import json
 import sys
 import os
-import time
 import traceback
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -186,7 +185,9 @@ def _apply_llm_correction(
             provider_type=provider_type,
         )
 
-        embedder = TestStepEmbedder()
+        embedder = TestStepEmbedder(
+            path=config.vector_db_path, backend=config.vector_db_backend
+        )
         reference_steps = embedder.get_reference_steps(title, n_results=10)
         if reference_steps:
             print(f"  Found {len(reference_steps)} reference steps for correction")
@@ -513,36 +514,33 @@ async def upload_tests_for_story(
         plan_id = suite_info.get('plan_id', 0)
         suite_id = suite_info['id']
 
+        payload = []
         for tc in test_cases:
-            tc_id = tc.get('id', '')
-            title = tc.get('title', '')
-            steps = tc.get('steps', [])
             objective = tc.get('objective', '')
-
             # Format objective for platform
-            formatted_objective = obj_gen.format_objective_for_ado(objective) if objective and target_platform == 'ADO' else objective
-
-            try:
-                # Create test case using repository
-                work_item_id = case_repo.create_test_case(
-                    title=title,
-                    steps=steps,
-                    objective=formatted_objective,
-                    section_id=suite_id
-                )
-
-                if work_item_id:
-                    # Add to suite (ADO needs explicit linking; TestRail handles via section_id)
-                    if suite_repo.add_test_case_to_suite(plan_id, suite_id, work_item_id):
-                        created.append({'id': work_item_id, 'tc_id': tc_id})
-                    else:
-                        failed.append({'tc_id': tc_id, 'error': 'Failed to add to suite'})
-                else:
-                    failed.append({'tc_id': tc_id, 'error': 'Failed to create'})
-            except Exception as e:
-                failed.append({'tc_id': tc_id, 'error': str(e)})
-
-            time.sleep(0.3)  # Rate limiting
+            if objective and target_platform == 'ADO':
+                objective = obj_gen.format_objective_for_ado(objective)
+            payload.append({'title': tc.get('title', ''), 'steps': tc.get('steps', []), 'objective': objective})
+
+        try:
+            # Create test cases in bulk, then add them to the suite in one call
+            # (ADO needs explicit linking; TestRail handles via section_id)
+            results = case_repo.create_test_cases(payload, section_id=suite_id)
+            in_suite = set(suite_repo.add_test_cases_to_suite(
+                plan_id, suite_id, [item['id'] for item in results if item['id']]
+            ))
+        except Exception as e:
+            results = [{'id': None, 'error': str(e)} for _ in test_cases]
+            in_suite = set()
+
+        for tc, item in zip(test_cases, results):
+            tc_id = tc.get('id', '')
+            if not item['id']:
+                failed.append({'tc_id': tc_id, 'error': item.get('error') or 'Failed to create'})
+            elif item['id'] in in_suite:
+                created.append({'id': item['id'], 'tc_id': tc_id})
+            else:
+                failed.append({'tc_id': tc_id, 'error': 'Failed to add to suite'})
 
         return {
             "success": True,
@@ -0,0 +1,125 @@
+"""
+Multi-keyword matcher for project configuration checks.
+
+All configured keywords are compiled into one regex alternation, so a
+single pass over the text finds every (possibly overlapping) occurrence
+of every keyword. Callers then apply their own word-boundary rules to the
+reported positions, which keeps the semantics of the per-keyword regexes
+this replaces.
+"""
+import re
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Tuple
+
+
+def is_word_char(ch: str) -> bool:
+    """Equivalent of regex \\w for a single character."""
+    return ch.isalnum() or ch == '_'
+
+
+def at_word_boundary(text: str, index: int) -> bool:
+    """Equivalent of regex \\b at text[index]."""
+    left = index > 0 and is_word_char(text[index - 1])
+    right = index < len(text) and is_word_char(text[index])
+    return left != right
+
+
+class KeywordMatcher:
+    """Single-pass matcher over a fixed keyword set.
+
+    The pattern is a zero-width lookahead over all keywords sorted
+    longest-first, so at every offset it reports the longest keyword that
+    starts there. Any shorter keyword starting at the same offset must be
+    a prefix of that one, so those are added from a precomputed table.
+
+    Usage:
+        matcher = KeywordMatcher(["cut", "copy", "copy tool"])
+        hits = matcher.scan("use the copy tool")
+        # {"copy tool": [8], "copy": [8]}
+    """
+
+    # Recent scan results kept per matcher (same AC checked by several methods)
+    SCAN_MEMO_SIZE = 256
+
+    def __init__(self, keywords: Iterable[str]):
+        """Compile the keyword set.
+
+        Args:
+            keywords: Keywords to match (case-sensitive, empty strings ignored)
+        """
+        self._keywords: List[str] = sorted(
+            dict.fromkeys(k for k in keywords if k), key=len, reverse=True
+        )
+        self._pattern = None
+        if self._keywords:
+            alternation = '|'.join(re.escape(k) for k in self._keywords)
+            self._pattern = re.compile(f'(?=({alternation}))')
+
+        # keyword -> shorter keywords that are its prefixes
+        self._prefixes: Dict[str, List[str]] = {
+            keyword: [other for other in self._keywords
+                      if len(other) < len(keyword) and keyword.startswith(other)]
+            for keyword in self._keywords
+        }
+        self._memo: "OrderedDict[str, Dict[str, List[int]]]" = OrderedDict()
+
+    @property
+    def keywords(self) -> List[str]:
+        """Keywords in the matcher (longest first)."""
+        return list(self._keywords)
+
+    def scan(self, text: str) -> Dict[str, List[int]]:
+        """Find all keyword occurrences in one pass.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Dict mapping each found keyword to its start offsets
+            (shared between callers; do not mutate)
+        """
+        memo = self._memo.get(text)
+        if memo is not None:
+            self._memo.move_to_end(text)
+            return memo
+
+        hits: Dict[str, List[int]] = {}
+        if self._pattern is not None:
+            for match in self._pattern.finditer(text):
+                start = match.start()
+                longest = match.group(1)
+                hits.setdefault(longest, []).append(start)
+                for prefix in self._prefixes[longest]:
+                    hits.setdefault(prefix, []).append(start)
+
+        self._memo[text] = hits
+        if len(self._memo) > self.SCAN_MEMO_SIZE:
+            self._memo.popitem(last=False)
+        return hits
+
+    @staticmethod
+    def matches(
+        text: str,
+        hits: Dict[str, List[int]],
+        keyword: str,
+        boundaries: Tuple[bool, bool] = (False, False)
+    ) -> bool:
+        """Check whether keyword occurs in text under the given boundary rules.
+
+        Args:
+            text: The scanned text
+            hits: Result of scan(text)
+            keyword: Keyword to check
+            boundaries: (require leading \\b, require trailing \\b)
+
+        Returns:
+            True if at least one occurrence satisfies the boundary rules
+        """
+        leading, trailing = boundaries
+        for start in hits.get(keyword, ()):
+            if leading and not at_word_boundary(text, start):
+                continue
+            if trailing and not at_word_boundary(text, start + len(keyword)):
+                continue
+            return True
+        return False
@@ -3,11 +3,12 @@ Project configuration data classes for multi-project support.
 Defines the structure for application-specific configurations.
 """
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from pathlib import Path
 import yaml
 import os
-import re
+
+from .keyword_matcher import KeywordMatcher
 
 
 @dataclass
@@ -102,6 +103,47 @@ class ApplicationConfig:
         """Get formatted close step for this application."""
         return self.close_step.format(app_name=self.name)
 
+    # Compiled keyword automaton over the constraint/mapping keys (built lazily)
+    _matcher_cache: Optional[Tuple[tuple, KeywordMatcher, List[str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _keyword_matcher(self) -> Tuple[KeywordMatcher, List[str]]:
+        """Get the automaton over all config keywords, rebuilt only if they changed.
+
+        Keywords are stored in the form each check compares them in:
+        unavailable features, aliases and notes lowercased; entry point and
+        object keywords as configured (they are matched against lowercased
+        text, as before).
+
+        Returns:
+            (matcher, entry point keywords sorted longest-first)
+        """
+        signature = (
+            tuple(self.unavailable_features),
+            tuple(self.feature_aliases),
+            tuple(self.feature_notes),
+            tuple(self.entry_point_mappings),
+            tuple(self.object_interaction_keywords),
+        )
+        if self._matcher_cache is None or self._matcher_cache[0] != signature:
+            keywords = (
+                [k.lower() for k in self.unavailable_features]
+                + [k.lower() for k in self.feature_aliases]
+                + [k.lower() for k in self.feature_notes]
+                + list(self.entry_point_mappings)
+                + list(self.object_interaction_keywords)
+            )
+            entry_keywords = sorted(self.entry_point_mappings, key=len, reverse=True)
+            self._matcher_cache = (signature, KeywordMatcher(keywords), entry_keywords)
+        return self._matcher_cache[1], self._matcher_cache[2]
+
+    def _scan(self, text: str) -> Tuple[str, Dict[str, List[int]]]:
+        """Lowercase text and find every config keyword in a single pass."""
+        text_lower = text.lower()
+        matcher, _ = self._keyword_matcher()
+        return text_lower, matcher.scan(text_lower)
+
     def determine_entry_point(self, feature_name: str, hints: List[str] = None) -> str:
         """Determine the most appropriate entry point for a feature.
 
@@ -114,16 +156,16 @@ class ApplicationConfig:
         'dimension' also match 'dimensions', 'propert' matches 'properties', etc.
         Keywords are tried longest-first to prefer specific matches.
         """
-        feature_lower = feature_name.lower()
+        feature_lower, hits = self._scan(feature_name)
+        _, entry_keywords = self._keyword_matcher()
 
         # FIRST: Check config mapping for feature name (highest priority)
-        # Sort by keyword length descending — longer (more specific) keywords first
-        for keyword, entry_point in sorted(self.entry_point_mappings.items(), key=lambda kv: len(kv[0]), reverse=True):
+        # Keywords are pre-sorted by length descending — longer (more specific) first
+        for keyword in entry_keywords:
             # Leading \b prevents substring false positives ('cut' won't match 'executed')
             # No trailing \b so stems match plurals ('dimension' → 'dimensions')
-            pattern = rf'\b{re.escape(keyword)}'
-            if re.search(pattern, feature_lower):
-                return entry_point
+            if KeywordMatcher.matches(feature_lower, hits, keyword, (True, False)):
+                return self.entry_point_mappings[keyword]
 
         # SECOND: Use hints if no direct mapping found
         if hints:
@@ -136,39 +178,38 @@ class ApplicationConfig:
 
         Uses word boundary matching to avoid false positives.
         """
-        text_lower = text.lower()
-        for keyword in self.object_interaction_keywords:
-            pattern = rf'\b{re.escape(keyword)}\b'
-            if re.search(pattern, text_lower):
-                return True
-        return False
+        text_lower, hits = self._scan(text)
+        return any(
+            KeywordMatcher.matches(text_lower, hits, keyword, (True, True))
+            for keyword in self.object_interaction_keywords
+        )
 
     def is_feature_available(self, feature_text: str) -> bool:
         """Check if a feature is available in this application.
 
         Uses word boundary matching to avoid false positives.
         """
-        text_lower = feature_text.lower()
+        text_lower, hits = self._scan(feature_text)
         for unavailable in self.unavailable_features:
             # Use word boundary matching for multi-word phrases
-            pattern = rf'\b{re.escape(unavailable.lower())}\b'
-            if re.search(pattern, text_lower):
+            if KeywordMatcher.matches(text_lower, hits, unavailable.lower(), (True, True)):
                 return False
         return True
 
     def get_feature_warning(self, feature_text: str) -> Optional[str]:
         """Get any warnings/notes about a feature."""
-        text_lower = feature_text.lower()
+        _, hits = self._scan(feature_text)
         for feature_key, note in self.feature_notes.items():
-            if feature_key.lower() in text_lower:
+            if feature_key.lower() in hits:
                 return note
         return None
 
     def resolve_feature_alias(self, ac_text: str) -> str:
         """Replace AC terminology with actual feature names if aliases exist."""
         result = ac_text
+        _, hits = self._scan(ac_text)
         for alias, actual in self.feature_aliases.items():
-            if alias.lower() in ac_text.lower():
+            if alias.lower() in hits:
                 # Add note about the alias
                 result = result + f" [Note: {alias} → {actual}]"
         return result
@@ -187,11 +228,11 @@ class ApplicationConfig:
             'notes': []
         }
 
-        text_lower = ac_text.lower()
+        _, hits = self._scan(ac_text)
 
         # Check for unavailable features
         for unavailable in self.unavailable_features:
-            if unavailable.lower() in text_lower:
+            if unavailable.lower() in hits:
                 result['feasible'] = False
                 result['blocked_reasons'].append(
                     f"Feature '{unavailable}' is not available in {self.name}"
@@ -199,12 +240,12 @@ class ApplicationConfig:
 
         # Check for feature notes/warnings
         for feature_key, note in self.feature_notes.items():
-            if feature_key.lower() in text_lower:
+            if feature_key.lower() in hits:
                 result['warnings'].append(note)
 
         # Check for aliases
         for alias, actual in self.feature_aliases.items():
-            if alias.lower() in text_lower:
+            if alias.lower() in hits:
                 result['notes'].append(f"'{alias}' maps to '{actual}'")
 
         return result
@@ -390,11 +431,21 @@ class ProjectConfig:
     # Output configuration
     output_dir: str = "output"
 
+    # Vector store persistence directory (None = VECTOR_DB_PATH env or ./db)
+    vector_db_path: Optional[str] = None
+    # Vector store backend: "chroma" or "numpy" (None = VECTOR_DB_BACKEND env or chroma)
+    vector_db_backend: Optional[str] = None
+
     # LLM configuration (inherited from global config by default)
     llm_enabled: bool = True
     llm_provider: str = "openai"
     llm_model: str = "gpt-4o-mini"
 
+    # Adaptive correction: only tests failing the quality gates (and
+    # uncovered ACs) are sent to the LLM corrector
+    adaptive_correction: bool = True
+    correction_quality_threshold: float = 0.6
+
     # Self-judge (lightweight self-review using corrector's own LLM)
     self_judge_enabled: bool = False
 
@@ -591,10 +642,15 @@ class ProjectConfig:
             source_platform=source_platform,
             target_platform=target_platform,
             output_dir=data.get('output_dir', 'output'),
+            vector_db_path=data.get('vector_db_path'),
+            vector_db_backend=data.get('vector_db_backend'),
             # LLM config: .env takes priority, YAML as fallback
             llm_enabled=os.getenv('LLM_ENABLED', str(data.get('llm_enabled', True))).lower() in ('true', '1'),
             llm_provider=os.getenv('LLM_PROVIDER') or data.get('llm_provider', 'openai'),
             llm_model=os.getenv('LLM_MODEL') or data.get('llm_model', 'gpt-4o-mini'),
+            # Adaptive correction config
+            adaptive_correction=os.getenv('ADAPTIVE_CORRECTION', str(data.get('adaptive_correction', True))).lower() in ('true', '1'),
+            correction_quality_threshold=float(os.getenv('CORRECTION_QUALITY_THRESHOLD', str(data.get('correction_quality_threshold', 0.6)))),
             # Self-judge config
             self_judge_enabled=os.getenv('SELF_JUDGE_ENABLED', str(data.get('self_judge_enabled', False))).lower() in ('true', '1'),
             # Judge config: .env takes priority, YAML as fallback
@@ -646,9 +702,13 @@ class ProjectConfig:
                 'test_id_increment': self.rules.test_id_increment,
             },
             'output_dir': self.output_dir,
+            'vector_db_path': self.vector_db_path,
+            'vector_db_backend': self.vector_db_backend,
             'llm_enabled': self.llm_enabled,
             'llm_provider': self.llm_provider,
             'llm_model': self.llm_model,
+            'adaptive_correction': self.adaptive_correction,
+            'correction_quality_threshold': self.correction_quality_threshold,
             'objective_patterns': self.objective_key_term_patterns,
         }
 
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Benchmark platform uploads and fetches against the fake platform server.
+
+Starts scripts/fake_platform_server.py in-process, seeds N stories and
+drives the real repositories (and UploadWorkflow's upload step) over
+HTTP, with optional latency, error and rate-limit injection. Reports
+per-call latency (p50/p95) and throughput per phase, plus the per-endpoint
+HTTP metrics and what the server injected.
+
+Phases:
+    ado_get_story       ADOStoryRepository.get_story, one story per call
+    ado_get_stories     ADOStoryRepository.get_stories, all stories at once
+    ado_qa_prep         ADOStoryRepository.get_qa_prep, one story per call
+    ado_upload          suite lookup/creation + UploadWorkflow upload, per story
+    jira_get_story      JiraStoryRepository.get_story, one story per call
+    jira_get_stories    JiraStoryRepository.get_stories, all stories at once
+    testrail_upload     section lookup + UploadWorkflow upload, per story
+    testrail_get_cases  TestRailHttpClient.get_cases (every page)
+
+Usage:
+    python scripts/benchmark_platform.py --stories 20 --tests-per-story 12
+    python scripts/benchmark_platform.py --latency 0.05 --jitter 0.05 --concurrency 16
+    python scripts/benchmark_platform.py --error-rate 0.05 --rate-limit 100 --json out.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from infrastructure import http_cache, http_resilience, http_throttle
+from infrastructure.ado import suite_index
+from infrastructure.ado.ado_repository import (
+    ADOStoryRepository,
+    ADOTestCaseRepository,
+    ADOTestSuiteRepository
+)
+from infrastructure.jira.jira_repository import JiraStoryRepository
+from infrastructure.testrail.testrail_repository import (
+    TestRailTestCaseRepository,
+    TestRailTestSuiteRepository
+)
+from scripts.fake_platform_server import (
+    JIRA_PROJECT,
+    ORGANIZATION,
+    PROJECT,
+    TESTRAIL_PROJECT,
+    FakePlatformServer,
+    FaultConfig
+)
+from workflows import UploadWorkflow
+
+PHASES = [
+    'ado_get_story', 'ado_get_stories', 'ado_qa_prep', 'ado_upload',
+    'jira_get_story', 'jira_get_stories', 'testrail_upload', 'testrail_get_cases',
+]
+
+TEST_PLAN_ID = 1
+
+
+def build_test_cases(story_id: int, count: int, steps: int) -> List[Dict]:
+    """Synthetic generated test cases for a story (upload payload shape)."""
+    return [
+        {
+            'id': f"{story_id}-AC1-{n:03d}",
+            'title': f"{story_id}: Rotate: Verify rotation by {15 * n} degrees",
+            'objective': f"Verify that the user can rotate the shape by {15 * n} degrees.",
+            'steps': [
+                {'action': f"Step {k}: rotate the shape {k * 5} degrees",
+                 'expected': f"The shape is rotated {k * 5} degrees"}
+                for k in range(1, steps + 1)
+            ],
+        }
+        for n in range(1, count + 1)
+    ]
+
+
+@dataclass
+class PhaseResult:
+    """Measurements for one phase."""
+    name: str
+    calls: int
+    wall_seconds: float
+    items: int
+    failures: int
+    items_per_second: float
+    p50_ms: float
+    p95_ms: float
+    latencies_ms: List[float] = field(default_factory=list)
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct * (len(ordered) - 1))))]
+
+
+class PlatformBenchmark:
+    """Runs the upload and fetch phases against a fake platform server."""
+
+    def __init__(
+        self,
+        server: FakePlatformServer,
+        story_ids: List[int],
+        tests_per_story: int = 10,
+        steps_per_test: int = 6
+    ):
+        self.server = server
+        self.story_ids = story_ids
+        self.tests_per_story = tests_per_story
+        self.steps_per_test = steps_per_test
+        self._upload = UploadWorkflow()
+
+    def phases(self) -> Dict[str, Callable[[], PhaseResult]]:
+        """Phase name -> runner, in run order."""
+        return {
+            'ado_get_story': self._ado_get_story,
+            'ado_get_stories': self._ado_get_stories,
+            'ado_qa_prep': self._ado_qa_prep,
+            'ado_upload': self._ado_upload,
+            'jira_get_story': self._jira_get_story,
+            'jira_get_stories': self._jira_get_stories,
+            'testrail_upload': self._testrail_upload,
+            'testrail_get_cases': self._testrail_get_cases,
+        }
+
+    def run(self, phases: Optional[List[str]] = None) -> List[PhaseResult]:
+        """Run the selected phases (default: all) in order."""
+        with _environ(ADO_SERVER_URL=self.server.url):
+            _reset_process_state()
+            with contextlib.redirect_stdout(io.StringIO()):
+                return [fn() for name, fn in self.phases().items() if not phases or name in phases]
+
+    # Repositories
+
+    def _ado_config(self) -> SimpleNamespace:
+        return SimpleNamespace(
+            organization=ORGANIZATION, project=PROJECT, pat='fake-pat',
+            qa_prep_pattern='Story {story_id}: QA Prep', assigned_to=None, area_path=None
+        )
+
+    def _jira(self) -> JiraStoryRepository:
+        return JiraStoryRepository(self.server.url, 'bench@example.com', 'fake-token', JIRA_PROJECT)
+
+    def _testrail_args(self) -> Dict:
+        return {'base_url': self.server.url, 'email': 'bench@example.com',
+                'api_key': 'fake-key', 'project_id': TESTRAIL_PROJECT}
+
+    # Phases
+
+    def _per_story(self, name: str, call: Callable[[int], Tuple[int, int]]) -> PhaseResult:
+        """Time call(story_id) per story; call returns (items, failures)."""
+        latencies, items, failures = [], 0, 0
+        start = time.perf_counter()
+        for story_id in self.story_ids:
+            call_start = time.perf_counter()
+            try:
+                done, failed = call(story_id)
+            except Exception:
+                done, failed = 0, 1
+            latencies.append((time.perf_counter() - call_start) * 1000)
+            items += done
+            failures += failed
+        return _result(name, time.perf_counter() - start, latencies, items, failures)
+
+    def _once(self, name: str, call: Callable[[], int]) -> PhaseResult:
+        start = time.perf_counter()
+        try:
+            items, failures = call(), 0
+        except Exception:
+            items, failures = 0, 1
+        wall = time.perf_counter() - start
+        return _result(name, wall, [wall * 1000], items, failures)
+
+    def _ado_get_story(self) -> PhaseResult:
+        repo = ADOStoryRepository(self._ado_config())
+        return self._per_story('ado_get_story', lambda sid: (1, 0) if repo.get_story(sid) else (0, 1))
+
+    def _ado_get_stories(self) -> PhaseResult:
+        repo = ADOStoryRepository(self._ado_config())
+        return self._once('ado_get_stories', lambda: len(repo.get_stories(self.story_ids)))
+
+    def _ado_qa_prep(self) -> PhaseResult:
+        repo = ADOStoryRepository(self._ado_config())
+        return self._per_story('ado_qa_prep', lambda sid: (1, 0) if repo.get_qa_prep(sid) else (0, 1))
+
+    def _ado_upload(self) -> PhaseResult:
+        config = self._ado_config()
+        suite_repo, case_repo = ADOTestSuiteRepository(config), ADOTestCaseRepository(config)
+
+        def upload(story_id: int):
+            suite = suite_repo.find_suite_by_story_id(story_id) or \
+                suite_repo.create_suite(TEST_PLAN_ID, f"{story_id} : Benchmark", story_id)
+            if not suite:
+                return 0, self.tests_per_story
+            return self._upload_tests(case_repo, suite_repo, suite, story_id, 'ADO')
+
+        return self._per_story('ado_upload', upload)
+
+    def _jira_get_story(self) -> PhaseResult:
+        repo = self._jira()
+        return self._per_story('jira_get_story', lambda sid: (1, 0) if repo.get_story(sid) else (0, 1))
+
+    def _jira_get_stories(self) -> PhaseResult:
+        repo = self._jira()
+        return self._once('jira_get_stories', lambda: len(repo.get_stories(self.story_ids)))
+
+    def _testrail_upload(self) -> PhaseResult:
+        suite_repo = TestRailTestSuiteRepository(**self._testrail_args())
+        case_repo = TestRailTestCaseRepository(**self._testrail_args())
+
+        def upload(story_id: int):
+            section = suite_repo.find_suite_by_story_id(story_id)
+            if not section:
+                return 0, self.tests_per_story
+            return self._upload_tests(case_repo, suite_repo, section, story_id, 'TESTRAIL')
+
+        return self._per_story('testrail_upload', upload)
+
+    def _testrail_get_cases(self) -> PhaseResult:
+        repo = TestRailTestCaseRepository(**self._testrail_args())
+        return self._once('testrail_get_cases', lambda: len(repo._client.get_cases(TESTRAIL_PROJECT)))
+
+    def _upload_tests(self, case_repo, suite_repo, suite: Dict, story_id: int, target: str):
+        test_cases = build_test_cases(story_id, self.tests_per_story, self.steps_per_test)
+        results = self._upload._upload_test_cases(None, case_repo, suite_repo, suite, test_cases, target)
+        return len(results['created']), len(results['failed'])
+
+
+def _result(name: str, wall: float, latencies: List[float], items: int, failures: int) -> PhaseResult:
+    return PhaseResult(
+        name=name,
+        calls=len(latencies),
+        wall_seconds=wall,
+        items=items,
+        failures=failures,
+        items_per_second=items / wall if wall else 0.0,
+        p50_ms=statistics.median(latencies) if latencies else 0.0,
+        p95_ms=_percentile(latencies, 0.95),
+        latencies_ms=latencies
+    )
+
+
+@contextlib.contextmanager
+def _environ(**values: Optional[str]) -> Iterator[None]:
+    """Set environment variables (None leaves one unchanged), restoring them on exit."""
+    previous = {name: os.environ.get(name) for name in values}
+    os.environ.update({name: value for name, value in values.items() if value is not None})
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def _reset_process_state() -> None:
+    """Fresh throttle, breaker, metrics, caches and suite indexes."""
+    http_throttle.reset_host_throttle()
+    http_resilience.reset_http_resilience()
+    http_cache.reset_http_cache()
+    suite_index.reset_suite_indexes()
+    ADOStoryRepository._qa_prep_ids.clear()
+
+
+def print_report(results: List[PhaseResult], stories: int, server: FakePlatformServer) -> None:
+    faults = server.faults
+    print(f"\nPlatform benchmark: {stories} stories "
+          f"(latency {faults.latency * 1000:.0f}+{faults.jitter * 1000:.0f} ms, "
+          f"errors {faults.error_rate:.0%}, rate limit {faults.rate_limit or 'none'})")
+    print(f"{'phase':<20}{'calls':>7}{'wall ms':>10}{'p50 ms':>9}{'p95 ms':>9}{'items':>7}{'failed':>8}{'items/s':>9}")
+    for r in results:
+        print(
+            f"{r.name:<20}{r.calls:>7}{r.wall_seconds * 1000:>10.1f}{r.p50_ms:>9.1f}{r.p95_ms:>9.1f}"
+            f"{r.items:>7}{r.failures:>8}{r.items_per_second:>9.1f}"
+        )
+    print(f"\nServer: {server.stats['requests']} requests, {server.stats['throttled']} throttled (429), "
+          f"{server.stats['injected_errors']} injected errors (503)")
+    print("\nHTTP metrics (per endpoint):")
+    print(http_resilience.get_http_metrics().report())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark platform uploads and fetches against a fake server")
+    parser.add_argument('--stories', type=int, default=20, help='Stories to seed')
+    parser.add_argument('--acs', type=int, default=5, help='Acceptance criteria per story')
+    parser.add_argument('--tests-per-story', type=int, default=10, help='Test cases uploaded per story')
+    parser.add_argument('--steps', type=int, default=6, help='Steps per test case')
+    parser.add_argument('--latency', type=float, default=0.02, help='Seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Extra random latency (seconds)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered 503')
+    parser.add_argument('--rate-limit', type=float, default=0.0, help='Requests/second before 429s (0 = off)')
+    parser.add_argument('--retry-after', type=int, default=1, help='Retry-After seconds sent with 429s')
+    parser.add_argument('--concurrency', type=int, help='UPLOAD_CONCURRENCY for the run')
+    parser.add_argument('--phases', nargs='+', choices=PHASES, help='Phases to run (default: all)')
+    parser.add_argument('--seed', type=int, default=7, help='Fault injection random seed')
+    parser.add_argument('--json', dest='json_out', help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    faults = FaultConfig(
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+        rate_limit=args.rate_limit, retry_after=args.retry_after, seed=args.seed
+    )
+    # Measure the HTTP path itself, not the local response cache
+    overrides = _environ(
+        HTTP_CACHE=os.environ.get("HTTP_CACHE", "off"),
+        UPLOAD_CONCURRENCY=str(args.concurrency) if args.concurrency else None
+    )
+    with overrides, FakePlatformServer(faults) as server:
+        story_ids = server.seed_stories(args.stories, acs_per_story=args.acs)
+        benchmark = PlatformBenchmark(server, story_ids, args.tests_per_story, args.steps)
+        results = benchmark.run(phases=args.phases)
+        print_report(results, len(story_ids), server)
+
+        if args.json_out:
+            report = {
+                'args': vars(args),
+                'python': sys.version.split()[0],
+                'server': dict(server.stats),
+                'phases': {r.name: asdict(r) for r in results},
+                'http': http_resilience.get_http_metrics().snapshot(),
+            }
+            with open(args.json_out, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+
+    failed = sum(r.failures for r in results)
+    sys.exit(1 if failed and not args.error_rate else 0)
+
+
+if __name__ == '__main__':
+    main()
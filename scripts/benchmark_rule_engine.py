@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Benchmark the deterministic (rule-engine) stages on a synthetic story corpus.
+
+Generates a seeded corpus of stories with configurable AC counts, AC
+lengths and feature types, runs every pure-Python stage with LLMs stubbed
+out, and reports per-stage wall time, allocations (tracemalloc) and
+throughput. Results can be saved as a baseline and later runs compared
+against it; a stage slower than the baseline by more than the tolerance
+fails the run (exit code 1).
+
+Stages:
+    generate      GenericTestGenerator.generate_test_cases
+    prompts       PromptBuilder system + user prompts
+    validate      TestCaseValidator and TestQualityAnalyzer
+    qa_summary    QASummaryGenerator (stub LLM -> deterministic path)
+
+Usage:
+    python scripts/benchmark_rule_engine.py --stories 20 --acs 3-12
+    python scripts/benchmark_rule_engine.py --save-baseline
+    python scripts/benchmark_rule_engine.py --compare --tolerance 0.25
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from projects.project_config import ProjectConfig
+from core.services.test_generator import GenericTestGenerator
+from core.services.test_validator import TestCaseValidator
+from core.services.quality import get_quality_analyzer
+from core.services.llm.prompt_builder import PromptBuilder
+from core.services.story_context_cache import reset_story_context_memo
+from infrastructure.export.qa_summary_generator import QASummaryGenerator
+
+DEFAULT_CONFIG = project_root / "projects" / "configs" / "env-quickdraw.yaml"
+DEFAULT_BASELINE = Path(__file__).parent / "benchmark_baseline.json"
+
+# Feature type -> (title templates, AC templates, vocabulary)
+FEATURE_TYPES: Dict[str, Dict[str, List[str]]] = {
+    'tool': {
+        'titles': ["{Obj} {verb} tool", "{Verb} selected {obj}s"],
+        'acs': [
+            "User can {verb} the selected {obj} {amount} degrees",
+            "{Verb} is enabled only when an {obj} is selected",
+            "Undo and redo are supported for {verb}",
+            "The canvas updates immediately after {verb}",
+            "{Verb} preserves the {obj} color, border and stroke",
+        ],
+        'verb': ["rotate", "mirror", "flip", "align", "resize"],
+        'obj': ["object", "shape", "line", "text box", "group"],
+    },
+    'menu': {
+        'titles': ["{Verb} from the {menu} Menu", "{Menu} Menu {obj} command"],
+        'acs': [
+            "The {menu} menu contains a {Obj} command",
+            "Selecting {menu} → {Obj} opens the {obj} dialog",
+            "The dialog closes when the user selects Cancel",
+            "Default {obj} = \"Letter\"",
+            "Recent {obj}s are listed in the {menu} menu",
+        ],
+        'verb': ["open", "export", "print", "insert"],
+        'obj': ["page setup", "template", "file", "layer"],
+        'menu': ["File", "Edit", "Tools", "Insert"],
+    },
+    'properties': {
+        'titles': ["{Obj} properties panel", "Edit {obj} properties"],
+        'acs': [
+            "The Properties panel shows the {obj} fields: width, height, angle",
+            "Changing the {obj} width updates the canvas",
+            "The {obj} setting follows the current unit of measure setting",
+            "Fields are available only when an {obj} is selected",
+            "Values outside the allowed range are rejected",
+        ],
+        'verb': ["edit", "change", "set"],
+        'obj': ["dimension", "line style", "fill", "layer"],
+    },
+    'help': {
+        'titles': ["Help {Obj}", "Offline {obj} viewer"],
+        'acs': [
+            "Help → {Obj} opens the built-in {obj} viewer",
+            "The {obj} is available offline",
+            "The viewer supports search and zoom",
+            "Closing the viewer returns focus to the canvas",
+        ],
+        'verb': ["open", "view"],
+        'obj': ["user manual", "quick start guide", "shortcut reference"],
+    },
+}
+
+FILLER = ("when the user works on a drawing with several layers and saved presets "
+          "so that the result matches the design specification").split()
+
+
+class _StubLLMProvider:
+    """LLM provider stand-in: every call returns nothing (deterministic fallbacks run)."""
+
+    def generate(self, *args, **kwargs):
+        return None
+
+
+def _fill(template: str, vocab: Dict[str, List[str]], rng: random.Random) -> str:
+    values = {}
+    for key in ('verb', 'obj', 'menu'):
+        if key in vocab:
+            word = rng.choice(vocab[key])
+            values[key] = word
+            values[key.capitalize()] = word.title()
+    values['amount'] = rng.choice([45, 90, 180])
+    return template.format(**values)
+
+
+def build_corpus(
+    stories: int = 20,
+    min_acs: int = 3,
+    max_acs: int = 12,
+    extra_words: int = 0,
+    feature_types: Optional[List[str]] = None,
+    seed: int = 7
+) -> List[Dict]:
+    """Generate a synthetic story corpus.
+
+    Args:
+        stories: Number of stories
+        min_acs: Minimum ACs per story
+        max_acs: Maximum ACs per story
+        extra_words: Filler words appended to each AC (AC length)
+        feature_types: Feature types to draw from (default: all)
+        seed: Random seed (same arguments -> same corpus)
+
+    Returns:
+        Stories as {story_id, title, description, criteria, qa_prep}
+    """
+    rng = random.Random(seed)
+    types = feature_types or sorted(FEATURE_TYPES)
+    corpus = []
+    for n in range(stories):
+        vocab = FEATURE_TYPES[types[n % len(types)]]
+        criteria = []
+        for _ in range(rng.randint(min_acs, max_acs)):
+            ac = _fill(rng.choice(vocab['acs']), vocab, rng)
+            if extra_words:
+                ac += ' ' + ' '.join(rng.choice(FILLER) for _ in range(extra_words))
+            criteria.append(ac)
+        title = _fill(rng.choice(vocab['titles']), vocab, rng)
+        corpus.append({
+            'story_id': 900000 + n,
+            'title': title,
+            'description': f"Users can {title.lower()}. " + ' '.join(criteria[:2]),
+            'criteria': criteria,
+            'qa_prep': '\n'.join(f"- Verify {ac}" for ac in criteria[:3]) if n % 2 else '',
+        })
+    return corpus
+
+
+@dataclass
+class StageResult:
+    """Measurements for one stage over the whole corpus."""
+    name: str
+    wall_seconds: float
+    stories_per_second: float
+    peak_kib: float
+    allocated_kib: float
+    runs: List[float] = field(default_factory=list)
+
+
+class RuleEngineBenchmark:
+    """Runs the deterministic stages over a corpus."""
+
+    def __init__(self, config: ProjectConfig, corpus: List[Dict]):
+        self.config = config
+        self.corpus = corpus
+        self._vector_dir = tempfile.TemporaryDirectory(prefix="bench_vectors_")
+        self.config.vector_db_backend = 'numpy'
+        self.config.vector_db_path = self._vector_dir.name
+        self._tests: Dict[int, List[Dict]] = {}
+
+    def stages(self) -> Dict[str, Callable[[Dict], None]]:
+        return {
+            'generate': self._generate,
+            'prompts': self._prompts,
+            'validate': self._validate,
+            'qa_summary': self._qa_summary,
+        }
+
+    def _generate(self, story: Dict) -> None:
+        generator = GenericTestGenerator(self.config)
+        self._tests[story['story_id']] = generator.generate_test_cases(
+            {'story_id': story['story_id'], 'title': story['title'], 'description': story['description']},
+            story['criteria'],
+            qa_prep_content=story['qa_prep'] or None
+        )
+
+    def _prompts(self, story: Dict) -> None:
+        builder = PromptBuilder.from_project_config(
+            self.config, str(story['story_id']), story['title'], story['criteria'],
+            qa_prep=story['qa_prep'], story_description=story['description']
+        )
+        builder.build_system_prompt()
+        builder.build_user_prompt(json.dumps({'test_cases': self._tests[story['story_id']]}, indent=2))
+
+    def _validate(self, story: Dict) -> None:
+        tests = self._tests[story['story_id']]
+        TestCaseValidator(prereq_pattern="Pre-req", close_pattern="Close").validate_test_cases(tests)
+        analyzer = get_quality_analyzer()
+        for tc in tests:
+            analyzer.analyze_test_case(tc)
+
+    def _qa_summary(self, story: Dict) -> None:
+        generator = QASummaryGenerator(provider_type="stub")
+        generator._provider = _StubLLMProvider()
+        generator.generate_summary({
+            'story_id': story['story_id'],
+            'title': story['title'],
+            'description_text': story['description'],
+            'acceptance_criteria_text': '\n'.join(story['criteria']),
+        }, self._tests[story['story_id']])
+
+    def _run_stage(self, stage: Callable[[Dict], None]) -> float:
+        start = time.perf_counter()
+        for story in self.corpus:
+            stage(story)
+        return time.perf_counter() - start
+
+    def run(self, repeat: int = 3, stages: Optional[List[str]] = None) -> List[StageResult]:
+        """Time each stage (median of repeat runs), then measure allocations once.
+
+        Allocations are traced in a separate pass so tracemalloc overhead
+        does not distort wall times.
+        """
+        selected = {name: fn for name, fn in self.stages().items() if not stages or name in stages}
+        results = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            # Later stages consume generated tests
+            if 'generate' not in selected:
+                self._run_stage(self._generate)
+
+            for name, stage in selected.items():
+                runs = [self._run_stage(stage) for _ in range(repeat)]
+                wall = statistics.median(runs)
+
+                tracemalloc.start()
+                before, _ = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+                self._run_stage(stage)
+                after, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+                results.append(StageResult(
+                    name=name,
+                    wall_seconds=wall,
+                    stories_per_second=len(self.corpus) / wall if wall else 0.0,
+                    peak_kib=(peak - before) / 1024,
+                    allocated_kib=(after - before) / 1024,
+                    runs=runs
+                ))
+        return results
+
+    def close(self) -> None:
+        self._vector_dir.cleanup()
+
+
+def compare(results: List[StageResult], baseline: Dict, tolerance: float) -> List[str]:
+    """Stages slower than baseline * (1 + tolerance)."""
+    regressions = []
+    stages = baseline.get('stages', {})
+    for result in results:
+        base = stages.get(result.name)
+        if base and result.wall_seconds > base['wall_seconds'] * (1 + tolerance):
+            regressions.append(
+                f"{result.name}: {result.wall_seconds * 1000:.1f} ms vs baseline "
+                f"{base['wall_seconds'] * 1000:.1f} ms (+{(result.wall_seconds / base['wall_seconds'] - 1):.0%})"
+            )
+    return regressions
+
+
+def print_report(results: List[StageResult], stories: int, baseline: Optional[Dict] = None) -> None:
+    print(f"\nRule-engine benchmark: {stories} stories")
+    print(f"{'stage':<12}{'wall ms':>10}{'ms/story':>10}{'stories/s':>11}{'peak KiB':>10}{'alloc KiB':>11}{'vs base':>9}")
+    base_stages = (baseline or {}).get('stages', {})
+    for r in results:
+        delta = ''
+        if r.name in base_stages and base_stages[r.name]['wall_seconds']:
+            delta = f"{r.wall_seconds / base_stages[r.name]['wall_seconds'] - 1:+.0%}"
+        print(
+            f"{r.name:<12}{r.wall_seconds * 1000:>10.1f}{r.wall_seconds * 1000 / stories:>10.2f}"
+            f"{r.stories_per_second:>11.1f}{r.peak_kib:>10.0f}{r.allocated_kib:>11.0f}{delta:>9}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the rule-engine stages")
+    parser.add_argument('--config', default=str(DEFAULT_CONFIG), help='Project config YAML')
+    parser.add_argument('--stories', type=int, default=20, help='Stories in the corpus')
+    parser.add_argument('--acs', default='3-12', help='AC count range per story (e.g. 3-12)')
+    parser.add_argument('--ac-words', type=int, default=0, help='Filler words added to each AC')
+    parser.add_argument('--feature-types', nargs='+', choices=sorted(FEATURE_TYPES),
+                        help='Feature types to include (default: all)')
+    parser.add_argument('--seed', type=int, default=7, help='Corpus random seed')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per stage (median reported)')
+    parser.add_argument('--stages', nargs='+', help='Stages to run (default: all)')
+    parser.add_argument('--baseline', default=str(DEFAULT_BASELINE), help='Baseline JSON path')
+    parser.add_argument('--save-baseline', action='store_true', help='Store results as the baseline')
+    parser.add_argument('--compare', action='store_true', help='Fail on regressions vs the baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed slowdown (0.25 = 25%%)')
+    parser.add_argument('--json', dest='json_out', help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    min_acs, _, max_acs = args.acs.partition('-')
+    corpus_args = {
+        'stories': args.stories,
+        'min_acs': int(min_acs),
+        'max_acs': int(max_acs or min_acs),
+        'extra_words': args.ac_words,
+        'feature_types': args.feature_types,
+        'seed': args.seed,
+    }
+    corpus = build_corpus(**corpus_args)
+
+    # Measure extraction itself, not the story context memo
+    previous_cache = os.environ.get("STORY_CONTEXT_CACHE")
+    os.environ.setdefault("STORY_CONTEXT_CACHE", "off")
+    reset_story_context_memo()
+    benchmark = RuleEngineBenchmark(ProjectConfig.load_from_yaml(args.config), corpus)
+    try:
+        results = benchmark.run(repeat=args.repeat, stages=args.stages)
+    finally:
+        benchmark.close()
+        if previous_cache is None:
+            os.environ.pop("STORY_CONTEXT_CACHE", None)
+        reset_story_context_memo()
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('corpus') != corpus_args:
+            print("Note: baseline was recorded with a different corpus; comparison skipped")
+            baseline = None
+
+    print_report(results, len(corpus), baseline)
+
+    report = {
+        'corpus': corpus_args,
+        'python': sys.version.split()[0],
+        'stages': {r.name: asdict(r) for r in results},
+    }
+    if args.json_out:
+        with open(args.json_out, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nBaseline saved: {args.baseline}")
+
+    if args.compare and baseline:
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo stage slower than baseline by more than {args.tolerance:.0%}")
+
+
+if __name__ == '__main__':
+    main()
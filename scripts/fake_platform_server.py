@@ -0,0 +1,579 @@
+#!/usr/bin/env python3
+"""
+In-process fake ADO / Jira / TestRail server for load tests.
+
+Serves the endpoints the platform clients use over real HTTP on
+127.0.0.1, so uploads and fetches go through the complete client stack
+(throttle, retries, circuit breaker, response cache) without touching a
+real tenant:
+
+    ADO       work items (GET/PATCH, workitemsbatch, $batch, comments),
+              WIQL, test plans and suites (continuation-token pages),
+              suite test cases
+    Jira      issue, issue comments, search (startAt/total pages), field
+    TestRail  get/add sections, get_cases (_links.next pages), add_case,
+              update_case, get_case, get_runs
+
+Faults are configurable: fixed and random latency, a fraction of requests
+answered with 503, and a request-rate limit answered with 429 and
+Retry-After.
+
+Usage:
+    with FakePlatformServer(FaultConfig(latency=0.02, rate_limit=200)) as server:
+        story_ids = server.seed_stories(20)
+        os.environ["ADO_SERVER_URL"] = server.url
+        ...
+
+    python scripts/fake_platform_server.py --stories 50 --latency 0.05
+"""
+import argparse
+import json
+import random
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+ORGANIZATION = "fake-org"
+PROJECT = "FakeProject"
+JIRA_PROJECT = "FAKE"
+JIRA_AC_FIELD = "customfield_10000"
+TESTRAIL_PROJECT = 1
+
+# Page sizes of the real services
+ADO_PAGE_SIZE = 100
+JIRA_MAX_RESULTS = 100
+TESTRAIL_PAGE_SIZE = 250
+
+_ADO_PREFIX = f"/{ORGANIZATION}/{PROJECT}/_apis/"
+_WIQL_CONDITION = re.compile(r"\[([\w.]+)\]\s*(=|Contains)\s*'([^']*)'", re.IGNORECASE)
+
+
+@dataclass
+class FaultConfig:
+    """Latency, error and rate-limit injection."""
+
+    latency: float = 0.0  # Seconds added to every response
+    jitter: float = 0.0  # Extra random latency, uniform in [0, jitter]
+    error_rate: float = 0.0  # Fraction of requests answered 503
+    rate_limit: float = 0.0  # Requests per second before 429s (0 = unlimited)
+    retry_after: int = 1  # Retry-After seconds sent with 429s
+    seed: int = 7
+
+
+class _HttpError(Exception):
+    def __init__(self, status: int, message: str = ""):
+        super().__init__(message)
+        self.status = status
+
+
+class FakePlatformState:
+    """Work items, suites, issues and TestRail cases behind the fake server."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._next_id = 1000
+        self.work_items: Dict[int, Dict[str, Any]] = {}
+        self.plans: Dict[int, Dict[str, Any]] = {}
+        self.suites: Dict[int, Dict[str, Any]] = {}
+        self.suite_cases: Dict[int, List[int]] = {}
+        self.sections: Dict[int, Dict[str, Any]] = {}
+        self.cases: Dict[int, Dict[str, Any]] = {}
+        self.add_plan(1, "Fake Plan")
+
+    def new_id(self) -> int:
+        with self._lock:
+            self._next_id += 1
+            return self._next_id
+
+    def add_plan(self, plan_id: int, name: str) -> None:
+        root = {'id': self.new_id(), 'name': name, 'plan_id': plan_id}
+        self.plans[plan_id] = {'id': plan_id, 'name': name, 'rootSuite': {'id': root['id']}}
+        self.suites[root['id']] = root
+        self.suite_cases[root['id']] = []
+
+    def add_work_item(self, work_item_type: str, fields: Dict[str, Any], parent: Optional[int] = None) -> Dict:
+        item_id = self.new_id()
+        item = {
+            'id': item_id,
+            'rev': 1,
+            'fields': dict(fields, **{'System.Id': item_id, 'System.WorkItemType': work_item_type}),
+            'relations': [],
+        }
+        self.work_items[item_id] = item
+        if parent is not None:
+            self.work_items[parent]['relations'].append({
+                'rel': 'System.LinkTypes.Hierarchy-Forward',
+                'url': f"http://fake/_apis/wit/workItems/{item_id}",
+            })
+        return item
+
+    def add_suite(self, plan_id: int, name: str) -> Dict[str, Any]:
+        suite = {'id': self.new_id(), 'name': name, 'plan_id': plan_id}
+        self.suites[suite['id']] = suite
+        self.suite_cases[suite['id']] = []
+        return suite
+
+    def add_case(self, section_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+        if section_id not in self.sections:
+            raise _HttpError(400, f"Field :section_id is not a valid section ({section_id})")
+        case = dict(data, id=self.new_id(), section_id=section_id,
+                    suite_id=self.sections[section_id].get('suite_id'))
+        self.cases[case['id']] = case
+        return case
+
+
+def _story_fields(title: str, criteria: List[str]) -> Dict[str, Any]:
+    return {
+        'System.Title': title,
+        'System.Description': f"<div>{title}: synthetic story for load tests.</div>",
+        'Microsoft.VSTS.Common.AcceptanceCriteria': '<ul>' + ''.join(f'<li>{ac}</li>' for ac in criteria) + '</ul>',
+        'System.State': 'Active',
+    }
+
+
+class FakePlatformServer:
+    """Threaded HTTP server around FakePlatformState.
+
+    Usage:
+        server = FakePlatformServer(FaultConfig(latency=0.01)).start()
+        ...  # point clients at server.url / server.jira_url / server.testrail_url
+        server.stop()
+    """
+
+    def __init__(self, faults: Optional[FaultConfig] = None, port: int = 0):
+        """Initialize server (not started).
+
+        Args:
+            faults: Latency, error and rate-limit injection
+            port: Port to listen on (0 = any free port)
+        """
+        self.faults = faults or FaultConfig()
+        self.state = FakePlatformState()
+        self._rng = random.Random(self.faults.seed)
+        self._rng_lock = threading.Lock()
+        self._tokens = self.faults.rate_limit
+        self._refilled_at = time.monotonic()
+        self._stats_lock = threading.Lock()
+        self.stats = {'requests': 0, 'throttled': 0, 'injected_errors': 0}
+        self._port = port
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Server URL (ADO server_url, Jira and TestRail base URL)."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'FakePlatformServer':
+        """Start serving in a background thread."""
+        server = self
+
+        class Handler(_Handler):
+            platform = server
+
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', self._port), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving."""
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> 'FakePlatformServer':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def seed_stories(self, count: int, acs_per_story: int = 5, qa_prep: bool = True) -> List[int]:
+        """Create stories on every platform.
+
+        Each story is an ADO User Story (with a QA Prep child task), a Jira
+        issue FAKE-{id}, and a TestRail section "{id} : {title}".
+
+        Returns:
+            Story IDs
+        """
+        story_ids = []
+        for n in range(count):
+            title = f"Story {n + 1}: rotate shape group {n + 1}"
+            criteria = [f"User can rotate shape group {n + 1} by {15 * (k + 1)} degrees" for k in range(acs_per_story)]
+            item = self.state.add_work_item('User Story', _story_fields(title, criteria))
+            story_id = item['id']
+            story_ids.append(story_id)
+            if qa_prep:
+                self.state.add_work_item('Task', {
+                    'System.Title': f"Story {story_id}: QA Prep",
+                    'System.Description': f"<p>Rotation limits for story {story_id}</p>",
+                }, parent=story_id)
+            self.state.sections[story_id] = {'id': story_id, 'name': f"{story_id} : {title}", 'suite_id': None}
+        return story_ids
+
+    # Fault injection
+
+    def _before_response(self) -> Optional[Tuple[int, Dict[str, str]]]:
+        with self._stats_lock:
+            self.stats['requests'] += 1
+        with self._rng_lock:
+            delay = self.faults.latency + (self._rng.uniform(0, self.faults.jitter) if self.faults.jitter else 0.0)
+            fail = self.faults.error_rate and self._rng.random() < self.faults.error_rate
+        if delay:
+            time.sleep(delay)
+        if self.faults.rate_limit and not self._take_token():
+            with self._stats_lock:
+                self.stats['throttled'] += 1
+            return 429, {'Retry-After': str(self.faults.retry_after)}
+        if fail:
+            with self._stats_lock:
+                self.stats['injected_errors'] += 1
+            return 503, {}
+        return None
+
+    def _take_token(self) -> bool:
+        with self._stats_lock:
+            now = time.monotonic()
+            rate = self.faults.rate_limit
+            self._tokens = min(rate, self._tokens + (now - self._refilled_at) * rate)
+            self._refilled_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Routes requests to the ADO, Jira and TestRail handlers."""
+
+    platform: FakePlatformServer
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self._dispatch('GET')
+
+    def do_POST(self) -> None:
+        self._dispatch('POST')
+
+    def do_PATCH(self) -> None:
+        self._dispatch('PATCH')
+
+    def do_PUT(self) -> None:
+        self._dispatch('PUT')
+
+    def _dispatch(self, method: str) -> None:
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length) if length else b''
+
+        fault = self.platform._before_response()
+        if fault:
+            status, headers = fault
+            return self._send(status, {'message': 'Injected fault'}, headers)
+
+        parts = urlsplit(self.path)
+        path = unquote(parts.path)
+        try:
+            body = json.loads(raw) if raw else None
+            if path == '/index.php' and parts.query.startswith('/api/v2/'):
+                status, payload, headers = _testrail(self.platform.state, method, parts.query[len('/api/v2/'):], body)
+            else:
+                query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+                if path.startswith('/rest/api/'):
+                    status, payload, headers = _jira(self.platform.state, method, path, query, body)
+                else:
+                    status, payload, headers = _ado(self.platform.state, method, path, query, body, self.headers)
+        except _HttpError as e:
+            status, payload, headers = e.status, {'message': str(e)}, {}
+        except (KeyError, ValueError, TypeError) as e:
+            status, payload, headers = 400, {'message': f"Bad request: {e}"}, {}
+        self._send(status, payload, headers)
+
+    def _send(self, status: int, payload: Any, headers: Dict[str, str]) -> None:
+        data = b'' if status == 304 else json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+Response = Tuple[int, Any, Dict[str, str]]
+
+
+# ADO
+
+def _work_item_view(item: Dict[str, Any], fields: Optional[str], expand: str) -> Dict[str, Any]:
+    view = {'id': item['id'], 'rev': item['rev']}
+    wanted = [f.strip() for f in fields.split(',')] if fields else None
+    view['fields'] = {k: v for k, v in item['fields'].items() if wanted is None or k in wanted}
+    if expand.lower() in ('relations', 'all'):
+        view['relations'] = list(item['relations'])
+    return view
+
+
+def _apply_patch(item: Dict[str, Any], operations: List[Dict[str, Any]]) -> None:
+    for op in operations:
+        if op.get('path', '').startswith('/fields/'):
+            item['fields'][op['path'][len('/fields/'):]] = op.get('value')
+    item['rev'] += 1
+
+
+def _ado(state: FakePlatformState, method: str, path: str, query: Dict, body: Any, headers) -> Response:
+    if path == f"/{ORGANIZATION}/_apis/wit/$batch" and method == 'POST':
+        results = []
+        for op in body:
+            if '$Test Case' not in unquote(op.get('uri', '')):
+                results.append({'code': 400, 'body': json.dumps({'message': 'Unsupported operation'})})
+                continue
+            item = state.add_work_item('Test Case', {})
+            _apply_patch(item, op.get('body', []))
+            results.append({'code': 200, 'body': json.dumps(_work_item_view(item, None, ''))})
+        return 200, {'count': len(results), 'value': results}, {}
+
+    if not path.startswith(_ADO_PREFIX):
+        raise _HttpError(404, f"Unknown ADO path {path}")
+    route = path[len(_ADO_PREFIX):]
+    segments = route.split('/')
+    lowered = [s.lower() for s in segments]
+
+    if lowered[:2] == ['wit', 'workitems']:
+        if len(segments) == 3 and segments[2] == '$Test Case' and method == 'PATCH':
+            item = state.add_work_item('Test Case', {})
+            _apply_patch(item, body)
+            return 200, _work_item_view(item, None, ''), {}
+        item = state.work_items.get(int(segments[2])) if len(segments) > 2 and segments[2].isdigit() else None
+        if item is None:
+            raise _HttpError(404, f"Work item {segments[2:3]} does not exist")
+        if len(segments) == 4 and lowered[3] == 'comments':
+            return 200, {'comments': [], 'count': 0}, {}
+        if method == 'PATCH':
+            _apply_patch(item, body)
+            return 200, _work_item_view(item, None, ''), {}
+        etag = f'"{item["rev"]}"'
+        if headers.get('If-None-Match') == etag:
+            return 304, None, {'ETag': etag}
+        return 200, _work_item_view(item, query.get('fields'), query.get('$expand', '')), {'ETag': etag}
+
+    if route.lower() == 'wit/workitemsbatch' and method == 'POST':
+        fields = ','.join(body.get('fields') or [])
+        value = [
+            _work_item_view(state.work_items[i], fields or None, '') if i in state.work_items else None
+            for i in body['ids']
+        ]
+        return 200, {'count': len(value), 'value': value}, {}
+
+    if route.lower() == 'wit/wiql' and method == 'POST':
+        conditions = _WIQL_CONDITION.findall(body.get('query', ''))
+        matches = [
+            {'id': item['id']} for item in state.work_items.values()
+            if all(
+                (str(item['fields'].get(field, '')) == value) if op == '='
+                else (value.lower() in str(item['fields'].get(field, '')).lower())
+                for field, op, value in conditions
+            )
+        ]
+        return 200, {'workItems': matches}, {}
+
+    if lowered[:2] == ['testplan', 'plans']:
+        return _testplan(state, method, segments[2:], lowered[2:], query, body)
+
+    raise _HttpError(404, f"Unknown ADO route {route}")
+
+
+def _page(items: List[Any], query: Dict) -> Response:
+    start = int(query.get('continuationToken') or 0)
+    page = items[start:start + ADO_PAGE_SIZE]
+    headers = {}
+    if start + ADO_PAGE_SIZE < len(items):
+        headers['x-ms-continuationtoken'] = str(start + ADO_PAGE_SIZE)
+    return 200, {'count': len(page), 'value': page}, headers
+
+
+def _testplan(state: FakePlatformState, method: str, segments, lowered, query: Dict, body: Any) -> Response:
+    if not segments:
+        return _page(list(state.plans.values()), query)
+
+    plan_id = int(segments[0])
+    if plan_id not in state.plans:
+        raise _HttpError(404, f"Test plan {plan_id} does not exist")
+    if len(segments) == 1:
+        return 200, state.plans[plan_id], {}
+
+    if lowered[1] == 'suites' and len(segments) == 2:
+        suites = [{'id': s['id'], 'name': s['name']} for s in state.suites.values() if s['plan_id'] == plan_id]
+        return _page(suites, query)
+
+    if lowered[1] == 'suites' and len(segments) == 3 and method == 'POST':
+        suite = state.add_suite(plan_id, body['name'])
+        return 200, {'id': suite['id'], 'name': suite['name']}, {}
+
+    if lowered[1] == 'suites' and len(segments) == 4 and lowered[3] == 'testcase':
+        suite_id = int(segments[2])
+        if suite_id not in state.suite_cases:
+            raise _HttpError(404, f"Test suite {suite_id} does not exist")
+        if method == 'POST':
+            ids = [entry['workItem']['id'] for entry in body]
+            unknown = [i for i in ids if i not in state.work_items]
+            if unknown:
+                raise _HttpError(400, f"Work items {unknown} do not exist")
+            state.suite_cases[suite_id].extend(ids)
+            value = [{'workItem': {'id': i}} for i in ids]
+        else:
+            value = [
+                {'workItem': {'id': i, 'name': state.work_items[i]['fields'].get('System.Title', '')}}
+                for i in state.suite_cases[suite_id]
+            ]
+        return 200, {'count': len(value), 'value': value}, {}
+
+    raise _HttpError(404, f"Unknown test plan route {'/'.join(segments)}")
+
+
+# Jira
+
+def _issue_view(state: FakePlatformState, item: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    all_fields = {
+        'summary': item['fields'].get('System.Title', ''),
+        'description': item['fields'].get('System.Description', ''),
+        JIRA_AC_FIELD: item['fields'].get('Microsoft.VSTS.Common.AcceptanceCriteria', ''),
+        'updated': f"2026-01-01T00:00:{item['rev']:02d}.000+0000",
+    }
+    selected = {k: v for k, v in all_fields.items() if not fields or k in fields}
+    return {
+        'key': f"{JIRA_PROJECT}-{item['id']}",
+        'fields': selected,
+        'renderedFields': {k: v for k, v in selected.items() if k != 'updated'},
+    }
+
+
+def _issue_item(state: FakePlatformState, key: str) -> Dict[str, Any]:
+    issue_id = key.rsplit('-', 1)[-1]
+    item = state.work_items.get(int(issue_id)) if issue_id.isdigit() else None
+    if item is None or item['fields'].get('System.WorkItemType') != 'User Story':
+        raise _HttpError(404, f"Issue {key} does not exist")
+    return item
+
+
+def _jira(state: FakePlatformState, method: str, path: str, query: Dict, body: Any) -> Response:
+    route = path.split('/', 4)[-1]  # "/rest/api/3/issue/FAKE-1" -> "issue/FAKE-1"
+    segments = route.split('/')
+
+    if route == 'field':
+        return 200, [
+            {'id': 'summary', 'name': 'Summary'},
+            {'id': JIRA_AC_FIELD, 'name': 'Acceptance Criteria'},
+        ], {}
+
+    if segments[0] == 'issue' and len(segments) == 3 and segments[2] == 'comment':
+        _issue_item(state, segments[1])
+        return 200, {'comments': [], 'total': 0}, {}
+
+    if segments[0] == 'issue' and len(segments) == 2:
+        fields = query['fields'].split(',') if query.get('fields') else None
+        return 200, _issue_view(state, _issue_item(state, segments[1]), fields), {}
+
+    if route == 'search' and method == 'POST':
+        jql = body.get('jql', '')
+        stories = [i for i in state.work_items.values() if i['fields'].get('System.WorkItemType') == 'User Story']
+        match = re.match(r'key in \((.*)\)', jql)
+        if match:
+            wanted = {key.strip() for key in match.group(1).split(',')}
+            stories = [i for i in stories if f"{JIRA_PROJECT}-{i['id']}" in wanted]
+        start = int(body.get('startAt', 0))
+        size = min(int(body.get('maxResults', 50)), JIRA_MAX_RESULTS)
+        issues = [_issue_view(state, item, body.get('fields')) for item in stories[start:start + size]]
+        return 200, {'startAt': start, 'maxResults': size, 'total': len(stories), 'issues': issues}, {}
+
+    raise _HttpError(404, f"Unknown Jira route {route}")
+
+
+# TestRail
+
+def _testrail_page(items: List[Dict], key: str, name: str, args: Dict[str, str]) -> Response:
+    offset = int(args.get('offset', 0))
+    limit = int(args.get('limit', TESTRAIL_PAGE_SIZE))
+    page = items[offset:offset + limit]
+    following = {k: v for k, v in args.items() if k not in ('offset', 'limit')}
+    base = f"/api/v2/{name}" + ''.join(f"&{k}={v}" for k, v in following.items())
+    next_link = f"{base}&limit={limit}&offset={offset + limit}" if offset + limit < len(items) else None
+    return 200, {
+        'offset': offset, 'limit': limit, 'size': len(page),
+        '_links': {'next': next_link, 'prev': None},
+        key: page,
+    }, {}
+
+
+def _testrail(state: FakePlatformState, method: str, query: str, body: Any) -> Response:
+    # "get_cases/1&suite_id=2&offset=250" -> ("get_cases", "1", {...})
+    name, _, raw_args = query.partition('&')
+    args = dict(part.split('=', 1) for part in raw_args.split('&') if '=' in part)
+    action, _, target = name.partition('/')
+
+    if action == 'get_sections':
+        sections = list(state.sections.values())
+        return _testrail_page(sections, 'sections', name, args)
+    if action == 'add_section' and method == 'POST':
+        section = {'id': state.new_id(), 'name': body['name'], 'suite_id': body.get('suite_id')}
+        state.sections[section['id']] = section
+        return 200, section, {}
+    if action == 'get_cases':
+        cases = [c for c in state.cases.values()
+                 if 'section_id' not in args or c['section_id'] == int(args['section_id'])]
+        return _testrail_page(cases, 'cases', name, args)
+    if action == 'add_case' and method == 'POST':
+        return 200, state.add_case(int(target), body), {}
+    if action in ('get_case', 'update_case'):
+        case = state.cases.get(int(target))
+        if case is None:
+            raise _HttpError(400, f"Field :case_id is not a valid test case ({target})")
+        if action == 'update_case':
+            case.update(body or {})
+        return 200, case, {}
+    if action == 'get_runs':
+        return _testrail_page([], 'runs', name, args)
+
+    raise _HttpError(400, f"Unknown method {action}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the fake ADO/Jira/TestRail server")
+    parser.add_argument('--port', type=int, default=8765, help='Port to listen on')
+    parser.add_argument('--stories', type=int, default=20, help='Stories to seed')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Extra random latency (seconds)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered 503')
+    parser.add_argument('--rate-limit', type=float, default=0.0, help='Requests/second before 429s')
+    args = parser.parse_args()
+
+    faults = FaultConfig(latency=args.latency, jitter=args.jitter,
+                         error_rate=args.error_rate, rate_limit=args.rate_limit)
+    server = FakePlatformServer(faults, port=args.port).start()
+    story_ids = server.seed_stories(args.stories)
+    print(f"Fake platform server at {server.url}")
+    print(f"  ADO:      ADO_SERVER_URL={server.url}  organization={ORGANIZATION}  project={PROJECT}")
+    print(f"  Jira:     base_url={server.url}  project={JIRA_PROJECT}")
+    print(f"  TestRail: base_url={server.url}  project_id={TESTRAIL_PROJECT}")
+    print(f"  Stories:  {story_ids[0]}..{story_ids[-1]}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -19,6 +19,7 @@ sys.path.insert(0, str(project_root))
 
 from scripts._shared import create_base_parser, load_project_config, create_ado_client
 from infrastructure.ado.http_client import ADOHttpClient
+from infrastructure.ado.suite_index import get_suite_index
 
 
 def get_stories_from_board(client: ADOHttpClient, team: str, columns: list[str], area_path: str) -> list[dict]:
@@ -117,19 +118,13 @@ def count_test_cases_from_suite(client: ADOHttpClient, story_id: int) -> int:
         Number of test cases in the suite
     """
     try:
-        plans = client.get("_apis/testplan/plans")
-
-        for plan in plans.get('value', []):
-            plan_id = plan['id']
-            suites = client.get(f"_apis/testplan/Plans/{plan_id}/suites")
-
-            for suite in suites.get('value', []):
-                if suite.get('name', '').startswith(f"{story_id} :"):
-                    # Found the suite, count test cases
-                    tc_result = client.get(
-                        f"_apis/testplan/Plans/{plan_id}/Suites/{suite['id']}/TestCase"
-                    )
-                    return len(tc_result.get('value', []))
+        suite = get_suite_index(client).find(story_id)
+        if suite:
+            # Found the suite, count test cases
+            tc_result = client.get(
+                f"_apis/testplan/Plans/{suite['plan_id']}/Suites/{suite['id']}/TestCase"
+            )
+            return len(tc_result.get('value', []))
     except Exception as e:
         print(f"  Warning: Could not check test suite for {story_id}: {e}")
 
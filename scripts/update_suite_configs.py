@@ -28,6 +28,7 @@ sys.path.insert(0, str(project_root))
 
 from scripts._shared import create_base_parser, load_project_config, create_ado_client
 from infrastructure.ado.http_client import ADOHttpClient
+from infrastructure.ado.suite_index import get_suite_index
 
 
 def get_all_configurations(client: ADOHttpClient) -> list[dict]:
@@ -36,34 +37,24 @@ def get_all_configurations(client: ADOHttpClient) -> list[dict]:
     return result.get('value', [])
 
 
-def find_suite_for_story(client: ADOHttpClient, story_id: int, plans_cache: list[dict]) -> dict | None:
+def find_suite_for_story(client: ADOHttpClient, story_id: int) -> dict | None:
     """Find the test suite matching a story ID.
 
     Args:
         client: ADO HTTP client
         story_id: Story work item ID
-        plans_cache: Cached list of test plans
 
     Returns:
         Dict with suite_id, plan_id, name or None if not found
     """
-    prefix = f"{story_id} :"
-
-    for plan in plans_cache:
-        plan_id = plan['id']
-        try:
-            suites = client.get(f"_apis/testplan/Plans/{plan_id}/suites")
-            for suite in suites.get('value', []):
-                if suite.get('name', '').startswith(prefix):
-                    return {
-                        'suite_id': suite['id'],
-                        'plan_id': plan_id,
-                        'name': suite['name']
-                    }
-        except Exception:
-            continue
-
-    return None
+    suite = get_suite_index(client).find(story_id)
+    if not suite:
+        return None
+    return {
+        'suite_id': suite['id'],
+        'plan_id': suite['plan_id'],
+        'name': suite['name']
+    }
 
 
 def get_suite_details(client: ADOHttpClient, plan_id: int, suite_id: int) -> dict:
@@ -239,11 +230,11 @@ def main():
     print(f"\n  KEEP:   {[c['name'] for c in keep_configs]}")
     print(f"  REMOVE: {[c['name'] for c in remove_configs]}")
 
-    # Step 2: Cache test plans (fetched once)
-    print("\nFetching test plans...")
-    plans = client.get("_apis/testplan/plans")
-    plans_list = plans.get('value', [])
-    print(f"  Found {len(plans_list)} test plans")
+    # Step 2: Index test suites by story (all plans scanned once)
+    print("\nIndexing test suites...")
+    suite_index = get_suite_index(client)
+    suite_index.refresh()
+    print(f"  Indexed {len(suite_index)} story suites")
 
     # Step 3: Process each story
     print(f"\n{'—' * 70}")
@@ -258,7 +249,7 @@ def main():
         print(f"  [{story_id}] ", end="")
 
         # Find the test suite
-        suite_info = find_suite_for_story(client, story_id, plans_list)
+        suite_info = find_suite_for_story(client, story_id)
         if not suite_info:
             print("No test suite found — SKIPPED")
             not_found += 1
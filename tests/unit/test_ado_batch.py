@@ -0,0 +1,175 @@
+"""
+Unit tests for bulk ADO test case creation and suite linking.
+"""
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from infrastructure.ado import http_client
+from infrastructure.ado.ado_repository import ADOTestCaseRepository, ADOTestSuiteRepository
+from infrastructure.ado.http_client import ADOHttpClient
+
+CONFIG = SimpleNamespace(
+    organization='org', project='Proj', pat='token', assigned_to=None, area_path='Proj\\QA'
+)
+
+
+def _tests(n):
+    return [
+        {'title': f'T{i}', 'steps': [{'action': 'Do', 'expected': 'Done'}], 'objective': 'Obj'}
+        for i in range(n)
+    ]
+
+
+class _Response:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+class TestHttpClientBatch:
+    """Test the $batch request and response parsing."""
+
+    def test_batch_posts_to_organization_endpoint(self, monkeypatch):
+        """Test operations are posted once and string bodies are parsed."""
+        calls = []
+
+        def fake_post(url, **kwargs):
+            calls.append((url, kwargs))
+            return _Response({'count': 2, 'value': [
+                {'code': 200, 'body': json.dumps({'id': 11})},
+                {'code': 400, 'body': json.dumps({'message': 'bad field'})},
+            ]})
+
+        monkeypatch.setattr(http_client.requests, 'post', fake_post)
+        client = ADOHttpClient('org', 'Proj', 'token')
+        results = client.batch([{'method': 'PATCH'}, {'method': 'PATCH'}])
+
+        assert len(calls) == 1
+        assert calls[0][0] == 'https://dev.azure.com/org/_apis/wit/$batch'
+        assert results == [{'code': 200, 'body': {'id': 11}}, {'code': 400, 'body': {'message': 'bad field'}}]
+
+    def test_batch_limit(self):
+        """Test more than BATCH_LIMIT operations are rejected."""
+        client = ADOHttpClient('org', 'Proj', 'token')
+        with pytest.raises(ValueError):
+            client.batch([{}] * (ADOHttpClient.BATCH_LIMIT + 1))
+
+
+class TestCreateTestCases:
+    """Test bulk creation through the repository."""
+
+    def test_chunks_and_partial_failures(self, monkeypatch):
+        """Test tests are sent in chunks of 200 and failures stay per item."""
+        repo = ADOTestCaseRepository(CONFIG)
+        chunks = []
+
+        def fake_batch(operations):
+            chunks.append(operations)
+            offset = sum(len(c) for c in chunks[:-1])
+            return [
+                {'code': 500, 'body': {'message': 'boom'}} if offset + i == 3
+                else {'code': 200, 'body': {'id': 1000 + offset + i}}
+                for i in range(len(operations))
+            ]
+
+        monkeypatch.setattr(repo._client, 'batch', fake_batch)
+        results = repo.create_test_cases(_tests(250))
+
+        assert [len(c) for c in chunks] == [200, 50]
+        assert results[3] == {'id': None, 'error': 'boom'}
+        assert results[249] == {'id': 1249, 'error': None}
+        operation = chunks[0][0]
+        assert operation['uri'] == '/Proj/_apis/wit/workitems/$Test Case?api-version=7.1'
+        assert operation['body'] == repo._build_patch_doc('T0', _tests(1)[0]['steps'], 'Obj')
+
+    def test_failed_chunk_fails_its_items(self, monkeypatch):
+        """Test a failed batch request marks only that chunk's tests failed."""
+        repo = ADOTestCaseRepository(CONFIG)
+        calls = []
+
+        def fake_batch(operations):
+            calls.append(1)
+            if len(calls) == 1:
+                raise ConnectionError('reset')
+            return [{'code': 200, 'body': {'id': i}} for i in range(1, len(operations) + 1)]
+
+        monkeypatch.setattr(repo._client, 'batch', fake_batch)
+        results = repo.create_test_cases(_tests(201))
+
+        assert all(r == {'id': None, 'error': 'reset'} for r in results[:200])
+        assert results[200] == {'id': 1, 'error': None}
+
+
+class TestAddTestCasesToSuite:
+    """Test bulk suite linking."""
+
+    def test_single_request(self, monkeypatch):
+        """Test all IDs are added with one POST."""
+        repo = ADOTestSuiteRepository(CONFIG)
+        posts = []
+
+        def fake_post(endpoint, data, params=None):
+            posts.append(data)
+            return {'value': [{'workItem': {'id': d['workItem']['id']}} for d in data]}
+
+        monkeypatch.setattr(repo._client, 'post', fake_post)
+
+        assert repo.add_test_cases_to_suite(1, 2, [10, 11, 12]) == [10, 11, 12]
+        assert len(posts) == 1
+
+    def test_retries_missing_individually(self, monkeypatch):
+        """Test IDs missing from the bulk response are retried one at a time."""
+        repo = ADOTestSuiteRepository(CONFIG)
+        posts = []
+
+        def fake_post(endpoint, data, params=None):
+            posts.append([d['workItem']['id'] for d in data])
+            if len(data) > 1:
+                return {'value': [{'workItem': {'id': 10}}]}
+            if data[0]['workItem']['id'] == 12:
+                raise RuntimeError('denied')
+            return {'value': [{'workItem': {'id': data[0]['workItem']['id']}}]}
+
+        monkeypatch.setattr(repo._client, 'post', fake_post)
+
+        assert repo.add_test_cases_to_suite(1, 2, [10, 11, 12]) == [10, 11]
+        assert posts == [[10, 11, 12], [11], [12]]
+
+
+class TestUploadReporting:
+    """Test the upload workflow reports bulk results per test case."""
+
+    def test_created_and_failed(self):
+        """Test create and suite-link failures land in 'failed' with their errors."""
+        from workflows import UploadWorkflow
+
+        class CaseRepo:
+            def create_test_cases(self, test_cases, **kwargs):
+                return [{'id': 100, 'error': None}, {'id': None, 'error': 'HTTP 400'}, {'id': 102, 'error': None}]
+
+        class SuiteRepo:
+            def add_test_cases_to_suite(self, plan_id, suite_id, ids):
+                assert ids == [100, 102]
+                return [100]
+
+        test_cases = [dict(tc, id=f'1-00{i}') for i, tc in enumerate(_tests(3))]
+        results = UploadWorkflow()._upload_test_cases(
+            None, CaseRepo(), SuiteRepo(), {'id': 2, 'plan_id': 1}, test_cases, 'TestRail'
+        )
+
+        assert results['created'] == [{'id': 100, 'tc_id': '1-000'}]
+        assert results['failed'] == [
+            {'tc_id': '1-001', 'error': 'HTTP 400'},
+            {'tc_id': '1-002', 'error': 'Failed to add to suite'},
+        ]
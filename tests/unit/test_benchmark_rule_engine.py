@@ -0,0 +1,56 @@
+"""
+Unit tests for the rule-engine benchmark harness.
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from projects.project_config import ProjectConfig
+from core.services.story_context_cache import reset_story_context_memo
+from scripts.benchmark_rule_engine import (
+    DEFAULT_CONFIG,
+    RuleEngineBenchmark,
+    StageResult,
+    build_corpus,
+    compare,
+)
+
+
+class TestCorpus:
+    """Test synthetic corpus generation."""
+
+    def test_corpus_is_seeded(self):
+        """Test the same arguments give the same corpus."""
+        assert build_corpus(stories=5, seed=3) == build_corpus(stories=5, seed=3)
+        assert build_corpus(stories=5, seed=3) != build_corpus(stories=5, seed=4)
+
+    def test_corpus_shape(self):
+        """Test AC counts, AC length and feature types are honoured."""
+        corpus = build_corpus(stories=4, min_acs=2, max_acs=3, extra_words=5, feature_types=['help'])
+        assert all(2 <= len(story['criteria']) <= 3 for story in corpus)
+        assert all(len(ac.split()) >= 6 for story in corpus for ac in story['criteria'])
+
+
+class TestBenchmark:
+    """Test stage measurements and baseline comparison."""
+
+    def test_run_reports_every_stage(self, monkeypatch):
+        """Test a small run measures all stages."""
+        monkeypatch.setenv("STORY_CONTEXT_CACHE", "off")
+        reset_story_context_memo()
+        benchmark = RuleEngineBenchmark(ProjectConfig.load_from_yaml(str(DEFAULT_CONFIG)), build_corpus(stories=2))
+        try:
+            results = benchmark.run(repeat=1)
+        finally:
+            benchmark.close()
+            reset_story_context_memo()
+        assert [r.name for r in results] == ['generate', 'prompts', 'validate', 'qa_summary']
+        assert all(r.wall_seconds > 0 and r.stories_per_second > 0 for r in results)
+
+    def test_compare_flags_regressions(self):
+        """Test only stages beyond the tolerance are reported."""
+        baseline = {'stages': {'generate': {'wall_seconds': 1.0}, 'prompts': {'wall_seconds': 1.0}}}
+        results = [StageResult('generate', 1.5, 1.0, 0, 0), StageResult('prompts', 1.1, 1.0, 0, 0)]
+        regressions = compare(results, baseline, tolerance=0.25)
+        assert len(regressions) == 1 and regressions[0].startswith('generate')
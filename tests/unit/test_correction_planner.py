@@ -0,0 +1,127 @@
+"""
+Unit tests for the adaptive LLM correction planner.
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from projects.project_config import ProjectConfig
+from core.services.llm.correction_planner import CorrectionPlanner, estimate_tokens
+from core.services.llm.corrector import LLMCorrector
+
+CONFIG_PATH = Path(__file__).parent.parent.parent / "projects" / "configs" / "env-quickdraw.yaml"
+
+CRITERIA = ['Rotate the selected object 90 degrees clockwise']
+
+
+def _test(test_id, expected="The object is rotated 90 degrees clockwise."):
+    return {
+        'id': test_id,
+        'title': f"{test_id}: Rotate / Tools Menu / Rotate Object Clockwise",
+        'objective': 'Verify that the selected object rotates 90 degrees clockwise.',
+        'steps': [
+            {'action': 'Pre-req: The ENV QuickDraw is installed', 'expected': ''},
+            {'action': 'Launch the ENV QuickDraw application.', 'expected': 'The application opens.'},
+            {'action': 'Select the object and click Tools > Rotate 90 degrees clockwise.', 'expected': expected},
+            {'action': 'Close the ENV QuickDraw application.', 'expected': ''},
+        ]
+    }
+
+
+def _suite():
+    """Two passing tests (the minimum for CRITERIA)."""
+    return [_test('1001-AC1'), _test('1001-005', expected='The object is rotated and stays selected.')]
+
+
+def _planner(threshold=0.0):
+    config = ProjectConfig.load_from_yaml(str(CONFIG_PATH))
+    return CorrectionPlanner(config, LLMCorrector(), quality_threshold=threshold)
+
+
+class TestCorrectionPlanner:
+    """Test splitting tests by quality gates."""
+
+    def test_all_passing_skips_llm(self):
+        """Test a clean, covering suite needs no LLM call."""
+        tests = _suite()
+        plan = _planner().plan(tests, CRITERIA)
+        assert plan.skip_llm
+        assert plan.passing == tests
+        assert plan.tokens_saved == estimate_tokens(tests) > 0
+
+    def test_minimum_count_prevents_skip(self):
+        """Test a passing suite with fewer tests than the minimum still needs the LLM."""
+        plan = _planner().plan([_test('1001-AC1')], CRITERIA)
+        assert not plan.failing and not plan.uncovered_acs
+        assert plan.minimum_tests == 2
+        assert not plan.skip_llm
+
+    def test_validation_errors_fail(self):
+        """Test a test with validator errors is sent to the LLM."""
+        broken = _test('1001-005')
+        broken['steps'] = broken['steps'][:-1]  # no close step
+        tests = [_test('1001-AC1'), broken]
+        plan = _planner().plan(tests, CRITERIA)
+        assert [tc['id'] for tc in plan.failing] == ['1001-005']
+        assert plan.assessments[1].errors
+        assert not plan.skip_llm
+
+    def test_quality_threshold(self):
+        """Test tests below the quality threshold fail."""
+        plan = _planner(threshold=1.01).plan([_test('1001-AC1')], CRITERIA)
+        assert len(plan.failing) == 1
+        assert plan.tokens_saved == 0
+
+    def test_grounding_gate(self):
+        """Test a title area missing from the story evidence fails grounding."""
+        grounded = {'story_id': 1001, 'title': 'Rotate', 'description': 'Location: Tools Menu → Rotate'}
+        ungrounded = dict(grounded, description='Rotate things')
+
+        assert _planner().plan(_suite(), CRITERIA, story_data=grounded, qa_prep='').skip_llm
+        plan = _planner().plan([_test('1001-AC1')], CRITERIA, story_data=ungrounded, qa_prep='')
+        assert "Title area 'Tools Menu' is not grounded" in plan.assessments[0].errors[0]
+
+    def test_uncovered_ac_prevents_skip(self):
+        """Test an AC no test covers still needs the gap-filling call."""
+        plan = _planner().plan([_test('1001-AC1')], CRITERIA + ['Export the drawing to PDF format'])
+        assert not plan.failing
+        assert plan.uncovered_acs == [2]
+        assert not plan.skip_llm
+
+
+class TestPassingTestMerge:
+    """Test passing tests are merged back into the corrected suite."""
+
+    def test_merge_keeps_original_order(self):
+        """Test merged tests are ordered by their original IDs."""
+        corrector = LLMCorrector()
+        merged = corrector._merge_passing_tests(
+            [_test('1001-AC1'), _test('1001-010')], [_test('1001-005'), _test('1001-015')]
+        )
+        assert [tc['id'] for tc in merged] == ['1001-AC1', '1001-005', '1001-010', '1001-015']
+        assert corrector._merge_passing_tests([], [_test('1001-005')])[0]['id'] == '1001-005'
+
+
+class TestSkippedCorrection:
+    """Test output when the LLM call is skipped."""
+
+    def test_post_process_without_llm(self):
+        """Test titles, step numbers and accessibility tests are still applied."""
+        config = ProjectConfig.load_from_yaml(str(CONFIG_PATH))
+        tests = [_test('1001-AC1')]
+        tests[0]['title'] = '1001-AC1: Rotate / Tools Menu / rotate object clockwise'
+
+        result = LLMCorrector(project_config=config).post_process(tests, '1001', 'Rotate', CRITERIA)
+        assert result[0]['title'].endswith('Rotate Object Clockwise')
+        assert [step['step'] for step in result[0]['steps']] == [1, 2, 3, 4]
+        assert len(result) > 1
+
+    def test_post_process_removes_duplicates(self):
+        """Test duplicate tests are dropped and the rest renumbered."""
+        config = ProjectConfig.load_from_yaml(str(CONFIG_PATH))
+        tests = [_test('1001-AC1'), _test('1001-005'), _test('1001-010')]
+
+        result = LLMCorrector(project_config=config).post_process(tests, '1001', 'Rotate', CRITERIA)
+        assert sum('Rotate Object Clockwise' in tc['title'] for tc in result) == 1
+        assert [tc['id'] for tc in result] == ['1001-AC1', '1001-005']
@@ -0,0 +1,94 @@
+"""
+Unit tests for the AC coverage index used by LLMCorrector.
+"""
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.services.coverage_index import CoverageIndex, searchable_text
+from core.services.embeddings.providers.hashing_embeddings import HashingEmbeddingProvider
+from core.services.llm.corrector import LLMCorrector
+
+TEST_CASES = [
+    {'id': 'TC-1', 'title': 'Rotate object', 'objective': 'Rotate the selected object 90 degrees.',
+     'steps': [{'action': 'Select Tools > Rotate', 'expected': 'The object rotates.'}]},
+    {'id': 'TC-2', 'title': 'Mirror object', 'objective': 'Mirror flips the object horizontally.',
+     'steps': [{'action': 'Select Tools > Mirror', 'expected': 'The object is mirrored.'}]},
+    {'id': 'TC-3', 'title': 'Rotate_all shortcut', 'objective': 'Keyboard shortcut.', 'steps': []},
+]
+CRITERIA = [
+    'User can rotate the selected object 90 degrees',
+    'Mirror horizontally flips the object',
+    'Export to PDF keeps layers',
+]
+
+
+class TestCoverageIndex:
+    """Test the inverted index and scoring modes."""
+
+    def test_keyword_hits_are_whole_words(self):
+        """Test hits match \\bkeyword\\b semantics (rotate_all is not rotate)."""
+        docs = [searchable_text(tc) for tc in TEST_CASES]
+        index = CoverageIndex(docs)
+        hits = index.keyword_hits({'rotate', 'object'})
+        for doc_idx, doc in enumerate(docs):
+            expected = sum(1 for kw in ('rotate', 'object') if re.search(rf'\b{kw}\b', doc))
+            assert hits.get(doc_idx, 0) == expected
+
+    def test_tfidf_scores_are_calibrated(self):
+        """Test TF-IDF cosine scores lie in [0, 1] and rank the right test first."""
+        index = CoverageIndex([searchable_text(tc) for tc in TEST_CASES])
+        scores = index.tfidf_scores([{'mirror', 'flips', 'horizontally'}, {'export', 'pdf'}])
+        assert scores.shape == (2, 3)
+        assert ((scores >= 0) & (scores <= 1 + 1e-6)).all()
+        assert scores[0].argmax() == 1
+        assert scores[1].max() == 0.0
+
+    def test_embedding_scores(self):
+        """Test embedding mode scores a test against its own text highest."""
+        docs = [searchable_text(tc) for tc in TEST_CASES]
+        scores = CoverageIndex(docs).embedding_scores([docs[2]], HashingEmbeddingProvider())
+        assert scores[0].argmax() == 2
+
+    def test_embedding_scores_blank_query(self):
+        """Test a blank AC in the middle scores zero and leaves later rows aligned."""
+        docs = [searchable_text(tc) for tc in TEST_CASES]
+        scores = CoverageIndex(docs).embedding_scores([docs[0], '', docs[2]], HashingEmbeddingProvider())
+        assert scores[1].max() == 0.0
+        assert [scores[0].argmax(), scores[2].argmax()] == [0, 2]
+
+    def test_empty_index(self):
+        """Test scoring with no test cases."""
+        assert CoverageIndex([]).tfidf_scores([{'rotate'}]).shape == (1, 0)
+
+
+class TestCorrectorCoverageMap:
+    """Test LLMCorrector.map_acs_to_tests in each scoring mode."""
+
+    def test_keyword_mode(self):
+        """Test the default mode maps ACs to tests mentioning their keywords."""
+        coverage = LLMCorrector().map_acs_to_tests(TEST_CASES, CRITERIA)
+        assert coverage == {1: ['TC-1'], 2: ['TC-2'], 3: []}
+
+    def test_tfidf_mode(self):
+        """Test TF-IDF mode leaves the unrelated AC uncovered."""
+        coverage = LLMCorrector(coverage_scoring='tfidf').map_acs_to_tests(TEST_CASES, CRITERIA)
+        assert 'TC-1' in coverage[1] and 'TC-2' in coverage[2]
+        assert coverage[3] == []
+
+    def test_embedding_mode_without_provider(self, monkeypatch):
+        """Test embedding mode falls back to keyword scoring and thresholds."""
+        monkeypatch.setenv("EMBEDDING_PROVIDER", "openai")
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        corrector = LLMCorrector(coverage_scoring='embedding')
+        assert corrector._coverage_scoring == 'keyword'
+        assert corrector.map_acs_to_tests(TEST_CASES, CRITERIA) == LLMCorrector().map_acs_to_tests(TEST_CASES, CRITERIA)
+
+    def test_unknown_mode(self):
+        """Test an unknown scoring mode is rejected."""
+        with pytest.raises(ValueError):
+            LLMCorrector(coverage_scoring='bogus')
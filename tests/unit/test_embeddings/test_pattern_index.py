@@ -0,0 +1,187 @@
+"""Tests for EmbeddingPatternIndex loading and snapshotting."""
+import json
+
+import pytest
+
+from core.services.embeddings.embedding_cache import EmbeddingCache
+from core.services.embeddings.pattern_index import (
+    EmbeddingPatternIndex,
+    normalize_pattern_text,
+    stem_pattern_text,
+)
+from core.services.embeddings.providers.hashing_embeddings import HashingEmbeddingProvider
+
+
+class CountingProvider(HashingEmbeddingProvider):
+    """Hashing provider that records which texts were embedded."""
+
+    def __init__(self):
+        super().__init__(dimensions=64)
+        self.embedded = []
+
+    def embed_batch(self, texts):
+        self.embedded.extend(texts)
+        return super().embed_batch(texts)
+
+
+def _write_patterns(path, synonyms):
+    path.write_text(json.dumps({"patterns": [
+        {"id": "action_rotate", "canonical": "rotate", "category": "action", "synonyms": synonyms},
+        {"id": "outcome_visible", "canonical": "is displayed", "category": "outcome", "synonyms": []},
+    ]}))
+
+
+class TestPatternIndexSnapshot:
+    """Snapshot and incremental re-embedding behaviour."""
+
+    @pytest.fixture
+    def env(self, tmp_path):
+        patterns_file = tmp_path / "patterns.json"
+        _write_patterns(patterns_file, ["spin", "turn"])
+        return {
+            "patterns_file": str(patterns_file),
+            "snapshot_dir": str(tmp_path / "snapshot"),
+            "cache_dir": str(tmp_path / "cache"),
+        }
+
+    def _index(self, env, provider):
+        return EmbeddingPatternIndex(
+            provider,
+            EmbeddingCache(cache_dir=env["cache_dir"]),
+            env["patterns_file"],
+            snapshot_dir=env["snapshot_dir"],
+        )
+
+    def test_first_load_embeds_everything(self, env):
+        provider = CountingProvider()
+        index = self._index(env, provider)
+        index.load_patterns()
+
+        assert index.load_source == "full"
+        assert index.pattern_count == 2
+        assert sorted(provider.embedded) == ["is displayed", "rotate", "spin", "turn"]
+
+    def test_unchanged_file_loads_snapshot(self, env):
+        self._index(env, CountingProvider()).load_patterns()
+
+        provider = CountingProvider()
+        index = self._index(env, provider)
+        index.load_patterns()
+
+        assert index.load_source == "snapshot"
+        assert provider.embedded == []
+        assert index.get_pattern_by_id("action_rotate").synonyms == ["spin", "turn"]
+
+    def test_changed_file_embeds_only_new_texts(self, env, tmp_path):
+        self._index(env, CountingProvider()).load_patterns()
+        _write_patterns(tmp_path / "patterns.json", ["spin", "turn", "apply rotation"])
+        # Empty embedding cache so only the snapshot can supply old vectors
+        env["cache_dir"] = str(tmp_path / "cache2")
+
+        provider = CountingProvider()
+        index = self._index(env, provider)
+        index.load_patterns()
+
+        assert index.load_source == "incremental"
+        assert provider.embedded == ["apply rotation"]
+        assert len(index.get_pattern_by_id("action_rotate").synonym_embeddings) == 3
+
+    def test_accessors_load_lazily(self, env):
+        index = self._index(env, CountingProvider())
+        assert not index.is_loaded
+
+        assert [p.pattern_id for p in index.get_patterns_by_category("action")] == ["action_rotate"]
+        assert index.is_loaded
+
+
+class TestPatternTextLookup:
+    """Hash-index exact and near-exact lookups."""
+
+    @pytest.fixture
+    def index(self, tmp_path):
+        patterns_file = tmp_path / "patterns.json"
+        _write_patterns(patterns_file, ["spin", "apply rotation"])
+        index = EmbeddingPatternIndex(
+            CountingProvider(),
+            EmbeddingCache(cache_dir=str(tmp_path / "cache")),
+            str(patterns_file),
+            snapshot_dir=None,
+        )
+        index.load_patterns()
+        return index
+
+    def test_normalization(self):
+        assert normalize_pattern_text("  Apply   Rotation! ") == "apply rotation"
+        assert stem_pattern_text("Applying the rotations") == "apply rotation"
+
+    def test_exact_hit_on_synonym(self, index):
+        entry, match_type = index.lookup_text("Apply Rotation.")
+        assert entry.pattern_id == "action_rotate"
+        assert match_type == "exact"
+
+    def test_stem_hit(self, index):
+        entry, match_type = index.lookup_text("applying the rotation")
+        assert entry.pattern_id == "action_rotate"
+        assert match_type == "stem"
+
+    def test_search_by_text_is_exact_only(self, index):
+        assert index.search_by_text("IS DISPLAYED").pattern_id == "outcome_visible"
+        assert index.search_by_text("applying the rotation") is None
+
+    def test_miss(self, index):
+        assert index.lookup_text("export the drawing") is None
+
+
+class TestEmbeddingParserExactPath:
+    """Exact pattern hits should skip embedding the input text."""
+
+    def test_exact_hit_skips_embedding(self, tmp_path, monkeypatch):
+        from core.services.nlp.embedding_parser import EmbeddingSemanticParser
+
+        monkeypatch.setenv("EMBEDDING_ENABLED", "true")
+        patterns_file = tmp_path / "patterns.json"
+        _write_patterns(patterns_file, ["spin"])
+        provider = CountingProvider()
+        cache = EmbeddingCache(cache_dir=str(tmp_path / "cache"))
+        index = EmbeddingPatternIndex(provider, cache, str(patterns_file), snapshot_dir=None)
+        parser = EmbeddingSemanticParser(provider=provider, cache=cache, pattern_index=index)
+        index.load_patterns()
+
+        calls = []
+        monkeypatch.setattr(provider, "embed", lambda text: calls.append(text))
+        result = parser.parse("Spin")
+
+        assert result.method == "embedding_exact"
+        assert result.direct_object == "rotate"
+        assert result.confidence == pytest.approx(1.0)
+        assert calls == []
+
+
+class TestHybridParserMetrics:
+    """Exact hits are counted separately but reported as the embedding layer."""
+
+    def test_exact_hit_counts_and_last_method(self, tmp_path, monkeypatch):
+        from core.services.metrics.metrics_collector import MetricsCollector
+        from core.services.nlp import hybrid_parser
+        from core.services.nlp.embedding_parser import EmbeddingSemanticParser
+
+        monkeypatch.setenv("EMBEDDING_ENABLED", "true")
+        collector = MetricsCollector(enable_logging=False)
+        monkeypatch.setattr(hybrid_parser, "get_metrics_collector", lambda: collector)
+        patterns_file = tmp_path / "patterns.json"
+        _write_patterns(patterns_file, ["spin"])
+        provider = CountingProvider()
+        cache = EmbeddingCache(cache_dir=str(tmp_path / "cache"))
+        index = EmbeddingPatternIndex(provider, cache, str(patterns_file), snapshot_dir=None)
+        index.load_patterns()
+        parser = hybrid_parser.HybridACParser(embedding_enabled=False)
+        parser._embedding_parser = EmbeddingSemanticParser(provider=provider, cache=cache, pattern_index=index)
+
+        for _ in range(3):
+            parser.parse("Spin")
+
+        assert parser.last_method == "embedding"
+        metrics = collector._aggregate_parsing_metrics()
+        assert metrics["embedding_exact"]["count"] == 3
+        assert metrics["embedding_exact"]["success_rate"] == 1.0
+        assert list(collector._parsing_stats) == ["embedding_exact"]
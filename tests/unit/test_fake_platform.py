@@ -0,0 +1,124 @@
+"""
+Unit tests for the fake ADO/Jira/TestRail server and the platform benchmark.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+import requests
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from infrastructure import http_resilience
+from infrastructure.ado.ado_repository import ADOStoryRepository
+from infrastructure.testrail import http_client as testrail_http
+from scripts.benchmark_platform import PHASES, PlatformBenchmark, PhaseResult, _reset_process_state
+from scripts.fake_platform_server import (
+    ORGANIZATION,
+    PROJECT,
+    TESTRAIL_PROJECT,
+    FakePlatformServer,
+    FaultConfig
+)
+
+
+@pytest.fixture
+def platform(monkeypatch):
+    """Yield a started fake server with fresh process-wide HTTP state."""
+    monkeypatch.setenv("HTTP_CACHE", "off")
+    monkeypatch.setattr(http_resilience, 'backoff_seconds', lambda attempt: 0.0)
+    servers = []
+
+    def start(**faults):
+        server = FakePlatformServer(FaultConfig(**dict({'retry_after': 0}, **faults))).start()
+        servers.append(server)
+        monkeypatch.setenv("ADO_SERVER_URL", server.url)
+        _reset_process_state()
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
+    _reset_process_state()
+
+
+def _ado_repo():
+    config = type('Config', (), {'organization': ORGANIZATION, 'project': PROJECT, 'pat': 'pat',
+                                 'qa_prep_pattern': 'Story {story_id}: QA Prep'})()
+    return ADOStoryRepository(config)
+
+
+class TestFakeServer:
+    """Test the fake platform over real HTTP."""
+
+    def test_ado_story_and_qa_prep(self, platform):
+        """Test seeded stories come back through the ADO repository."""
+        server = platform()
+        story_id = server.seed_stories(1, acs_per_story=3)[0]
+        repo = _ado_repo()
+
+        story = repo.get_story(story_id)
+        assert story.story_id == story_id
+        assert len(story.acceptance_criteria) == 3
+        assert repo.get_qa_prep(story_id)
+
+    def test_work_item_etag(self, platform):
+        """Test a GET with the returned ETag is answered 304."""
+        server = platform()
+        story_id = server.seed_stories(1)[0]
+        url = f"{server.url}/{ORGANIZATION}/{PROJECT}/_apis/wit/workitems/{story_id}"
+
+        first = requests.get(url)
+        second = requests.get(url, headers={'If-None-Match': first.headers['ETag']})
+        assert first.status_code == 200 and second.status_code == 304
+
+    def test_rate_limit_is_retried(self, platform):
+        """Test 429s are counted by the server and retried by the client."""
+        server = platform(rate_limit=2, retry_after=1)
+        story_ids = server.seed_stories(6, qa_prep=False)
+        repo = _ado_repo()
+
+        assert all(repo.get_story(story_id) for story_id in story_ids)
+        assert server.stats['throttled'] > 0
+
+    def test_injected_errors_are_retried(self, platform):
+        """Test idempotent reads survive injected 503s."""
+        server = platform(error_rate=0.3)
+        story_ids = server.seed_stories(5, qa_prep=False)
+        repo = _ado_repo()
+
+        assert all(repo.get_story(story_id) for story_id in story_ids)
+        assert server.stats['injected_errors'] > 0
+
+    def test_testrail_cases_paginate(self, platform):
+        """Test get_cases follows _links.next across pages."""
+        server = platform()
+        section_id = server.seed_stories(1, qa_prep=False)[0]
+        for n in range(300):
+            server.state.add_case(section_id, {'title': f"Case {n}"})
+        client = testrail_http.TestRailHttpClient(server.url, 'a@b.c', 'key')
+
+        assert len(client.get_cases(TESTRAIL_PROJECT)) == 300
+        assert server.stats['requests'] == 2
+
+
+class TestPlatformBenchmark:
+    """Test the benchmark phases against the fake server."""
+
+    def test_all_phases_succeed(self, platform):
+        """Test a small run measures every phase without failures."""
+        server = platform()
+        benchmark = PlatformBenchmark(server, server.seed_stories(2, acs_per_story=2),
+                                      tests_per_story=2, steps_per_test=2)
+
+        results = benchmark.run()
+        assert [r.name for r in results] == PHASES
+        assert all(isinstance(r, PhaseResult) and r.failures == 0 for r in results)
+        assert all(r.items > 0 and r.calls > 0 for r in results)
+
+    def test_selected_phases(self, platform):
+        """Test run() limits itself to the requested phases."""
+        server = platform()
+        benchmark = PlatformBenchmark(server, server.seed_stories(1))
+
+        assert [r.name for r in benchmark.run(['jira_get_story'])] == ['jira_get_story']
@@ -0,0 +1,175 @@
+"""
+Unit tests for incremental regeneration via the generation manifest.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from projects.project_config import ProjectConfig
+from core.services.generation_manifest import (
+    GenerationManifest,
+    ac_hash,
+    attribution_by_id,
+    attribution_by_title,
+    context_hash,
+    generation_fingerprint,
+    merge_tests
+)
+from core.services.llm.corrector import LLMCorrector
+from core.services.test_generator import GenericTestGenerator
+
+CONFIG_PATH = Path(__file__).parent.parent.parent / "projects" / "configs" / "env-quickdraw.yaml"
+
+STORY = {
+    'story_id': 1001,
+    'title': 'Rotate and Mirror objects',
+    'description': 'Users can rotate and mirror objects via the Tools menu.'
+}
+CRITERIA = [
+    'User can rotate the selected object 90 degrees',
+    'Mirror horizontally flips the object',
+    'The canvas updates immediately',
+]
+
+
+def _test(test_id, title, ac_words=''):
+    return {'id': test_id, 'title': f"{test_id}: {title}", 'objective': ac_words, 'steps': []}
+
+
+@pytest.fixture
+def manifest():
+    """Manifest of a previous run: one test per AC plus a story-level test."""
+    tests = [
+        _test('1001-AC1', 'Rotate', 'rotate selected object degrees'),
+        _test('1001-005', 'Mirror', 'mirror horizontally flips object'),
+        _test('1001-010', 'Canvas', 'canvas updates immediately'),
+        _test('1001-015', 'Accessibility', 'screen reader'),
+    ]
+    known = {'1001-AC1': 0, '1001-005': 1, '1001-010': 2}
+    return GenerationManifest.build(1001, context_hash('ctx'), CRITERIA, tests, known=known)
+
+
+class TestGenerationManifest:
+    """Test AC diffing and persistence."""
+
+    def test_ac_hash_ignores_case_and_spacing(self):
+        """Test trivial reformatting does not count as a change."""
+        assert ac_hash('Mirror  horizontally flips') == ac_hash('mirror horizontally flips ')
+
+    def test_build_attributes_tests(self, manifest):
+        """Test known and unattributed tests are recorded."""
+        assert [entry.test_ids for entry in manifest.acs] == [['1001-AC1'], ['1001-005'], ['1001-010']]
+        assert manifest.story_test_ids == ['1001-015']
+
+    def test_unchanged(self, manifest):
+        """Test identical ACs reuse every test."""
+        plan = manifest.plan(CRITERIA, context_hash('ctx'))
+        assert plan.unchanged
+        assert len(plan.kept_tests) == 4
+
+    def test_context_change_forces_full(self, manifest):
+        """Test a changed story context invalidates the manifest."""
+        assert manifest.plan(CRITERIA, context_hash('other')).full
+
+    def test_edited_and_new_acs(self, manifest):
+        """Test an edited AC reuses its IDs and other tests are kept verbatim."""
+        criteria = [CRITERIA[0], 'Mirror vertically flips the object upside down', CRITERIA[2], 'Rotation can be undone']
+        plan = manifest.plan(criteria, context_hash('ctx'))
+
+        assert plan.changed == [1, 3]
+        assert plan.reusable_ids == {1: ['1001-005']}
+        assert [tc['id'] for tc in plan.kept_tests] == ['1001-AC1', '1001-010', '1001-015']
+
+        new_tests = [
+            _test('1001-005', 'Mirror vertically', 'mirror vertically flips object upside down'),
+            _test('1001-010', 'Undo rotation', 'rotation can be undone'),
+            _test('1001-015', 'Accessibility', 'screen reader'),  # re-added duplicate
+        ]
+        merged = merge_tests(plan, new_tests, 1001, criteria,
+                             known={'1001-005': 1, '1001-010': 3})
+
+        assert [tc['id'] for tc in merged] == ['1001-AC1', '1001-005', '1001-010', '1001-015', '1001-020']
+        assert merged[-1]['title'] == '1001-020: Undo rotation'
+        assert plan.attribution['1001-020'] == 3
+
+    def test_settings_change_forces_full(self, manifest, tmp_path):
+        """Test the generation fingerprint follows project settings and models."""
+        config = _config(tmp_path)
+        before = generation_fingerprint(config)
+        config.llm_model = 'gpt-4o'
+        after_model = generation_fingerprint(config)
+        config.rules.forbidden_words = config.rules.forbidden_words + ['maybe']
+
+        assert len({before, after_model, generation_fingerprint(config)}) == 3
+        assert manifest.plan(CRITERIA, context_hash(after_model, 'ctx')).full
+
+    def test_removed_ac(self, manifest):
+        """Test a removed AC drops its tests."""
+        plan = manifest.plan(CRITERIA[:2], context_hash('ctx'))
+        assert not plan.unchanged and plan.removed == 1
+        assert '1001-010' not in [tc['id'] for tc in plan.kept_tests]
+
+    def test_save_and_load(self, manifest, tmp_path):
+        """Test round trip through the manifest file."""
+        path = GenerationManifest.path_for(str(tmp_path), 1001)
+        manifest.save(path)
+        assert GenerationManifest.load(path) == manifest
+        assert GenerationManifest.load(str(tmp_path / 'missing.json')) is None
+
+
+def _config(tmp_path):
+    config = ProjectConfig.load_from_yaml(str(CONFIG_PATH))
+    config.vector_db_backend = 'numpy'
+    config.vector_db_path = str(tmp_path)
+    return config
+
+
+class TestIncrementalGeneration:
+    """Test the generator's changed-AC mode."""
+
+    def test_only_acs(self, tmp_path):
+        """Test only the requested ACs are derived, without story-level tests."""
+        generator = GenericTestGenerator(_config(tmp_path))
+
+        tests = generator.generate_test_cases(dict(STORY), list(CRITERIA), only_acs={1})
+
+        assert len(tests) == 1
+        assert generator.ac_test_ids_by_test() == {tests[0]['id']: 1}
+
+    def test_attribution_survives_correction(self, tmp_path):
+        """Test tests renumbered by correction are merged under the AC they were derived from."""
+        config = _config(tmp_path)
+
+        def run(criteria, only_acs=None):
+            generator = GenericTestGenerator(config)
+            tests = generator.generate_test_cases(dict(STORY), list(criteria), only_acs=only_acs)
+            generated = attribution_by_title(tests, generator.ac_test_ids_by_test())
+            tests = LLMCorrector(project_config=config).post_process(
+                tests, str(STORY['story_id']), STORY['title'], list(criteria))
+            return tests, attribution_by_id(tests, generated)
+
+        criteria = CRITERIA + ['User can export the drawing as PNG']
+        tests, known = run(criteria)
+        manifest = GenerationManifest.build(1001, context_hash('ctx'), criteria, tests, known=known)
+        previous_ids = [entry.test_ids[0] for entry in manifest.acs]
+
+        edited = [criteria[0], 'Mirror vertically flips the object upside down',
+                  criteria[2], 'User can export the drawing as SVG']
+        plan = manifest.plan(edited, context_hash('ctx'))
+        new_tests, known = run(edited, set(plan.changed))
+        assert [tc['id'] for tc in new_tests[:2]] == ['1001-AC1', '1001-005']  # renumbered
+
+        merge_tests(plan, new_tests, 1001, edited, known=known)
+        assert plan.attribution[previous_ids[1]] == 1
+        assert plan.attribution[previous_ids[3]] == 3
+
+    def test_assign_test_id(self):
+        """Test the ID is replaced in id and title prefix only."""
+        body = {'id': '1001-010', 'title': '1001-010: Feature / Menu / Scenario', 'steps': []}
+        assigned = GenericTestGenerator._assign_test_id(body, '1001-005')
+        assert assigned['id'] == '1001-005'
+        assert assigned['title'] == '1001-005: Feature / Menu / Scenario'
+        assert GenericTestGenerator._assign_test_id(None, '1001-005') is None
@@ -0,0 +1,106 @@
+"""
+Unit tests for heuristic rule tables used by GenericTestGenerator.
+"""
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.services.heuristic_rules import (
+    HeuristicRule,
+    RuleTable,
+    RuleEngine,
+    SCENARIO_TITLES,
+    STEP_BRANCHES,
+    ACTION_OUTCOMES,
+    NO_SELECTION_EDGE_CASE,
+)
+
+
+def _first_by_search(table: RuleTable, text: str, flags: int = 0):
+    """Reference implementation: the loop the tables replace."""
+    for rule in table.rules:
+        if re.search(rule.pattern, text, flags):
+            return rule
+    return None
+
+
+class TestRuleTable:
+    """Test first-match semantics of compiled rule tables."""
+
+    def test_table_order_wins(self):
+        """Test more specific rules listed first take precedence."""
+        assert SCENARIO_TITLES.first("mirror the object horizontally").name == "horizontal"
+        assert SCENARIO_TITLES.first("undo and redo are supported").name == "undo_redo"
+        assert SCENARIO_TITLES.first("undo is supported").name == "undo"
+
+    def test_no_match_returns_none(self):
+        """Test None when no rule matches."""
+        assert SCENARIO_TITLES.first("nothing relevant here") is None
+
+    def test_matches_sequential_search(self):
+        """Test tables agree with a plain re.search loop."""
+        texts = [
+            "user can rotate the object",
+            "mirror then go vertical",
+            "color is not modified",
+            "not modify the color, border or stroke",
+            "the setting follows the unit",
+            "follow the current unit of measure setting",
+            "fields available: width, height",
+            "exit",
+            "",
+        ]
+        for table in (SCENARIO_TITLES, STEP_BRANCHES, ACTION_OUTCOMES):
+            for text in texts:
+                assert table.first(text) == _first_by_search(table, text), (table.name, text)
+
+    def test_ignorecase_table(self):
+        """Test IGNORECASE tables match mixed-case text."""
+        text = "Button is Enabled only when an Object is Selected"
+        assert NO_SELECTION_EDGE_CASE.first(text) == _first_by_search(
+            NO_SELECTION_EDGE_CASE, text, re.IGNORECASE
+        )
+        assert NO_SELECTION_EDGE_CASE.first(text).name == "enabled_only_when_selected"
+
+    def test_regex_rule_checks_order(self):
+        """Test 'a.*b' rules require the words in order, not just present."""
+        table = RuleTable("t", [HeuristicRule("ab", "alpha.*beta", "x")])
+        assert table.first("alpha then beta") is not None
+        assert table.first("beta then alpha") is None
+
+
+class TestRuleEngine:
+    """Test rule engine tracing."""
+
+    def test_trace_records_fired_rules(self):
+        """Test trace counts fired rules and misses."""
+        engine = RuleEngine()
+        engine.first(SCENARIO_TITLES, "rotate the object")
+        engine.first(SCENARIO_TITLES, "nothing relevant")
+        engine.search('setting_name', "follows the current unit setting")
+
+        trace = engine.trace
+        assert trace.evaluations == 3
+        assert trace.fired_count == 2
+        assert trace.counts() == {
+            "scenario_title.rotate_object": 1,
+            "setting_name.setting_name": 1,
+        }
+        assert trace.elapsed_seconds >= 0.0
+        assert "3 rule evaluations" in trace.summary()
+
+    def test_extractor_groups(self):
+        """Test extractors expose their capture groups."""
+        engine = RuleEngine()
+        match = engine.search('default_value', 'Default preset = "Letter".')
+        assert match.group(1) == "Letter"
+
+    def test_reset_trace(self):
+        """Test reset returns the previous trace and starts a new one."""
+        engine = RuleEngine()
+        engine.first(STEP_BRANCHES, "open the dialog")
+        previous = engine.reset_trace()
+        assert previous.evaluations == 1
+        assert engine.trace.evaluations == 0
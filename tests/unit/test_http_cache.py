@@ -0,0 +1,200 @@
+"""
+Unit tests for the conditional GET response cache.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.services.cache import CacheManager
+from infrastructure.ado import http_client
+from infrastructure.ado.http_client import ADOHttpClient
+from infrastructure.http_cache import HttpResponseCache, _parse_endpoint_ttls
+
+
+class _Response:
+    def __init__(self, payload=None, status_code=200, headers=None):
+        self._payload = payload
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return HttpResponseCache(cache_dir=str(tmp_path), endpoint_ttls={})
+
+
+class TestHttpResponseCache:
+    """Test freshness, revalidation and probes."""
+
+    def test_etag_revalidation(self, cache):
+        """Test a 304 serves the stored body and If-None-Match is sent."""
+        sent = []
+        responses = [
+            _Response({'id': 1, 'rev': 3}, headers={'ETag': '"v3"'}),
+            _Response(status_code=304),
+        ]
+
+        def fetch(headers):
+            sent.append(headers)
+            return responses[len(sent) - 1]
+
+        assert cache.get('https://h/items/1', None, fetch) == {'id': 1, 'rev': 3}
+        assert cache.get('https://h/items/1', None, fetch) == {'id': 1, 'rev': 3}
+        assert sent == [{}, {'If-None-Match': '"v3"'}]
+        assert (cache.misses, cache.revalidated) == (1, 1)
+
+    def test_changed_response_replaces_entry(self, cache):
+        """Test a 200 on revalidation stores the new body."""
+        bodies = iter([{'v': 1}, {'v': 2}])
+        fetch = lambda headers: _Response(next(bodies), headers={'ETag': 'x'})
+
+        cache.get('https://h/a', {'q': 1}, fetch)
+        assert cache.get('https://h/a', {'q': 1}, fetch) == {'v': 2}
+
+    def test_probe_skips_full_request(self, cache):
+        """Test an unchanged revision probe needs no full GET."""
+        fetches = []
+
+        def fetch(headers):
+            fetches.append(headers)
+            return _Response({'rev': 5})
+
+        cache.get('https://h/wi/1', None, fetch)
+        assert cache.get('https://h/wi/1', None, fetch, probe=lambda body: body['rev'] == 5) == {'rev': 5}
+        assert len(fetches) == 1
+
+        cache.get('https://h/wi/1', None, fetch, probe=lambda body: False)
+        assert len(fetches) == 2
+
+    def test_revalidation_does_not_rewrite_file_tier(self, tmp_path):
+        """Test a 304 refreshes only the in-memory entry; a changed body is persisted."""
+        cache = HttpResponseCache(cache_dir=str(tmp_path), endpoint_ttls={}, enable_file=True)
+        responses = iter([
+            _Response({'v': 1}, headers={'ETag': 'a'}),
+            _Response(status_code=304),
+            _Response({'v': 2}, headers={'ETag': 'b'}),
+        ])
+        fetch = lambda headers: next(responses)
+        key = HttpResponseCache.key('https://h/a')
+
+        def stored():
+            return CacheManager(enable_memory=False, cache_dir=str(tmp_path), namespace='http').get(key)
+
+        cache.get('https://h/a', None, fetch)
+        stored_at = stored()['stored_at']
+        cache.get('https://h/a', None, fetch)
+        assert stored()['stored_at'] == stored_at
+        assert cache.revalidated == 1
+
+        assert cache.get('https://h/a', None, fetch) == {'v': 2}
+        assert stored()['body'] == {'v': 2}
+
+    def test_memory_by_default(self, tmp_path, monkeypatch):
+        """Test the process-wide cache has no file tier unless HTTP_CACHE=file."""
+        from infrastructure import http_cache
+        monkeypatch.delenv("HTTP_CACHE", raising=False)
+        monkeypatch.setenv("HTTP_CACHE_DIR", str(tmp_path / "http"))
+        http_cache.reset_http_cache()
+        try:
+            http_cache.get_http_cache().get('https://h/a', None, lambda headers: _Response({'v': 1}))
+            assert not (tmp_path / "http").exists()
+        finally:
+            http_cache.reset_http_cache()
+
+    def test_endpoint_ttl_override(self, tmp_path):
+        """Test fresh entries on overridden endpoints are served without a request."""
+        cache = HttpResponseCache(cache_dir=str(tmp_path), endpoint_ttls={r'/configurations$': 3600})
+        fetches = []
+
+        def fetch(headers):
+            fetches.append(headers)
+            return _Response({'value': []})
+
+        for _ in range(3):
+            cache.get('https://h/_apis/testplan/configurations', None, fetch)
+            cache.get('https://h/_apis/wit/workitems/1', None, fetch)
+        assert len(fetches) == 4
+        assert cache.hits == 2
+
+    def test_hits_are_copies(self, tmp_path):
+        """Test callers mutating a cached body do not change the cache."""
+        cache = HttpResponseCache(cache_dir=str(tmp_path), ttl=60)
+        fetch = lambda headers: _Response({'fields': {'a': 1}})
+
+        cache.get('https://h/x', None, fetch)['fields']['a'] = 2
+        assert cache.get('https://h/x', None, fetch) == {'fields': {'a': 1}}
+
+    def test_disabled(self, tmp_path):
+        """Test a disabled cache always fetches."""
+        cache = HttpResponseCache(cache_dir=str(tmp_path), ttl=60, enabled=False)
+        fetches = []
+        fetch = lambda headers: fetches.append(headers) or _Response({})
+
+        cache.get('https://h/x', None, fetch)
+        cache.get('https://h/x', None, fetch)
+        assert len(fetches) == 2
+
+    def test_parse_endpoint_ttls(self):
+        """Test the HTTP_CACHE_TTLS format."""
+        assert _parse_endpoint_ttls('/field$=600; /plans/\\d+$=60') == {'/field$': 600.0, '/plans/\\d+$': 60.0}
+        assert _parse_endpoint_ttls('') == {}
+
+
+class TestCacheNamespace:
+    """Test CacheManager key namespaces."""
+
+    def test_namespaces_are_isolated(self, tmp_path):
+        """Test managers in one directory do not share keys."""
+        http = CacheManager(enable_file=False, cache_dir=str(tmp_path), namespace='http')
+        other = CacheManager(enable_file=False, cache_dir=str(tmp_path), namespace='llm')
+        http.set('k', 1)
+
+        assert http.get('k') == 1
+        assert other.get('k') is None
+        assert http.contains('k') and http.delete('k')
+
+    def test_clear_and_keys_stay_in_namespace(self, tmp_path):
+        """Test clear() and keys() leave other namespaces' entries alone."""
+        http = CacheManager(cache_dir=str(tmp_path), namespace='http')
+        http.set('k', 1)
+        llm = CacheManager(cache_dir=str(tmp_path), namespace='llm')
+        llm.set('k', 2)
+        llm.set('j', 3)
+
+        assert sorted(llm.keys()['file']) == ['j', 'k']
+        llm.clear()
+
+        assert llm.keys() == {'memory': [], 'file': []}
+        reopened = CacheManager(enable_memory=False, cache_dir=str(tmp_path), namespace='http')
+        assert reopened.keys() == {'file': ['k']}
+        assert reopened.get('k') == 1
+
+
+class TestADOConditionalGet:
+    """Test the ADO client's work item rev probe."""
+
+    def test_unchanged_work_item_read_with_probe(self, monkeypatch, cache):
+        """Test a cached work item is revalidated by reading only System.Rev."""
+        calls = []
+
+        def fake_get(url, **kwargs):
+            calls.append(kwargs['params'])
+            if kwargs['params'].get('fields') == 'System.Rev':
+                return _Response({'id': 7, 'rev': 2})
+            return _Response({'id': 7, 'rev': 2, 'fields': {'System.Title': 'Story'}})
+
+        monkeypatch.setattr(http_client.requests, 'get', fake_get)
+        client = ADOHttpClient('org', 'Proj', 'token', cache=cache)
+
+        first = client.get('_apis/wit/workitems/7')
+        assert client.get('_apis/wit/workitems/7') == first
+        assert [p.get('fields') for p in calls] == [None, 'System.Rev']
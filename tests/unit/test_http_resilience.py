@@ -0,0 +1,201 @@
+"""
+Unit tests for HTTP retries, the circuit breaker and request metrics.
+"""
+import sys
+import time
+from pathlib import Path
+
+import pytest
+import requests
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from infrastructure import http_resilience, http_throttle
+from infrastructure.http_resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    HttpMetrics,
+    backoff_seconds,
+    endpoint_key
+)
+from infrastructure.http_throttle import throttled_request
+
+
+class _Response:
+    def __init__(self, status_code=200, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def _sender(name, outcomes):
+    """requests-like function (named get/post) returning or raising outcomes in turn."""
+    calls = []
+
+    def send(url, **kwargs):
+        calls.append(url)
+        outcome = outcomes[min(len(calls), len(outcomes)) - 1]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    send.__name__ = name
+    return send, calls
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    """Fresh process-wide throttle/breaker/metrics and no backoff sleeps."""
+    http_throttle.reset_host_throttle()
+    http_resilience.reset_http_resilience()
+    monkeypatch.setattr(http_throttle, 'backoff_seconds', lambda attempt: 0.0)
+    yield
+    http_throttle.reset_host_throttle()
+    http_resilience.reset_http_resilience()
+
+
+class TestRetries:
+    """Test idempotency-aware retries of transient failures."""
+
+    def test_transient_get_is_retried(self):
+        """Test a 503 without Retry-After is retried for a GET."""
+        send, calls = _sender('get', [_Response(503), _Response(502), _Response(200)])
+
+        assert throttled_request(send, 'https://h/_apis/x').status_code == 200
+        assert len(calls) == 3
+        assert http_resilience.get_http_metrics().snapshot()['GET h/_apis/x']['retries'] == 2
+
+    def test_post_is_not_retried(self):
+        """Test a non-idempotent POST is sent once on a transient failure."""
+        send, calls = _sender('post', [_Response(500), _Response(201)])
+
+        assert throttled_request(send, 'https://h/add_case/1').status_code == 500
+        assert len(calls) == 1
+
+    def test_read_only_post_is_retried(self):
+        """Test POSTs marked idempotent are retried."""
+        send, calls = _sender('post', [_Response(504), _Response(200)])
+
+        assert throttled_request(send, 'https://h/search', idempotent=True).status_code == 200
+        assert len(calls) == 2
+
+    def test_connection_errors(self):
+        """Test connection errors are retried, then raised when retries run out."""
+        send, calls = _sender('get', [requests.ConnectionError('reset')])
+
+        with pytest.raises(requests.ConnectionError):
+            throttled_request(send, 'https://h/x', max_retries=2)
+        assert len(calls) == 3
+
+    def test_connect_timeout_retried_for_post(self):
+        """Test a POST that never reached the server is retried."""
+        send, calls = _sender('post', [requests.ConnectTimeout('slow'), _Response(201)])
+
+        assert throttled_request(send, 'https://h/x').status_code == 201
+        assert len(calls) == 2
+
+    def test_backoff_is_jittered_and_capped(self):
+        """Test backoff stays within the exponential envelope."""
+        delays = [backoff_seconds(3) for _ in range(200)]
+        assert all(0 <= d <= 4.0 for d in delays)
+        assert len(set(delays)) > 1
+        assert backoff_seconds(30) <= http_resilience.MAX_BACKOFF
+
+
+class TestCircuitBreaker:
+    """Test open, fail-fast and half-open probing."""
+
+    def test_opens_after_threshold_and_probes(self):
+        """Test consecutive failures open the circuit and one probe closes it."""
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=0.05)
+        for _ in range(3):
+            breaker.before_request('h')
+            breaker.record('h', success=False)
+
+        assert breaker.state('h') == 'open'
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request('h')
+
+        time.sleep(0.06)
+        probe = breaker.before_request('h')
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request('h')
+
+        breaker.record('h', success=True, probe=probe)
+        assert breaker.state('h') == 'closed'
+        assert breaker.state('other') == 'closed'
+
+    def test_failed_probe_reopens(self):
+        """Test a failed half-open probe opens the circuit again."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+        breaker.before_request('h')
+        breaker.record('h', success=False)
+        time.sleep(0.06)
+        probe = breaker.before_request('h')
+        breaker.record('h', success=False, probe=probe)
+
+        assert breaker.state('h') == 'open'
+
+    def test_stale_request_does_not_settle_probe(self):
+        """Test a request started before the circuit opened can't clear or fail the probe."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+        stale = breaker.before_request('h')
+        breaker.before_request('h')
+        breaker.record('h', success=False)
+        time.sleep(0.06)
+        probe = breaker.before_request('h')
+
+        breaker.record('h', success=False, probe=stale)
+        assert breaker.state('h') == 'half-open'
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request('h')
+
+        breaker.record('h', success=True, probe=probe)
+        assert breaker.state('h') == 'closed'
+
+    def test_requests_fail_fast_when_open(self, monkeypatch):
+        """Test a degraded host stops receiving requests."""
+        monkeypatch.setattr(http_resilience, '_breaker', CircuitBreaker(failure_threshold=4, reset_timeout=60))
+        send, calls = _sender('get', [_Response(503)])
+
+        with pytest.raises(CircuitOpenError):
+            throttled_request(send, 'https://h/x', max_retries=10)
+        assert len(calls) == 4
+
+        with pytest.raises(CircuitOpenError):
+            throttled_request(send, 'https://h/y')
+        assert len(calls) == 4
+
+    def test_throttling_does_not_open(self, monkeypatch):
+        """Test 429s are not counted as failures."""
+        monkeypatch.setattr(http_resilience, '_breaker', CircuitBreaker(failure_threshold=1))
+        send, _ = _sender('get', [_Response(429, {'Retry-After': '0'}), _Response(200)])
+
+        throttled_request(send, 'https://h/x')
+        assert http_resilience.get_circuit_breaker().state('h') == 'closed'
+
+
+class TestHttpMetrics:
+    """Test endpoint labels and histograms."""
+
+    def test_endpoint_key(self):
+        """Test IDs and issue keys are folded out of labels."""
+        assert endpoint_key('GET', 'https://dev.azure.com/org/P/_apis/wit/workitems/42') == \
+            'GET dev.azure.com/org/P/_apis/wit/workitems/{id}'
+        assert endpoint_key('GET', 'https://j.example.com/rest/api/3/issue/PROJ-12/comment') == \
+            'GET j.example.com/rest/api/3/issue/{key}/comment'
+        assert endpoint_key('POST', 'https://tr.io/index.php?/api/v2/add_case/7&x=1') == \
+            'POST tr.io/index.php?/api/v2/add_case/{id}'
+
+    def test_histogram(self):
+        """Test latencies land in their buckets."""
+        metrics = HttpMetrics()
+        metrics.observe('GET h/x', 0.02, failed=False)
+        metrics.observe('GET h/x', 0.3, failed=True)
+        metrics.observe('GET h/x', 20, failed=False)
+
+        stats = metrics.snapshot()['GET h/x']
+        assert stats['requests'] == 3 and stats['failures'] == 1
+        assert stats['histogram']['<=50ms'] == 1
+        assert stats['histogram']['<=500ms'] == 1
+        assert stats['histogram']['>10000ms'] == 1
+        assert 'GET h/x' in metrics.report()
@@ -0,0 +1,98 @@
+"""
+Unit tests for Jira search pagination (iter_issues).
+"""
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from infrastructure.jira.http_client import JiraHttpClient
+
+
+class _FakeSearch:
+    """Serves `total` issues in pages capped at `cap`, recording start offsets."""
+
+    def __init__(self, total, cap=100, delay=0.0):
+        self.total = total
+        self.cap = cap
+        self.delay = delay
+        self.starts = []
+        self.fields = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, jql, fields=None, start_at=0, max_results=50, expand=None, validate_query=None):
+        with self._lock:
+            self.starts.append(start_at)
+            self.fields.append(fields)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        size = min(max_results, self.cap)
+        issues = [{'key': f'PROJ-{i}'} for i in range(start_at, min(start_at + size, self.total))]
+        with self._lock:
+            self.active -= 1
+        return {'startAt': start_at, 'maxResults': size, 'total': self.total, 'issues': issues}
+
+
+def _client(monkeypatch, fake):
+    client = JiraHttpClient('https://jira.example.com', 'a@b.c', 'token')
+    monkeypatch.setattr(client, 'search_issues', fake)
+    return client
+
+
+class TestIterIssues:
+    """Test sequential, prefetching and parallel paging."""
+
+    def test_pages_until_total(self, monkeypatch):
+        """Test every page is read once with the projected fields."""
+        fake = _FakeSearch(total=250)
+        issues = list(_client(monkeypatch, fake).iter_issues('project = PROJ', fields=['summary']))
+
+        assert [i['key'] for i in issues] == [f'PROJ-{i}' for i in range(250)]
+        assert fake.starts == [0, 100, 200]
+        assert set(map(tuple, fake.fields)) == {('summary',)}
+
+    def test_follows_server_page_cap(self, monkeypatch):
+        """Test offsets advance by what the server returned."""
+        fake = _FakeSearch(total=120, cap=50)
+        issues = list(_client(monkeypatch, fake).iter_issues('project = PROJ', page_size=100))
+
+        assert len(issues) == 120
+        assert fake.starts == [0, 50, 100]
+
+    def test_prefetches_next_page(self, monkeypatch):
+        """Test the next page is requested before the current one is consumed."""
+        fake = _FakeSearch(total=200, delay=0.01)
+        iterator = _client(monkeypatch, fake).iter_issues('project = PROJ')
+
+        next(iterator)
+        time.sleep(0.05)
+        assert fake.starts == [0, 100]
+        assert len(list(iterator)) == 199
+
+    def test_parallel_fan_out_keeps_order(self, monkeypatch):
+        """Test pages after the first are fetched concurrently and yielded in order."""
+        fake = _FakeSearch(total=1000, delay=0.02)
+        client = _client(monkeypatch, fake)
+        issues = list(client.iter_issues('project = PROJ', parallel=True, max_workers=4))
+
+        assert [i['key'] for i in issues] == [f'PROJ-{i}' for i in range(1000)]
+        assert sorted(fake.starts) == list(range(0, 1000, 100))
+        assert fake.peak == 4
+
+    def test_empty_and_totalless_results(self, monkeypatch):
+        """Test empty results and pages without a total stop paging."""
+        assert list(_client(monkeypatch, _FakeSearch(total=0)).iter_issues('x')) == []
+
+        calls = []
+
+        def search(jql, **kwargs):
+            calls.append(kwargs['start_at'])
+            return {'issues': [{'key': 'PROJ-1'}]}
+
+        assert len(list(_client(monkeypatch, search).iter_issues('x', page_size=1))) == 1
+        assert calls == [0]
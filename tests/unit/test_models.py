@@ -1,4 +1,6 @@
 """Tests for domain models."""
+import dataclasses
+
 import pytest
 from core.domain.models import (
     UserStory, TestCase, TestStep, Objective,
@@ -60,6 +62,19 @@ def test_test_case_creation():
     assert tc.requires_object is True
 
 
+def test_test_case_is_immutable():
+    """Test TestCase and TestStep are slotted, frozen value objects."""
+    step = TestStep(index=1, action="Step 1")
+    tc = TestCase(test_id="12345-AC1", title="Test Title", steps=[step], area="Tools Menu")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        tc.title = "Other"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        step.action = "Other"
+    assert not hasattr(tc, '__dict__') and not hasattr(step, '__dict__')
+    assert dataclasses.replace(tc, test_id="12345-005").steps[0] is step
+
+
 def test_evidence_model_is_supported():
     """Test EvidenceModel.is_supported()."""
     evidence = EvidenceModel(
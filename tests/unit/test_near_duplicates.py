@@ -0,0 +1,104 @@
+"""
+Unit tests for the near-duplicate detection service.
+"""
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.services.near_duplicates import NearDuplicateDetector, MinHasher, jaccard
+from core.services.embeddings.providers.hashing_embeddings import HashingEmbeddingProvider
+
+
+def _corpus(size: int, seed: int = 7):
+    """Texts built from a few templates so that many pairs are near-duplicates."""
+    rng = random.Random(seed)
+    vocab = "menu open viewer file help offline browser rotate mirror object canvas panel".split()
+    templates = [[rng.choice(vocab) for _ in range(6)] for _ in range(15)]
+    texts = []
+    for _ in range(size):
+        words = list(rng.choice(templates))
+        if rng.random() < 0.5:
+            words[rng.randrange(len(words))] = rng.choice(vocab)
+        texts.append(' '.join(words))
+    return texts
+
+
+class TestJaccard:
+    """Test Jaccard similarity helper."""
+
+    def test_jaccard(self):
+        """Test overlap ratio and empty-set handling."""
+        assert jaccard({'a', 'b'}, {'b', 'c'}) == pytest.approx(1 / 3)
+        assert jaccard(set(), {'a'}) == 0.0
+
+
+class TestMinHasher:
+    """Test MinHash signatures."""
+
+    def test_signature_is_deterministic(self):
+        """Test the same tokens give the same signature."""
+        hasher = MinHasher(num_perm=64)
+        assert (hasher.signature({'open', 'menu'}) == MinHasher(num_perm=64).signature({'menu', 'open'})).all()
+
+    def test_signature_agreement_tracks_jaccard(self):
+        """Test identical sets agree on every signature position."""
+        hasher = MinHasher()
+        sig = hasher.signature({'a', 'b', 'c'})
+        assert (sig == hasher.signature({'c', 'b', 'a'})).mean() == 1.0
+        assert (sig == hasher.signature({'x', 'y', 'z'})).mean() < 0.2
+
+
+class TestNearDuplicateDetector:
+    """Test pair detection in exact and LSH modes."""
+
+    def test_small_input_exact(self):
+        """Test pairs, ordering and inclusive threshold."""
+        detector = NearDuplicateDetector(threshold=0.75)
+        pairs = detector.similar_pairs(["a b c d", "a b c e", "a b c d", "x y"])
+        assert [(i, j) for i, j, _ in pairs] == [(0, 2)]
+
+    def test_embedding_mode_blank_text(self):
+        """Test a blank text in the middle does not shift later embeddings."""
+        detector = NearDuplicateDetector(threshold=0.99, embedding_provider=HashingEmbeddingProvider())
+        pairs = detector.similar_pairs(["open the menu", "  ", "rotate the object", "rotate the object"])
+        assert [(i, j) for i, j, _ in pairs] == [(2, 3)]
+
+        detector = NearDuplicateDetector(threshold=0.6)
+        assert [(i, j) for i, j, _ in detector.similar_pairs(["a b c d", "a b c e"])] == [(0, 1)]
+
+    def test_strict_threshold(self):
+        """Test inclusive=False excludes similarity equal to the threshold."""
+        texts = ["a b c d", "a b c e f"]  # 3 / 6 = 0.5
+        assert NearDuplicateDetector(threshold=0.5).similar_pairs(texts)
+        assert not NearDuplicateDetector(threshold=0.5, inclusive=False).similar_pairs(texts)
+
+    def test_lsh_matches_exact(self):
+        """Test LSH candidate generation finds the same pairs as all-pairs."""
+        texts = _corpus(200)
+        exact = NearDuplicateDetector(threshold=0.7, exact_limit=10_000).similar_pairs(texts)
+        lsh = NearDuplicateDetector(threshold=0.7, exact_limit=0).similar_pairs(texts)
+        assert lsh == exact
+        assert len(exact) > 0
+
+    def test_duplicates_of_earlier(self):
+        """Test greedy keep-first dropping honours always_keep."""
+        detector = NearDuplicateDetector(threshold=0.7)
+        texts = ["open the file menu", "open the file menu", "open the file menu", "rotate object"]
+        assert detector.duplicates_of_earlier(texts) == {1, 2}
+        # A kept duplicate still knocks out later copies
+        assert detector.duplicates_of_earlier(texts, always_keep={1}) == {2}
+
+    def test_embedding_mode(self):
+        """Test cosine mode with an embedding provider."""
+        detector = NearDuplicateDetector(threshold=0.99, embedding_provider=HashingEmbeddingProvider())
+        pairs = detector.similar_pairs(["open the menu", "rotate the object", "open the menu"])
+        assert [(i, j) for i, j, _ in pairs] == [(0, 2)]
+
+    def test_invalid_banding(self):
+        """Test num_perm must split evenly into bands."""
+        with pytest.raises(ValueError):
+            NearDuplicateDetector(num_perm=100, bands=32)
@@ -91,6 +91,53 @@ class TestApplicationConfig:
         assert config.requires_object_interaction("Move the selection")
         assert not config.requires_object_interaction("Open the menu")
 
+    def test_determine_entry_point_prefers_longest_keyword(self):
+        """Longer (more specific) keywords should win; leading boundary only."""
+        config = ApplicationConfig(
+            name="Test App",
+            entry_point_mappings={"tool": "Tools Menu", "hand tool": "Left Toolbar", "dimension": "Dimensions Menu"}
+        )
+
+        assert config.determine_entry_point("Hand Tool panning") == "Left Toolbar"
+        assert config.determine_entry_point("Edit dimensions") == "Dimensions Menu"
+        assert config.determine_entry_point("Subtool options") == "Application Menu"
+
+    def test_object_interaction_requires_word_boundaries(self):
+        """Keywords should not match inside other words."""
+        config = ApplicationConfig(
+            name="Test App",
+            object_interaction_keywords=["move", "label"]
+        )
+
+        assert not config.requires_object_interaction("Remove the file")
+        assert not config.requires_object_interaction("Labelled output")
+
+    def test_feature_checks_share_one_scan(self):
+        """Feasibility, availability and aliases should agree on one AC."""
+        config = ApplicationConfig(
+            name="Test App",
+            unavailable_features=["multi-select"],
+            feature_aliases={"GPS": "Set Base Coordinates"},
+            feature_notes={"rotate": "Only 90-degree rotations supported"}
+        )
+        ac = "User can multi-select and rotate objects using GPS input"
+
+        result = config.check_ac_feasibility(ac)
+        assert result['feasible'] is False
+        assert result['warnings'] == ["Only 90-degree rotations supported"]
+        assert result['notes'] == ["'GPS' maps to 'Set Base Coordinates'"]
+        assert not config.is_feature_available(ac)
+        assert config.get_feature_warning(ac) == "Only 90-degree rotations supported"
+        assert config.resolve_feature_alias(ac).endswith("[Note: GPS → Set Base Coordinates]")
+
+    def test_keyword_changes_are_picked_up(self):
+        """Mutating config lists after a check should rebuild the matcher."""
+        config = ApplicationConfig(name="Test App", unavailable_features=[])
+        assert config.is_feature_available("cloud sync")
+
+        config.unavailable_features.append("cloud sync")
+        assert not config.is_feature_available("cloud sync")
+
     def test_get_prereq_step(self):
         """Test formatted prereq step."""
         config = ApplicationConfig(
@@ -0,0 +1,103 @@
+"""
+Unit tests for ADO QA Prep resolution (relations + workitemsbatch, memoized).
+"""
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from infrastructure.ado.ado_repository import ADOStoryRepository
+
+CONFIG = SimpleNamespace(
+    organization='org', project='Proj', pat='token', qa_prep_pattern='Story {story_id}: QA Prep'
+)
+
+
+def _relation(item_id, rel='System.LinkTypes.Hierarchy-Forward'):
+    return {'rel': rel, 'url': f'https://dev.azure.com/org/_apis/wit/workItems/{item_id}'}
+
+
+class _FakeADO:
+    """Serves one story with many children, recording every request."""
+
+    def __init__(self, children):
+        self.children = children
+        self.requests = []
+
+    def get(self, endpoint, params=None):
+        self.requests.append(('GET', endpoint))
+        return {'id': 100, 'relations': [_relation(i) for i in self.children]
+                + [_relation(1, rel='System.LinkTypes.Related')]}
+
+    def post(self, endpoint, data, params=None):
+        self.requests.append(('POST', endpoint))
+        return {'value': [
+            {'id': i, 'fields': {'System.Id': i, **self.children[i]}} for i in data['ids'] if i in self.children
+        ]}
+
+    def execute_wiql(self, query):
+        self.requests.append(('WIQL', query))
+        return {'workItems': []}
+
+
+@pytest.fixture
+def repo(monkeypatch):
+    ADOStoryRepository._qa_prep_ids.clear()
+    repo = ADOStoryRepository(CONFIG)
+    yield repo
+    ADOStoryRepository._qa_prep_ids.clear()
+
+
+def _attach(monkeypatch, repo, fake):
+    for name in ('get', 'post', 'execute_wiql'):
+        monkeypatch.setattr(repo._client, name, getattr(fake, name))
+
+
+class TestQAPrepLookup:
+    """Test request counts and memoization."""
+
+    def test_two_requests_regardless_of_children(self, monkeypatch, repo):
+        """Test 50 children resolve with one relations GET and one batch read."""
+        children = {i: {'System.Title': f'Task {i}', 'System.Description': ''} for i in range(200, 250)}
+        children[230] = {'System.Title': 'Story 100: QA Prep', 'System.Description': '<p>Plan</p>'}
+        fake = _FakeADO(children)
+        _attach(monkeypatch, repo, fake)
+
+        assert repo.get_qa_prep(100) == 'Plan'
+        assert fake.requests == [('GET', '_apis/wit/workitems/100'), ('POST', '_apis/wit/workitemsbatch')]
+
+    def test_memoized_id_skips_lookup(self, monkeypatch, repo):
+        """Test a resolved QA Prep is read directly and found again without requests."""
+        fake = _FakeADO({300: {'System.Title': 'Story 100: QA Prep', 'System.Description': '<p>Plan</p>'}})
+        _attach(monkeypatch, repo, fake)
+
+        repo.get_qa_prep(100)
+        fake.requests.clear()
+
+        assert repo._find_qa_prep_id(100) == 300
+        assert fake.requests == []
+        assert ADOStoryRepository(CONFIG)._find_qa_prep_id(100) == 300
+
+        assert repo.get_qa_prep(100) == 'Plan'
+        assert fake.requests == [('POST', '_apis/wit/workitemsbatch')]
+
+    def test_empty_description_falls_back_to_search(self, monkeypatch, repo):
+        """Test an empty QA Prep child still falls back to the title search."""
+        fake = _FakeADO({300: {'System.Title': 'Story 100: QA Prep', 'System.Description': ''}})
+        _attach(monkeypatch, repo, fake)
+
+        assert repo.get_qa_prep(100) is None
+        assert fake.requests[-1][0] == 'WIQL'
+        assert repo._find_qa_prep_id(100) == 300
+
+    def test_no_pattern(self, monkeypatch, repo):
+        """Test nothing is requested without a QA Prep pattern."""
+        repo._config = SimpleNamespace(qa_prep_pattern=None)
+        fake = _FakeADO({})
+        _attach(monkeypatch, repo, fake)
+
+        assert repo.get_qa_prep(100) is None
+        assert fake.requests == []
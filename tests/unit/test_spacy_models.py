@@ -0,0 +1,71 @@
+"""Tests for the shared spaCy model registry (with a fake spaCy module)."""
+import pytest
+
+from core.services.nlp import spacy_models
+
+
+class FakeDoc:
+    def __init__(self, text):
+        self.text = text
+        self.ents = []
+
+
+class FakeNLP:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, text):
+        self.calls += 1
+        return FakeDoc(text)
+
+
+class FakeSpacy:
+    def __init__(self):
+        self.loads = []
+
+    def load(self, name, exclude=()):
+        self.loads.append((name, tuple(exclude)))
+        return FakeNLP()
+
+
+@pytest.fixture
+def fake_spacy(monkeypatch):
+    fake = FakeSpacy()
+    monkeypatch.setattr(spacy_models, "spacy", fake)
+    monkeypatch.setattr(spacy_models, "SPACY_AVAILABLE", True)
+    spacy_models.clear_spacy_models()
+    yield fake
+    spacy_models.clear_spacy_models()
+
+
+class TestSpacyModelRegistry:
+    """Pipelines load once per (model, exclude) and Docs are memoized."""
+
+    def test_model_loaded_once(self, fake_spacy):
+        a = spacy_models.get_spacy_model("en_core_web_sm", exclude=("ner",))
+        b = spacy_models.get_spacy_model("en_core_web_sm", exclude=["ner"])
+        assert a is b
+        assert fake_spacy.loads == [("en_core_web_sm", ("ner",))]
+
+    def test_different_profiles_load_separately(self, fake_spacy):
+        spacy_models.get_spacy_model("en_core_web_sm", exclude=("ner",))
+        spacy_models.get_spacy_model("en_core_web_sm")
+        assert len(fake_spacy.loads) == 2
+
+    def test_analyze_memoizes_docs(self, fake_spacy):
+        first = spacy_models.analyze("Click the Save button")
+        second = spacy_models.analyze("Click the Save button")
+        assert first is second
+        assert spacy_models.get_spacy_model(exclude=spacy_models.PARSE_EXCLUDE).calls == 1
+
+    def test_memo_is_bounded(self, fake_spacy, monkeypatch):
+        monkeypatch.setattr(spacy_models, "DOC_MEMO_SIZE", 2)
+        for text in ["a", "b", "c"]:
+            spacy_models.analyze(text)
+        spacy_models.analyze("a")
+        assert spacy_models.get_spacy_model(exclude=spacy_models.PARSE_EXCLUDE).calls == 4
+
+    def test_unavailable_returns_none(self, monkeypatch):
+        monkeypatch.setattr(spacy_models, "SPACY_AVAILABLE", False)
+        assert spacy_models.get_spacy_model() is None
+        assert spacy_models.analyze("text") is None
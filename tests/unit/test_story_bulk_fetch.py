@@ -0,0 +1,114 @@
+"""
+Unit tests for bulk story retrieval (ADO workitemsbatch, Jira JQL).
+"""
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from infrastructure.ado.ado_repository import ADOStoryRepository
+from infrastructure.jira.jira_repository import JiraStoryRepository
+from workflows import DiscoverWorkflow
+
+CONFIG = SimpleNamespace(organization='org', project='Proj', pat='token')
+
+
+def _ado_item(story_id, ac='<ul><li>User can rotate the object</li></ul>'):
+    return {'id': story_id, 'fields': {
+        'System.Id': story_id,
+        'System.Title': f'Story {story_id}',
+        'System.Description': '<div>Rotate things</div>',
+        'Microsoft.VSTS.Common.AcceptanceCriteria': ac,
+    }}
+
+
+class TestADOGetStories:
+    """Test workitemsbatch retrieval."""
+
+    def test_chunks_of_200_with_projection(self, monkeypatch):
+        """Test 450 IDs take three requests and only story fields are asked for."""
+        repo = ADOStoryRepository(CONFIG)
+        requests_made = []
+
+        def fake_post(endpoint, data, params=None):
+            requests_made.append((endpoint, data))
+            return {'value': [_ado_item(i) for i in data['ids']]}
+
+        monkeypatch.setattr(repo._client, 'post', fake_post)
+        stories = repo.get_stories(list(range(1, 451)))
+
+        assert len(stories) == 450
+        assert [len(d['ids']) for _, d in requests_made] == [200, 200, 50]
+        assert all(e == '_apis/wit/workitemsbatch' for e, _ in requests_made)
+        assert requests_made[0][1]['fields'] == ADOStoryRepository.STORY_FIELDS
+        assert stories[7].acceptance_criteria == ['User can rotate the object']
+
+    def test_matches_single_fetch(self, monkeypatch):
+        """Test bulk and single retrieval build the same story."""
+        repo = ADOStoryRepository(CONFIG)
+        monkeypatch.setattr(repo._client, 'post', lambda endpoint, data, params=None: {'value': [_ado_item(5)]})
+        monkeypatch.setattr(repo._client, 'get', lambda endpoint, params=None: _ado_item(5))
+
+        assert repo.get_stories([5])[5] == repo.get_story(5)
+
+    def test_missing_and_invalid_stories_left_out(self, monkeypatch):
+        """Test omitted IDs (null entries) and stories without AC are skipped."""
+        repo = ADOStoryRepository(CONFIG)
+        monkeypatch.setattr(
+            repo._client, 'post',
+            lambda endpoint, data, params=None: {'value': [_ado_item(1), None, _ado_item(3, ac='')]}
+        )
+        monkeypatch.setattr(repo._client, 'get', lambda endpoint, params=None: {'comments': []})
+
+        assert list(repo.get_stories([1, 2, 3])) == [1]
+
+
+class TestJiraGetStories:
+    """Test JQL key-in retrieval."""
+
+    def test_key_in_search(self, monkeypatch):
+        """Test stories come from one search per SEARCH_BATCH keys."""
+        repo = JiraStoryRepository(
+            'https://jira.example.com', 'a@b.c', 'token', 'PROJ', ac_field_name='customfield_1'
+        )
+        searches = []
+
+        def fake_search(jql, fields=None, start_at=0, max_results=50, expand=None, validate_query=None):
+            searches.append((jql, fields, validate_query))
+            keys = jql[len('key in ('):-1].split(', ')
+            return {'issues': [
+                {'key': key, 'fields': {'summary': f'Story {key}', 'description': 'Desc',
+                                        'customfield_1': '• User can mirror the object'}}
+                for key in keys if key != 'PROJ-2'
+            ]}
+
+        monkeypatch.setattr(repo._client, 'search_issues', fake_search)
+        stories = repo.get_stories(list(range(1, 151)))
+
+        assert len(searches) == 2
+        assert searches[0][0].startswith('key in (PROJ-1, PROJ-2,')
+        assert searches[0][1] == ['summary', 'description', 'customfield_1']
+        assert searches[0][2] == 'warn'
+        assert 2 not in stories and len(stories) == 149
+        assert stories[1].acceptance_criteria == ['User can mirror the object']
+
+
+class TestDiscoverFetch:
+    """Test the Discover workflow's bulk story fetch."""
+
+    def test_invalid_id_fails_only_that_story(self, monkeypatch, capsys):
+        """Test a non-numeric ID is reported and the other stories are still fetched."""
+        repo = ADOStoryRepository(CONFIG)
+        requested = []
+
+        def fake_post(endpoint, data, params=None):
+            requested.extend(data['ids'])
+            return {'value': [_ado_item(i) for i in data['ids']]}
+
+        monkeypatch.setattr(repo._client, 'post', fake_post)
+        stories = DiscoverWorkflow._fetch_stories(repo, ['5', 'abc', 7])
+
+        assert requested == [5, 7]
+        assert [story['title'] for story in stories] == ['Story 5', 'Story 7']
+        assert 'Failed to fetch abc' in capsys.readouterr().out
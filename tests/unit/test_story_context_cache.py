@@ -0,0 +1,136 @@
+"""
+Unit tests for the story context memo.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.domain.grounded_spec import GroundedSpec
+from core.domain.ruleset import Ruleset
+from core.services import story_context_cache
+from core.services.story_context_cache import StoryContextMemo, get_story_context_memo
+from core.services.story_type_classifier import StoryTypeClassifier
+from core.services.test_generator import DescriptionParser
+
+STORY = {
+    'story_id': 1001,
+    'title': 'Rotate and Mirror objects',
+    'description_text': 'Location: Tools Menu → Transform. Users can rotate objects.'
+}
+CRITERIA = [
+    'User can rotate the selected object 90 degrees from the Tools Menu',
+    'Mirror horizontally flips the object',
+    'Undo and redo are supported',
+]
+QA_PREP = '- Verify rotate is disabled when nothing is selected\n- Check keyboard shortcut Ctrl+R'
+
+
+@pytest.fixture
+def memo(tmp_path, monkeypatch):
+    """Process-wide memo pointed at a throwaway directory."""
+    monkeypatch.setenv("STORY_CONTEXT_CACHE", "file")
+    monkeypatch.setenv("STORY_CONTEXT_CACHE_DIR", str(tmp_path))
+    story_context_cache.reset_story_context_memo()
+    yield get_story_context_memo()
+    story_context_cache.reset_story_context_memo()
+
+
+class TestStoryContextMemo:
+    """Test memo keys, hits and tiers."""
+
+    def test_hit_and_miss(self, tmp_path):
+        """Test the second call for the same content is served from the memo."""
+        memo = StoryContextMemo(cache_dir=str(tmp_path))
+        calls = []
+
+        def build():
+            calls.append(1)
+            return {'value': 1}
+
+        for _ in range(2):
+            assert memo.get_or_build("k", ["a"], build, dict, dict) == {'value': 1}
+        memo.get_or_build("k", ["b"], build, dict, dict)
+
+        assert len(calls) == 2
+        assert (memo.hits, memo.misses) == (1, 2)
+
+    def test_file_tier_survives_new_instance(self, tmp_path):
+        """Test entries are reused across processes via the on-disk tier."""
+        StoryContextMemo(cache_dir=str(tmp_path), enable_file=True).get_or_build("k", ["a"], lambda: [1], list, list)
+        memo = StoryContextMemo(cache_dir=str(tmp_path), enable_file=True)
+        assert memo.get_or_build("k", ["a"], lambda: [2], list, list) == [1]
+        assert memo.hits == 1
+
+    def test_source_file_changes_key(self, tmp_path):
+        """Test an extractor's source fingerprint is part of the key."""
+        first = tmp_path / "a.py"
+        second = tmp_path / "b.py"
+        first.write_text("x = 1")
+        second.write_text("x = 2")
+        memo = StoryContextMemo(cache_dir=str(tmp_path))
+        assert memo.key("k", ["a"], str(first)) != memo.key("k", ["a"], str(second))
+
+    def test_disabled(self, tmp_path):
+        """Test a disabled memo always rebuilds."""
+        memo = StoryContextMemo(cache_dir=str(tmp_path), enabled=False)
+        assert memo.get_or_build("k", ["a"], lambda: 1, int, int) == 1
+        assert memo.get_or_build("k", ["a"], lambda: 2, int, int) == 2
+        assert memo.hits == 0
+
+    def test_memory_by_default(self, tmp_path, monkeypatch):
+        """Test the process-wide memo has no file tier unless STORY_CONTEXT_CACHE=file."""
+        monkeypatch.delenv("STORY_CONTEXT_CACHE", raising=False)
+        monkeypatch.setenv("STORY_CONTEXT_CACHE_DIR", str(tmp_path / "memo"))
+        story_context_cache.reset_story_context_memo()
+        try:
+            get_story_context_memo().get_or_build("k", ["a"], lambda: [1], list, list)
+            assert not (tmp_path / "memo").exists()
+        finally:
+            story_context_cache.reset_story_context_memo()
+
+    def test_env_off(self, monkeypatch):
+        """Test STORY_CONTEXT_CACHE=off disables the process-wide memo."""
+        monkeypatch.setenv("STORY_CONTEXT_CACHE", "off")
+        story_context_cache.reset_story_context_memo()
+        try:
+            assert get_story_context_memo().enabled is False
+        finally:
+            story_context_cache.reset_story_context_memo()
+
+
+class TestMemoizedBuilders:
+    """Test memoized results equal freshly built ones."""
+
+    def test_grounded_spec_round_trip(self, memo):
+        """Test a cached GroundedSpec matches the one built from scratch."""
+        expected = GroundedSpec.from_story_data(STORY, CRITERIA, QA_PREP)
+        story_context_cache.build_grounded_spec(STORY, CRITERIA, QA_PREP)
+        cached = story_context_cache.build_grounded_spec(STORY, CRITERIA, QA_PREP)
+
+        assert memo.hits == 1
+        assert cached.to_dict() == expected.to_dict()
+        assert cached.surfaces == expected.surfaces
+
+    def test_ruleset_round_trip(self, memo):
+        """Test a cached Ruleset matches the one built from scratch."""
+        qa_texts = ['Verify rotate is disabled when nothing is selected']
+        expected = Ruleset.from_evidence(1001, CRITERIA, qa_texts)
+        story_context_cache.build_ruleset(1001, CRITERIA, qa_texts)
+        cached = story_context_cache.build_ruleset(1001, CRITERIA, qa_texts)
+
+        assert memo.hits == 1
+        assert cached.to_dict() == expected.to_dict()
+
+    def test_classify_and_parse_use_memo(self, memo):
+        """Test classifier and description parser return the same results on a hit."""
+        expected_type = StoryTypeClassifier._classify(STORY['title'], CRITERIA)
+        expected_ctx = DescriptionParser._parse(STORY['description_text'])
+
+        for _ in range(2):
+            assert StoryTypeClassifier.classify(STORY['title'], CRITERIA) == expected_type
+            assert DescriptionParser.parse(STORY['description_text']) == expected_ctx
+
+        assert memo.hits == 2
@@ -0,0 +1,122 @@
+"""
+Unit tests for the ADO story -> suite index and paged GETs.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from infrastructure.ado import http_client, suite_index
+from infrastructure.ado.http_client import ADOHttpClient
+from infrastructure.ado.suite_index import SuiteIndex, get_suite_index
+
+
+class _FakeClient:
+    """Client serving fixed plans and suites, counting list calls."""
+
+    base_url = 'https://dev.azure.com/org/Proj'
+
+    def __init__(self):
+        self.plans = [{'id': 1}, {'id': 2}]
+        self.suites = {
+            1: [{'id': 10, 'name': 'Root'}, {'id': 11, 'name': '1001 : Rotate'}],
+            2: [{'id': 20, 'name': '1002 : Mirror'}, {'id': 21, 'name': '1001 : Duplicate'}],
+        }
+        self.calls = []
+
+    def get_all(self, endpoint, params=None):
+        self.calls.append(endpoint)
+        if endpoint == '_apis/testplan/plans':
+            return self.plans
+        plan_id = int(endpoint.split('/')[3])
+        return self.suites[plan_id]
+
+
+@pytest.fixture(autouse=True)
+def fresh_indexes():
+    suite_index.reset_suite_indexes()
+    yield
+    suite_index.reset_suite_indexes()
+
+
+class TestSuiteIndex:
+    """Test lookups, first-match order and refresh rules."""
+
+    def test_one_scan_for_many_lookups(self):
+        """Test repeated lookups are served from one scan."""
+        client = _FakeClient()
+        index = SuiteIndex(client)
+
+        assert index.find(1001) == {'id': 11, 'name': '1001 : Rotate', 'plan_id': 1}
+        assert index.find(1002) == {'id': 20, 'name': '1002 : Mirror', 'plan_id': 2}
+        assert index.builds == 1
+        assert len(client.calls) == 3
+
+    def test_miss_refresh_is_rate_limited(self):
+        """Test a miss only rebuilds once the refresh interval has passed."""
+        client = _FakeClient()
+        index = SuiteIndex(client, miss_refresh=3600)
+        assert index.find(9999) is None
+        assert index.find(9999) is None
+        assert index.builds == 1
+
+        index.miss_refresh = 0
+        client.suites[2].append({'id': 22, 'name': '9999 : New'})
+        assert index.find(9999)['id'] == 22
+        assert index.builds == 2
+
+    def test_ttl_rebuild(self):
+        """Test an expired index is rebuilt before answering."""
+        index = SuiteIndex(_FakeClient(), ttl=0)
+        index.find(1001)
+        index.find(1001)
+        assert index.builds == 2
+
+    def test_add_created_suite(self):
+        """Test a suite created this run is found without a rebuild."""
+        index = SuiteIndex(_FakeClient(), miss_refresh=3600)
+        index.find(1001)
+        index.add(3000, {'id': 30, 'name': '3000 : Created', 'plan_id': 1})
+        assert index.find(3000)['id'] == 30
+        assert index.builds == 1
+
+    def test_shared_per_project(self):
+        """Test the run-wide index is shared by clients of the same project."""
+        assert get_suite_index(_FakeClient()) is get_suite_index(_FakeClient())
+
+
+class _Response:
+    def __init__(self, payload, headers):
+        self._payload = payload
+        self.headers = headers
+        self.status_code = 200
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+class TestGetAll:
+    """Test continuation-token paging."""
+
+    def test_follows_continuation_token(self, monkeypatch):
+        """Test every page is fetched and the token passed back."""
+        pages = {
+            None: _Response({'value': [{'id': 1}, {'id': 2}]}, {'x-ms-continuationtoken': 'p2'}),
+            'p2': _Response({'value': [{'id': 3}]}, {}),
+        }
+        tokens = []
+
+        def fake_get(url, **kwargs):
+            tokens.append(kwargs['params'].get('continuationToken'))
+            return pages[tokens[-1]]
+
+        monkeypatch.setattr(http_client.requests, 'get', fake_get)
+        items = ADOHttpClient('org', 'Proj', 'token').get_all('_apis/testplan/plans')
+
+        assert [i['id'] for i in items] == [1, 2, 3]
+        assert tokens == [None, 'p2']
@@ -0,0 +1,120 @@
+"""
+Unit tests for TestRail pagination and concurrent bulk operations.
+"""
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Module imports: pytest would try to collect the Test*-named classes
+from infrastructure.testrail import http_client, testrail_repository
+
+
+def _paged_get(total, key='cases', limit=250):
+    """Fake client.get serving TestRail 6.7+ pages, recording endpoints."""
+    calls = []
+
+    def get(endpoint, params=None):
+        calls.append((endpoint, params))
+        offset = int(endpoint.split('&offset=')[1]) if '&offset=' in endpoint else 0
+        base = endpoint.split('&')[0]
+        suite = f"&suite_id={params['suite_id']}" if params and 'suite_id' in params else ''
+        if '&suite_id=' in endpoint:
+            suite = '&suite_id=' + endpoint.split('&suite_id=')[1].split('&')[0]
+        end = min(offset + limit, total)
+        return {
+            'offset': offset, 'limit': limit, 'size': end - offset,
+            '_links': {
+                'next': f"/api/v2/{base}{suite}&limit={limit}&offset={end}" if end < total else None,
+                'prev': None,
+            },
+            key: [{'id': i, 'name': f'{i} : Story'} for i in range(offset, end)],
+        }
+
+    return get, calls
+
+
+class TestPagination:
+    """Test _links.next pagination."""
+
+    def test_get_cases_reads_every_page(self, monkeypatch):
+        """Test a 600-case suite is read in three pages with the filters kept."""
+        client = http_client.TestRailHttpClient('https://tr.example.com', 'a@b.c', 'key')
+        get, calls = _paged_get(600)
+        monkeypatch.setattr(client, 'get', get)
+
+        cases = client.get_cases(1, suite_id=7)
+
+        assert [c['id'] for c in cases] == list(range(600))
+        assert calls[0] == ('get_cases/1', {'suite_id': 7})
+        assert calls[1] == ('get_cases/1&suite_id=7&limit=250&offset=250', None)
+        assert len(calls) == 3
+
+    def test_unpaginated_list_response(self, monkeypatch):
+        """Test older servers returning a plain list still work."""
+        client = http_client.TestRailHttpClient('https://tr.example.com', 'a@b.c', 'key')
+        monkeypatch.setattr(client, 'get', lambda endpoint, params=None: [{'id': 1}, {'id': 2}])
+
+        assert client.get_runs(1) == [{'id': 1}, {'id': 2}]
+        assert client.get_sections(1) == [{'id': 1}, {'id': 2}]
+
+    def test_section_lookup_stops_at_match(self, monkeypatch):
+        """Test finding a section does not read the pages after it."""
+        repo = testrail_repository.TestRailTestSuiteRepository('https://tr.example.com', 'a@b.c', 'key', project_id=1)
+        get, calls = _paged_get(1000, key='sections')
+        monkeypatch.setattr(repo._client, 'get', get)
+
+        assert repo.find_suite_by_story_id(300)['id'] == 300
+        assert len(calls) == 2
+
+
+class TestBulkOperations:
+    """Test concurrent creates and updates."""
+
+    def _repo(self, monkeypatch, delay=0.01):
+        repo = testrail_repository.TestRailTestCaseRepository('https://tr.example.com', 'a@b.c', 'key', project_id=1)
+        state = {'active': 0, 'peak': 0, 'posts': []}
+        lock = threading.Lock()
+
+        def post(endpoint, data):
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+                state['posts'].append((endpoint, data))
+            time.sleep(delay)
+            with lock:
+                state['active'] -= 1
+            if 'Broken' in data.get('title', ''):
+                raise RuntimeError('400 Bad Request')
+            return {'id': 1000 + int(data.get('title', 'T0')[1:] or 0)}
+
+        monkeypatch.setattr(repo._client, 'post', post)
+        return repo, state
+
+    def test_bulk_create_is_concurrent_and_ordered(self, monkeypatch):
+        """Test bulk create overlaps requests and keeps input order."""
+        monkeypatch.setenv('UPLOAD_CONCURRENCY', '4')
+        repo, state = self._repo(monkeypatch)
+        test_cases = [{'title': f'T{i}', 'steps': [], 'objective': ''} for i in range(12)]
+        test_cases[5]['title'] = 'Broken'
+
+        ids = repo.bulk_create_test_cases(section_id=3, test_cases=test_cases)
+
+        assert ids == [1000 + i for i in range(12) if i != 5]
+        assert state['peak'] == 4
+        assert all(endpoint == 'add_case/3' for endpoint, _ in state['posts'])
+
+    def test_bulk_update(self, monkeypatch):
+        """Test updates run concurrently and leave the callers' dicts intact."""
+        repo, state = self._repo(monkeypatch)
+        fields = {'steps': [{'action': 'Open', 'expected': 'Opened'}], 'objective': 'Goal'}
+
+        results = repo.update_test_cases({1: fields, 2: dict(fields), 3: {'title': 'Broken'}})
+
+        assert results == {1: True, 2: True, 3: False}
+        assert 'steps' in fields
+        sent = dict(state['posts'])['update_case/1']
+        assert sent['custom_steps_separated'] == [{'content': 'Open', 'expected': 'Opened'}]
+        assert sent['custom_preconds'] == 'Goal'
@@ -0,0 +1,157 @@
+"""
+Unit tests for the upload executor and the per-host HTTP throttle.
+"""
+import random
+import sys
+import threading
+import time
+from email.utils import formatdate
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from infrastructure import http_throttle
+from infrastructure.http_throttle import HostThrottle, retry_after_seconds, throttled_request
+from infrastructure.upload_executor import UploadExecutor
+
+
+class _Response:
+    def __init__(self, status_code=200, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+@pytest.fixture(autouse=True)
+def fresh_throttle():
+    """Each test gets its own process-wide throttle."""
+    http_throttle.reset_host_throttle()
+    yield
+    http_throttle.reset_host_throttle()
+
+
+class TestUploadExecutor:
+    """Test ordering, concurrency and error capture."""
+
+    def test_results_and_callbacks_in_input_order(self):
+        """Test out-of-order completion is reported in input order."""
+        seen = []
+
+        def upload(n):
+            time.sleep(random.uniform(0, 0.01))
+            return n * 10
+
+        outcomes = UploadExecutor(max_workers=8).map(
+            upload, list(range(20)), on_result=lambda idx, item, result, error: seen.append(idx)
+        )
+
+        assert [result for result, _ in outcomes] == [n * 10 for n in range(20)]
+        assert seen == list(range(20))
+
+    def test_runs_concurrently(self):
+        """Test calls overlap up to max_workers."""
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def upload(_):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+
+        UploadExecutor(max_workers=4).map(upload, range(12))
+        assert peak[0] == 4
+
+    def test_errors_are_captured_per_item(self):
+        """Test a failing call does not stop the others."""
+        def upload(n):
+            if n == 2:
+                raise RuntimeError('boom')
+            return n
+
+        outcomes = UploadExecutor(max_workers=3).map(upload, range(4))
+
+        assert [r for r, _ in outcomes] == [0, 1, None, 3]
+        assert str(outcomes[2][1]) == 'boom'
+
+    def test_env_concurrency(self, monkeypatch):
+        """Test UPLOAD_CONCURRENCY sets the default worker count."""
+        monkeypatch.setenv("UPLOAD_CONCURRENCY", "3")
+        assert UploadExecutor().max_workers == 3
+
+
+class TestRetryAfter:
+    """Test throttled response detection and Retry-After parsing."""
+
+    def test_seconds_and_date(self):
+        """Test both Retry-After forms."""
+        assert retry_after_seconds(_Response(429, {'Retry-After': '7'})) == 7.0
+        date = formatdate(time.time() + 30, usegmt=True)
+        assert 25 <= retry_after_seconds(_Response(429, {'Retry-After': date})) <= 30
+
+    def test_backoff_without_header(self):
+        """Test a bare 429 backs off exponentially by attempt."""
+        assert retry_after_seconds(_Response(429), attempt=0) == 1.0
+        assert retry_after_seconds(_Response(429), attempt=3) == 8.0
+
+    def test_not_throttled(self):
+        """Test ordinary responses and 503 without Retry-After are not throttled."""
+        assert retry_after_seconds(_Response(200)) is None
+        assert retry_after_seconds(_Response(503)) is None
+        assert retry_after_seconds(_Response(503, {'Retry-After': '1'})) == 1.0
+
+
+class TestHostThrottle:
+    """Test adaptive per-host limits."""
+
+    def test_throttled_halves_limit_and_recovers(self):
+        """Test a 429 halves the limit and successes grow it back."""
+        throttle = HostThrottle(max_concurrency=8, recovery_after=2)
+        throttle.acquire('h')
+        throttle.release('h', throttled=True)
+        assert throttle.limit('h') == 4
+
+        for _ in range(4):
+            throttle.acquire('h')
+            throttle.release('h', throttled=False)
+        assert throttle.limit('h') == 6
+        assert throttle.limit('other') == 8
+
+    def test_pause_blocks_acquire(self):
+        """Test requests wait out the Retry-After pause."""
+        throttle = HostThrottle()
+        throttle.acquire('h')
+        throttle.release('h', throttled=True, delay=0.1)
+
+        start = time.monotonic()
+        throttle.acquire('h')
+        assert time.monotonic() - start >= 0.09
+
+    def test_throttled_request_retries(self):
+        """Test a 429 is retried and the final response returned."""
+        responses = [_Response(429, {'Retry-After': '0'}), _Response(429, {'Retry-After': '0'}), _Response(201)]
+        calls = []
+
+        def send(url, **kwargs):
+            calls.append(kwargs)
+            return responses[len(calls) - 1]
+
+        response = throttled_request(send, 'https://dev.azure.com/org/_apis/x', json={'a': 1})
+
+        assert response.status_code == 201
+        assert len(calls) == 3
+        assert http_throttle.get_host_throttle().limit('dev.azure.com') == 2
+
+    def test_throttled_request_gives_up(self):
+        """Test the last throttled response is returned when retries run out."""
+        calls = []
+
+        def send(url, **kwargs):
+            calls.append(1)
+            return _Response(429, {'Retry-After': '0'})
+
+        assert throttled_request(send, 'https://h/x', max_retries=2).status_code == 429
+        assert len(calls) == 3
@@ -0,0 +1,143 @@
+"""Tests for vector store implementations and the shared store registry."""
+import pytest
+
+from core.services.embeddings.test_step_embedder import TestStepEmbedder
+from infrastructure.vector_db import (
+    ChromaRepository,
+    NumpyVectorStore,
+    get_vector_store,
+    reset_vector_stores,
+)
+
+
+class TestVectorStoreRegistry:
+    """Tests for the process-wide vector store registry."""
+
+    @pytest.fixture(autouse=True)
+    def clean_registry(self):
+        reset_vector_stores()
+        yield
+        reset_vector_stores()
+
+    def test_same_collection_and_path_shared(self, tmp_path):
+        """Same collection and path should return the same instance."""
+        a = get_vector_store("steps", path=str(tmp_path))
+        b = get_vector_store("steps", path=str(tmp_path))
+        assert a is b
+
+    def test_different_paths_not_shared(self, tmp_path):
+        """Different persistence paths should get separate stores."""
+        a = get_vector_store("steps", path=str(tmp_path / "a"))
+        b = get_vector_store("steps", path=str(tmp_path / "b"))
+        assert a is not b
+
+    def test_env_path_used_by_default(self, tmp_path, monkeypatch):
+        """VECTOR_DB_PATH should be used when no path is given."""
+        monkeypatch.setenv("VECTOR_DB_PATH", str(tmp_path))
+        store = get_vector_store("steps")
+        assert isinstance(store, ChromaRepository)
+        assert store.path == str(tmp_path)
+
+    def test_numpy_backend(self, tmp_path):
+        """backend='numpy' should return a NumpyVectorStore."""
+        store = get_vector_store("steps", path=str(tmp_path), backend="numpy")
+        assert isinstance(store, NumpyVectorStore)
+
+    def test_unknown_backend_raises(self, tmp_path):
+        with pytest.raises(ValueError):
+            get_vector_store("steps", path=str(tmp_path), backend="faiss")
+
+    def test_chroma_client_not_opened_on_construction(self, tmp_path):
+        """Creating a store should not open the chromadb client."""
+        store = get_vector_store("steps", path=str(tmp_path))
+        assert store._collection is None
+
+
+class TestTestStepEmbedderLazyStore:
+    """TestStepEmbedder should resolve its store on first use only."""
+
+    @pytest.fixture(autouse=True)
+    def clean_registry(self):
+        reset_vector_stores()
+        yield
+        reset_vector_stores()
+
+    def test_construction_is_lazy(self, tmp_path):
+        embedder = TestStepEmbedder(path=str(tmp_path))
+        assert embedder._store is None
+
+    def test_embedders_share_store(self, tmp_path):
+        a = TestStepEmbedder(path=str(tmp_path))
+        b = TestStepEmbedder(path=str(tmp_path))
+        assert a.store is b.store
+
+
+class TestNumpyVectorStore:
+    """Tests for the NumPy-backed vector store."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        store = NumpyVectorStore("steps", path=str(tmp_path))
+        store.add(
+            ["a", "b", "c"],
+            [
+                "Click the Mirror Tool button in the Tools Menu",
+                "Drag the zoom slider in the Bottom Bar",
+                "Select the Export option in the File Menu",
+            ],
+        )
+        return store
+
+    def test_count(self, store):
+        assert store.count() == 3
+
+    def test_query_matches_chroma_shape(self, store):
+        """Results should be nested one level per query text, like Chroma."""
+        results = store.query("mirror tool in tools menu", n_results=2)
+        assert set(results) >= {"ids", "documents", "metadatas", "distances"}
+        assert len(results["ids"]) == 1
+        assert len(results["ids"][0]) == 2
+        assert results["ids"][0][0] == "a"
+
+    def test_distances_sorted_ascending(self, store):
+        distances = store.query("file menu export", n_results=3)["distances"][0]
+        assert distances == sorted(distances)
+        assert all(0.0 <= d <= 4.0 for d in distances)
+
+    def test_duplicate_ids_skipped(self, store):
+        store.add(["a"], ["Something else entirely"])
+        assert store.count() == 3
+
+    def test_delete(self, store):
+        store.delete(["b"])
+        assert store.count() == 2
+        assert "b" not in store.query("zoom slider", n_results=5)["ids"][0]
+
+    def test_persists_to_disk(self, store, tmp_path):
+        """A new store on the same path should load saved vectors."""
+        assert (tmp_path / "steps.npy").exists()
+        assert (tmp_path / "steps.json").exists()
+
+        reloaded = NumpyVectorStore("steps", path=str(tmp_path))
+        assert reloaded.count() == 3
+        assert reloaded.query("zoom slider", n_results=1)["ids"][0] == ["b"]
+
+    def test_empty_store_query(self, tmp_path):
+        store = NumpyVectorStore("empty", path=str(tmp_path))
+        assert store.query("anything")["ids"] == [[]]
+
+    def test_works_with_test_step_embedder(self, tmp_path):
+        """TestStepEmbedder should run end-to-end on the numpy backend."""
+        reset_vector_stores()
+        embedder = TestStepEmbedder(path=str(tmp_path), backend="numpy")
+        stored = embedder.store_steps([{
+            "id": "1-AC1",
+            "steps": [
+                {"action": "Launch the application"},
+                {"action": "Click the Mirror Tool button in the Tools Menu"},
+            ],
+        }])
+        assert stored == 1
+        steps = embedder.get_reference_steps("Mirror Tool", n_results=5)
+        assert steps == ["Click the Mirror Tool button in the Tools Menu"]
+        reset_vector_stores()
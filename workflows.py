@@ -129,10 +129,20 @@ class GenerateWorkflow(IWorkflow):
         from infrastructure import get_story_repository
         from infrastructure.export import CSVGenerator, ObjectiveGenerator
         from core.services import GenericTestGenerator
+        from core.services.generation_manifest import (
+            GenerationManifest,
+            attribution_by_id,
+            attribution_by_title,
+            context_hash,
+            generation_fingerprint,
+            merge_tests
+        )
+        from core.services.llm.prompt_builder import clean_acceptance_criteria
 
         story_id = kwargs['story_id']
         output_dir = kwargs.get('output_dir') or config.output_dir or 'output'
         skip_correction = kwargs.get('skip_correction', False)
+        full_regenerate = kwargs.get('full_regenerate', False)
 
         # Determine source platform
         source_platform = config.source_platform.upper()
@@ -181,36 +191,75 @@ class GenerateWorkflow(IWorkflow):
         generator = GenericTestGenerator(config)
         # Include description in story_data for proper entry point detection
         description = getattr(story, 'description', '') or ''
-        test_cases = generator.generate_test_cases(
-            story_data={'story_id': story_id, 'title': title, 'description': description},
-            criteria=acceptance_criteria,
-            qa_prep_content=qa_prep
-        )
-        print(f"  Generated {len(test_cases)} test cases")
 
-        # Optional LLM correction
-        if not skip_correction and config.llm_enabled:
-            test_cases = self._apply_llm_correction(
-                config, test_cases, story_id, title, acceptance_criteria, qa_prep,
-                story_description=description
-            )
+        # Incremental mode: diff ACs against the previous run's manifest
+        criteria = clean_acceptance_criteria(acceptance_criteria)
+        manifest_path = GenerationManifest.path_for(output_dir, story_id)
+        context = context_hash(
+            generation_fingerprint(config), config.project_id, title, description, qa_prep,
+            'rule_based' if skip_correction else 'hybrid'
+        )
+        plan = None
+        previous = None if full_regenerate else GenerationManifest.load(manifest_path)
+        if previous:
+            plan = previous.plan(criteria, context)
+            if plan.full:
+                print("  Story context changed since last run, regenerating all tests")
+                plan = None
+            else:
+                print(
+                    f"  Incremental: {len(criteria) - len(plan.changed)} unchanged AC(s), "
+                    f"{len(plan.changed)} new/changed, {plan.removed} removed"
+                )
 
-        # Judge validation (cross-LLM review)
-        if config.judge_enabled:
-            test_cases = self._apply_judge_validation(
-                config, test_cases,
+        if plan and plan.unchanged:
+            test_cases = list(plan.kept_tests)
+            print(f"  No AC changes, reusing {len(test_cases)} test cases")
+        else:
+            changed_criteria = [criteria[idx] for idx in plan.changed] if plan else acceptance_criteria
+            test_cases = generator.generate_test_cases(
                 story_data={'story_id': story_id, 'title': title, 'description': description},
-                acceptance_criteria=acceptance_criteria
+                criteria=acceptance_criteria,
+                qa_prep_content=qa_prep,
+                only_acs=set(plan.changed) if plan else None
             )
+            print(f"  Generated {len(test_cases)} test cases")
+            # Correction renumbers the tests, so carry the generator's AC
+            # attribution over by title
+            generated = attribution_by_title(test_cases, generator.ac_test_ids_by_test())
+
+            # Optional LLM correction
+            if test_cases and not skip_correction and config.llm_enabled:
+                test_cases = self._apply_llm_correction(
+                    config, test_cases, story_id, title, changed_criteria, qa_prep,
+                    story_description=description
+                )
 
-        # Self-judge (final cleanup using corrector's own LLM)
-        if config.self_judge_enabled and config.llm_enabled:
-            test_cases = self._apply_self_judge(
-                config, test_cases,
-                story_title=title,
-                story_description=description,
-                acceptance_criteria=acceptance_criteria
-            )
+            # Judge validation (cross-LLM review)
+            if test_cases and config.judge_enabled:
+                test_cases = self._apply_judge_validation(
+                    config, test_cases,
+                    story_data={'story_id': story_id, 'title': title, 'description': description},
+                    acceptance_criteria=changed_criteria
+                )
+
+            # Self-judge (final cleanup using corrector's own LLM)
+            if test_cases and config.self_judge_enabled and config.llm_enabled:
+                test_cases = self._apply_self_judge(
+                    config, test_cases,
+                    story_title=title,
+                    story_description=description,
+                    acceptance_criteria=changed_criteria
+                )
+
+            known = attribution_by_id(test_cases, generated)
+            if plan:
+                test_cases = merge_tests(
+                    plan, test_cases, story_id, criteria,
+                    increment=config.rules.test_id_increment,
+                    known=known
+                )
+                print(f"  Merged with kept tests: {len(test_cases)} test cases")
 
         # Step 3: Save outputs
         print("\n[3/3] Saving outputs...")
@@ -221,6 +270,13 @@ class GenerateWorkflow(IWorkflow):
             qa_prep_exists=bool(qa_prep)
         )
 
+        # Record AC hashes for the next incremental run
+        GenerationManifest.build(
+            story_id, context, criteria, test_cases,
+            known=plan.attribution if plan else known
+        ).save(manifest_path)
+        output_files['manifest'] = manifest_path
+
         print(f"\nGeneration complete")
         print(f"  Test cases: {len(test_cases)}")
         for key, path in output_files.items():
@@ -265,20 +321,46 @@ class GenerateWorkflow(IWorkflow):
                 provider_type=provider_type
             )
 
-            embedder = TestStepEmbedder()
+            embedder = TestStepEmbedder(
+                path=config.vector_db_path, backend=config.vector_db_backend
+            )
+            # Adaptive correction: only tests failing the quality gates go to the LLM
+            to_correct, passing = test_cases, None
+            if config.adaptive_correction:
+                from core.services.llm.correction_planner import CorrectionPlanner
+                plan = CorrectionPlanner(config, corrector).plan(
+                    test_cases, acceptance_criteria,
+                    story_data={'story_id': story_id, 'title': title, 'description': story_description},
+                    qa_prep=qa_prep
+                )
+                print(f"  Correction plan: {plan.summary()}")
+                cost_saved = plan.cost_saved(config.llm_model)
+                if cost_saved:
+                    print(f"  Estimated cost saved: ${cost_saved:.4f}")
+                if plan.skip_llm:
+                    corrected = corrector.post_process(test_cases, str(story_id), title, acceptance_criteria)
+                    if len(corrected) >= plan.minimum_tests:
+                        print("  All tests pass quality gates and cover every AC, skipping LLM correction")
+                        return corrected
+                    # Removing duplicates left too few tests
+                    print(f"  {len(corrected)} tests after dedup < minimum {plan.minimum_tests}, correcting with LLM")
+                    to_correct, passing = corrected, None
+                else:
+                    to_correct, passing = plan.failing, plan.passing
+
             reference_steps = embedder.get_reference_steps(title, n_results=10)
             if reference_steps:
                 print(f"  Found {len(reference_steps)} reference steps for correction")
 
-
             corrected = corrector.correct_test_cases(
-                test_cases=test_cases,
+                test_cases=to_correct,
                 story_id=str(story_id),
                 feature_name=title,
                 acceptance_criteria=acceptance_criteria,
                 qa_prep=qa_prep,
                 reference_steps=reference_steps,
-                story_description=story_description
+                story_description=story_description,
+                passing_tests=passing
             )
             print(f"  LLM correction complete: {len(corrected)} test cases")
             return corrected
@@ -753,8 +835,11 @@ class UploadWorkflow(IWorkflow):
         test_cases: List[Dict],
         target_platform: str
     ) -> Dict:
-        """Upload test cases to target platform (ADO or TestRail)."""
-        import time
+        """Upload test cases to target platform (ADO or TestRail).
+
+        Test cases are created in bulk and then added to the suite in one
+        call; results are still reported per test case.
+        """
         from infrastructure.export import ObjectiveGenerator
 
         results = {'created': [], 'failed': []}
@@ -763,44 +848,43 @@ class UploadWorkflow(IWorkflow):
         plan_id = suite_info.get('plan_id', 0)
         suite_id = suite_info['id']
 
-        for idx, tc in enumerate(test_cases, 1):
-            tc_id = tc.get('id', '')
-            title = tc.get('title', '')
-            steps = tc.get('steps', [])
+        payload = []
+        for tc in test_cases:
+            # Format objective for ADO if needed
             objective = tc.get('objective', '')
+            if target_platform == 'ADO' and objective:
+                objective = objective_gen.format_objective_for_ado(objective)
+            payload.append({
+                'title': tc.get('title', ''),
+                'steps': tc.get('steps', []),
+                'objective': objective
+            })
 
-            print(f"  [{idx}/{len(test_cases)}] {tc_id}...", end=' ')
-
-            try:
-                # Format objective for ADO if needed
-                formatted_objective = objective
-                if target_platform == 'ADO' and objective:
-                    formatted_objective = objective_gen.format_objective_for_ado(objective)
-
-                # Create test case using the repository
-                work_item_id = case_repo.create_test_case(
-                    title=title,
-                    steps=steps,
-                    objective=formatted_objective,
-                    section_id=suite_id  # For TestRail
-                )
+        try:
+            # section_id is used by TestRail
+            created = case_repo.create_test_cases(payload, section_id=suite_id)
+            work_item_ids = [item['id'] for item in created if item['id']]
+            # Add to suite (for ADO; TestRail handles this automatically)
+            in_suite = set(suite_repo.add_test_cases_to_suite(plan_id, suite_id, work_item_ids))
+        except Exception as e:
+            created = [{'id': None, 'error': str(e)} for _ in test_cases]
+            in_suite = set()
 
-                if work_item_id:
-                    # Add to suite (for ADO; TestRail handles this automatically)
-                    if suite_repo.add_test_case_to_suite(plan_id, suite_id, work_item_id):
-                        results['created'].append({'id': work_item_id, 'tc_id': tc_id})
-                        print(f"OK (ID: {work_item_id})")
-                    else:
-                        results['failed'].append({'tc_id': tc_id, 'error': 'Failed to add to suite'})
-                        print("Failed to add to suite")
-                else:
-                    results['failed'].append({'tc_id': tc_id, 'error': 'Failed to create'})
-                    print("Failed")
-            except Exception as e:
-                results['failed'].append({'tc_id': tc_id, 'error': str(e)})
-                print(f"Failed: {e}")
+        for idx, (tc, item) in enumerate(zip(test_cases, created), 1):
+            tc_id = tc.get('id', '')
+            work_item_id = item['id']
 
-            time.sleep(0.5)
+            print(f"  [{idx}/{len(test_cases)}] {tc_id}...", end=' ')
+            if not work_item_id:
+                error = item.get('error') or 'Failed to create'
+                results['failed'].append({'tc_id': tc_id, 'error': error})
+                print(f"Failed: {error}")
+            elif work_item_id in in_suite:
+                results['created'].append({'id': work_item_id, 'tc_id': tc_id})
+                print(f"OK (ID: {work_item_id})")
+            else:
+                results['failed'].append({'tc_id': tc_id, 'error': 'Failed to add to suite'})
+                print("Failed to add to suite")
 
         return results
 
@@ -972,6 +1056,33 @@ class DiscoverWorkflow(IWorkflow):
         if config.testrail and not config.testrail.api_key:
             config.testrail.api_key = os.getenv('TESTRAIL_API_KEY')
 
+    @staticmethod
+    def _fetch_stories(story_repo, story_ids: List[Any]) -> List[Dict]:
+        """Fetch stories in one bulk call (invalid or missing IDs are reported and skipped)."""
+        numeric_ids = []
+        for story_id in story_ids:
+            try:
+                numeric_ids.append((story_id, int(story_id)))
+            except (TypeError, ValueError):
+                print(f"  Failed to fetch {story_id}: not a numeric story ID")
+
+        fetched = story_repo.get_stories([numeric_id for _, numeric_id in numeric_ids]) if numeric_ids else {}
+
+        stories = []
+        for story_id, numeric_id in numeric_ids:
+            story = fetched.get(numeric_id)
+            if story:
+                # Convert to dict format expected by discovery
+                stories.append({
+                    'title': story.title,
+                    'description': story.description,
+                    'acceptance_criteria': story.acceptance_criteria
+                })
+                print(f"  Fetched: {story_id} - {story.title[:50]}...")
+            else:
+                print(f"  Failed to fetch {story_id}")
+        return stories
+
     def execute(self, config: ProjectConfig, **kwargs) -> WorkflowResult:
         from infrastructure import get_story_repository
 
@@ -992,22 +1103,7 @@ class DiscoverWorkflow(IWorkflow):
         try:
             self._ensure_credentials(config)
             story_repo = get_story_repository(config)
-
-            stories = []
-            for story_id in story_ids:
-                try:
-                    story = story_repo.get_story(int(story_id))
-                    if story:
-                        # Convert to dict format expected by discovery
-                        story_data = {
-                            'title': story.title,
-                            'description': story.description,
-                            'acceptance_criteria': story.acceptance_criteria
-                        }
-                        stories.append(story_data)
-                        print(f"  Fetched: {story_id} - {story.title[:50]}...")
-                except Exception as e:
-                    print(f"  Failed to fetch {story_id}: {e}")
+            stories = self._fetch_stories(story_repo, story_ids)
         except Exception as e:
             return WorkflowResult(
                 status=WorkflowStatus.FAILED,
@@ -1691,32 +1787,27 @@ Return ONLY valid JSON."""
         print(f"Summary: {len(tests_with_changes)} test case(s) will be updated")
 
     def _update_ado(self, client, test_cases: Dict, fixes: Dict) -> tuple:
-        """Update test cases in ADO."""
-        success = 0
-        failed = 0
+        """Update test cases in ADO (several at a time, reported in order)."""
+        from infrastructure.upload_executor import UploadExecutor
 
-        for tc_id, fix in fixes.items():
-            if not fix.get('has_changes'):
-                continue
+        changed = [(tc_id, fix) for tc_id, fix in fixes.items() if fix.get('has_changes')]
 
-            print(f"  Updating {tc_id}...", end=" ")
+        def update(item) -> None:
+            tc_id, fix = item
+            patch_doc = [
+                {"op": "replace", "path": "/fields/System.Title", "value": fix['title']},
+                {"op": "replace", "path": "/fields/System.State", "value": fix['state']},
+                {"op": "replace", "path": "/fields/Microsoft.VSTS.TCM.Steps",
+                 "value": self._build_steps_xml(fix['steps'])}
+            ]
+            client.patch(f"_apis/wit/workitems/{tc_id}", data=patch_doc)
 
-            try:
-                patch_doc = [
-                    {"op": "replace", "path": "/fields/System.Title", "value": fix['title']},
-                    {"op": "replace", "path": "/fields/System.State", "value": fix['state']},
-                    {"op": "replace", "path": "/fields/Microsoft.VSTS.TCM.Steps",
-                     "value": self._build_steps_xml(fix['steps'])}
-                ]
-
-                client.patch(f"_apis/wit/workitems/{tc_id}", data=patch_doc)
-                print("OK")
-                success += 1
-            except Exception as e:
-                print(f"FAILED - {e}")
-                failed += 1
+        def report(idx, item, result, error) -> None:
+            print(f"  Updating {item[0]}...", "OK" if error is None else f"FAILED - {error}")
 
-        return success, failed
+        outcomes = UploadExecutor().map(update, changed, on_result=report)
+        failed = sum(1 for _, error in outcomes if error is not None)
+        return len(outcomes) - failed, failed
 
     def _build_steps_xml(self, steps: List[Dict]) -> str:
         """Build XML for test steps."""
@@ -2371,6 +2462,8 @@ Examples:
     gen_parser.add_argument('--story-id', type=int, required=True, help='ADO Story ID')
     gen_parser.add_argument('--output-dir', default=None, help='Output directory')
     gen_parser.add_argument('--skip-correction', action='store_true', help='Skip LLM correction')
+    gen_parser.add_argument('--full-regenerate', action='store_true',
+                            help='Ignore the generation manifest and regenerate all tests')
 
     # Upload workflow
     upload_parser = subparsers.add_parser('upload', help='Generate + Upload to ADO')